@@ -0,0 +1 @@
+# Inicialización del paquete de benchmarks
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Mide el costo por petición de obtener el RecruitmentController.
+
+- antes: un controlador nuevo por petición, con seis clientes GraphQL nuevos
+  (cada uno con su línea de log) y un KafkaClient nuevo.
+- después: el controlador compartido del contenedor de dependencias.
+
+Uso (desde el directorio app/):
+    python -m benchmarks.controller_overhead [iteraciones]
+"""
+import asyncio
+import logging
+import sys
+import time
+from types import SimpleNamespace
+from src.cache import EntityCache
+from src.container import Container, get_controller
+from src.controllers.recruitment_controller import RecruitmentController
+from src.graphql_client import GraphQLClient, PoolStats
+from src.kafka_client import KafkaClient
+
+logging.basicConfig(level=logging.INFO, handlers=[logging.NullHandler()])
+logger = logging.getLogger(__name__)
+
+class PerRequestPool:
+    """Reproduce la construcción anterior: un cliente GraphQL nuevo por servicio y por petición"""
+
+    def __init__(self, shared_pool):
+        self.shared_pool = shared_pool
+
+    def get_client(self, service_name):
+        client = GraphQLClient(service_name, self.shared_pool.sessions[service_name], PoolStats(0))
+        logger.info(f"Inicializando cliente GraphQL para {service_name} en {client.graphql_endpoint}")
+        return client
+
+def measure(label, factory, iterations):
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        factory()
+    elapsed = time.perf_counter() - started_at
+    print(f"{label:<40} {elapsed / iterations * 1_000_000:>10.2f} µs/petición")
+    return elapsed
+
+async def main(iterations):
+    container = Container()
+    # Solo se necesitan las sesiones; Kafka no se inicia para aislar el costo de construcción
+    await container.graphql_pool.start()
+    container.controller = RecruitmentController(container.graphql_pool, container.kafka_client, container.entity_cache)
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(container=container)))
+    per_request_pool = PerRequestPool(container.graphql_pool)
+
+    try:
+        before = measure(
+            "antes (controlador por petición)",
+            lambda: RecruitmentController(per_request_pool, KafkaClient(), EntityCache()),
+            iterations
+        )
+        after = measure(
+            "después (contenedor compartido)",
+            lambda: get_controller(request),
+            iterations
+        )
+        print(f"{'mejora':<40} {before / after:>10.1f}x")
+    finally:
+        await container.graphql_pool.close()
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,98 @@
+import logging
+import time
+from collections import OrderedDict
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+class EntityCache:
+    """Caché LRU con TTL de entidades (requisiciones, vacantes, candidatos) por tipo e ID"""
+
+    def __init__(self, max_entries=None, ttl=None):
+        """
+        Inicializa la caché.
+
+        Args:
+            max_entries (int, optional): Número máximo de entidades guardadas
+            ttl (float, optional): Segundos que una entidad se considera vigente
+        """
+        self.max_entries = max_entries or Config.ENTITY_CACHE_SIZE
+        self.ttl = ttl or Config.ENTITY_CACHE_TTL
+        self.entries = OrderedDict()
+        self.invalidation_count = 0
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0
+        }
+
+    @staticmethod
+    def _key(entity_type, entity_id):
+        # Los IDs llegan como int desde las rutas y como str desde GraphQL o Kafka
+        return entity_type, str(entity_id)
+
+    def get(self, entity_type, entity_id):
+        """Devuelve la entidad guardada o None si no está o ya venció"""
+        key = self._key(entity_type, entity_id)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self.entries[key]
+            self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return value
+
+    def token(self):
+        """
+        Devuelve una marca para tomar antes de consultar el servicio.
+
+        Si entre la marca y el set() hubo una invalidación, el valor leído
+        puede ser anterior al evento y no se guarda.
+        """
+        return self.invalidation_count
+
+    def set(self, entity_type, entity_id, value, token=None):
+        """Guarda una entidad, desalojando la menos usada si se supera el límite"""
+        if value is None or (token is not None and token != self.invalidation_count):
+            return
+
+        key = self._key(entity_type, entity_id)
+        self.entries[key] = (value, time.monotonic() + self.ttl)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def invalidate(self, entity_type, entity_id):
+        """Descarta una entidad tras una mutación propia o un evento Kafka"""
+        if entity_id is None:
+            return
+        self.invalidation_count += 1
+        if self.entries.pop(self._key(entity_type, entity_id), None) is not None:
+            self.stats["invalidations"] += 1
+            logger.debug(f"Caché invalidada para {entity_type} {entity_id}")
+
+    def clear(self):
+        self.entries.clear()
+        self.invalidation_count += 1
+
+    def metrics(self):
+        """Devuelve los contadores de la caché"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "size": len(self.entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0
+        }
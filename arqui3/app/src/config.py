@@ -24,6 +24,64 @@ class Config:
     KAFKA_BOOTSTRAP_SERVERS = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
     KAFKA_TOPIC_PREFIX = os.getenv("KAFKA_TOPIC_PREFIX", "recruiting")
     
+    # Publicación asíncrona en lotes del productor Kafka
+    KAFKA_ASYNC_PUBLISH = os.getenv("KAFKA_ASYNC_PUBLISH", "true").lower() == "true"
+    KAFKA_BUFFER_SIZE = int(os.getenv("KAFKA_BUFFER_SIZE", "10000"))
+    KAFKA_LINGER_MS = int(os.getenv("KAFKA_LINGER_MS", "20"))
+    KAFKA_MAX_BATCH_SIZE = int(os.getenv("KAFKA_MAX_BATCH_SIZE", "65536"))
+    KAFKA_COMPRESSION_TYPE = os.getenv("KAFKA_COMPRESSION_TYPE", "gzip")
+    KAFKA_FLUSH_TIMEOUT = float(os.getenv("KAFKA_FLUSH_TIMEOUT", "10.0"))
+    
+    # Consumo por lotes con workers por partición
+    KAFKA_CONSUMER_WORKERS = int(os.getenv("KAFKA_CONSUMER_WORKERS", "4"))
+    KAFKA_CONSUMER_MAX_RECORDS = int(os.getenv("KAFKA_CONSUMER_MAX_RECORDS", "100"))
+    KAFKA_CONSUMER_POLL_TIMEOUT_MS = int(os.getenv("KAFKA_CONSUMER_POLL_TIMEOUT_MS", "500"))
+    KAFKA_CONSUMER_QUEUE_SIZE = int(os.getenv("KAFKA_CONSUMER_QUEUE_SIZE", "4"))
+
+    # Configuración de los pools de conexiones GraphQL
+    GRAPHQL_POOL_LIMIT = int(os.getenv("GRAPHQL_POOL_LIMIT", "20"))
+    GRAPHQL_CONNECT_TIMEOUT = float(os.getenv("GRAPHQL_CONNECT_TIMEOUT", "2.0"))
+    GRAPHQL_READ_TIMEOUT = float(os.getenv("GRAPHQL_READ_TIMEOUT", "10.0"))
+    GRAPHQL_KEEPALIVE_TIMEOUT = float(os.getenv("GRAPHQL_KEEPALIVE_TIMEOUT", "30.0"))
+    # Enviar solo el hash de las consultas (persisted queries) con reintento con texto completo
+    PERSISTED_QUERIES_ENABLED = os.getenv("PERSISTED_QUERIES_ENABLED", "true").lower() == "true"
+
+    # Circuit breakers por servicio (ventana deslizante de errores y llamadas lentas)
+    BREAKER_WINDOW_SECONDS = float(os.getenv("BREAKER_WINDOW_SECONDS", "30.0"))
+    BREAKER_MIN_CALLS = int(os.getenv("BREAKER_MIN_CALLS", "20"))
+    BREAKER_ERROR_RATE = float(os.getenv("BREAKER_ERROR_RATE", "0.5"))
+    BREAKER_SLOW_CALL_SECONDS = float(os.getenv("BREAKER_SLOW_CALL_SECONDS", "2.0"))
+    BREAKER_SLOW_RATE = float(os.getenv("BREAKER_SLOW_RATE", "0.8"))
+    BREAKER_OPEN_SECONDS = float(os.getenv("BREAKER_OPEN_SECONDS", "15.0"))
+    BREAKER_HALF_OPEN_CALLS = int(os.getenv("BREAKER_HALF_OPEN_CALLS", "3"))
+
+    # Reintentos en paralelo (hedging) de consultas idempotentes tras el p95 del servicio
+    HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "false").lower() == "true"
+    HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "50"))
+    HEDGE_MIN_DELAY = float(os.getenv("HEDGE_MIN_DELAY", "0.05"))
+    LATENCY_WINDOW_SIZE = int(os.getenv("LATENCY_WINDOW_SIZE", "1000"))
+
+    # Flujos del controlador: tiempo límite por paso y trazas guardadas por flujo
+    WORKFLOW_STEP_TIMEOUT = float(os.getenv("WORKFLOW_STEP_TIMEOUT", "5.0"))
+    WORKFLOW_TRACE_SIZE = int(os.getenv("WORKFLOW_TRACE_SIZE", "50"))
+
+    # Caché de entidades invalidada por eventos
+    ENTITY_CACHE_SIZE = int(os.getenv("ENTITY_CACHE_SIZE", "1000"))
+    ENTITY_CACHE_TTL = float(os.getenv("ENTITY_CACHE_TTL", "30.0"))
+
+    # Descarga de reportes en streaming desde el servicio de evaluaciones
+    REPORT_CHUNK_SIZE = int(os.getenv("REPORT_CHUNK_SIZE", "65536"))
+    REPORT_READ_TIMEOUT = float(os.getenv("REPORT_READ_TIMEOUT", "60.0"))
+
+    # Registro masivo de candidatos: filas por lote y lotes simultáneos hacia el servicio
+    BULK_BATCH_SIZE = int(os.getenv("BULK_BATCH_SIZE", "100"))
+    BULK_CONCURRENCY = int(os.getenv("BULK_CONCURRENCY", "4"))
+
+    @classmethod
+    def get_service_pool_limit(cls, service_name):
+        """Devuelve el límite de conexiones del pool del servicio (ej. CANDIDATE_POOL_LIMIT)"""
+        return int(os.getenv(f"{service_name.upper()}_POOL_LIMIT", cls.GRAPHQL_POOL_LIMIT))
+
     @classmethod
     def get_service_url(cls, service_name):
         """Devuelve la URL del servicio solicitado"""
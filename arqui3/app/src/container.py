@@ -0,0 +1,42 @@
+import logging
+from fastapi import Request
+from .graphql_client import GraphQLClientPool
+from .kafka_client import KafkaClient
+from .cache import EntityCache
+from .controllers.recruitment_controller import RecruitmentController
+
+logger = logging.getLogger(__name__)
+
+class Container:
+    """Contenedor de dependencias con el ciclo de vida de la aplicación"""
+
+    def __init__(self):
+        self.graphql_pool = GraphQLClientPool()
+        self.kafka_client = KafkaClient()
+        self.entity_cache = EntityCache()
+        self.controller = None
+
+    async def start(self):
+        """Crea los clientes compartidos, inicia el productor Kafka y construye el controlador"""
+        await self.graphql_pool.start()
+        await self.kafka_client.start_producer()
+        self.controller = RecruitmentController(self.graphql_pool, self.kafka_client, self.entity_cache)
+        logger.info("Contenedor de dependencias iniciado")
+
+    async def shutdown(self):
+        """Detiene los consumidores, encola los eventos pendientes del controlador, detiene el productor Kafka y cierra los pools GraphQL"""
+        if self.kafka_client.kafka_enabled:
+            await self.kafka_client.stop_all_consumers()
+        if self.controller is not None:
+            await self.controller.drain()
+        await self.kafka_client.stop_producer()
+        await self.graphql_pool.close()
+        self.controller = None
+        logger.info("Contenedor de dependencias detenido")
+
+# Dependencia para obtener el controlador compartido
+def get_controller(request: Request) -> RecruitmentController:
+    controller = request.app.state.container.controller
+    if controller is None:
+        raise RuntimeError("El contenedor de dependencias no está iniciado")
+    return controller
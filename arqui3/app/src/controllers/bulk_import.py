@@ -0,0 +1,236 @@
+import asyncio
+import codecs
+import csv
+import json
+import logging
+from collections import defaultdict
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_FIELDS = ("name", "email", "resume_url", "vacancy_id")
+
+async def iter_lines(chunks):
+    """Convierte los bloques de bytes de la subida en líneas de texto, sin leer el cuerpo completo"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+async def iter_rows(chunks, upload_format):
+    """
+    Recorre las filas de una subida NDJSON o CSV.
+
+    En CSV la primera línea es la cabecera, skills va separado por ';' y cada
+    registro ocupa una línea.
+
+    Yields:
+        tuple: (número de fila, dict con la fila o None, mensaje de error o None)
+    """
+    header = None
+    row_number = 0
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        if upload_format == "csv" and header is None:
+            header = [column.strip() for column in next(csv.reader([line]))]
+            continue
+
+        row_number += 1
+        try:
+            if upload_format == "csv":
+                values = next(csv.reader([line]))
+                row = dict(zip(header, values))
+                if row.get("skills") is not None:
+                    row["skills"] = [skill.strip() for skill in row["skills"].split(";") if skill.strip()]
+            else:
+                row = json.loads(line)
+                if not isinstance(row, dict):
+                    raise ValueError("cada línea debe ser un objeto JSON")
+        except ValueError as e:
+            yield row_number, None, f"Fila mal formada: {str(e)}"
+            continue
+        yield row_number, row, None
+
+def validate_row(row):
+    """
+    Valida una fila con las mismas reglas que el servicio de candidatos.
+
+    Returns:
+        tuple: (candidate, error_message)
+    """
+    missing = [field for field in REQUIRED_FIELDS if row.get(field) in (None, "")]
+    if missing:
+        return None, f"Faltan campos obligatorios: {', '.join(missing)}"
+
+    try:
+        vacancy_id = int(row["vacancy_id"])
+        experience_years = row.get("experience_years")
+        experience_years = int(experience_years) if experience_years not in (None, "") else None
+    except (TypeError, ValueError):
+        return None, "vacancy_id y experience_years deben ser enteros"
+
+    name = str(row["name"]).strip()
+    email = str(row["email"]).strip()
+    resume_url = str(row["resume_url"]).strip()
+    skills = row.get("skills") or []
+
+    if len(name) < 2:
+        return None, "El nombre debe tener al menos 2 caracteres"
+    if "@" not in email:
+        return None, "Email no válido"
+    if len(resume_url) < 5:
+        return None, "URL del currículum no válida"
+    if vacancy_id <= 0:
+        return None, "vacancy_id debe ser positivo"
+    if experience_years is not None and experience_years < 0:
+        return None, "experience_years no puede ser negativo"
+    if not isinstance(skills, list):
+        return None, "skills debe ser una lista"
+
+    return {
+        "name": name,
+        "email": email,
+        "resume_url": resume_url,
+        "vacancy_id": vacancy_id,
+        "skills": [str(skill) for skill in skills],
+        "experience_years": experience_years
+    }, None
+
+class BulkCandidateImport:
+    """
+    Registro masivo de candidatos: valida las filas según llegan, consulta cada
+    vacante una sola vez, envía lotes al servicio de candidatos con concurrencia
+    acotada y devuelve el resultado de cada fila en cuanto se conoce.
+    """
+
+    def __init__(self, controller, batch_size=None, concurrency=None):
+        self.controller = controller
+        self.batch_size = batch_size or Config.BULK_BATCH_SIZE
+        self.concurrency = concurrency or Config.BULK_CONCURRENCY
+        self.vacancy_checks = {}
+        self.summary = defaultdict(int)
+
+    async def _check_vacancy(self, vacancy_id):
+        """
+        Comprueba si la vacante admite postulaciones.
+
+        Returns:
+            tuple: None si la admite o (estado de la fila, motivo): rejected si la
+                   vacante no existe o no está publicada, failed si la consulta falló
+        """
+        if vacancy_id not in self.vacancy_checks:
+            self.vacancy_checks[vacancy_id] = asyncio.ensure_future(
+                self.controller.vacancy_service.find_vacancy(vacancy_id)
+            )
+        vacancy, error_message = await self.vacancy_checks[vacancy_id]
+        if error_message:
+            # Un fallo no se recuerda: la siguiente fila de la vacante vuelve a consultarla
+            del self.vacancy_checks[vacancy_id]
+            return "failed", f"No se pudo consultar la vacante {vacancy_id}: {error_message}"
+        if not vacancy:
+            return "rejected", f"Vacante {vacancy_id} no encontrada"
+        if vacancy["status"] != "PUBLISHED":
+            return "rejected", f"Vacante {vacancy_id} no está publicada"
+        return None
+
+    async def _submit(self, batch):
+        """Envía un lote al servicio de candidatos y publica un evento por vacante"""
+        row_numbers = [row_number for row_number, _ in batch]
+        candidates = [candidate for _, candidate in batch]
+        created, error_message = await self.controller.candidate_service.submit_applications(candidates)
+
+        if created is None:
+            return [self._result(row_number, "failed", error=error_message) for row_number in row_numbers]
+
+        by_vacancy = defaultdict(list)
+        for candidate in created:
+            self.controller.cache.invalidate("candidate", candidate["id"])
+            by_vacancy[candidate["vacancyId"]].append(
+                {"candidate_id": candidate["id"], "name": candidate["name"]}
+            )
+        for vacancy_id, registered in by_vacancy.items():
+            self.controller.publish_event(
+                "candidate.registered",
+                {"vacancy_id": vacancy_id, "candidates": registered},
+                key=vacancy_id
+            )
+
+        return [
+            self._result(row_number, "created", candidate_id=candidate["id"])
+            for row_number, candidate in zip(row_numbers, created)
+        ]
+
+    def _result(self, row_number, status, **fields):
+        self.summary[status] += 1
+        return {"row": row_number, "status": status, **fields}
+
+    @staticmethod
+    def _collect(tasks):
+        """Saca de tasks los lotes terminados y devuelve sus resultados"""
+        results = []
+        for task in [task for task in tasks if task.done()]:
+            tasks.discard(task)
+            results.extend(task.result())
+        return results
+
+    async def run(self, chunks, upload_format):
+        """
+        Procesa la subida y produce el resultado de cada fila.
+
+        Args:
+            chunks: Iterador asíncrono con los bytes de la subida
+            upload_format (str): ndjson o csv
+
+        Yields:
+            dict: Resultado de una fila y, al final, el resumen ({"summary": {...}})
+        """
+        batch = []
+        in_flight = set()
+        try:
+            async for row_number, row, error in iter_rows(chunks, upload_format):
+                if row is not None:
+                    candidate, error = validate_row(row)
+                if error:
+                    yield self._result(row_number, "invalid", error=error)
+                    continue
+
+                rejection = await self._check_vacancy(candidate["vacancy_id"])
+                if rejection:
+                    status, error = rejection
+                    yield self._result(row_number, status, error=error)
+                    continue
+
+                batch.append((row_number, candidate))
+                if len(batch) >= self.batch_size:
+                    # Con todos los lotes en curso se deja de leer la subida hasta que termine uno
+                    while len(in_flight) >= self.concurrency:
+                        await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                        for result in self._collect(in_flight):
+                            yield result
+                    in_flight.add(asyncio.ensure_future(self._submit(batch)))
+                    batch = []
+
+                for result in self._collect(in_flight):
+                    yield result
+
+            if batch:
+                in_flight.add(asyncio.ensure_future(self._submit(batch)))
+            while in_flight:
+                await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for result in self._collect(in_flight):
+                    yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
+            for check in self.vacancy_checks.values():
+                check.cancel()
+
+        logger.info(f"Registro masivo de candidatos terminado: {dict(self.summary)}")
+        yield {"summary": dict(self.summary)}
@@ -1,26 +1,135 @@
+import asyncio
 import logging
+from contextlib import contextmanager
+from .workflow import WorkflowTrace, TraceRecorder
+from .bulk_import import BulkCandidateImport
 from ..services.requisition_service import RequisitionService
 from ..services.vacancy_service import VacancyService
 from ..services.candidate_service import CandidateService
 from ..services.evaluation_service import EvaluationService
 from ..services.interview_service import InterviewService
 from ..services.selection_service import SelectionService
-from ..kafka_client import KafkaClient
 
 logger = logging.getLogger(__name__)
 
 class RecruitmentController:
     """Controlador para manejar el flujo del proceso de selección"""
     
-    def __init__(self):
-        self.requisition_service = RequisitionService()
-        self.vacancy_service = VacancyService()
-        self.candidate_service = CandidateService()
-        self.evaluation_service = EvaluationService()
-        self.interview_service = InterviewService()
-        self.selection_service = SelectionService()
-        self.kafka_client = KafkaClient()
+    def __init__(self, graphql_pool, kafka_client, cache):
+        """
+        Inicializa el controlador.
+        
+        Args:
+            graphql_pool (GraphQLClientPool): Pool de clientes GraphQL creado al iniciar la aplicación
+            kafka_client (KafkaClient): Cliente Kafka con el productor ya iniciado
+            cache (EntityCache): Caché de entidades invalidada por eventos Kafka y mutaciones
+        """
+        self.requisition_service = RequisitionService(graphql_pool.get_client("requisition"))
+        self.vacancy_service = VacancyService(graphql_pool.get_client("vacancy"))
+        self.candidate_service = CandidateService(graphql_pool.get_client("candidate"))
+        self.evaluation_service = EvaluationService(graphql_pool.get_client("evaluation"))
+        self.interview_service = InterviewService(graphql_pool.get_client("interview"))
+        self.selection_service = SelectionService(graphql_pool.get_client("selection"))
+        self.kafka_client = kafka_client
+        self.cache = cache
+        self.traces = TraceRecorder()
+        self.pending_events = set()
+    
+    @contextmanager
+    def _workflow(self, name):
+        """Abre la traza de un flujo y la registra al terminar"""
+        trace = WorkflowTrace(name)
+        try:
+            yield trace
+        finally:
+            self.traces.record(trace)
+    
+    def publish_event(self, topic_suffix, message, key=None):
+        """Publica un evento fuera de la ruta de respuesta; el productor lo entrega en segundo plano"""
+        task = asyncio.ensure_future(self.kafka_client.send_message(topic_suffix, message, key=key))
+        self.pending_events.add(task)
+        task.add_done_callback(self._on_event_published)
+    
+    def _on_event_published(self, task):
+        self.pending_events.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Error al publicar evento: {task.exception()}")
+    
+    async def drain(self):
+        """Espera a que se encolen los eventos pendientes (se llama antes de detener Kafka)"""
+        if self.pending_events:
+            await asyncio.gather(*self.pending_events, return_exceptions=True)
+    
+    def metrics(self):
+        """Devuelve las trazas de los flujos y los eventos pendientes de encolar"""
+        return {
+            "pending_events": len(self.pending_events),
+            "workflows": self.traces.summary()
+        }
         
+    async def get_requisition(self, requisition_id, fresh=False):
+        """
+        Obtiene una requisición, usando la caché salvo que se pida una copia fresca.
+        
+        Args:
+            requisition_id (int): ID de la requisición
+            fresh (bool, optional): Ignorar la caché y consultar el servicio
+            
+        Returns:
+            tuple: (requisition, error_message)
+        """
+        if not fresh:
+            requisition = self.cache.get("requisition", requisition_id)
+            if requisition is not None:
+                return requisition, None
+        
+        token = self.cache.token()
+        requisition, error_message = await self.requisition_service.get_requisition(requisition_id)
+        self.cache.set("requisition", requisition_id, requisition, token)
+        return requisition, error_message
+    
+    async def get_vacancy(self, vacancy_id, fresh=False):
+        """
+        Obtiene una vacante, usando la caché salvo que se pida una copia fresca.
+        
+        Args:
+            vacancy_id (int): ID de la vacante
+            fresh (bool, optional): Ignorar la caché y consultar el servicio
+            
+        Returns:
+            dict: Información de la vacante o None si no existe
+        """
+        if not fresh:
+            vacancy = self.cache.get("vacancy", vacancy_id)
+            if vacancy is not None:
+                return vacancy
+        
+        token = self.cache.token()
+        vacancy = await self.vacancy_service.get_vacancy(vacancy_id)
+        self.cache.set("vacancy", vacancy_id, vacancy, token)
+        return vacancy
+    
+    async def get_candidate(self, candidate_id, fresh=False):
+        """
+        Obtiene un candidato, usando la caché salvo que se pida una copia fresca.
+        
+        Args:
+            candidate_id (int): ID del candidato
+            fresh (bool, optional): Ignorar la caché y consultar el servicio
+            
+        Returns:
+            dict: Información del candidato o None si no existe
+        """
+        if not fresh:
+            candidate = self.cache.get("candidate", candidate_id)
+            if candidate is not None:
+                return candidate
+        
+        token = self.cache.token()
+        candidate = await self.candidate_service.get_candidate(candidate_id)
+        self.cache.set("candidate", candidate_id, candidate, token)
+        return candidate
+    
     async def create_requisition(self, position_name, functions, salary_category, profile):
         """
         Crea una nueva requisición de personal.
@@ -36,25 +145,33 @@ class RecruitmentController:
                   - requisition es la información de la requisición creada o None si hay error
                   - error_message es None si no hay error o un mensaje descriptivo si lo hay
         """
-        requisition, error_message = self.requisition_service.create_requisition(
-            position_name, functions, salary_category, profile
-        )
-        
-        if requisition is None:
-            # Propagar el mensaje de error
-            return None, error_message
-            
-        # Notificar a través de Kafka
-        await self.kafka_client.send_message(
-            "requisition.created",
-            {
-                "requisition_id": requisition["id"],
-                "position_name": requisition["positionName"],
-                "status": requisition["status"]
-            }
-        )
-            
-        return requisition, None
+        with self._workflow("create_requisition") as trace:
+            requisition, error_message = await trace.step(
+                "requisition.create_requisition",
+                self.requisition_service.create_requisition(
+                    position_name, functions, salary_category, profile
+                ),
+                default=(None, "Tiempo límite agotado al crear la requisición")
+            )
+        
+            if requisition is None:
+                # Propagar el mensaje de error
+                return None, error_message
+            
+            self.cache.invalidate("requisition", requisition["id"])
+            
+            # Notificar a través de Kafka
+            self.publish_event(
+                "requisition.created",
+                {
+                    "requisition_id": requisition["id"],
+                    "position_name": requisition["positionName"],
+                    "status": requisition["status"]
+                },
+                key=requisition["id"]
+            )
+            
+            return requisition, None
     
     async def publish_vacancy(self, requisition_id, platforms):
         """
@@ -69,33 +186,50 @@ class RecruitmentController:
                   - vacancy es la información de la vacante publicada o None si hay error
                   - error_message es None si no hay error o un mensaje descriptivo si lo hay
         """
-        # Verificar que la requisición exista y esté aprobada
-        requisition, error_message = self.requisition_service.get_requisition(requisition_id)
+        with self._workflow("publish_vacancy") as trace:
+            # Verificar que la requisición exista y esté aprobada
+            requisition, error_message = await trace.step(
+                "requisition.get_requisition",
+                self.get_requisition(requisition_id),
+                default=(None, f"Tiempo límite agotado al consultar la requisición {requisition_id}")
+            )
+            
+            if requisition and requisition["status"] != "APPROVED":
+                # La copia en caché puede ser anterior a la aprobación: confirmar con el servicio
+                requisition, error_message = await trace.step(
+                    "requisition.get_requisition.fresh",
+                    self.get_requisition(requisition_id, fresh=True),
+                    default=(None, f"Tiempo límite agotado al consultar la requisición {requisition_id}")
+                )
         
-        if not requisition:
-            logger.error(f"Requisición {requisition_id} no encontrada: {error_message}")
-            return None, error_message or f"Requisición {requisition_id} no encontrada"
+            if not requisition:
+                logger.error(f"Requisición {requisition_id} no encontrada: {error_message}")
+                return None, error_message or f"Requisición {requisition_id} no encontrada"
             
-        if requisition["status"] != "APPROVED":
-            error_msg = f"Requisición {requisition_id} no está aprobada"
-            logger.error(error_msg)
-            return None, error_msg
+            if requisition["status"] != "APPROVED":
+                error_msg = f"Requisición {requisition_id} no está aprobada"
+                logger.error(error_msg)
+                return None, error_msg
             
-        # Publicar la vacante
-        vacancy = self.vacancy_service.publish_vacancy(requisition_id, platforms)
+            # Publicar la vacante
+            vacancy = await trace.step("vacancy.publish_vacancy", self.vacancy_service.publish_vacancy(requisition_id, platforms))
         
-        if vacancy:
-            # Notificar a través de Kafka
-            await self.kafka_client.send_message(
-                "vacancy.published",
-                {
-                    "vacancy_id": vacancy["id"],
-                    "requisition_id": vacancy["requisitionId"],
-                    "platforms": vacancy["platforms"]
-                }
-            )
+            if vacancy:
+                self.cache.invalidate("requisition", requisition_id)
+                self.cache.invalidate("vacancy", vacancy["id"])
+                
+                # Notificar a través de Kafka
+                self.publish_event(
+                    "vacancy.published",
+                    {
+                        "vacancy_id": vacancy["id"],
+                        "requisition_id": vacancy["requisitionId"],
+                        "platforms": vacancy["platforms"]
+                    },
+                    key=vacancy["id"]
+                )
             
-        return vacancy, None
+            return vacancy, None
     
     async def register_candidate(self, name, email, resume_url, vacancy_id, skills, experience_years):
         """
@@ -112,34 +246,58 @@ class RecruitmentController:
         Returns:
             dict: Información del candidato registrado
         """
-        # Verificar que la vacante exista y esté publicada
-        vacancy = self.vacancy_service.get_vacancy(vacancy_id)
+        with self._workflow("register_candidate") as trace:
+            # Verificar que la vacante exista y esté publicada
+            vacancy = await trace.step("vacancy.get_vacancy", self.get_vacancy(vacancy_id))
+            
+            if vacancy and vacancy["status"] != "PUBLISHED":
+                # La copia en caché puede ser anterior a la publicación: confirmar con el servicio
+                vacancy = await trace.step("vacancy.get_vacancy.fresh", self.get_vacancy(vacancy_id, fresh=True))
         
-        if not vacancy:
-            logger.error(f"Vacante {vacancy_id} no encontrada")
-            return None
+            if not vacancy:
+                logger.error(f"Vacante {vacancy_id} no encontrada")
+                return None
             
-        if vacancy["status"] != "PUBLISHED":
-            logger.error(f"Vacante {vacancy_id} no está publicada")
-            return None
+            if vacancy["status"] != "PUBLISHED":
+                logger.error(f"Vacante {vacancy_id} no está publicada")
+                return None
             
-        # Registrar el candidato
-        candidate = self.candidate_service.submit_application(
-            name, email, resume_url, vacancy_id, skills, experience_years
-        )
-        
-        if candidate:
-            # Notificar a través de Kafka
-            await self.kafka_client.send_message(
-                "candidate.registered",
-                {
-                    "candidate_id": candidate["id"],
-                    "name": candidate["name"],
-                    "vacancy_id": vacancy_id
-                }
+            # Registrar el candidato
+            candidate = await trace.step(
+                "candidate.submit_application",
+                self.candidate_service.submit_application(
+                    name, email, resume_url, vacancy_id, skills, experience_years
+                )
             )
+        
+            if candidate:
+                self.cache.invalidate("candidate", candidate["id"])
+                
+                # Notificar a través de Kafka
+                self.publish_event(
+                    "candidate.registered",
+                    {
+                        "candidate_id": candidate["id"],
+                        "name": candidate["name"],
+                        "vacancy_id": vacancy_id
+                    },
+                    key=candidate["id"]
+                )
             
-        return candidate
+            return candidate
+    
+    def register_candidates_bulk(self, chunks, upload_format):
+        """
+        Registra candidatos en bloque a partir de una subida NDJSON o CSV.
+        
+        Args:
+            chunks: Iterador asíncrono con los bytes de la subida
+            upload_format (str): ndjson o csv
+            
+        Returns:
+            Iterador asíncrono con el resultado de cada fila y un resumen final
+        """
+        return BulkCandidateImport(self).run(chunks, upload_format)
     
     async def assign_candidate_evaluation(self, candidate_id, vacancy_id, tests):
         """
@@ -153,30 +311,37 @@ class RecruitmentController:
         Returns:
             dict: Información de la evaluación asignada
         """
-        # Verificar que el candidato exista
-        candidate = self.candidate_service.get_candidate(candidate_id)
+        with self._workflow("assign_candidate_evaluation") as trace:
+            # Verificar que el candidato exista
+            candidate = await trace.step("candidate.get_candidate", self.get_candidate(candidate_id))
         
-        if not candidate:
-            logger.error(f"Candidato {candidate_id} no encontrado")
-            return None
+            if not candidate:
+                logger.error(f"Candidato {candidate_id} no encontrado")
+                return None
             
-        # Asignar evaluación
-        evaluation = self.evaluation_service.assign_evaluation(
-            candidate_id, vacancy_id, tests
-        )
-        
-        if evaluation:
-            # Notificar a través de Kafka
-            await self.kafka_client.send_message(
-                "evaluation.assigned",
-                {
-                    "evaluation_id": evaluation["id"],
-                    "candidate_id": candidate_id,
-                    "vacancy_id": vacancy_id
-                }
+            # Asignar evaluación
+            evaluation = await trace.step(
+                "evaluation.assign_evaluation",
+                self.evaluation_service.assign_evaluation(
+                    candidate_id, vacancy_id, tests
+                )
             )
+        
+            if evaluation:
+                self.cache.invalidate("candidate", candidate_id)
+                
+                # Notificar a través de Kafka
+                self.publish_event(
+                    "evaluation.assigned",
+                    {
+                        "evaluation_id": evaluation["id"],
+                        "candidate_id": candidate_id,
+                        "vacancy_id": vacancy_id
+                    },
+                    key=candidate_id
+                )
             
-        return evaluation
+            return evaluation
     
     async def register_test_result(self, evaluation_id, test_name, score, comments=""):
         """
@@ -191,22 +356,27 @@ class RecruitmentController:
         Returns:
             dict: Información de la evaluación actualizada
         """
-        result = self.evaluation_service.submit_test_result(
-            evaluation_id, test_name, score, comments
-        )
-        
-        if result:
-            # Notificar a través de Kafka
-            await self.kafka_client.send_message(
-                "test.completed",
-                {
-                    "evaluation_id": result["id"],
-                    "test_name": test_name,
-                    "score": score
-                }
+        with self._workflow("register_test_result") as trace:
+            result = await trace.step(
+                "evaluation.submit_test_result",
+                self.evaluation_service.submit_test_result(
+                    evaluation_id, test_name, score, comments
+                )
             )
+        
+            if result:
+                # Notificar a través de Kafka
+                self.publish_event(
+                    "test.completed",
+                    {
+                        "evaluation_id": result["id"],
+                        "test_name": test_name,
+                        "score": score
+                    },
+                    key=result["candidateId"]
+                )
             
-        return result
+            return result
     
     async def schedule_candidate_interview(self, candidate_id, interviewer_id, vacancy_id, 
                                          interview_type, scheduled_time, duration_minutes, location):
@@ -225,23 +395,30 @@ class RecruitmentController:
         Returns:
             dict: Información de la entrevista programada
         """
-        interview = self.interview_service.schedule_interview(
-            candidate_id, interviewer_id, vacancy_id, interview_type,
-            scheduled_time, duration_minutes, location
-        )
-        
-        if interview:
-            # Notificar a través de Kafka
-            await self.kafka_client.send_message(
-                "interview.scheduled",
-                {
-                    "interview_id": interview["id"],
-                    "candidate_id": candidate_id,
-                    "scheduled_time": scheduled_time
-                }
+        with self._workflow("schedule_candidate_interview") as trace:
+            interview = await trace.step(
+                "interview.schedule_interview",
+                self.interview_service.schedule_interview(
+                    candidate_id, interviewer_id, vacancy_id, interview_type,
+                    scheduled_time, duration_minutes, location
+                )
             )
+        
+            if interview:
+                self.cache.invalidate("candidate", candidate_id)
+                
+                # Notificar a través de Kafka
+                self.publish_event(
+                    "interview.scheduled",
+                    {
+                        "interview_id": interview["id"],
+                        "candidate_id": candidate_id,
+                        "scheduled_time": scheduled_time
+                    },
+                    key=candidate_id
+                )
             
-        return interview
+            return interview
     
     async def register_interview_feedback(self, interview_id, strengths, weaknesses, 
                                         technical_score, communication_score, 
@@ -262,22 +439,27 @@ class RecruitmentController:
         Returns:
             dict: Información de la entrevista actualizada
         """
-        feedback = self.interview_service.submit_feedback(
-            interview_id, strengths, weaknesses, technical_score,
-            communication_score, culture_fit_score, recommendation, notes
-        )
-        
-        if feedback:
-            # Notificar a través de Kafka
-            await self.kafka_client.send_message(
-                "interview.feedback",
-                {
-                    "interview_id": feedback["id"],
-                    "recommendation": feedback["feedback"]["recommendation"]
-                }
+        with self._workflow("register_interview_feedback") as trace:
+            feedback = await trace.step(
+                "interview.submit_feedback",
+                self.interview_service.submit_feedback(
+                    interview_id, strengths, weaknesses, technical_score,
+                    communication_score, culture_fit_score, recommendation, notes
+                )
             )
+        
+            if feedback:
+                # Notificar a través de Kafka
+                self.publish_event(
+                    "interview.feedback",
+                    {
+                        "interview_id": feedback["id"],
+                        "recommendation": feedback["feedback"]["recommendation"]
+                    },
+                    key=feedback["candidateId"]
+                )
             
-        return feedback
+            return feedback
     
     async def generate_selection_report(self, selection_id, technical_evaluation, hr_evaluation, additional_notes=""):
         """
@@ -292,21 +474,26 @@ class RecruitmentController:
         Returns:
             dict: Información del reporte generado
         """
-        report = self.selection_service.generate_final_report(
-            selection_id, technical_evaluation, hr_evaluation, additional_notes
-        )
-        
-        if report:
-            # Notificar a través de Kafka
-            await self.kafka_client.send_message(
-                "selection.report",
-                {
-                    "selection_id": report["id"],
-                    "status": report["status"]
-                }
+        with self._workflow("generate_selection_report") as trace:
+            report = await trace.step(
+                "selection.generate_final_report",
+                self.selection_service.generate_final_report(
+                    selection_id, technical_evaluation, hr_evaluation, additional_notes
+                )
             )
+        
+            if report:
+                # Notificar a través de Kafka
+                self.publish_event(
+                    "selection.report",
+                    {
+                        "selection_id": report["id"],
+                        "status": report["status"]
+                    },
+                    key=report["candidateId"]
+                )
             
-        return report
+            return report
     
     async def make_final_decision(self, selection_id, decision, reason=""):
         """
@@ -320,30 +507,50 @@ class RecruitmentController:
         Returns:
             dict: Información actualizada del proceso
         """
-        result = self.selection_service.make_hiring_decision(
-            selection_id, decision, reason
-        )
+        with self._workflow("make_final_decision") as trace:
+            # Si se va a contratar, la consulta del proceso no depende de la decisión:
+            # ambas operaciones viajan en un solo lote y el servicio las ejecuta en paralelo
+            selection = None
+            if decision == "HIRE":
+                result, selection = await trace.step(
+                    "selection.make_hiring_decision+get_selection_process",
+                    self.selection_service.make_hiring_decision_with_process(
+                        selection_id, decision, reason
+                    ),
+                    default=(None, None)
+                )
+            else:
+                result = await trace.step(
+                    "selection.make_hiring_decision",
+                    self.selection_service.make_hiring_decision(
+                        selection_id, decision, reason
+                    )
+                )
         
-        if result:
+            if not result:
+                return result
+            
             # Notificar a través de Kafka
-            await self.kafka_client.send_message(
+            self.publish_event(
                 "selection.decision",
                 {
                     "selection_id": result["id"],
                     "decision": result["decision"]
-                }
+                },
+                key=result["candidateId"]
             )
             
-            # Si se decidió contratar, cerrar la vacante
-            if decision == "HIRE":
-                # Obtener la vacante asociada al proceso de selección
-                selection = self.selection_service.get_selection_process(result["id"])
-                if selection:
-                    vacancy_id = selection.get("vacancyId")
-                    if vacancy_id:
+            # Si se decidió contratar, cerrar la vacante asociada al proceso de selección
+            if selection:
+                vacancy_id = selection.get("vacancyId")
+                if vacancy_id:
+                    await trace.step(
+                        "vacancy.close_vacancy",
                         self.vacancy_service.close_vacancy(vacancy_id, "FILLED")
+                    )
+                    self.cache.invalidate("vacancy", vacancy_id)
             
-        return result
+            return result
     
     async def close_vacancy_without_hiring(self, vacancy_id, reason="CANCELLED"):
         """
@@ -356,17 +563,21 @@ class RecruitmentController:
         Returns:
             dict: Información de la vacante cerrada
         """
-        result = self.vacancy_service.close_vacancy(vacancy_id, reason)
+        with self._workflow("close_vacancy_without_hiring") as trace:
+            result = await trace.step("vacancy.close_vacancy", self.vacancy_service.close_vacancy(vacancy_id, reason))
         
-        if result:
-            # Notificar a través de Kafka
-            await self.kafka_client.send_message(
-                "vacancy.closed",
-                {
-                    "vacancy_id": result["id"],
-                    "status": result["status"],
-                    "reason": reason
-                }
-            )
+            if result:
+                self.cache.invalidate("vacancy", vacancy_id)
+                
+                # Notificar a través de Kafka
+                self.publish_event(
+                    "vacancy.closed",
+                    {
+                        "vacancy_id": result["id"],
+                        "status": result["status"],
+                        "reason": reason
+                    },
+                    key=result["id"]
+                )
             
-        return result 
\ No newline at end of file
+            return result 
\ No newline at end of file
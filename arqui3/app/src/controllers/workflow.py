@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+class WorkflowTrace:
+    """Traza de un flujo del controlador: tiempos de cada paso y su ruta crítica"""
+
+    def __init__(self, name):
+        self.name = name
+        self.started_at = time.perf_counter()
+        self.duration_ms = None
+        self.steps = []
+
+    def _elapsed_ms(self):
+        return (time.perf_counter() - self.started_at) * 1000
+
+    async def step(self, name, awaitable, timeout=None, default=None):
+        """
+        Ejecuta un paso con tiempo límite y registra su duración.
+
+        Args:
+            name (str): Nombre del paso
+            awaitable: Corrutina del paso
+            timeout (float, optional): Tiempo límite en segundos (por defecto WORKFLOW_STEP_TIMEOUT)
+            default (optional): Valor devuelto si se agota el tiempo límite
+
+        Returns:
+            El resultado del paso, o default si se agotó el tiempo límite
+        """
+        start_ms = self._elapsed_ms()
+        status = "ok"
+        try:
+            return await asyncio.wait_for(awaitable, timeout or Config.WORKFLOW_STEP_TIMEOUT)
+        except asyncio.TimeoutError:
+            status = "timeout"
+            logger.error(f"Tiempo límite agotado en el paso {name} del flujo {self.name}")
+            return default
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            self.steps.append({
+                "step": name,
+                "start_ms": round(start_ms, 2),
+                "end_ms": round(self._elapsed_ms(), 2),
+                "status": status
+            })
+
+    def finish(self):
+        self.duration_ms = round(self._elapsed_ms(), 2)
+        return self
+
+    def critical_path(self):
+        """Cadena de pasos que determinó la duración total del flujo"""
+        remaining = sorted(self.steps, key=lambda s: s["end_ms"])
+        path = []
+        horizon = float("inf")
+        while remaining:
+            candidates = [s for s in remaining if s["end_ms"] <= horizon]
+            if not candidates:
+                break
+            last = candidates[-1]
+            path.append(last["step"])
+            horizon = last["start_ms"]
+            remaining = [s for s in remaining if s["end_ms"] <= horizon and s is not last]
+        return list(reversed(path))
+
+    def to_dict(self):
+        return {
+            "workflow": self.name,
+            "duration_ms": self.duration_ms,
+            "critical_path": self.critical_path(),
+            "steps": self.steps
+        }
+
+class TraceRecorder:
+    """Guarda las últimas trazas de cada flujo para benchmarks y /metrics"""
+
+    def __init__(self, size=None):
+        self.size = size or Config.WORKFLOW_TRACE_SIZE
+        self.traces = {}
+
+    def record(self, trace):
+        self.traces.setdefault(trace.name, deque(maxlen=self.size)).append(trace.finish())
+
+    def summary(self):
+        result = {}
+        for name, traces in self.traces.items():
+            durations = sorted(t.duration_ms for t in traces)
+            result[name] = {
+                "count": len(durations),
+                "avg_ms": round(sum(durations) / len(durations), 2),
+                "max_ms": durations[-1],
+                "last": traces[-1].to_dict()
+            }
+        return result
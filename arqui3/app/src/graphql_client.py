@@ -1,63 +1,357 @@
-import requests
-import json
+import asyncio
 import logging
+import time
+import aiohttp
 from .config import Config
+from .persisted_queries import registry, is_persisted_query_not_found
+from .resilience import CircuitBreaker, LatencyWindow
+from .encoding import loads
+from .metrics import DOWNSTREAM_DURATION, GRAPHQL_DURATION, GRAPHQL_ERRORS, GRAPHQL_OPERATIONS, operation_name
 
 logger = logging.getLogger(__name__)
 
+class PoolStats:
+    """Métricas de uso del pool de conexiones de un servicio"""
+
+    def __init__(self, limit, service_name="unknown"):
+        self.limit = limit
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.persisted_misses = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.batches = 0
+        self.batched_operations = 0
+        self.total_latency = 0.0
+        self.latencies = LatencyWindow()
+        # Series del histograma ya resueltas para no buscar etiquetas en cada petición
+        self.ok_latency = DOWNSTREAM_DURATION.labels(service_name, "ok")
+        self.error_latency = DOWNSTREAM_DURATION.labels(service_name, "error")
+
+    def begin(self):
+        """Registra el inicio de una petición y devuelve el instante de inicio"""
+        self.in_flight += 1
+        self.requests += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return time.perf_counter()
+
+    def end(self, started_at, error=False, timeout=False):
+        """Registra el fin de una petición y devuelve su latencia en segundos"""
+        latency = time.perf_counter() - started_at
+        self.in_flight -= 1
+        self.total_latency += latency
+        if error:
+            self.errors += 1
+            self.error_latency.observe(latency)
+        if timeout:
+            self.timeouts += 1
+        if not error:
+            self.latencies.add(latency)
+            self.ok_latency.observe(latency)
+        return latency
+
+    def to_dict(self):
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "persisted_misses": self.persisted_misses,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "batches": self.batches,
+            "batched_operations": self.batched_operations,
+            "avg_latency_ms": round(self.total_latency / self.requests * 1000, 2) if self.requests else 0.0,
+            **self.latencies.to_dict()
+        }
+
 class GraphQLClient:
-    """Cliente para realizar consultas GraphQL a los microservicios"""
-    
-    def __init__(self, service_name="gateway"):
+    """Cliente asíncrono para realizar consultas GraphQL a los microservicios"""
+
+    def __init__(self, service_name, session, stats, breaker=None):
         """
         Inicializa el cliente GraphQL.
-        
+
         Args:
-            service_name (str): Nombre del servicio a consultar 
+            service_name (str): Nombre del servicio a consultar
                                (requisition, vacancy, candidate, evaluation, interview, selection, gateway)
+            session (aiohttp.ClientSession): Sesión compartida con el pool keep-alive del servicio
+            stats (PoolStats): Métricas del pool del servicio
+            breaker (CircuitBreaker, optional): Circuit breaker del servicio
         """
+        self.service_name = service_name
         self.service_url = Config.get_service_url(service_name)
         self.graphql_endpoint = f"{self.service_url}/graphql"
-        logger.info(f"Inicializando cliente GraphQL para {service_name} en {self.graphql_endpoint}")
-    
-    def execute_query(self, query, variables=None):
+        self.session = session
+        self.stats = stats
+        self.breaker = breaker or CircuitBreaker(service_name)
+
+    async def execute_query(self, query, variables=None, idempotent=True):
         """
         Ejecuta una consulta GraphQL.
-        
+
         Args:
             query (str): Consulta GraphQL a ejecutar
             variables (dict, optional): Variables para la consulta
-            
+            idempotent (bool, optional): Si es una lectura que admite reintentos en paralelo (hedging)
+
         Returns:
             dict: Respuesta de la consulta GraphQL
         """
-        headers = {"Content-Type": "application/json"}
-        payload = {"query": query}
-        
+        operation = operation_name(query)
+        started_at = time.perf_counter()
+        result = await self._execute(query, variables, idempotent)
+        GRAPHQL_OPERATIONS.labels(self.service_name, operation).inc()
+        GRAPHQL_DURATION.labels(self.service_name, operation).observe(time.perf_counter() - started_at)
+        if result.get("errors"):
+            GRAPHQL_ERRORS.labels(self.service_name, operation).inc()
+        return result
+
+    async def _execute(self, query, variables, idempotent):
+        """Envía la consulta, primero solo con su hash si las persisted queries están activas"""
+        payload = {}
+
         if variables:
             payload["variables"] = variables
-            
-        try:
-            response = requests.post(
-                self.graphql_endpoint,
-                headers=headers,
-                data=json.dumps(payload)
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error en la consulta GraphQL: {str(e)}")
-            return {"errors": [{"message": str(e)}]}
-            
-    def execute_mutation(self, mutation, variables=None):
+
+        if Config.PERSISTED_QUERIES_ENABLED:
+            # Primero solo el hash; el texto se envía únicamente si el servicio no lo conoce
+            payload["extensions"] = {
+                "persistedQuery": {"version": 1, "sha256Hash": registry.hash_for(query)}
+            }
+            result = await self._send(payload, idempotent)
+            if not is_persisted_query_not_found(result):
+                return result
+            self.stats.persisted_misses += 1
+
+        payload["query"] = query
+        return await self._send(payload, idempotent)
+
+    async def execute_batch(self, operations, idempotent=False):
+        """
+        Ejecuta varias operaciones en una sola petición HTTP (lote).
+
+        El servicio ejecuta las operaciones del lote en paralelo, así que deben ser
+        independientes entre sí. Los errores de una operación no afectan a las demás.
+
+        Args:
+            operations (list): Operaciones a ejecutar [(query, variables)]
+            idempotent (bool, optional): Si todas son lecturas que admiten reintentos en paralelo (hedging)
+
+        Returns:
+            list: Respuesta de cada operación, en el mismo orden
+        """
+        started_at = time.perf_counter()
+        results = await self._execute_batch(operations, idempotent)
+        duration = time.perf_counter() - started_at
+        self.stats.batches += 1
+        self.stats.batched_operations += len(operations)
+        for (query, _), result in zip(operations, results):
+            operation = operation_name(query)
+            GRAPHQL_OPERATIONS.labels(self.service_name, operation).inc()
+            GRAPHQL_DURATION.labels(self.service_name, operation).observe(duration)
+            if result.get("errors"):
+                GRAPHQL_ERRORS.labels(self.service_name, operation).inc()
+        return results
+
+    async def _execute_batch(self, operations, idempotent):
+        """Envía el lote; con persisted queries, reenvía con el texto solo las operaciones que el servicio no conocía"""
+        payloads = []
+        for query, variables in operations:
+            payload = {}
+            if variables:
+                payload["variables"] = variables
+            if Config.PERSISTED_QUERIES_ENABLED:
+                payload["extensions"] = {
+                    "persistedQuery": {"version": 1, "sha256Hash": registry.hash_for(query)}
+                }
+            else:
+                payload["query"] = query
+            payloads.append(payload)
+
+        results = await self._send_batch(payloads, idempotent)
+        if not Config.PERSISTED_QUERIES_ENABLED:
+            return results
+
+        missing = [index for index, result in enumerate(results) if is_persisted_query_not_found(result)]
+        if missing:
+            self.stats.persisted_misses += len(missing)
+            for index in missing:
+                payloads[index]["query"] = operations[index][0]
+            retried = await self._send_batch([payloads[index] for index in missing], idempotent)
+            for index, result in zip(missing, retried):
+                results[index] = result
+        return results
+
+    async def _send_batch(self, payloads, idempotent):
+        """Envía el lote; si falla la petición completa, cada operación recibe el mismo error"""
+        result = await self._send(payloads, idempotent)
+        if isinstance(result, list) and len(result) == len(payloads):
+            return result
+        if not isinstance(result, dict) or not result.get("errors"):
+            result = {"errors": [{"message": f"Respuesta de lote no válida de {self.service_name}"}]}
+        return [dict(result) for _ in payloads]
+
+    async def execute_mutation(self, mutation, variables=None):
         """
         Ejecuta una mutación GraphQL.
-        
+
         Args:
             mutation (str): Mutación GraphQL a ejecutar
             variables (dict, optional): Variables para la mutación
-            
+
         Returns:
             dict: Respuesta de la mutación GraphQL
         """
-        return self.execute_query(mutation, variables) 
\ No newline at end of file
+        return await self.execute_query(mutation, variables, idempotent=False)
+
+    async def _send(self, payload, idempotent):
+        """Envía la petición respetando el circuit breaker; los errores de transporte se devuelven como errores GraphQL"""
+        if not self.breaker.allow():
+            message = f"Servicio {self.service_name} no disponible temporalmente (circuito abierto)"
+            logger.warning(message)
+            return {"errors": [{"message": message}]}
+
+        try:
+            if idempotent and Config.HEDGE_ENABLED:
+                return await self._hedged_request(payload)
+            return await self._request(payload)
+        except asyncio.TimeoutError:
+            message = f"Tiempo de espera agotado al consultar {self.service_name}"
+            logger.error(f"Error en la consulta GraphQL: {message}")
+            return {"errors": [{"message": message}]}
+        except aiohttp.ClientError as e:
+            logger.error(f"Error en la consulta GraphQL: {str(e)}")
+            return {"errors": [{"message": str(e)}]}
+
+    async def _request(self, payload):
+        """Realiza la petición HTTP y registra su resultado en las métricas y en el breaker"""
+        started_at = self.stats.begin()
+        try:
+            async with self.session.post(self.graphql_endpoint, json=payload) as response:
+                response.raise_for_status()
+                result = await response.json(loads=loads)
+        except asyncio.TimeoutError:
+            self.stats.end(started_at, error=True, timeout=True)
+            self.breaker.record(False)
+            raise
+        except aiohttp.ClientError:
+            self.stats.end(started_at, error=True)
+            self.breaker.record(False)
+            raise
+        except asyncio.CancelledError:
+            self.stats.end(started_at)
+            self.breaker.release()
+            raise
+
+        self.breaker.record(True, self.stats.end(started_at))
+        return result
+
+    async def _hedged_request(self, payload):
+        """
+        Lanza la petición y, si no responde antes del p95 del servicio, lanza una
+        segunda; se usa la primera respuesta correcta y se cancela la otra.
+        """
+        primary = asyncio.ensure_future(self._request(payload))
+        delay = self._hedge_delay()
+        if delay is None:
+            return await primary
+
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            # asyncio.wait no cancela la tarea al cancelarse quien espera
+            primary.cancel()
+            raise
+        if done or not self.breaker.allow():
+            return await primary
+
+        self.stats.hedged += 1
+        hedge = asyncio.ensure_future(self._request(payload))
+        pending = {primary, hedge}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.stats.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _hedge_delay(self):
+        """Espera antes del reintento en paralelo: el p95 reciente, si hay muestras suficientes"""
+        if len(self.stats.latencies) < Config.HEDGE_MIN_SAMPLES:
+            return None
+        return max(self.stats.latencies.percentile(0.95), Config.HEDGE_MIN_DELAY)
+
+class GraphQLClientPool:
+    """Registro de clientes GraphQL con un pool de conexiones keep-alive por servicio"""
+
+    SERVICES = ("requisition", "vacancy", "candidate", "evaluation", "interview", "selection", "gateway")
+
+    def __init__(self):
+        self.sessions = {}
+        self.clients = {}
+        self.stats = {}
+        self.breakers = {}
+
+    async def start(self):
+        """Crea una sesión HTTP por servicio. Debe llamarse una sola vez al iniciar la aplicación"""
+        registry.load()
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=Config.GRAPHQL_CONNECT_TIMEOUT,
+            sock_read=Config.GRAPHQL_READ_TIMEOUT
+        )
+        for service_name in self.SERVICES:
+            limit = Config.get_service_pool_limit(service_name)
+            connector = aiohttp.TCPConnector(
+                limit=limit,
+                keepalive_timeout=Config.GRAPHQL_KEEPALIVE_TIMEOUT
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers={"Content-Type": "application/json"}
+            )
+            stats = PoolStats(limit, service_name)
+            breaker = CircuitBreaker(service_name)
+            self.sessions[service_name] = session
+            self.stats[service_name] = stats
+            self.breakers[service_name] = breaker
+            self.clients[service_name] = GraphQLClient(service_name, session, stats, breaker)
+            logger.info(f"Pool GraphQL para {service_name} iniciado (límite {limit} conexiones)")
+
+    def get_client(self, service_name):
+        """Devuelve el cliente compartido del servicio solicitado"""
+        client = self.clients.get(service_name.lower())
+        if client is None:
+            raise RuntimeError(f"El pool GraphQL para {service_name} no está iniciado")
+        return client
+
+    async def close(self):
+        """Cierra todas las sesiones y sus conexiones"""
+        for session in self.sessions.values():
+            await session.close()
+        self.sessions.clear()
+        self.clients.clear()
+        logger.info("Pools GraphQL cerrados")
+
+    def metrics(self):
+        """Devuelve las métricas de uso de cada pool"""
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
+
+    def breaker_metrics(self):
+        """Devuelve el estado del circuit breaker de cada servicio"""
+        return {name: breaker.to_dict() for name, breaker in self.breakers.items()}
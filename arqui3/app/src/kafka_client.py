@@ -1,11 +1,108 @@
 import json
 import logging
 import asyncio
+import time
 from aiokafka import AIOKafkaProducer, AIOKafkaConsumer
+from aiokafka.abc import ConsumerRebalanceListener
 from .config import Config
+from .metrics import KAFKA_SEND_DURATION
 
 logger = logging.getLogger(__name__)
 
+class PartitionedConsumer(ConsumerRebalanceListener):
+    """
+    Runtime de consumo por lotes para un topic.
+    
+    Cada partición asignada tiene una cola de lotes y un worker que procesa sus mensajes en
+    orden; un semáforo limita cuántas particiones se procesan a la vez. El offset de una
+    partición se confirma manualmente solo después de procesar su lote completo, y la
+    partición se pausa mientras su cola está llena. La entrega es "al menos una vez".
+    """
+    
+    def __init__(self, topic, consumer, callback):
+        self.topic = topic
+        self.consumer = consumer
+        self.callback = callback
+        self.task = None
+        self.semaphore = asyncio.Semaphore(Config.KAFKA_CONSUMER_WORKERS)
+        self.queues = {}
+        self.workers = {}
+        self.paused = set()
+        
+    async def run(self):
+        """Bucle principal: lee lotes y los reparte en las colas de cada partición"""
+        try:
+            self.consumer.subscribe([self.topic], listener=self)
+            await self.consumer.start()
+            while True:
+                batches = await self.consumer.getmany(
+                    timeout_ms=Config.KAFKA_CONSUMER_POLL_TIMEOUT_MS,
+                    max_records=Config.KAFKA_CONSUMER_MAX_RECORDS
+                )
+                for tp, records in batches.items():
+                    if records:
+                        await self._dispatch(tp, records)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Error en consumidor de {self.topic}: {e}")
+        finally:
+            self._stop_workers(list(self.workers.keys()))
+            await self.consumer.stop()
+    
+    async def stop(self):
+        """Detiene el bucle de consumo y los workers de las particiones"""
+        if self.task:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+    
+    async def _dispatch(self, tp, records):
+        queue = self.queues.get(tp)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=Config.KAFKA_CONSUMER_QUEUE_SIZE)
+            self.queues[tp] = queue
+            self.workers[tp] = asyncio.create_task(self._partition_worker(tp, queue))
+        await queue.put(records)
+        if queue.full() and tp not in self.paused:
+            # Dejar de leer la partición hasta que su worker libere espacio
+            self.consumer.pause(tp)
+            self.paused.add(tp)
+    
+    async def _partition_worker(self, tp, queue):
+        """Procesa en orden los lotes de una partición y confirma su offset al terminar cada lote"""
+        while True:
+            records = await queue.get()
+            async with self.semaphore:
+                for record in records:
+                    try:
+                        await self.callback(record.value)
+                    except Exception as e:
+                        logger.error(f"Error en callback de consumidor ({tp.topic}[{tp.partition}]@{record.offset}): {e}")
+            try:
+                await self.consumer.commit({tp: records[-1].offset + 1})
+            except Exception as e:
+                logger.error(f"Error al confirmar offset de {tp.topic}[{tp.partition}]: {e}")
+            queue.task_done()
+            if tp in self.paused and queue.empty():
+                self.consumer.resume(tp)
+                self.paused.discard(tp)
+    
+    def _stop_workers(self, partitions):
+        for tp in partitions:
+            worker = self.workers.pop(tp, None)
+            if worker:
+                worker.cancel()
+            self.queues.pop(tp, None)
+            self.paused.discard(tp)
+    
+    async def on_partitions_revoked(self, revoked):
+        # Los lotes sin confirmar de estas particiones se volverán a entregar al nuevo dueño
+        self._stop_workers(revoked)
+    
+    async def on_partitions_assigned(self, assigned):
+        pass
+
 class KafkaClient:
     """Cliente para la comunicación asíncrona con Apache Kafka"""
     
@@ -16,54 +113,158 @@ class KafkaClient:
         self.consumers = {}
         self.kafka_enabled = True  # Flag para controlar si Kafka está habilitado
         
+        # Modo de publicación asíncrona: los mensajes se encolan y un sender los envía en lotes
+        self.async_publish = Config.KAFKA_ASYNC_PUBLISH
+        self.buffer = None
+        self.sender_task = None
+        self.delivery_callbacks = []
+        self.stats = {"enqueued": 0, "delivered": 0, "failed": 0, "dropped": 0}
+        
     async def start_producer(self):
         """Inicia el productor de Kafka"""
         try:
             self.producer = AIOKafkaProducer(
                 bootstrap_servers=self.bootstrap_servers,
-                value_serializer=lambda v: json.dumps(v).encode('utf-8')
+                value_serializer=lambda v: json.dumps(v).encode('utf-8'),
+                key_serializer=lambda k: str(k).encode('utf-8') if k is not None else None,
+                linger_ms=Config.KAFKA_LINGER_MS,
+                max_batch_size=Config.KAFKA_MAX_BATCH_SIZE,
+                compression_type=Config.KAFKA_COMPRESSION_TYPE or None
             )
             await self.producer.start()
-            logger.info("Productor Kafka iniciado")
+            if self.async_publish:
+                self.buffer = asyncio.Queue(maxsize=Config.KAFKA_BUFFER_SIZE)
+                self.sender_task = asyncio.create_task(self._drain_buffer())
+            logger.info(f"Productor Kafka iniciado (publicación asíncrona: {self.async_publish})")
         except Exception as e:
             logger.warning(f"No se pudo iniciar el productor Kafka: {e}")
             self.kafka_enabled = False
             logger.info("La aplicación funcionará sin Kafka")
     
     async def stop_producer(self):
-        """Detiene el productor de Kafka"""
+        """Vacía el buffer pendiente y detiene el productor de Kafka"""
         if self.producer and self.kafka_enabled:
+            if self.sender_task:
+                try:
+                    await asyncio.wait_for(self.buffer.join(), timeout=Config.KAFKA_FLUSH_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.warning(f"{self.buffer.qsize()} mensajes Kafka sin enviar al detener el productor")
+                self.sender_task.cancel()
+                self.sender_task = None
+            await self.producer.flush()
             await self.producer.stop()
             logger.info("Productor Kafka detenido")
     
-    async def send_message(self, topic_suffix, message):
+    def add_delivery_callback(self, callback):
+        """
+        Registra una función a llamar cuando se confirma (o falla) la entrega de un mensaje.
+        
+        Args:
+            callback (callable): Función callback(topic, message, metadata, error)
+        """
+        self.delivery_callbacks.append(callback)
+    
+    async def send_message(self, topic_suffix, message, key=None):
         """
         Envía un mensaje a un topic de Kafka.
         
+        En modo asíncrono el mensaje solo se encola y el método retorna de inmediato;
+        los mensajes con la misma clave se entregan en orden a la misma partición.
+        
         Args:
             topic_suffix (str): Sufijo del topic (ej. "requisition.created")
             message (dict): Mensaje a enviar
+            key (optional): Clave de partición (ej. el ID del candidato o de la vacante)
             
         Returns:
-            bool: True si el mensaje se envió correctamente, False en caso contrario
+            bool: True si el mensaje se envió (o encoló) correctamente, False en caso contrario
         """
         if not self.kafka_enabled or not self.producer:
             logger.warning(f"Kafka no está disponible. Mensaje no enviado: {topic_suffix}")
             return False
             
+        topic = f"{self.topic_prefix}.{topic_suffix}"
+        
+        if self.sender_task:
+            try:
+                self.buffer.put_nowait((topic, message, key, time.perf_counter()))
+                self.stats["enqueued"] += 1
+                return True
+            except asyncio.QueueFull:
+                self.stats["dropped"] += 1
+                logger.error(f"Buffer Kafka lleno. Mensaje descartado: {topic}")
+                return False
+            
+        started_at = time.perf_counter()
         try:
-            topic = f"{self.topic_prefix}.{topic_suffix}"
-            await self.producer.send_and_wait(topic, message)
+            await self.producer.send_and_wait(topic, message, key=key)
+            self.stats["delivered"] += 1
+            KAFKA_SEND_DURATION.labels("delivered").observe(time.perf_counter() - started_at)
             logger.info(f"Mensaje enviado a {topic}: {message}")
             return True
         except Exception as e:
+            self.stats["failed"] += 1
+            KAFKA_SEND_DURATION.labels("failed").observe(time.perf_counter() - started_at)
             logger.error(f"Error al enviar mensaje a {topic_suffix}: {e}")
             return False
     
+    async def _drain_buffer(self):
+        """Proceso interno que pasa los mensajes encolados al acumulador de lotes del productor"""
+        while True:
+            topic, message, key, enqueued_at = await self.buffer.get()
+            try:
+                # send() solo espera a que el mensaje entre en el lote; la entrega se confirma en el callback
+                future = await self.producer.send(topic, message, key=key)
+                future.add_done_callback(
+                    lambda f, topic=topic, message=message, enqueued_at=enqueued_at:
+                        self._on_delivery(topic, message, f, enqueued_at)
+                )
+            except Exception as e:
+                self._notify_delivery(topic, message, None, e, enqueued_at)
+            finally:
+                self.buffer.task_done()
+    
+    def _on_delivery(self, topic, message, future, enqueued_at):
+        """Callback interno de confirmación de entrega"""
+        if future.cancelled():
+            self._notify_delivery(topic, message, None, asyncio.CancelledError(), enqueued_at)
+        elif future.exception():
+            self._notify_delivery(topic, message, None, future.exception(), enqueued_at)
+        else:
+            self._notify_delivery(topic, message, future.result(), None, enqueued_at)
+    
+    def _notify_delivery(self, topic, message, metadata, error, enqueued_at):
+        # Latencia completa: espera en el buffer, en el lote del productor y confirmación del broker
+        latency = time.perf_counter() - enqueued_at
+        if error is None:
+            self.stats["delivered"] += 1
+            KAFKA_SEND_DURATION.labels("delivered").observe(latency)
+        else:
+            self.stats["failed"] += 1
+            KAFKA_SEND_DURATION.labels("failed").observe(latency)
+            logger.error(f"Error al entregar mensaje a {topic}: {error}")
+        for callback in self.delivery_callbacks:
+            try:
+                callback(topic, message, metadata, error)
+            except Exception as e:
+                logger.error(f"Error en callback de entrega: {e}")
+    
+    def metrics(self):
+        """Devuelve los contadores de publicación del productor"""
+        return {
+            **self.stats,
+            "async_publish": self.async_publish,
+            "buffer_size": self.buffer.qsize() if self.buffer else 0,
+            "buffer_capacity": Config.KAFKA_BUFFER_SIZE
+        }
+    
     async def start_consumer(self, topic_suffix, callback):
         """
         Inicia un consumidor para un topic específico.
         
+        Los mensajes se leen en lotes con getmany(); cada partición se procesa en orden
+        y las particiones se procesan en paralelo (hasta KAFKA_CONSUMER_WORKERS a la vez).
+        
         Args:
             topic_suffix (str): Sufijo del topic (ej. "requisition.created")
             callback (callable): Función a llamar cuando se recibe un mensaje
@@ -78,37 +279,24 @@ class KafkaClient:
         try:
             topic = f"{self.topic_prefix}.{topic_suffix}"
             consumer = AIOKafkaConsumer(
-                topic,
                 bootstrap_servers=self.bootstrap_servers,
                 group_id=f"recruitment_app",
                 value_deserializer=lambda m: json.loads(m.decode('utf-8')),
-                auto_offset_reset="latest"
+                auto_offset_reset="latest",
+                enable_auto_commit=False
             )
             
-            self.consumers[topic_suffix] = consumer
+            runtime = PartitionedConsumer(topic, consumer, callback)
+            self.consumers[topic_suffix] = runtime
             
             # Iniciar el consumidor en una tarea separada
-            asyncio.create_task(self._consume(consumer, callback))
+            runtime.task = asyncio.create_task(runtime.run())
             logger.info(f"Consumidor iniciado para {topic}")
             return True
         except Exception as e:
             logger.error(f"Error al iniciar consumidor para {topic_suffix}: {e}")
             return False
     
-    async def _consume(self, consumer, callback):
-        """Proceso interno de consumo de mensajes"""
-        try:
-            await consumer.start()
-            async for msg in consumer:
-                try:
-                    await callback(msg.value)
-                except Exception as e:
-                    logger.error(f"Error en callback de consumidor: {e}")
-        except Exception as e:
-            logger.error(f"Error en consumidor: {e}")
-        finally:
-            await consumer.stop()
-    
     async def stop_consumer(self, topic_suffix):
         """Detiene un consumidor específico"""
         if topic_suffix in self.consumers and self.kafka_enabled:
@@ -1,6 +1,6 @@
 import logging
 import os
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -9,7 +9,10 @@ import uvicorn
 from .config import Config
 from .routes import requisition_routes, vacancy_routes, candidate_routes
 from .routes import evaluation_routes, interview_routes, selection_routes
-from .kafka_client import KafkaClient
+from .container import Container
+from .pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
+from .metrics import PrometheusMiddleware, register_container, render_metrics
+from .encoding import CompressionMiddleware, FastJSONResponse
 
 # Configurar logging
 logging.basicConfig(
@@ -22,7 +25,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Sistema de Gestión de Selección de Personal",
     description="Aplicación para gestionar el proceso de selección de personal",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
 # Configurar CORS
@@ -32,8 +36,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER],
 )
 
+# Peticiones por ruta, errores y duración en formato Prometheus
+app.add_middleware(PrometheusMiddleware)
+
+# Comprimir con gzip/brotli las respuestas grandes según Accept-Encoding
+app.add_middleware(CompressionMiddleware)
+
 # Montar archivos estáticos
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -48,16 +59,19 @@ app.include_router(evaluation_routes.router)
 app.include_router(interview_routes.router)
 app.include_router(selection_routes.router)
 
-# Cliente Kafka
-kafka_client = KafkaClient()
+# Contenedor de dependencias compartido por todas las peticiones
+container = Container()
+app.state.container = container
+register_container(container)
 
 @app.on_event("startup")
 async def startup_event():
     """Evento de inicio de la aplicación"""
     logger.info("Iniciando la aplicación...")
     
-    # Iniciar el productor de Kafka
-    await kafka_client.start_producer()
+    # Crear los pools GraphQL, el productor Kafka y el controlador
+    await container.start()
+    kafka_client = container.kafka_client
     
     # Iniciar los consumidores solo si Kafka está habilitado
     if kafka_client.kafka_enabled:
@@ -78,10 +92,8 @@ async def shutdown_event():
     """Evento de cierre de la aplicación"""
     logger.info("Deteniendo la aplicación...")
     
-    # Detener los consumidores y el productor de Kafka
-    if kafka_client.kafka_enabled:
-        await kafka_client.stop_all_consumers()
-    await kafka_client.stop_producer()
+    # Detener Kafka y cerrar los pools de conexiones GraphQL
+    await container.shutdown()
     
     logger.info("Aplicación detenida correctamente")
 
@@ -89,14 +101,22 @@ async def shutdown_event():
 async def handle_requisition_created(message):
     """Manejar evento de requisición creada"""
     logger.info(f"Requisición creada: {message}")
+    container.entity_cache.invalidate("requisition", message.get("requisition_id"))
 
 async def handle_vacancy_published(message):
     """Manejar evento de vacante publicada"""
     logger.info(f"Vacante publicada: {message}")
+    # La publicación cambia la vacante y puede cambiar el estado de su requisición
+    container.entity_cache.invalidate("vacancy", message.get("vacancy_id"))
+    container.entity_cache.invalidate("requisition", message.get("requisition_id"))
 
 async def handle_candidate_registered(message):
     """Manejar evento de candidato registrado"""
     logger.info(f"Candidato registrado: {message}")
+    container.entity_cache.invalidate("candidate", message.get("candidate_id"))
+    # Los registros masivos publican un evento por vacante con todos sus candidatos
+    for candidate in message.get("candidates", []):
+        container.entity_cache.invalidate("candidate", candidate.get("candidate_id"))
 
 @app.get("/")
 async def root(request: Request):
@@ -113,16 +133,19 @@ async def health_check():
 
 @app.get("/metrics")
 async def metrics():
-    """Endpoint para obtener métricas de la aplicación"""
+    """Métricas de la aplicación en formato Prometheus"""
+    body, content_type = render_metrics()
+    return Response(content=body, headers={"Content-Type": content_type})
+
+@app.get("/metrics/summary")
+async def metrics_summary():
+    """Resumen de los pools, breakers, Kafka, controlador y caché en JSON"""
     return {
-        "services": {
-            "requisition": "ok",
-            "vacancy": "ok",
-            "candidate": "ok",
-            "evaluation": "ok",
-            "interview": "ok",
-            "selection": "ok"
-        }
+        "pools": container.graphql_pool.metrics(),
+        "breakers": container.graphql_pool.breaker_metrics(),
+        "kafka": container.kafka_client.metrics(),
+        "controller": container.controller.metrics() if container.controller else {},
+        "cache": container.entity_cache.metrics()
     }
 
 @app.exception_handler(Exception)
@@ -0,0 +1,163 @@
+"""
+Métricas en formato Prometheus de la aplicación.
+
+En el camino de cada petición solo se incrementan contadores e histogramas ya
+creados; el uso de los pools GraphQL y la cola del productor Kafka se leen al
+momento de la recolección (scrape) mediante collectors.
+"""
+import re
+import time
+from functools import lru_cache
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, REGISTRY
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+OPERATION_NAME = re.compile(r"^\s*(?:query|mutation|subscription)\s+(\w+)")
+
+HTTP_REQUESTS = Counter(
+    "app_http_requests_total", "Peticiones HTTP atendidas", ["method", "route", "status"]
+)
+HTTP_ERRORS = Counter(
+    "app_http_request_errors_total", "Peticiones HTTP con error 5xx o excepción", ["method", "route"]
+)
+HTTP_DURATION = Histogram(
+    "app_http_request_duration_seconds", "Duración de las peticiones HTTP", ["method", "route"],
+    buckets=LATENCY_BUCKETS
+)
+GRAPHQL_OPERATIONS = Counter(
+    "app_graphql_operations_total", "Operaciones GraphQL enviadas a los servicios", ["service", "operation"]
+)
+GRAPHQL_ERRORS = Counter(
+    "app_graphql_operation_errors_total", "Operaciones GraphQL con errores", ["service", "operation"]
+)
+GRAPHQL_DURATION = Histogram(
+    "app_graphql_operation_duration_seconds",
+    "Duración de las operaciones GraphQL, con reintentos de persisted queries y hedging",
+    ["service", "operation"],
+    buckets=LATENCY_BUCKETS
+)
+DOWNSTREAM_DURATION = Histogram(
+    "app_downstream_request_duration_seconds", "Latencia de cada petición HTTP a los servicios", ["service", "outcome"],
+    buckets=LATENCY_BUCKETS
+)
+KAFKA_SEND_DURATION = Histogram(
+    "app_kafka_send_duration_seconds",
+    "Tiempo desde que se publica un mensaje hasta que Kafka confirma su entrega",
+    ["outcome"],
+    buckets=LATENCY_BUCKETS
+)
+
+@lru_cache(maxsize=256)
+def operation_name(query):
+    """Nombre de la operación de una consulta GraphQL, o "anonymous" si no lo tiene"""
+    match = OPERATION_NAME.match(query)
+    return match.group(1) if match else "anonymous"
+
+class PrometheusMiddleware:
+    """
+    Middleware ASGI que mide las peticiones HTTP. La ruta es la plantilla del
+    endpoint (no la URL) para acotar las etiquetas.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # El router de FastAPI deja la ruta resuelta en el scope; los estáticos no tienen ruta
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            HTTP_REQUESTS.labels(method, path, status).inc()
+            HTTP_DURATION.labels(method, path).observe(time.perf_counter() - started_at)
+            if status >= 500:
+                HTTP_ERRORS.labels(method, path).inc()
+
+class ContainerCollector:
+    """
+    Uso y latencia de los pools GraphQL, estado de los breakers, caché de
+    entidades y cola del productor Kafka del contenedor
+    """
+
+    def __init__(self, container):
+        self.container = container
+
+    def collect(self):
+        pools = self.container.graphql_pool.metrics()
+        in_flight = GaugeMetricFamily("app_pool_in_flight", "Peticiones en curso hacia el servicio", labels=["service"])
+        max_in_flight = GaugeMetricFamily(
+            "app_pool_max_in_flight", "Máximo de peticiones simultáneas observado", labels=["service"]
+        )
+        limit = GaugeMetricFamily("app_pool_limit", "Conexiones máximas del pool", labels=["service"])
+        timeouts = CounterMetricFamily("app_pool_timeouts", "Peticiones con tiempo agotado", labels=["service"])
+        latency = GaugeMetricFamily(
+            "app_pool_latency_seconds",
+            "Percentiles de latencia de las últimas respuestas correctas del servicio (ventana de LatencyWindow)",
+            labels=["service", "quantile"]
+        )
+        for service, stats in pools.items():
+            in_flight.add_metric([service], stats["in_flight"])
+            max_in_flight.add_metric([service], stats["max_in_flight"])
+            limit.add_metric([service], stats["limit"])
+            timeouts.add_metric([service], stats["timeouts"])
+            for quantile in ("0.5", "0.95", "0.99"):
+                value = stats[f"p{int(float(quantile) * 100)}_ms"]
+                if value is not None:
+                    latency.add_metric([service, quantile], value / 1000)
+        yield from (in_flight, max_in_flight, limit, timeouts, latency)
+
+        breaker_open = GaugeMetricFamily("app_breaker_open", "1 si el circuito del servicio no está cerrado", labels=["service"])
+        error_rate = GaugeMetricFamily(
+            "app_breaker_error_rate", "Fracción de llamadas con error en la ventana del breaker", labels=["service"]
+        )
+        slow_rate = GaugeMetricFamily(
+            "app_breaker_slow_rate", "Fracción de llamadas lentas en la ventana del breaker", labels=["service"]
+        )
+        times_opened = CounterMetricFamily("app_breaker_opened", "Veces que se abrió el circuito", labels=["service"])
+        rejected = CounterMetricFamily("app_breaker_rejected", "Llamadas rechazadas por el circuito", labels=["service"])
+        for service, breaker in self.container.graphql_pool.breaker_metrics().items():
+            breaker_open.add_metric([service], 0 if breaker["state"] == "closed" else 1)
+            error_rate.add_metric([service], breaker["error_rate"])
+            slow_rate.add_metric([service], breaker["slow_rate"])
+            times_opened.add_metric([service], breaker["times_opened"])
+            rejected.add_metric([service], breaker["rejected"])
+        yield from (breaker_open, error_rate, slow_rate, times_opened, rejected)
+
+        cache = self.container.entity_cache.metrics()
+        for name in ("hits", "misses", "evictions", "expirations", "invalidations"):
+            yield CounterMetricFamily(f"app_entity_cache_{name}", f"Caché de entidades: {name}", value=cache[name])
+        yield GaugeMetricFamily("app_entity_cache_size", "Entradas en la caché de entidades", value=cache["size"])
+        yield GaugeMetricFamily("app_entity_cache_max_entries", "Capacidad de la caché de entidades", value=cache["max_entries"])
+        yield GaugeMetricFamily("app_entity_cache_hit_rate", "Fracción de aciertos de la caché de entidades", value=cache["hit_rate"])
+
+        kafka = self.container.kafka_client.metrics()
+        yield GaugeMetricFamily("app_kafka_buffer_size", "Mensajes en la cola del productor Kafka", value=kafka["buffer_size"])
+        yield GaugeMetricFamily("app_kafka_buffer_capacity", "Capacidad de la cola del productor Kafka", value=kafka["buffer_capacity"])
+        messages = CounterMetricFamily("app_kafka_messages", "Mensajes del productor Kafka por resultado", labels=["outcome"])
+        for outcome in ("enqueued", "delivered", "failed", "dropped"):
+            messages.add_metric([outcome], kafka[outcome])
+        yield messages
+
+def register_container(container):
+    """Registra el collector del contenedor en el registro de Prometheus"""
+    REGISTRY.register(ContainerCollector(container))
+
+def render_metrics():
+    """Devuelve (cuerpo, content-type) con todas las métricas registradas"""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
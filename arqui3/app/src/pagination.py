@@ -0,0 +1,35 @@
+"""
+Paginación por cursor de las rutas de listas.
+
+Las rutas piden una página a los campos *Connection del gateway y devuelven la
+lista de nodos como antes; el cursor de la página siguiente y el total (solo si
+se pidió con include_total) van en las cabeceras X-Next-Cursor y X-Total-Count.
+"""
+from typing import Optional
+from fastapi import Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+def page_variables(first: Optional[int] = None, after: Optional[str] = None, include_total: bool = False) -> dict:
+    """Variables $first, $after e $includeTotal de las consultas de páginas"""
+    return {"first": first, "after": after, "includeTotal": include_total}
+
+def page_items(response: Response, connection: Optional[dict]) -> list:
+    """
+    Nodos de una página; fija en la respuesta las cabeceras de paginación.
+
+    Args:
+        response (Response): Respuesta de la ruta
+        connection (dict): Conexión devuelta por el gateway (edges, pageInfo, totalCount)
+
+    Returns:
+        list: Nodos de la página
+    """
+    connection = connection or {}
+    page_info = connection.get("pageInfo") or {}
+    if page_info.get("hasNextPage") and page_info.get("endCursor"):
+        response.headers[NEXT_CURSOR_HEADER] = page_info["endCursor"]
+    if connection.get("totalCount") is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(connection["totalCount"])
+    return [edge["node"] for edge in connection.get("edges") or []]
@@ -0,0 +1,83 @@
+"""
+Consultas persistidas (Automatic Persisted Queries) de los clientes GraphQL.
+
+El cliente envía solo el hash sha256 de la consulta; si el servicio no lo
+conoce responde PersistedQueryNotFound y el cliente reintenta con el texto.
+
+Paso de build (desde el directorio app/):
+    python -m src.persisted_queries
+
+Extrae las consultas estáticas de las clases de src/services/ y genera
+persisted_queries.json ({hash: consulta}). La app lo carga al iniciar y los
+servicios lo precargan si PERSISTED_QUERIES_FILE apunta a él.
+"""
+import ast
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = Path(__file__).parent.parent / "persisted_queries.json"
+SERVICES_DIR = Path(__file__).parent / "services"
+NOT_FOUND_MESSAGE = "PersistedQueryNotFound"
+
+def query_hash(query):
+    """Hash sha256 del texto de la consulta"""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+def is_persisted_query_not_found(response):
+    """Indica si el servicio no tenía registrada la consulta enviada por hash"""
+    return any(error.get("message") == NOT_FOUND_MESSAGE for error in response.get("errors") or [])
+
+class PersistedQueryRegistry:
+    """Hashes de las consultas conocidas, para no recalcularlos en cada petición"""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def load(self, path=MANIFEST_PATH):
+        """Carga el manifiesto generado por el paso de build, si existe"""
+        path = Path(path)
+        if not path.exists():
+            logger.info("Sin manifiesto de consultas persistidas; los hashes se calcularán al usarse")
+            return
+        with open(path, encoding="utf-8") as file:
+            manifest = json.load(file)
+        for sha256_hash, query in manifest.items():
+            self.hashes[query] = sha256_hash
+        logger.info(f"{len(manifest)} consultas persistidas cargadas desde {path}")
+
+    def hash_for(self, query):
+        sha256_hash = self.hashes.get(query)
+        if sha256_hash is None:
+            sha256_hash = self.hashes[query] = query_hash(query)
+        return sha256_hash
+
+registry = PersistedQueryRegistry()
+
+def extract_queries(directory=SERVICES_DIR):
+    """Devuelve las consultas asignadas a variables query/mutation (o constantes *_QUERY/*_MUTATION) en los módulos de servicios"""
+    queries = []
+    for path in sorted(Path(directory).glob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Assign):
+                continue
+            names = {target.id for target in node.targets if isinstance(target, ast.Name)}
+            value = node.value
+            is_query = any(name in ("query", "mutation") or name.endswith(("_QUERY", "_MUTATION")) for name in names)
+            if is_query and isinstance(value, ast.Constant) and isinstance(value.value, str):
+                queries.append(value.value)
+    return queries
+
+def build(path=MANIFEST_PATH):
+    """Genera el manifiesto de consultas persistidas"""
+    manifest = {query_hash(query): query for query in extract_queries()}
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2, ensure_ascii=False, sort_keys=True)
+    print(f"{len(manifest)} consultas registradas en {path}")
+
+if __name__ == "__main__":
+    build()
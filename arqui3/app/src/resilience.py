@@ -0,0 +1,153 @@
+import logging
+import time
+from collections import deque
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+class LatencyWindow:
+    """Últimas latencias observadas de un servicio, para calcular percentiles"""
+
+    # Los percentiles se recalculan cada REFRESH_EVERY muestras para no ordenar en cada petición
+    REFRESH_EVERY = 50
+
+    def __init__(self, size=None):
+        self.samples = deque(maxlen=size or Config.LATENCY_WINDOW_SIZE)
+        self.ordered = None
+        self.pending_samples = 0
+
+    def add(self, latency):
+        self.samples.append(latency)
+        self.pending_samples += 1
+
+    def __len__(self):
+        return len(self.samples)
+
+    def percentile(self, fraction):
+        """Devuelve el percentil en segundos, o None si no hay muestras"""
+        if not self.samples:
+            return None
+        if self.ordered is None or self.pending_samples >= self.REFRESH_EVERY:
+            self.ordered = sorted(self.samples)
+            self.pending_samples = 0
+        index = min(int(fraction * len(self.ordered)), len(self.ordered) - 1)
+        return self.ordered[index]
+
+    def to_dict(self):
+        return {
+            f"p{int(fraction * 100)}_ms": round(value * 1000, 2) if value is not None else None
+            for fraction, value in ((f, self.percentile(f)) for f in (0.5, 0.95, 0.99))
+        }
+
+class CircuitBreaker:
+    """
+    Circuit breaker de un servicio según la tasa de errores y de llamadas lentas
+    en una ventana deslizante de tiempo.
+
+    - closed: deja pasar todas las llamadas.
+    - open: rechaza las llamadas de inmediato durante BREAKER_OPEN_SECONDS.
+    - half_open: deja pasar BREAKER_HALF_OPEN_CALLS llamadas de prueba; si
+      todas salen bien se cierra y, si alguna falla, se vuelve a abrir.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, service_name):
+        self.service_name = service_name
+        self.state = self.CLOSED
+        self.calls = deque()
+        # Contadores de la ventana: suben al añadir una llamada y bajan al descartarla
+        self.window_errors = 0
+        self.window_slow = 0
+        self.opened_at = None
+        self.trial_calls = 0
+        self.trial_successes = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    def _trim(self, now):
+        limit = now - Config.BREAKER_WINDOW_SECONDS
+        while self.calls and self.calls[0][0] < limit:
+            _, success, slow = self.calls.popleft()
+            self.window_errors -= not success
+            self.window_slow -= slow
+
+    def _clear(self):
+        self.calls.clear()
+        self.window_errors = 0
+        self.window_slow = 0
+
+    def allow(self):
+        """Indica si se puede llamar al servicio; cuenta la llamada rechazada si no"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < Config.BREAKER_OPEN_SECONDS:
+                self.rejected += 1
+                return False
+            self.state = self.HALF_OPEN
+            self.trial_calls = 0
+            self.trial_successes = 0
+            logger.info(f"Circuito de {self.service_name} semiabierto: probando el servicio")
+
+        if self.state == self.HALF_OPEN:
+            if self.trial_calls >= Config.BREAKER_HALF_OPEN_CALLS:
+                self.rejected += 1
+                return False
+            self.trial_calls += 1
+        return True
+
+    def release(self):
+        """Devuelve el turno de una llamada cancelada sin resultado (ej. la perdedora de un hedge)"""
+        if self.state == self.HALF_OPEN and self.trial_calls > 0:
+            self.trial_calls -= 1
+
+    def record(self, success, latency=0.0):
+        """Registra el resultado de una llamada"""
+        if self.state == self.HALF_OPEN:
+            if not success:
+                self._open()
+                return
+            self.trial_successes += 1
+            if self.trial_successes >= Config.BREAKER_HALF_OPEN_CALLS:
+                self.state = self.CLOSED
+                self._clear()
+                logger.info(f"Circuito de {self.service_name} cerrado")
+            return
+
+        now = time.monotonic()
+        slow = latency >= Config.BREAKER_SLOW_CALL_SECONDS
+        self.calls.append((now, success, slow))
+        self.window_errors += not success
+        self.window_slow += slow
+        self._trim(now)
+
+        if self.state == self.CLOSED and len(self.calls) >= Config.BREAKER_MIN_CALLS:
+            error_rate, slow_rate = self._rates()
+            if error_rate >= Config.BREAKER_ERROR_RATE or slow_rate >= Config.BREAKER_SLOW_RATE:
+                self._open()
+
+    def _rates(self):
+        total = len(self.calls)
+        if not total:
+            return 0.0, 0.0
+        return self.window_errors / total, self.window_slow / total
+
+    def _open(self):
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+        self._clear()
+        logger.warning(f"Circuito de {self.service_name} abierto durante {Config.BREAKER_OPEN_SECONDS}s")
+
+    def to_dict(self):
+        self._trim(time.monotonic())
+        error_rate, slow_rate = self._rates()
+        return {
+            "state": self.state,
+            "window_calls": len(self.calls),
+            "error_rate": round(error_rate, 4),
+            "slow_rate": round(slow_rate, 4),
+            "times_opened": self.times_opened,
+            "rejected": self.rejected
+        }
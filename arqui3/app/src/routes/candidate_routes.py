@@ -1,7 +1,11 @@
-from fastapi import APIRouter, HTTPException, Depends
+import json
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional
 from ..controllers.recruitment_controller import RecruitmentController
+from ..container import get_controller
+from ..pagination import page_items
 
 router = APIRouter(prefix="/candidates", tags=["Candidatos"])
 
@@ -20,10 +24,6 @@ class CandidateFilterInput(BaseModel):
     required_skills: Optional[List[str]] = None
     min_experience: Optional[int] = None
 
-# Dependencia para obtener el controlador
-def get_controller():
-    return RecruitmentController()
-
 @router.post("/", status_code=201)
 async def register_candidate(
     candidate: CandidateInput,
@@ -47,13 +47,48 @@ async def register_candidate(
         
     return result
 
+class UploadStreamingResponse(StreamingResponse):
+    """
+    Respuesta en streaming que no escucha la desconexión del cliente, porque
+    el cuerpo de la petición se sigue leyendo mientras se envía la respuesta.
+    """
+    
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+@router.post("/bulk")
+async def register_candidates_bulk(
+    request: Request,
+    format: Optional[str] = None,
+    controller: RecruitmentController = Depends(get_controller)
+):
+    """
+    Registra candidatos en bloque desde una subida NDJSON o CSV (cabecera en la
+    primera línea, skills separadas por ';'). El formato se toma del parámetro
+    format o del Content-Type. Devuelve en NDJSON el resultado de cada fila.
+    """
+    content_type = request.headers.get("content-type", "")
+    upload_format = format or ("csv" if "csv" in content_type else "ndjson")
+    if upload_format not in ("ndjson", "csv"):
+        raise HTTPException(status_code=415, detail="Formato no soportado. Use ndjson o csv.")
+    
+    results = controller.register_candidates_bulk(request.stream(), upload_format)
+    
+    async def report():
+        async for result in results:
+            yield json.dumps(result) + "\n"
+    
+    return UploadStreamingResponse(report(), media_type="application/x-ndjson")
+
 @router.get("/{candidate_id}")
 async def get_candidate(
     candidate_id: int,
     controller: RecruitmentController = Depends(get_controller)
 ):
     """Obtiene un candidato por su ID"""
-    result = controller.candidate_service.get_candidate(candidate_id)
+    result = await controller.get_candidate(candidate_id)
     
     if not result:
         raise HTTPException(status_code=404, detail=f"Candidato {candidate_id} no encontrado")
@@ -63,11 +98,15 @@ async def get_candidate(
 @router.get("/vacancy/{vacancy_id}")
 async def list_candidates_by_vacancy(
     vacancy_id: int,
+    response: Response,
+    first: Optional[int] = Query(None, ge=1),
+    after: Optional[str] = None,
+    include_total: bool = False,
     controller: RecruitmentController = Depends(get_controller)
 ):
-    """Lista todos los candidatos para una vacante"""
-    result = controller.candidate_service.list_candidates_by_vacancy(vacancy_id)
-    return result
+    """Lista una página de los candidatos de una vacante; el cursor de la siguiente va en X-Next-Cursor"""
+    result = await controller.candidate_service.list_candidates_by_vacancy(vacancy_id, first, after, include_total)
+    return page_items(response, result)
 
 @router.post("/filter")
 async def filter_candidates(
@@ -75,7 +114,7 @@ async def filter_candidates(
     controller: RecruitmentController = Depends(get_controller)
 ):
     """Filtra candidatos según criterios"""
-    result = controller.candidate_service.filter_candidates(
+    result = await controller.candidate_service.filter_candidates(
         filters.vacancy_id,
         filters.status,
         filters.required_skills,
@@ -1,7 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends, Response
+import asyncio
+import aiohttp
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
 from typing import List, Optional
 from ..controllers.recruitment_controller import RecruitmentController
+from ..container import get_controller
+from ..pagination import page_items
+from ..services.evaluation_service import REPORT_FORMATS, REPORT_RESPONSE_HEADERS
 
 router = APIRouter(prefix="/evaluations", tags=["Evaluaciones"])
 
@@ -23,10 +30,6 @@ class TestResultInput(BaseModel):
     score: float
     comments: Optional[str] = ""
 
-# Dependencia para obtener el controlador
-def get_controller():
-    return RecruitmentController()
-
 @router.post("/", status_code=201)
 async def assign_evaluation(
     evaluation: EvaluationInput,
@@ -74,7 +77,7 @@ async def get_evaluation(
     controller: RecruitmentController = Depends(get_controller)
 ):
     """Obtiene una evaluación por su ID"""
-    result = controller.evaluation_service.get_evaluation(evaluation_id)
+    result = await controller.evaluation_service.get_evaluation(evaluation_id)
     
     if not result:
         raise HTTPException(status_code=404, detail=f"Evaluación {evaluation_id} no encontrada")
@@ -84,56 +87,74 @@ async def get_evaluation(
 @router.get("/candidate/{candidate_id}")
 async def get_evaluations_by_candidate(
     candidate_id: int,
+    response: Response,
+    first: Optional[int] = Query(None, ge=1),
+    after: Optional[str] = None,
+    include_total: bool = False,
     controller: RecruitmentController = Depends(get_controller)
 ):
-    """Obtiene todas las evaluaciones de un candidato"""
-    result = controller.evaluation_service.get_evaluations_by_candidate(candidate_id)
-    return result
+    """Obtiene una página de las evaluaciones de un candidato; el cursor de la siguiente va en X-Next-Cursor"""
+    result = await controller.evaluation_service.get_evaluations_by_candidate(candidate_id, first, after, include_total)
+    return page_items(response, result)
 
-@router.get("/reports/{candidate_id}/excel")
-async def download_excel_report(
-    candidate_id: int,
-    controller: RecruitmentController = Depends(get_controller)
-):
-    """Descarga un reporte en Excel para un candidato"""
+async def stream_report(request, controller, candidate_id, report_format):
+    """Reenvía el reporte del servicio de evaluaciones por bloques, con soporte de rangos y peticiones condicionales"""
+    evaluation_service = controller.evaluation_service
+    extension, media_type = REPORT_FORMATS[report_format]
+    
+    try:
+        upstream = await evaluation_service.open_report(candidate_id, report_format, request.headers)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        raise HTTPException(status_code=502, detail=f"Error al generar el reporte: {str(e)}")
+    
+    # La conexión vuelve al pool aquí salvo que se entregue a la StreamingResponse
+    streaming = False
     try:
-        file_path = controller.evaluation_service.download_excel_report(candidate_id)
+        if upstream.status >= 400 and upstream.status != 416:
+            detail = await upstream.text()
+            raise HTTPException(
+                status_code=upstream.status if upstream.status < 500 else 502,
+                detail=f"Error al generar el reporte: {detail}"
+            )
         
-        with open(file_path, "rb") as file:
-            content = file.read()
-            
         headers = {
-            "Content-Disposition": f"attachment; filename=evaluation_report_{candidate_id}.xlsx"
+            name: upstream.headers[name]
+            for name in REPORT_RESPONSE_HEADERS
+            if name in upstream.headers
         }
+        headers["Content-Disposition"] = f"attachment; filename=evaluation_report_{candidate_id}.{extension}"
+        
+        if upstream.status in (304, 416):
+            return Response(status_code=upstream.status, headers=headers)
         
-        return Response(
-            content=content,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers=headers
+        streaming = True
+        # iter_report libera la respuesta al terminar; la tarea en segundo plano
+        # cubre el caso en que la iteración no llega a empezar
+        return StreamingResponse(
+            evaluation_service.iter_report(upstream),
+            status_code=upstream.status,
+            media_type=media_type,
+            headers=headers,
+            background=BackgroundTask(upstream.release)
         )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al generar el reporte: {str(e)}")
+    finally:
+        if not streaming:
+            upstream.release()
+
+@router.get("/reports/{candidate_id}/excel")
+async def download_excel_report(
+    candidate_id: int,
+    request: Request,
+    controller: RecruitmentController = Depends(get_controller)
+):
+    """Descarga un reporte en Excel para un candidato"""
+    return await stream_report(request, controller, candidate_id, "excel")
 
 @router.get("/reports/{candidate_id}/pdf")
 async def download_pdf_report(
     candidate_id: int,
+    request: Request,
     controller: RecruitmentController = Depends(get_controller)
 ):
     """Descarga un reporte en PDF para un candidato"""
-    try:
-        file_path = controller.evaluation_service.download_pdf_report(candidate_id)
-        
-        with open(file_path, "rb") as file:
-            content = file.read()
-            
-        headers = {
-            "Content-Disposition": f"attachment; filename=evaluation_report_{candidate_id}.pdf"
-        }
-        
-        return Response(
-            content=content,
-            media_type="application/pdf",
-            headers=headers
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error al generar el reporte: {str(e)}") 
\ No newline at end of file
+    return await stream_report(request, controller, candidate_id, "pdf")
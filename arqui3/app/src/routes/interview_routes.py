@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from pydantic import BaseModel
 from typing import List, Optional
 from ..controllers.recruitment_controller import RecruitmentController
+from ..container import get_controller
+from ..pagination import page_items
 
 router = APIRouter(prefix="/interviews", tags=["Entrevistas"])
 
@@ -25,10 +27,6 @@ class FeedbackInput(BaseModel):
     recommendation: str  # HIRE, REJECT, CONSIDER
     notes: Optional[str] = ""
 
-# Dependencia para obtener el controlador
-def get_controller():
-    return RecruitmentController()
-
 @router.post("/", status_code=201)
 async def schedule_interview(
     interview: InterviewInput,
@@ -84,7 +82,7 @@ async def get_interview(
     controller: RecruitmentController = Depends(get_controller)
 ):
     """Obtiene una entrevista por su ID"""
-    result = controller.interview_service.get_interview(interview_id)
+    result = await controller.interview_service.get_interview(interview_id)
     
     if not result:
         raise HTTPException(status_code=404, detail=f"Entrevista {interview_id} no encontrada")
@@ -94,8 +92,12 @@ async def get_interview(
 @router.get("/candidate/{candidate_id}")
 async def list_interviews_by_candidate(
     candidate_id: int,
+    response: Response,
+    first: Optional[int] = Query(None, ge=1),
+    after: Optional[str] = None,
+    include_total: bool = False,
     controller: RecruitmentController = Depends(get_controller)
 ):
-    """Lista todas las entrevistas de un candidato"""
-    result = controller.interview_service.list_interviews_by_candidate(candidate_id)
-    return result 
\ No newline at end of file
+    """Lista una página de las entrevistas de un candidato; el cursor de la siguiente va en X-Next-Cursor"""
+    result = await controller.interview_service.list_interviews_by_candidate(candidate_id, first, after, include_total)
+    return page_items(response, result) 
\ No newline at end of file
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from pydantic import BaseModel
 from typing import List, Optional
 from ..controllers.recruitment_controller import RecruitmentController
+from ..container import get_controller
+from ..pagination import page_items
 
 router = APIRouter(prefix="/requisitions", tags=["Requisiciones"])
 
@@ -18,10 +20,6 @@ class RequisitionResponse(BaseModel):
     status: str
     created_at: str
 
-# Dependencia para obtener el controlador
-def get_controller():
-    return RecruitmentController()
-
 @router.post("/", response_model=RequisitionResponse)
 async def create_requisition(
     requisition: RequisitionInput,
@@ -56,7 +54,7 @@ async def get_requisition(
     controller: RecruitmentController = Depends(get_controller)
 ):
     """Obtiene una requisición por su ID"""
-    result, error_message = controller.requisition_service.get_requisition(requisition_id)
+    result, error_message = await controller.get_requisition(requisition_id)
     
     if not result:
         raise HTTPException(
@@ -68,11 +66,15 @@ async def get_requisition(
 
 @router.get("/")
 async def list_requisitions(
+    response: Response,
     status: Optional[str] = None,
+    first: Optional[int] = Query(None, ge=1),
+    after: Optional[str] = None,
+    include_total: bool = False,
     controller: RecruitmentController = Depends(get_controller)
 ):
-    """Lista todas las requisiciones, opcionalmente filtradas por estado"""
-    result, error_message = controller.requisition_service.list_requisitions(status)
+    """Lista una página de requisiciones, opcionalmente filtradas por estado; el cursor de la siguiente va en X-Next-Cursor"""
+    result, error_message = await controller.requisition_service.list_requisitions(status, first, after, include_total)
     
     if error_message:
         # Solo devolvemos error si hay un mensaje específico, ya que una lista vacía es un resultado válido
@@ -81,4 +83,4 @@ async def list_requisitions(
             detail=error_message
         )
         
-    return result 
\ No newline at end of file
+    return page_items(response, result) 
\ No newline at end of file
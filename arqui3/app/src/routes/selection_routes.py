@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import List, Optional, Dict
 from ..controllers.recruitment_controller import RecruitmentController
+from ..container import get_controller
 
 router = APIRouter(prefix="/selection", tags=["Selección"])
 
@@ -21,10 +22,6 @@ class DecisionInput(BaseModel):
     decision: str  # HIRE, REJECT
     reason: Optional[str] = ""
 
-# Dependencia para obtener el controlador
-def get_controller():
-    return RecruitmentController()
-
 @router.post("/reports", status_code=201)
 async def generate_final_report(
     report: ReportInput,
@@ -72,7 +69,7 @@ async def get_selection_process(
     controller: RecruitmentController = Depends(get_controller)
 ):
     """Obtiene la información de un proceso de selección por ID de vacante"""
-    result = controller.selection_service.get_selection_process(vacancy_id)
+    result = await controller.selection_service.get_selection_process(vacancy_id)
     
     if not result:
         raise HTTPException(status_code=404, detail=f"Proceso de selección para la vacante {vacancy_id} no encontrado")
@@ -85,5 +82,5 @@ async def list_selection_processes(
     controller: RecruitmentController = Depends(get_controller)
 ):
     """Lista todos los procesos de selección, opcionalmente filtrados por estado"""
-    result = controller.selection_service.list_selection_processes(status)
+    result = await controller.selection_service.list_selection_processes(status)
     return result 
\ No newline at end of file
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from pydantic import BaseModel
 from typing import List, Optional
 from ..controllers.recruitment_controller import RecruitmentController
+from ..container import get_controller
+from ..pagination import page_items
 
 router = APIRouter(prefix="/vacancies", tags=["Vacantes"])
 
@@ -13,10 +15,6 @@ class VacancyInput(BaseModel):
 class VacancyCloseInput(BaseModel):
     reason: str = "FILLED"  # FILLED o CANCELLED
 
-# Dependencia para obtener el controlador
-def get_controller():
-    return RecruitmentController()
-
 @router.post("/", status_code=201)
 async def publish_vacancy(
     vacancy: VacancyInput,
@@ -42,7 +40,7 @@ async def get_vacancy(
     controller: RecruitmentController = Depends(get_controller)
 ):
     """Obtiene una vacante por su ID"""
-    result = controller.vacancy_service.get_vacancy(vacancy_id)
+    result = await controller.get_vacancy(vacancy_id)
     
     if not result:
         raise HTTPException(status_code=404, detail=f"Vacante {vacancy_id} no encontrada")
@@ -51,12 +49,16 @@ async def get_vacancy(
 
 @router.get("/")
 async def list_vacancies(
+    response: Response,
     status: Optional[str] = None,
+    first: Optional[int] = Query(None, ge=1),
+    after: Optional[str] = None,
+    include_total: bool = False,
     controller: RecruitmentController = Depends(get_controller)
 ):
-    """Lista todas las vacantes, opcionalmente filtradas por estado"""
-    result = controller.vacancy_service.list_vacancies(status)
-    return result
+    """Lista una página de vacantes, opcionalmente filtradas por estado; el cursor de la siguiente va en X-Next-Cursor"""
+    result = await controller.vacancy_service.list_vacancies(status, first, after, include_total)
+    return page_items(response, result)
 
 @router.post("/{vacancy_id}/close")
 async def close_vacancy(
@@ -1,15 +1,15 @@
 import logging
-from ..graphql_client import GraphQLClient
+from ..pagination import page_variables
 
 logger = logging.getLogger(__name__)
 
 class CandidateService:
     """Servicio para interactuar con el microservicio de candidatos"""
     
-    def __init__(self):
-        self.client = GraphQLClient("candidate")
+    def __init__(self, client):
+        self.client = client
     
-    def submit_application(self, name, email, resume_url, vacancy_id, skills, experience_years):
+    async def submit_application(self, name, email, resume_url, vacancy_id, skills, experience_years):
         """
         Registra la postulación de un candidato.
         
@@ -46,11 +46,62 @@ class CandidateService:
             }
         }
         
-        response = self.client.execute_mutation(mutation, variables)
+        response = await self.client.execute_mutation(mutation, variables)
         logger.info(f"Respuesta de registro de candidato: {response}")
         return response.get("data", {}).get("submitCandidateApplication")
     
-    def get_candidate(self, candidate_id):
+    async def submit_applications(self, candidates):
+        """
+        Registra varias postulaciones en una sola petición al servicio de candidatos.
+        
+        Args:
+            candidates (list): Postulaciones [{"name", "email", "resume_url", "vacancy_id", "skills", "experience_years"}]
+            
+        Returns:
+            tuple: (candidates, error_message) donde:
+                  - candidates es la lista de candidatos registrados, en el mismo orden, o None si hay error
+                  - error_message es None si no hay error o un mensaje descriptivo si lo hay
+        """
+        mutation = """
+        mutation SubmitApplications($inputs: [CandidateInput!]!) {
+            submitApplications(inputs: $inputs) {
+                id
+                name
+                vacancyId
+                status
+            }
+        }
+        """
+        
+        variables = {
+            "inputs": [
+                {
+                    "name": candidate["name"],
+                    "email": candidate["email"],
+                    "resumeUrl": candidate["resume_url"],
+                    "vacancyId": candidate["vacancy_id"],
+                    "skills": candidate["skills"],
+                    "experienceYears": candidate["experience_years"]
+                }
+                for candidate in candidates
+            ]
+        }
+        
+        response = await self.client.execute_mutation(mutation, variables)
+        
+        if "errors" in response:
+            error_message = "; ".join(error.get("message", "") for error in response["errors"])
+            logger.error(f"Error en el registro masivo de candidatos: {error_message}")
+            return None, error_message
+        
+        created = (response.get("data") or {}).get("submitApplications")
+        if created is None:
+            return None, "No se pudieron registrar los candidatos"
+        
+        logger.info(f"{len(created)} candidatos registrados en lote")
+        return created, None
+    
+    async def get_candidate(self, candidate_id):
         """
         Obtiene la información de un candidato por su ID.
         
@@ -77,38 +128,47 @@ class CandidateService:
         
         variables = {"candidateId": candidate_id}
         
-        response = self.client.execute_query(query, variables)
+        response = await self.client.execute_query(query, variables)
         return response.get("data", {}).get("getCandidate")
     
-    def list_candidates_by_vacancy(self, vacancy_id):
+    async def list_candidates_by_vacancy(self, vacancy_id, first=None, after=None, include_total=False):
         """
-        Lista todos los candidatos para una vacante.
+        Lista una página de los candidatos de una vacante.
         
         Args:
             vacancy_id (int): ID de la vacante
+            first (int, optional): Tamaño de la página
+            after (str, optional): Cursor de la página anterior
+            include_total (bool, optional): Si se pide también el total de candidatos
             
         Returns:
-            list: Lista de candidatos
+            dict: Página de candidatos (edges, pageInfo, totalCount)
         """
         query = """
-        query ListCandidatesByVacancy($vacancyId: ID!) {
-            listCandidatesByVacancy(vacancyId: $vacancyId) {
-                id
-                name
-                email
-                status
-                skills
-                experienceYears
+        query ListCandidatesByVacancy($vacancyId: Int!, $first: Int, $after: String, $includeTotal: Boolean!) {
+            candidatesConnection(vacancyId: $vacancyId, first: $first, after: $after) {
+                edges {
+                    node {
+                        id
+                        name
+                        email
+                        status
+                        skills
+                        experienceYears
+                    }
+                }
+                pageInfo { hasNextPage endCursor }
+                totalCount @include(if: $includeTotal)
             }
         }
         """
         
-        variables = {"vacancyId": vacancy_id}
+        variables = {"vacancyId": vacancy_id, **page_variables(first, after, include_total)}
         
-        response = self.client.execute_query(query, variables)
-        return response.get("data", {}).get("listCandidatesByVacancy", [])
+        response = await self.client.execute_query(query, variables)
+        return response.get("data", {}).get("candidatesConnection")
     
-    def filter_candidates(self, vacancy_id, status=None, required_skills=None, min_experience=None):
+    async def filter_candidates(self, vacancy_id, status=None, required_skills=None, min_experience=None):
         """
         Filtra candidatos según criterios.
         
@@ -148,5 +208,5 @@ class CandidateService:
         if min_experience:
             variables["filters"]["minExperience"] = min_experience
         
-        response = self.client.execute_query(query, variables)
+        response = await self.client.execute_query(query, variables)
         return response.get("data", {}).get("filterCandidates", []) 
\ No newline at end of file
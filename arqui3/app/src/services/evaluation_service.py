@@ -1,19 +1,32 @@
 import logging
-import os
-import requests
-from ..graphql_client import GraphQLClient
+import aiohttp
 from ..config import Config
+from ..pagination import page_variables
 
 logger = logging.getLogger(__name__)
 
+# Cabeceras de la petición del cliente que se reenvían al descargar reportes
+REPORT_REQUEST_HEADERS = ("range", "if-range", "if-none-match", "if-modified-since")
+
+# Cabeceras de la respuesta del servicio que se devuelven al cliente
+REPORT_RESPONSE_HEADERS = (
+    "Content-Length", "Content-Range", "Accept-Ranges", "ETag", "Last-Modified"
+)
+
+# Extensión y tipo de contenido de cada formato de reporte
+REPORT_FORMATS = {
+    "excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "pdf": ("pdf", "application/pdf")
+}
+
 class EvaluationService:
     """Servicio para interactuar con el microservicio de evaluaciones"""
     
-    def __init__(self):
-        self.client = GraphQLClient("evaluation")
+    def __init__(self, client):
+        self.client = client
         self.service_url = Config.EVALUATION_SERVICE_URL
     
-    def assign_evaluation(self, candidate_id, vacancy_id, tests):
+    async def assign_evaluation(self, candidate_id, vacancy_id, tests):
         """
         Asigna pruebas a un candidato.
         
@@ -43,11 +56,11 @@ class EvaluationService:
             }
         }
         
-        response = self.client.execute_mutation(mutation, variables)
+        response = await self.client.execute_mutation(mutation, variables)
         logger.info(f"Respuesta de asignación de evaluación: {response}")
         return response.get("data", {}).get("assignEvaluation")
     
-    def submit_test_result(self, evaluation_id, test_name, score, comments=""):
+    async def submit_test_result(self, evaluation_id, test_name, score, comments=""):
         """
         Registra el resultado de una prueba.
         
@@ -64,6 +77,7 @@ class EvaluationService:
         mutation SubmitTestResult($input: TestResultInput!) {
             submitTestResult(input: $input) {
                 id
+                candidateId
                 status
                 scores {
                     testName
@@ -82,10 +96,10 @@ class EvaluationService:
             }
         }
         
-        response = self.client.execute_mutation(mutation, variables)
+        response = await self.client.execute_mutation(mutation, variables)
         return response.get("data", {}).get("submitTestResult")
     
-    def get_evaluation(self, evaluation_id):
+    async def get_evaluation(self, evaluation_id):
         """
         Obtiene la información de una evaluación por su ID.
         
@@ -115,97 +129,91 @@ class EvaluationService:
         
         variables = {"evaluationId": evaluation_id}
         
-        response = self.client.execute_query(query, variables)
+        response = await self.client.execute_query(query, variables)
         return response.get("data", {}).get("getEvaluation")
     
-    def get_evaluations_by_candidate(self, candidate_id):
+    async def get_evaluations_by_candidate(self, candidate_id, first=None, after=None, include_total=False):
         """
-        Obtiene todas las evaluaciones de un candidato.
+        Obtiene una página de las evaluaciones de un candidato.
         
         Args:
             candidate_id (int): ID del candidato
+            first (int, optional): Tamaño de la página
+            after (str, optional): Cursor de la página anterior
+            include_total (bool, optional): Si se pide también el total de evaluaciones
             
         Returns:
-            list: Lista de evaluaciones
+            dict: Página de evaluaciones (edges, pageInfo, totalCount)
         """
         query = """
-        query GetEvaluationsByCandidate($candidateId: ID!) {
-            evaluationsByCandidate(candidateId: $candidateId) {
-                id
-                status
-                assignedDate
-                completedDate
-                scores {
-                    testName
-                    score
+        query GetEvaluationsByCandidate($candidateId: Int!, $first: Int, $after: String, $includeTotal: Boolean!) {
+            evaluationsConnection(candidateId: $candidateId, first: $first, after: $after) {
+                edges {
+                    node {
+                        id
+                        testType
+                        status
+                        score
+                        feedback
+                        createdAt
+                        updatedAt
+                    }
                 }
+                pageInfo { hasNextPage endCursor }
+                totalCount @include(if: $includeTotal)
             }
         }
         """
         
-        variables = {"candidateId": candidate_id}
+        variables = {"candidateId": candidate_id, **page_variables(first, after, include_total)}
         
-        response = self.client.execute_query(query, variables)
-        return response.get("data", {}).get("evaluationsByCandidate", [])
+        response = await self.client.execute_query(query, variables)
+        return response.get("data", {}).get("evaluationsConnection")
     
-    def download_excel_report(self, candidate_id, output_path=None):
+    async def open_report(self, candidate_id, report_format, headers=None):
         """
-        Descarga un reporte en Excel para un candidato.
+        Abre la descarga de un reporte sin leer su cuerpo.
+        
+        Reenvía al servicio las cabeceras de rango y condicionales del cliente.
+        La respuesta debe consumirse con iter_report() o liberarse con release().
         
         Args:
             candidate_id (int): ID del candidato
-            output_path (str, optional): Ruta donde guardar el archivo
+            report_format (str): Formato del reporte (excel, pdf)
+            headers (Mapping, optional): Cabeceras de la petición original
             
         Returns:
-            str: Ruta del archivo descargado
+            aiohttp.ClientResponse: Respuesta del servicio de evaluaciones
         """
-        endpoint = f"{self.service_url}/reports/{candidate_id}/excel"
-        
-        try:
-            response = requests.get(endpoint)
-            response.raise_for_status()
-            
-            if not output_path:
-                # Crear directorio temporal si no existe
-                os.makedirs("tmp", exist_ok=True)
-                output_path = f"tmp/evaluation_report_{candidate_id}.xlsx"
-                
-            with open(output_path, "wb") as file:
-                file.write(response.content)
-                
-            logger.info(f"Reporte Excel descargado en {output_path}")
-            return output_path
-        except Exception as e:
-            logger.error(f"Error descargando reporte Excel: {str(e)}")
-            raise
+        endpoint = f"{self.service_url}/reports/{candidate_id}/{report_format}"
+        forwarded = {
+            name: value for name, value in (headers or {}).items()
+            if name.lower() in REPORT_REQUEST_HEADERS
+        }
+        # Sin compresión: los bytes, Content-Length y Content-Range se reenvían tal cual
+        forwarded["Accept-Encoding"] = "identity"
+        
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=Config.GRAPHQL_CONNECT_TIMEOUT,
+            sock_read=Config.REPORT_READ_TIMEOUT
+        )
+        response = await self.client.session.get(endpoint, headers=forwarded, timeout=timeout)
+        logger.info(f"Descarga de reporte {report_format} para candidato {candidate_id}: {response.status}")
+        return response
     
-    def download_pdf_report(self, candidate_id, output_path=None):
+    async def iter_report(self, response):
         """
-        Descarga un reporte en PDF para un candidato.
+        Recorre el cuerpo del reporte por bloques, sin cargarlo completo en memoria.
         
         Args:
-            candidate_id (int): ID del candidato
-            output_path (str, optional): Ruta donde guardar el archivo
+            response (aiohttp.ClientResponse): Respuesta devuelta por open_report()
             
-        Returns:
-            str: Ruta del archivo descargado
+        Yields:
+            bytes: Bloques de hasta REPORT_CHUNK_SIZE bytes
         """
-        endpoint = f"{self.service_url}/reports/{candidate_id}/pdf"
-        
         try:
-            response = requests.get(endpoint)
-            response.raise_for_status()
-            
-            if not output_path:
-                # Crear directorio temporal si no existe
-                os.makedirs("tmp", exist_ok=True)
-                output_path = f"tmp/evaluation_report_{candidate_id}.pdf"
-                
-            with open(output_path, "wb") as file:
-                file.write(response.content)
-                
-            logger.info(f"Reporte PDF descargado en {output_path}")
-            return output_path
-        except Exception as e:
-            logger.error(f"Error descargando reporte PDF: {str(e)}")
-            raise 
\ No newline at end of file
+            async for chunk in response.content.iter_chunked(Config.REPORT_CHUNK_SIZE):
+                yield chunk
+        finally:
+            response.release()
@@ -1,15 +1,15 @@
 import logging
-from ..graphql_client import GraphQLClient
+from ..pagination import page_variables
 
 logger = logging.getLogger(__name__)
 
 class InterviewService:
     """Servicio para interactuar con el microservicio de entrevistas"""
     
-    def __init__(self):
-        self.client = GraphQLClient("interview")
+    def __init__(self, client):
+        self.client = client
     
-    def schedule_interview(self, candidate_id, interviewer_id, vacancy_id, interview_type, 
+    async def schedule_interview(self, candidate_id, interviewer_id, vacancy_id, interview_type, 
                           scheduled_time, duration_minutes, location):
         """
         Programa una entrevista.
@@ -48,11 +48,11 @@ class InterviewService:
             }
         }
         
-        response = self.client.execute_mutation(mutation, variables)
+        response = await self.client.execute_mutation(mutation, variables)
         logger.info(f"Respuesta de programación de entrevista: {response}")
         return response.get("data", {}).get("scheduleInterview")
     
-    def submit_feedback(self, interview_id, strengths, weaknesses, technical_score, 
+    async def submit_feedback(self, interview_id, strengths, weaknesses, technical_score, 
                        communication_score, culture_fit_score, recommendation, notes=""):
         """
         Registra el feedback de una entrevista.
@@ -74,6 +74,7 @@ class InterviewService:
         mutation SubmitFeedback($interviewId: ID!, $feedback: FeedbackInput!) {
             submitFeedback(interviewId: $interviewId, feedback: $feedback) {
                 id
+                candidateId
                 status
                 feedback {
                     recommendation
@@ -96,10 +97,10 @@ class InterviewService:
             }
         }
         
-        response = self.client.execute_mutation(mutation, variables)
+        response = await self.client.execute_mutation(mutation, variables)
         return response.get("data", {}).get("submitFeedback")
     
-    def get_interview(self, interview_id):
+    async def get_interview(self, interview_id):
         """
         Obtiene la información de una entrevista por su ID.
         
@@ -136,34 +137,43 @@ class InterviewService:
         
         variables = {"interviewId": interview_id}
         
-        response = self.client.execute_query(query, variables)
+        response = await self.client.execute_query(query, variables)
         return response.get("data", {}).get("getInterview")
     
-    def list_interviews_by_candidate(self, candidate_id):
+    async def list_interviews_by_candidate(self, candidate_id, first=None, after=None, include_total=False):
         """
-        Lista todas las entrevistas de un candidato.
+        Lista una página de las entrevistas de un candidato.
         
         Args:
             candidate_id (int): ID del candidato
+            first (int, optional): Tamaño de la página
+            after (str, optional): Cursor de la página anterior
+            include_total (bool, optional): Si se pide también el total de entrevistas
             
         Returns:
-            list: Lista de entrevistas
+            dict: Página de entrevistas (edges, pageInfo, totalCount)
         """
         query = """
-        query ListInterviewsByCandidate($candidateId: ID!) {
-            interviewsByCandidate(candidateId: $candidateId) {
-                id
-                interviewType
-                status
-                scheduledTime
-                feedback {
-                    recommendation
+        query ListInterviewsByCandidate($candidateId: Int!, $first: Int, $after: String, $includeTotal: Boolean!) {
+            interviewsConnection(candidateId: $candidateId, first: $first, after: $after) {
+                edges {
+                    node {
+                        id
+                        interviewType
+                        status
+                        scheduledTime
+                        feedback {
+                            recommendation
+                        }
+                    }
                 }
+                pageInfo { hasNextPage endCursor }
+                totalCount @include(if: $includeTotal)
             }
         }
         """
         
-        variables = {"candidateId": candidate_id}
+        variables = {"candidateId": candidate_id, **page_variables(first, after, include_total)}
         
-        response = self.client.execute_query(query, variables)
-        return response.get("data", {}).get("interviewsByCandidate", []) 
\ No newline at end of file
+        response = await self.client.execute_query(query, variables)
+        return response.get("data", {}).get("interviewsConnection") 
\ No newline at end of file
@@ -1,15 +1,15 @@
 import logging
-from ..graphql_client import GraphQLClient
+from ..pagination import page_variables
 
 logger = logging.getLogger(__name__)
 
 class RequisitionService:
     """Servicio para interactuar con el microservicio de requisiciones"""
     
-    def __init__(self):
-        self.client = GraphQLClient("requisition")
+    def __init__(self, client):
+        self.client = client
     
-    def create_requisition(self, position_name, functions, salary_category, profile):
+    async def create_requisition(self, position_name, functions, salary_category, profile):
         """
         Crea una nueva requisición de personal.
         
@@ -44,7 +44,7 @@ class RequisitionService:
             }
         }
         
-        response = self.client.execute_mutation(mutation, variables)
+        response = await self.client.execute_mutation(mutation, variables)
         logger.info(f"Respuesta de creación de requisición: {response}")
         
         # Verifica si response es None 
@@ -85,7 +85,7 @@ class RequisitionService:
             
         return response.get("data", {}).get("createRequisition"), None
     
-    def get_requisition(self, requisition_id):
+    async def get_requisition(self, requisition_id):
         """
         Obtiene la información de una requisición por su ID.
         
@@ -113,7 +113,7 @@ class RequisitionService:
         
         variables = {"requisitionId": requisition_id}
         
-        response = self.client.execute_query(query, variables)
+        response = await self.client.execute_query(query, variables)
         
         # Verificar errores
         if response is None:
@@ -151,36 +151,45 @@ class RequisitionService:
             
         return requisition, None
     
-    def list_requisitions(self, status=None):
+    async def list_requisitions(self, status=None, first=None, after=None, include_total=False):
         """
-        Lista todas las requisiciones, opcionalmente filtradas por estado.
+        Lista una página de requisiciones, opcionalmente filtradas por estado.
         
         Args:
             status (str, optional): Estado de las requisiciones a filtrar
+            first (int, optional): Tamaño de la página
+            after (str, optional): Cursor de la página anterior
+            include_total (bool, optional): Si se pide también el total de requisiciones
             
         Returns:
-            tuple: (requisitions, error_message) donde:
-                  - requisitions es la lista de requisiciones o [] si hay error
+            tuple: (connection, error_message) donde:
+                  - connection es la página (edges, pageInfo, totalCount) o None si hay error
                   - error_message es None si no hay error o un mensaje descriptivo si lo hay
         """
         query = """
-        query ListRequisitions($status: String) {
-            requisitions(status: $status) {
-                id
-                positionName
-                status
-                createdAt
+        query ListRequisitions($status: String, $first: Int, $after: String, $includeTotal: Boolean!) {
+            requisitionsConnection(status: $status, first: $first, after: $after) {
+                edges {
+                    node {
+                        id
+                        positionName
+                        status
+                        createdAt
+                    }
+                }
+                pageInfo { hasNextPage endCursor }
+                totalCount @include(if: $includeTotal)
             }
         }
         """
         
-        variables = {"status": status} if status else {}
+        variables = {"status": status, **page_variables(first, after, include_total)}
         
-        response = self.client.execute_query(query, variables)
+        response = await self.client.execute_query(query, variables)
         
         # Verificar errores
         if response is None:
-            return [], "Error de conexión con el servicio de requisiciones"
+            return None, "Error de conexión con el servicio de requisiciones"
             
         if "errors" in response:
             try:
@@ -203,10 +212,10 @@ class RequisitionService:
                         error_message = f"Error de validación: {error_message}"
                 
                 logger.error(f"Error al listar requisiciones: {error_message}")
-                return [], error_message
+                return None, error_message
             except Exception as e:
                 logger.error(f"Error al procesar el mensaje de error: {str(e)}")
-                return [], "Error al listar requisiciones"
+                return None, "Error al listar requisiciones"
             
-        requisitions = response.get("data", {}).get("requisitions", [])
-        return requisitions, None 
\ No newline at end of file
+        connection = response.get("data", {}).get("requisitionsConnection")
+        return connection, None 
\ No newline at end of file
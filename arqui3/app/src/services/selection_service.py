@@ -1,15 +1,46 @@
 import logging
-from ..graphql_client import GraphQLClient
 
 logger = logging.getLogger(__name__)
 
+MAKE_HIRING_DECISION_MUTATION = """
+        mutation MakeHiringDecision($selectionId: ID!, $decision: String!, $reason: String) {
+            makeHiringDecision(selectionId: $selectionId, decision: $decision, reason: $reason) {
+                id
+                candidateId
+                status
+                decision
+            }
+        }
+        """
+
+GET_SELECTION_PROCESS_QUERY = """
+        query GetSelectionProcess($vacancyId: ID!) {
+            getSelectionProcess(vacancyId: $vacancyId) {
+                id
+                vacancyId
+                status
+                report {
+                    technicalEvaluation {
+                        score
+                        feedback
+                    }
+                    hrEvaluation {
+                        score
+                        feedback
+                    }
+                }
+                decision
+            }
+        }
+        """
+
 class SelectionService:
     """Servicio para interactuar con el microservicio de selección"""
     
-    def __init__(self):
-        self.client = GraphQLClient("selection")
+    def __init__(self, client):
+        self.client = client
     
-    def generate_final_report(self, selection_id, technical_evaluation, hr_evaluation, additional_notes=""):
+    async def generate_final_report(self, selection_id, technical_evaluation, hr_evaluation, additional_notes=""):
         """
         Genera el reporte final para un proceso de selección.
         
@@ -26,6 +57,7 @@ class SelectionService:
         mutation GenerateFinalReport($selectionId: ID!, $report: FinalReportInput!) {
             generateFinalReport(selectionId: $selectionId, report: $report) {
                 id
+                candidateId
                 status
                 report {
                     technicalEvaluation {
@@ -50,11 +82,11 @@ class SelectionService:
             }
         }
         
-        response = self.client.execute_mutation(mutation, variables)
+        response = await self.client.execute_mutation(mutation, variables)
         logger.info(f"Respuesta de generación de reporte final: {response}")
         return response.get("data", {}).get("generateFinalReport")
     
-    def make_hiring_decision(self, selection_id, decision, reason=""):
+    async def make_hiring_decision(self, selection_id, decision, reason=""):
         """
         Registra la decisión final de contratación.
         
@@ -66,26 +98,42 @@ class SelectionService:
         Returns:
             dict: Información actualizada del proceso de selección
         """
-        mutation = """
-        mutation MakeHiringDecision($selectionId: ID!, $decision: String!, $reason: String) {
-            makeHiringDecision(selectionId: $selectionId, decision: $decision, reason: $reason) {
-                id
-                status
-                decision
-            }
-        }
-        """
-        
         variables = {
             "selectionId": selection_id,
             "decision": decision,
             "reason": reason
         }
         
-        response = self.client.execute_mutation(mutation, variables)
+        response = await self.client.execute_mutation(MAKE_HIRING_DECISION_MUTATION, variables)
         return response.get("data", {}).get("makeHiringDecision")
     
-    def get_selection_process(self, vacancy_id):
+    async def make_hiring_decision_with_process(self, selection_id, decision, reason=""):
+        """
+        Registra la decisión final y consulta el proceso de selección en una sola
+        petición (lote); el servicio ejecuta ambas operaciones en paralelo.
+        
+        Args:
+            selection_id (int): ID del proceso de selección
+            decision (str): Decisión (HIRE, REJECT)
+            reason (str, optional): Motivo de la decisión
+            
+        Returns:
+            tuple: (resultado de la decisión, proceso de selección); cada uno None si falló
+        """
+        decision_response, process_response = await self.client.execute_batch([
+            (MAKE_HIRING_DECISION_MUTATION, {
+                "selectionId": selection_id,
+                "decision": decision,
+                "reason": reason
+            }),
+            (GET_SELECTION_PROCESS_QUERY, {"vacancyId": selection_id})
+        ])
+        return (
+            (decision_response.get("data") or {}).get("makeHiringDecision"),
+            (process_response.get("data") or {}).get("getSelectionProcess")
+        )
+    
+    async def get_selection_process(self, vacancy_id):
         """
         Obtiene la información de un proceso de selección por ID de vacante.
         
@@ -95,32 +143,12 @@ class SelectionService:
         Returns:
             dict: Información del proceso de selección
         """
-        query = """
-        query GetSelectionProcess($vacancyId: ID!) {
-            getSelectionProcess(vacancyId: $vacancyId) {
-                id
-                status
-                report {
-                    technicalEvaluation {
-                        score
-                        feedback
-                    }
-                    hrEvaluation {
-                        score
-                        feedback
-                    }
-                }
-                decision
-            }
-        }
-        """
-        
         variables = {"vacancyId": vacancy_id}
         
-        response = self.client.execute_query(query, variables)
+        response = await self.client.execute_query(GET_SELECTION_PROCESS_QUERY, variables)
         return response.get("data", {}).get("getSelectionProcess")
     
-    def list_selection_processes(self, status=None):
+    async def list_selection_processes(self, status=None):
         """
         Lista todos los procesos de selección, opcionalmente filtrados por estado.
         
@@ -143,5 +171,5 @@ class SelectionService:
         
         variables = {"status": status} if status else {}
         
-        response = self.client.execute_query(query, variables)
+        response = await self.client.execute_query(query, variables)
         return response.get("data", {}).get("selectionProcesses", []) 
\ No newline at end of file
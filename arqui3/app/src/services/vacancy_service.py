@@ -1,15 +1,15 @@
 import logging
-from ..graphql_client import GraphQLClient
+from ..pagination import page_variables
 
 logger = logging.getLogger(__name__)
 
 class VacancyService:
     """Servicio para interactuar con el microservicio de vacantes"""
     
-    def __init__(self):
-        self.client = GraphQLClient("vacancy")
+    def __init__(self, client):
+        self.client = client
     
-    def publish_vacancy(self, requisition_id, platforms):
+    async def publish_vacancy(self, requisition_id, platforms):
         """
         Publica una vacante en las plataformas seleccionadas.
         
@@ -40,11 +40,11 @@ class VacancyService:
             }
         }
         
-        response = self.client.execute_mutation(mutation, variables)
+        response = await self.client.execute_mutation(mutation, variables)
         logger.info(f"Respuesta de publicación de vacante: {response}")
         return response.get("data", {}).get("publishVacancy")
     
-    def get_vacancy(self, vacancy_id):
+    async def get_vacancy(self, vacancy_id):
         """
         Obtiene la información de una vacante por su ID.
         
@@ -52,7 +52,22 @@ class VacancyService:
             vacancy_id (int): ID de la vacante
             
         Returns:
-            dict: Información de la vacante
+            dict: Información de la vacante o None si no existe o la consulta falla
+        """
+        vacancy, _ = await self.find_vacancy(vacancy_id)
+        return vacancy
+    
+    async def find_vacancy(self, vacancy_id):
+        """
+        Obtiene una vacante distinguiendo si no existe de si la consulta falló.
+        
+        Args:
+            vacancy_id (int): ID de la vacante
+            
+        Returns:
+            tuple: (vacancy, error_message) donde:
+                  - vacancy es la información de la vacante o None si no existe o hay error
+                  - error_message es None si no hay error o un mensaje descriptivo si lo hay
         """
         query = """
         query GetVacancy($vacancyId: ID!) {
@@ -69,38 +84,57 @@ class VacancyService:
         
         variables = {"vacancyId": vacancy_id}
         
-        response = self.client.execute_query(query, variables)
-        return response.get("data", {}).get("getVacancy")
+        response = await self.client.execute_query(query, variables)
+        
+        if "errors" in response:
+            error_message = "; ".join(error.get("message", "") for error in response["errors"])
+            logger.error(f"Error al consultar la vacante {vacancy_id}: {error_message}")
+            return None, error_message
+        
+        data = response.get("data")
+        if not isinstance(data, dict):
+            return None, "Respuesta no válida del servicio de vacantes"
+        
+        return data.get("getVacancy"), None
     
-    def list_vacancies(self, status=None):
+    async def list_vacancies(self, status=None, first=None, after=None, include_total=False):
         """
-        Lista todas las vacantes, opcionalmente filtradas por estado.
+        Lista una página de vacantes, opcionalmente filtradas por estado.
         
         Args:
             status (str, optional): Estado de las vacantes a filtrar
+            first (int, optional): Tamaño de la página
+            after (str, optional): Cursor de la página anterior
+            include_total (bool, optional): Si se pide también el total de vacantes
             
         Returns:
-            list: Lista de vacantes
+            dict: Página de vacantes (edges, pageInfo, totalCount)
         """
         query = """
-        query ListVacancies($status: String) {
-            vacancies(status: $status) {
-                id
-                requisitionId
-                platforms
-                status
-                publicationDate
-                closingDate
+        query ListVacancies($status: String, $first: Int, $after: String, $includeTotal: Boolean!) {
+            vacanciesConnection(status: $status, first: $first, after: $after) {
+                edges {
+                    node {
+                        id
+                        requisitionId
+                        platforms
+                        status
+                        publicationDate
+                        closingDate
+                    }
+                }
+                pageInfo { hasNextPage endCursor }
+                totalCount @include(if: $includeTotal)
             }
         }
         """
         
-        variables = {"status": status} if status else {}
+        variables = {"status": status, **page_variables(first, after, include_total)}
         
-        response = self.client.execute_query(query, variables)
-        return response.get("data", {}).get("vacancies", [])
+        response = await self.client.execute_query(query, variables)
+        return response.get("data", {}).get("vacanciesConnection")
     
-    def close_vacancy(self, vacancy_id, reason="FILLED"):
+    async def close_vacancy(self, vacancy_id, reason="FILLED"):
         """
         Cierra una vacante.
         
@@ -126,5 +160,5 @@ class VacancyService:
             "reason": reason
         }
         
-        response = self.client.execute_mutation(mutation, variables)
+        response = await self.client.execute_mutation(mutation, variables)
         return response.get("data", {}).get("closeVacancy") 
\ No newline at end of file
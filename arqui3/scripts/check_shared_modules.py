@@ -0,0 +1,68 @@
+"""
+Comprueba que las copias de los módulos compartidos coinciden con su original.
+
+La app, el gateway y cada servicio se construyen y despliegan por separado, así
+que estos módulos se copian en cada uno en lugar de instalarse como paquete. Se
+edita solo el original de SHARED_MODULES (ver README.md) y se propaga con --fix.
+
+Uso (desde el directorio arqui3/):
+    python scripts/check_shared_modules.py         # código 1 si alguna copia difiere
+    python scripts/check_shared_modules.py --fix   # reemplaza las copias por el original
+"""
+import argparse
+import shutil
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SERVICES = ("s1", "s2", "s3", "s4", "s5", "s6")
+
+def service_copies(module: str) -> list:
+    """Rutas de un módulo en src/infrastructure/ de cada servicio, de s1 a s6"""
+    return [f"services/{service}/src/infrastructure/{module}" for service in SERVICES]
+
+# Original y copias de cada módulo compartido
+SHARED_MODULES = [
+    ["app/src/encoding.py", "services/gateway/src/encoding.py", *service_copies("encoding.py")],
+    service_copies("pagination.py"),
+    service_copies("graphql/connection.py"),
+    service_copies("graphql/persisted_queries.py"),
+    service_copies("database/engine.py"),
+]
+
+def check(fix: bool = False) -> list:
+    """
+    Compara cada copia con su original.
+
+    Args:
+        fix (bool, optional): Sobrescribir las copias que difieren
+
+    Returns:
+        list: Copias que diferían del original
+    """
+    stale = []
+    for original, *copies in SHARED_MODULES:
+        source = (ROOT / original).read_bytes()
+        for copy in copies:
+            path = ROOT / copy
+            if path.exists() and path.read_bytes() == source:
+                continue
+            stale.append((original, copy))
+            if fix:
+                shutil.copyfile(ROOT / original, path)
+    return stale
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fix", action="store_true", help="Reemplazar las copias desactualizadas por el original")
+    args = parser.parse_args()
+
+    stale = check(args.fix)
+    for original, copy in stale:
+        action = "actualizada desde" if args.fix else "difiere de"
+        print(f"{copy} {action} {original}")
+    if stale and not args.fix:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Compara la latencia de las llamadas del gateway a un servicio bajo carga concurrente.
+
+- antes: un httpx.AsyncClient nuevo por llamada (handshake TCP en cada consulta).
+- después: el cliente keep-alive compartido del registro de http_clients.
+
+Por defecto levanta un servicio GraphQL mínimo en proceso que responde al
+instante, para aislar el costo de conexión; con --url se mide contra un
+servicio real (ej. http://localhost:8001).
+
+Uso (desde el directorio gateway/):
+    python -m benchmarks.client_pool [--requests 2000] [--concurrency 50] [--url URL]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import httpx
+from src.http_clients import ServiceClientRegistry
+
+QUERY = """
+query GetRequisition($id: Int!) {
+    requisition(requisitionId: $id) {
+        id
+        status
+    }
+}
+"""
+
+RESPONSE_BODY = json.dumps({"data": {"requisition": {"id": 1, "status": "APPROVED"}}}).encode()
+
+async def handle_connection(reader, writer):
+    """Servicio HTTP/1.1 keep-alive mínimo: responde el mismo JSON a cada petición"""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.decode("latin-1").split("\r\n"):
+                name, _, value = line.partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            if length:
+                await reader.readexactly(length)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(RESPONSE_BODY)}\r\n\r\n".encode()
+                + RESPONSE_BODY
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+async def per_call(service_url, payload):
+    async with httpx.AsyncClient() as client:
+        response = await client.post(f"{service_url}/graphql", json=payload)
+        response.json()
+
+def shared(registry, service_url):
+    async def call(_, payload):
+        response = await registry.get_client(service_url).post("/graphql", json=payload)
+        response.json()
+    return call
+
+async def run(label, call, service_url, total, concurrency):
+    payload = {"query": QUERY, "variables": {"id": 1}}
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            started_at = time.perf_counter()
+            await call(service_url, payload)
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[min(int(0.99 * len(latencies)), len(latencies) - 1)] * 1000
+    print(f"{label:<32} p50 {p50:>8.2f} ms   p99 {p99:>8.2f} ms   {total / elapsed:>8.0f} req/s")
+    return p50, p99
+
+async def main(total, concurrency, url):
+    server = None
+    if url is None:
+        server = await asyncio.start_server(handle_connection, "127.0.0.1", 0)
+        url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+    registry = ServiceClientRegistry({"benchmark": url})
+    await registry.start()
+    try:
+        before = await run("antes (cliente por llamada)", per_call, url, total, concurrency)
+        after = await run("después (cliente compartido)", shared(registry, url), url, total, concurrency)
+        print(f"{'mejora p50 / p99':<32} {before[0] / after[0]:>10.1f}x {before[1] / after[1]:>12.1f}x")
+    finally:
+        await registry.close()
+        if server:
+            server.close()
+            await server.wait_closed()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--url", default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.url))
@@ -0,0 +1,151 @@
+"""
+Mide, por operación, los bytes enviados y el CPU de serialización de las respuestas.
+
+Para cada operación representativa (listas de candidatos con skills, procesos de
+selección con reportes, entrevistas con feedback y el pipeline de contratación)
+genera una respuesta con --rows filas y compara:
+
+- bytes: JSON de json.dumps, JSON compacto de encoding.dumps, gzip y brotli
+- CPU (µs por respuesta): json.dumps frente a encoding.dumps (orjson si está
+  instalado), json.loads frente a encoding.loads, y el costo de comprimir
+
+Uso (desde el directorio gateway/):
+    python -m benchmarks.encoding [--rows 200] [--iterations 200]
+"""
+import argparse
+import gzip
+import json
+import random
+import time
+from src.encoding import (
+    COMPRESSION_BROTLI_QUALITY,
+    COMPRESSION_GZIP_LEVEL,
+    brotli,
+    dumps,
+    loads,
+    orjson
+)
+
+WORDS = (
+    "python sql react docker kubernetes liderazgo comunicación análisis diseño "
+    "pruebas arquitectura negociación inglés scrum datos seguridad redes java"
+).split()
+
+def sentence(rng, words=12):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+def candidate(rng, candidate_id):
+    return {
+        "id": candidate_id,
+        "name": f"Candidato {candidate_id}",
+        "email": f"candidato{candidate_id}@example.com",
+        "resumeUrl": f"https://cv.example.com/{candidate_id}.pdf",
+        "vacancyId": 1,
+        "status": rng.choice(["APPLIED", "IN_REVIEW", "INTERVIEWED", "REJECTED"]),
+        "skills": rng.sample(WORDS, 8),
+        "experienceYears": rng.randint(0, 15),
+        "applicationDate": "2024-03-01T10:00:00",
+        "createdAt": "2024-03-01T10:00:00",
+    }
+
+def selection(rng, candidate_id):
+    return {
+        "id": candidate_id,
+        "vacancyId": 1,
+        "candidateId": candidate_id,
+        "report": {
+            "technicalEvaluation": {"score": rng.randint(1, 10), "feedback": sentence(rng, 40)},
+            "hrEvaluation": {"score": rng.randint(1, 10), "feedback": sentence(rng, 40)},
+            "additionalNotes": sentence(rng, 25),
+        },
+        "decision": rng.choice(["HIRE", "REJECT", None]),
+        "status": "COMPLETED",
+        "createdAt": "2024-03-10T10:00:00",
+        "updatedAt": "2024-03-12T10:00:00",
+    }
+
+def interview(rng, candidate_id):
+    return {
+        "id": candidate_id,
+        "candidateId": candidate_id,
+        "interviewerId": rng.randint(1, 20),
+        "vacancyId": 1,
+        "interviewType": "TECHNICAL",
+        "scheduledTime": "2024-03-05T15:00:00",
+        "durationMinutes": 60,
+        "location": "Sala 3",
+        "feedback": {
+            "strengths": sentence(rng, 20),
+            "weaknesses": sentence(rng, 20),
+            "technicalScore": rng.randint(1, 10),
+            "communicationScore": rng.randint(1, 10),
+            "culturalFitScore": rng.randint(1, 10),
+            "recommendation": rng.choice(["HIRE", "NO_HIRE"]),
+            "notes": sentence(rng, 30),
+        },
+        "status": "COMPLETED",
+        "createdAt": "2024-03-01T10:00:00",
+    }
+
+def build_operations(rows):
+    rng = random.Random(42)
+    ids = range(1, rows + 1)
+    return {
+        "listCandidatesByVacancy": {"data": {"listCandidatesByVacancy": [candidate(rng, i) for i in ids]}},
+        "getSelectionProcess": {"data": {"getSelectionProcess": [selection(rng, i) for i in ids]}},
+        "interviewsByCandidates": {"data": {"interviewsByCandidates": [interview(rng, i) for i in ids]}},
+        "hiringPipeline": {"data": {"hiringPipeline": {"candidates": [
+            {
+                "candidateId": i,
+                "candidate": candidate(rng, i),
+                "interviews": [interview(rng, i)],
+                "selection": selection(rng, i),
+            }
+            for i in ids
+        ]}}},
+    }
+
+def timed(function, argument, iterations):
+    """µs por llamada"""
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        function(argument)
+    return (time.perf_counter() - started_at) / iterations * 1_000_000
+
+def measure(payload, iterations):
+    stdlib = json.dumps(payload).encode("utf-8")
+    fast = dumps(payload)
+    result = {
+        "json_bytes": len(stdlib),
+        "fast_bytes": len(fast),
+        "gzip_bytes": len(gzip.compress(fast, compresslevel=COMPRESSION_GZIP_LEVEL)),
+        "json_dumps_us": timed(json.dumps, payload, iterations),
+        "fast_dumps_us": timed(dumps, payload, iterations),
+        "json_loads_us": timed(json.loads, stdlib, iterations),
+        "fast_loads_us": timed(loads, fast, iterations),
+        "gzip_us": timed(lambda body: gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL), fast, iterations),
+    }
+    if brotli is not None:
+        result["br_bytes"] = len(brotli.compress(fast, quality=COMPRESSION_BROTLI_QUALITY))
+        result["br_us"] = timed(lambda body: brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY), fast, iterations)
+    return result
+
+def main(rows, iterations):
+    print(f"Serializador rápido: {'orjson' if orjson is not None else 'json (orjson no instalado)'}; "
+          f"brotli: {'sí' if brotli is not None else 'no instalado'}; {rows} filas, {iterations} iteraciones\n")
+    print(f"{'operación':<26}{'json B':>10}{'rápido B':>10}{'gzip B':>9}{'br B':>9}"
+          f"{'dumps µs':>10}{'rápido µs':>11}{'loads µs':>10}{'rápido µs':>11}{'gzip µs':>9}{'br µs':>8}")
+    for name, payload in build_operations(rows).items():
+        r = measure(payload, iterations)
+        print(
+            f"{name:<26}{r['json_bytes']:>10}{r['fast_bytes']:>10}{r['gzip_bytes']:>9}{r.get('br_bytes', '-'):>9}"
+            f"{r['json_dumps_us']:>10.0f}{r['fast_dumps_us']:>11.0f}{r['json_loads_us']:>10.0f}{r['fast_loads_us']:>11.0f}"
+            f"{r['gzip_us']:>9.0f}{r['br_us'] if 'br_us' in r else float('nan'):>8.0f}"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    main(args.rows, args.iterations)
@@ -0,0 +1,103 @@
+"""
+Agrupación de operaciones de lectura idénticas en curso (singleflight).
+
+Cuando llegan a la vez varias consultas con el mismo documento normalizado,
+nombre de operación y variables, solo la primera (líder) llama a los
+servicios; las demás esperan su resultado y lo comparten. Si el líder se
+cancela o falla antes de terminar, cada una de las que esperaban se ejecuta
+por su cuenta.
+"""
+import asyncio
+import logging
+import os
+from typing import AsyncIterator
+from strawberry.extensions import SchemaExtension
+from .http_clients import downstream_calls
+from .response_cache import ResponseCache, SharedExecutionResult, analyze_document
+
+logger = logging.getLogger(__name__)
+
+GATEWAY_COALESCING_ENABLED = os.getenv("GATEWAY_COALESCING_ENABLED", "true").lower() == "true"
+
+class InFlightRequests:
+    """Operaciones de lectura en curso por clave, con sus contadores"""
+
+    def __init__(self):
+        self.pending = {}
+        self.stats = {"leaders": 0, "coalesced": 0, "calls_saved": 0, "fallbacks": 0}
+
+    def join(self, key: str):
+        """
+        Registra una operación.
+
+        Returns:
+            tuple: (True y el futuro a resolver si es la líder,
+                False y el futuro del líder si ya hay una igual en curso)
+        """
+        future = self.pending.get(key)
+        if future is not None:
+            return False, future
+        future = asyncio.get_running_loop().create_future()
+        self.pending[key] = future
+        self.stats["leaders"] += 1
+        return True, future
+
+    def finish(self, key: str, future: asyncio.Future, outcome) -> None:
+        """Publica el resultado del líder, o None si no terminó, y libera la clave"""
+        if self.pending.get(key) is future:
+            del self.pending[key]
+        if not future.done():
+            future.set_result(outcome)
+
+    def metrics(self) -> dict:
+        return {**self.stats, "in_flight": len(self.pending)}
+
+in_flight = InFlightRequests()
+
+class RequestCoalescer(SchemaExtension):
+    """
+    Comparte el resultado de una lectura idéntica que ya está en curso. Debe ir
+    después de ResponseCacheExtension: los aciertos de caché no llegan a agruparse.
+    """
+
+    coalesced = False
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        execution_context = self.execution_context
+        if not GATEWAY_COALESCING_ENABLED or execution_context.result is not None:
+            yield
+            return
+
+        normalized, _, read_only, _, _ = analyze_document(execution_context.query)
+        if not read_only:
+            yield
+            return
+
+        key = ResponseCache.key(normalized, execution_context.operation_name, execution_context.variables)
+        leader, future = in_flight.join(key)
+
+        if not leader:
+            # shield: si se cancela esta petición no se cancela el futuro de las demás
+            outcome = await asyncio.shield(future)
+            if outcome is None:
+                in_flight.stats["fallbacks"] += 1
+            else:
+                result, calls = outcome
+                execution_context.result = SharedExecutionResult(data=result.data, errors=result.errors)
+                in_flight.stats["coalesced"] += 1
+                in_flight.stats["calls_saved"] += calls
+                self.coalesced = True
+            yield
+            return
+
+        outcome = None
+        try:
+            yield
+            if execution_context.result is not None:
+                calls = downstream_calls.get() or {}
+                outcome = (execution_context.result, sum(calls.values()))
+        finally:
+            in_flight.finish(key, future, outcome)
+
+    def get_results(self) -> dict:
+        return {"coalesced": True} if self.coalesced else {}
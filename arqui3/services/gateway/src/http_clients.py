@@ -0,0 +1,209 @@
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+import httpx
+from .metrics import DOWNSTREAM_DURATION
+
+logger = logging.getLogger(__name__)
+
+# URLs de los servicios
+REQUISITIONS_SERVICE_URL = os.getenv("REQUISITIONS_SERVICE_URL", "http://localhost:8001")
+VACANCIES_SERVICE_URL = os.getenv("VACANCIES_SERVICE_URL", "http://localhost:8002")
+CANDIDATES_SERVICE_URL = os.getenv("CANDIDATES_SERVICE_URL", "http://localhost:8003")
+EVALUATIONS_SERVICE_URL = os.getenv("EVALUATIONS_SERVICE_URL", "http://localhost:8004")
+INTERVIEWS_SERVICE_URL = os.getenv("INTERVIEWS_SERVICE_URL", "http://localhost:8005")
+SELECTIONS_SERVICE_URL = os.getenv("SELECTIONS_SERVICE_URL", "http://localhost:8006")
+
+SERVICE_URLS = {
+    "requisitions": REQUISITIONS_SERVICE_URL,
+    "vacancies": VACANCIES_SERVICE_URL,
+    "candidates": CANDIDATES_SERVICE_URL,
+    "evaluations": EVALUATIONS_SERVICE_URL,
+    "interviews": INTERVIEWS_SERVICE_URL,
+    "selections": SELECTIONS_SERVICE_URL,
+}
+
+# Pool de conexiones por servicio
+GATEWAY_MAX_CONNECTIONS = int(os.getenv("GATEWAY_MAX_CONNECTIONS", "100"))
+GATEWAY_MAX_KEEPALIVE = int(os.getenv("GATEWAY_MAX_KEEPALIVE", "20"))
+GATEWAY_KEEPALIVE_EXPIRY = float(os.getenv("GATEWAY_KEEPALIVE_EXPIRY", "30"))
+
+# Tiempos límite (segundos)
+GATEWAY_CONNECT_TIMEOUT = float(os.getenv("GATEWAY_CONNECT_TIMEOUT", "2"))
+GATEWAY_READ_TIMEOUT = float(os.getenv("GATEWAY_READ_TIMEOUT", "10"))
+GATEWAY_WRITE_TIMEOUT = float(os.getenv("GATEWAY_WRITE_TIMEOUT", "5"))
+GATEWAY_POOL_TIMEOUT = float(os.getenv("GATEWAY_POOL_TIMEOUT", "2"))
+
+# HTTP/2 requiere el extra httpx[http2] y un servicio (o proxy TLS) que lo hable
+GATEWAY_HTTP2 = os.getenv("GATEWAY_HTTP2", "false").lower() == "true"
+
+# Conexiones que se abren por servicio al iniciar el gateway
+GATEWAY_WARMUP_CONNECTIONS = int(os.getenv("GATEWAY_WARMUP_CONNECTIONS", "4"))
+
+# Llamadas a servicios de la operación GraphQL en curso, por servicio
+downstream_calls: ContextVar[Optional[Counter]] = ContextVar("downstream_calls", default=None)
+
+def http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+class ClientStats:
+    """Métricas de uso del pool de conexiones de un servicio"""
+
+    def __init__(self, service: str = "unknown"):
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.total_time = 0.0
+        # Series del histograma ya resueltas para no buscar etiquetas en cada llamada
+        self.ok_latency = DOWNSTREAM_DURATION.labels(service, "ok")
+        self.error_latency = DOWNSTREAM_DURATION.labels(service, "error")
+
+    def begin(self) -> float:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return time.perf_counter()
+
+    def end(self, started_at: float, success: bool) -> None:
+        elapsed = time.perf_counter() - started_at
+        self.in_flight -= 1
+        self.total_time += elapsed
+        if success:
+            self.ok_latency.observe(elapsed)
+        else:
+            self.errors += 1
+            self.error_latency.observe(elapsed)
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "avg_ms": round(self.total_time / self.requests * 1000, 2) if self.requests else 0.0,
+        }
+
+class OperationStats:
+    """Llamadas a servicios que provoca cada operación GraphQL del gateway"""
+
+    def __init__(self):
+        self.operations = {}
+
+    def record(self, operation_name: str, calls: Counter) -> None:
+        entry = self.operations.setdefault(
+            operation_name,
+            {"count": 0, "downstream_calls": 0, "max_downstream_calls": 0, "by_service": Counter()}
+        )
+        total = sum(calls.values())
+        entry["count"] += 1
+        entry["downstream_calls"] += total
+        entry["max_downstream_calls"] = max(entry["max_downstream_calls"], total)
+        entry["by_service"].update(calls)
+
+    def to_dict(self) -> dict:
+        return {
+            name: {
+                "count": entry["count"],
+                "avg_downstream_calls": round(entry["downstream_calls"] / entry["count"], 2),
+                "max_downstream_calls": entry["max_downstream_calls"],
+                "by_service": dict(entry["by_service"]),
+            }
+            for name, entry in self.operations.items()
+        }
+
+class ServiceClientRegistry:
+    """
+    Registro de clientes httpx con un pool keep-alive por servicio, compartidos
+    durante toda la vida del gateway.
+    """
+
+    def __init__(self, service_urls: dict = None):
+        self.service_urls = dict(service_urls or SERVICE_URLS)
+        self.clients = {}
+        self.stats = {url: ClientStats(name) for name, url in self.service_urls.items()}
+        self.names = {url: name for name, url in self.service_urls.items()}
+        self.operations = OperationStats()
+        self.http2 = False
+
+    def _build_client(self, service_url: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=service_url,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=GATEWAY_MAX_CONNECTIONS,
+                max_keepalive_connections=GATEWAY_MAX_KEEPALIVE,
+                keepalive_expiry=GATEWAY_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                connect=GATEWAY_CONNECT_TIMEOUT,
+                read=GATEWAY_READ_TIMEOUT,
+                write=GATEWAY_WRITE_TIMEOUT,
+                pool=GATEWAY_POOL_TIMEOUT,
+            ),
+        )
+
+    async def start(self) -> None:
+        """Crea un cliente por servicio y abre sus primeras conexiones"""
+        self.http2 = GATEWAY_HTTP2 and http2_available()
+        if GATEWAY_HTTP2 and not self.http2:
+            logger.warning("GATEWAY_HTTP2 activo pero falta el paquete h2 (httpx[http2]); se usa HTTP/1.1")
+
+        for name, service_url in self.service_urls.items():
+            self.clients[service_url] = self._build_client(service_url)
+            logger.info(f"Cliente HTTP para {name} iniciado en {service_url} (http2={self.http2})")
+        await self.warm_up()
+
+    async def warm_up(self, connections: int = GATEWAY_WARMUP_CONNECTIONS) -> None:
+        """
+        Abre `connections` conexiones por servicio con peticiones concurrentes a la
+        raíz, para que las primeras consultas no paguen el handshake. Un servicio
+        caído no impide iniciar el gateway.
+        """
+        async def ping(name, client):
+            try:
+                await client.get("/")
+                return True
+            except httpx.HTTPError as e:
+                logger.warning(f"No se pudo precalentar la conexión con {name}: {str(e)}")
+                return False
+
+        for name, service_url in self.service_urls.items():
+            client = self.clients[service_url]
+            results = await asyncio.gather(*(ping(name, client) for _ in range(connections)))
+            logger.info(f"Conexiones precalentadas para {name}: {sum(results)}/{connections}")
+
+    def get_client(self, service_url: str) -> httpx.AsyncClient:
+        """Devuelve el cliente compartido del servicio; lo crea si el gateway no lo inició"""
+        client = self.clients.get(service_url)
+        if client is None:
+            client = self.clients[service_url] = self._build_client(service_url)
+            self.stats.setdefault(service_url, ClientStats(self.names.get(service_url, service_url)))
+        return client
+
+    def count_call(self, service_url: str) -> None:
+        """Suma una llamada al servicio en el contador de la operación en curso"""
+        calls = downstream_calls.get()
+        if calls is not None:
+            calls[self.names.get(service_url, service_url)] += 1
+
+    async def close(self) -> None:
+        """Cierra todos los clientes y sus conexiones"""
+        for client in self.clients.values():
+            await client.aclose()
+        self.clients.clear()
+        logger.info("Clientes HTTP del gateway cerrados")
+
+    def metrics(self) -> dict:
+        """Devuelve las métricas de uso de cada pool"""
+        return {self.names.get(url, url): stats.to_dict() for url, stats in self.stats.items()}
+
+clients = ServiceClientRegistry()
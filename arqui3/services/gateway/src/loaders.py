@@ -0,0 +1,218 @@
+"""
+DataLoaders por petición para los campos anidados entre servicios.
+
+Cada loader junta los IDs pedidos durante un mismo tick del event loop y hace
+una sola consulta por lotes al servicio correspondiente, en lugar de una por
+cada objeto padre (N+1).
+"""
+import dataclasses
+import typing
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Callable, Iterator, List
+from strawberry.dataloader import DataLoader
+from strawberry.extensions import SchemaExtension
+from .types import Candidate, Interview, Selection, EvaluationResult
+from .http_clients import (
+    clients,
+    downstream_calls,
+    CANDIDATES_SERVICE_URL,
+    EVALUATIONS_SERVICE_URL,
+    INTERVIEWS_SERVICE_URL,
+    SELECTIONS_SERVICE_URL
+)
+
+CANDIDATE_FIELDS = """
+    id
+    name
+    email
+    resumeUrl
+    vacancyId
+    status
+    skills
+    experienceYears
+    applicationDate
+    createdAt
+"""
+
+CANDIDATES_BY_IDS = """
+query CandidatesByIds($ids: [Int!]!) {
+    candidatesByIds(ids: $ids) {%s}
+}
+""" % CANDIDATE_FIELDS
+
+CANDIDATES_BY_VACANCIES = """
+query CandidatesByVacancies($vacancyIds: [Int!]!) {
+    candidatesByVacancies(vacancyIds: $vacancyIds) {%s}
+}
+""" % CANDIDATE_FIELDS
+
+EVALUATION_FIELDS = """
+    id
+    candidateId
+    testType
+    status
+    score
+    feedback
+    createdAt
+    updatedAt
+"""
+
+INTERVIEW_FIELDS = """
+    id
+    candidateId
+    interviewerId
+    vacancyId
+    interviewType
+    scheduledTime
+    durationMinutes
+    location
+    feedback {
+        strengths
+        weaknesses
+        technicalScore
+        communicationScore
+        culturalFitScore
+        recommendation
+        notes
+    }
+    status
+    createdAt
+"""
+
+SELECTION_FIELDS = """
+    id
+    vacancyId
+    candidateId
+    report {
+        technicalEvaluation { score feedback }
+        hrEvaluation { score feedback }
+        additionalNotes
+    }
+    decision
+    status
+    createdAt
+    updatedAt
+"""
+
+EVALUATIONS_BY_CANDIDATES = """
+query EvaluationsByCandidates($candidateIds: [Int!]!) {
+    evaluationsByCandidates(candidateIds: $candidateIds) {%s}
+}
+""" % EVALUATION_FIELDS
+
+INTERVIEWS_BY_CANDIDATES = """
+query InterviewsByCandidates($candidateIds: [Int!]!) {
+    interviewsByCandidates(candidateIds: $candidateIds) {%s}
+}
+""" % INTERVIEW_FIELDS
+
+SELECTIONS_BY_CANDIDATES = """
+query SelectionsByCandidates($candidateIds: [Int!]!) {
+    selectionsByCandidates(candidateIds: $candidateIds) {%s}
+}
+""" % SELECTION_FIELDS
+
+def _snake_case(name: str) -> str:
+    return "".join(f"_{char.lower()}" if char.isupper() else char for char in name)
+
+def _convert(field_type, value):
+    if value is None:
+        return None
+    args = [arg for arg in typing.get_args(field_type) if arg is not type(None)]
+    if typing.get_origin(field_type) is typing.Union and len(args) == 1:
+        return _convert(args[0], value)
+    if typing.get_origin(field_type) in (list, List):
+        return [_convert(args[0], item) for item in value]
+    if field_type is datetime and isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dataclasses.is_dataclass(field_type) and isinstance(value, dict):
+        return from_service(field_type, value)
+    return value
+
+def from_service(cls, data: dict):
+    """Construye un tipo del gateway a partir de la respuesta (camelCase) de un servicio"""
+    values = {_snake_case(key): value for key, value in data.items()}
+    hints = typing.get_type_hints(cls)
+    kwargs = {
+        field.name: _convert(hints[field.name], values.get(field.name))
+        for field in dataclasses.fields(cls)
+        if field.init
+    }
+    return cls(**kwargs)
+
+class Loaders:
+    """
+    DataLoaders de una petición. Se crean en el context_getter para que la caché
+    de cada loader no se comparta entre peticiones.
+    """
+
+    def __init__(self, execute: Callable):
+        self.execute = execute
+        self.candidate_by_id = DataLoader(load_fn=self._load_candidates)
+        self.candidates_by_vacancy = DataLoader(load_fn=self._load_candidates_by_vacancy)
+        self.evaluations_by_candidate = DataLoader(load_fn=self._load_evaluations)
+        self.interviews_by_candidate = DataLoader(load_fn=self._load_interviews)
+        self.selections_by_candidate = DataLoader(load_fn=self._load_selections)
+
+    async def _fetch(self, service_url: str, query: str, field: str, variables: dict) -> list:
+        result = await self.execute(service_url, query, variables)
+        return (result.get("data") or {}).get(field) or []
+
+    @staticmethod
+    def _group(items: list, keys: List[int], attribute: str) -> List[list]:
+        grouped = defaultdict(list)
+        for item in items:
+            grouped[getattr(item, attribute)].append(item)
+        return [grouped.get(key, []) for key in keys]
+
+    async def _load_candidates(self, ids: List[int]) -> List[Candidate]:
+        rows = await self._fetch(CANDIDATES_SERVICE_URL, CANDIDATES_BY_IDS, "candidatesByIds", {"ids": list(ids)})
+        by_id = {row["id"]: from_service(Candidate, row) for row in rows}
+        return [by_id.get(candidate_id) for candidate_id in ids]
+
+    async def _load_candidates_by_vacancy(self, vacancy_ids: List[int]) -> List[List[Candidate]]:
+        rows = await self._fetch(
+            CANDIDATES_SERVICE_URL, CANDIDATES_BY_VACANCIES, "candidatesByVacancies",
+            {"vacancyIds": list(vacancy_ids)}
+        )
+        return self._group([from_service(Candidate, row) for row in rows], vacancy_ids, "vacancy_id")
+
+    async def _load_evaluations(self, candidate_ids: List[int]) -> List[List[EvaluationResult]]:
+        rows = await self._fetch(
+            EVALUATIONS_SERVICE_URL, EVALUATIONS_BY_CANDIDATES, "evaluationsByCandidates",
+            {"candidateIds": list(candidate_ids)}
+        )
+        return self._group([from_service(EvaluationResult, row) for row in rows], candidate_ids, "candidate_id")
+
+    async def _load_interviews(self, candidate_ids: List[int]) -> List[List[Interview]]:
+        rows = await self._fetch(
+            INTERVIEWS_SERVICE_URL, INTERVIEWS_BY_CANDIDATES, "interviewsByCandidates",
+            {"candidateIds": list(candidate_ids)}
+        )
+        return self._group([from_service(Interview, row) for row in rows], candidate_ids, "candidate_id")
+
+    async def _load_selections(self, candidate_ids: List[int]) -> List[List[Selection]]:
+        rows = await self._fetch(
+            SELECTIONS_SERVICE_URL, SELECTIONS_BY_CANDIDATES, "selectionsByCandidates",
+            {"candidateIds": list(candidate_ids)}
+        )
+        return self._group([from_service(Selection, row) for row in rows], candidate_ids, "candidate_id")
+
+class DownstreamCallCounter(SchemaExtension):
+    """
+    Cuenta las llamadas a servicios de cada operación, las acumula en las métricas
+    del gateway y las devuelve en extensions.downstreamCalls de la respuesta.
+    """
+
+    def on_operation(self) -> Iterator[None]:
+        self.calls = Counter()
+        token = downstream_calls.set(self.calls)
+        try:
+            yield
+        finally:
+            downstream_calls.reset(token)
+            clients.operations.record(self.execution_context.operation_name or "anonymous", self.calls)
+
+    def get_results(self) -> dict:
+        return {"downstreamCalls": dict(self.calls)}
@@ -1,12 +1,24 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from strawberry.fastapi import GraphQLRouter
-from .schema import schema
+from fastapi.responses import StreamingResponse
+from graphql import ExecutionResult as GraphQLExecutionResult, GraphQLError, OperationType, get_operation_ast, parse, validate
+from starlette.requests import HTTPConnection
+from .schema import schema, execute_graphql_query
+from .loaders import Loaders
+from .response_cache import CacheInvalidationConsumer, response_cache
+from .query_cost import CLIENT_HEADER, DEFAULT_CLIENT, GATEWAY_COST_ENABLED, admission
+from .streaming import MULTIPART_CONTENT_TYPE, multipart_stream
+from .coalescing import in_flight
+from .persisted_queries import PersistedQueryRouter
+from .http_clients import clients, SERVICE_URLS, GATEWAY_MAX_CONNECTIONS
+from .metrics import PrometheusMiddleware, StatsCollector, register_collector, render_metrics
+from .encoding import CompressionMiddleware, FastJSONResponse
 
 app = FastAPI(
     title="HR Selection Process Gateway",
     description="API Gateway para el proceso de selección de personal",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
 # Configurar CORS
@@ -18,26 +30,162 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Peticiones por ruta, errores y duración en formato Prometheus
+app.add_middleware(PrometheusMiddleware)
+
+# Comprimir con gzip/brotli las respuestas grandes según Accept-Encoding
+app.add_middleware(CompressionMiddleware)
+
+# Uso de los pools y de la caché, leídos en cada scrape
+register_collector(StatsCollector(
+    "gateway_pool", "service",
+    lambda: {
+        name: {**values, "max_connections": GATEWAY_MAX_CONNECTIONS}
+        for name, values in clients.metrics().items()
+    },
+    gauges={
+        "in_flight": "Peticiones en curso hacia el servicio",
+        "max_in_flight": "Máximo de peticiones simultáneas observado",
+        "max_connections": "Conexiones máximas del pool",
+    }
+))
+register_collector(StatsCollector(
+    "gateway_response_cache", "cache",
+    lambda: {"responses": response_cache.metrics()},
+    gauges={
+        "size": "Entradas en la caché de respuestas",
+        "bytes": "Bytes ocupados por la caché de respuestas",
+        "hit_rate": "Tasa de aciertos de la caché de respuestas",
+    },
+    counters={
+        "hits": "Aciertos de la caché de respuestas",
+        "misses": "Fallos de la caché de respuestas",
+        "invalidations": "Entradas invalidadas por eventos o mutaciones",
+    }
+))
+register_collector(StatsCollector(
+    "gateway_coalescing", "kind",
+    lambda: {"reads": in_flight.metrics()},
+    gauges={"in_flight": "Lecturas líderes en curso"},
+    counters={
+        "coalesced": "Lecturas que compartieron el resultado de otra en curso",
+        "calls_saved": "Llamadas a servicios ahorradas al agrupar lecturas",
+    }
+))
+
+# Invalida la caché de respuestas con los eventos de los servicios
+cache_invalidation = CacheInvalidationConsumer()
+
+# DataLoaders nuevos en cada petición (agrupan las consultas de los campos anidados)
+# y el cliente al que se cargan los presupuestos de costo
+# (HTTPConnection: también se usa para las suscripciones por WebSocket)
+async def get_context(request: HTTPConnection):
+    return {
+        "loaders": Loaders(execute_graphql_query),
+        "client_id": request.headers.get(CLIENT_HEADER, DEFAULT_CLIENT)
+    }
+
 # Configurar la ruta de GraphQL
-graphql_app = GraphQLRouter(
+graphql_app = PersistedQueryRouter(
     schema,
+    context_getter=get_context,
     graphiql=True  # Habilitar la interfaz GraphiQL
 )
 
 app.include_router(graphql_app, prefix="/graphql")
 
+def graphql_errors(errors, status_code: int = 200) -> FastJSONResponse:
+    return FastJSONResponse({"data": None, "errors": [error.formatted for error in errors]}, status_code=status_code)
+
+@app.post("/graphql/stream")
+async def graphql_stream(request: Request):
+    """
+    Entrega incremental por HTTP: las suscripciones se responden con una parte
+    multipart/mixed por resultado; las demás operaciones, con una respuesta JSON normal.
+    """
+    try:
+        body = await request.json()
+    except ValueError:
+        return graphql_errors([GraphQLError("El cuerpo de la petición no es un JSON válido")], 400)
+    if not isinstance(body, dict):
+        return graphql_errors([GraphQLError("El cuerpo de la petición debe ser un objeto JSON")], 400)
+    query = body.get("query") or ""
+    variables = body.get("variables")
+    operation_name = body.get("operationName")
+    context = await get_context(request)
+
+    try:
+        document = parse(query)
+    except GraphQLError as e:
+        return graphql_errors([e], 400)
+    # La suscripción de graphql-core no valida el documento ni pasa por las extensiones
+    errors = validate(schema._schema, document)
+    if errors:
+        return graphql_errors(errors, 400)
+    operation = get_operation_ast(document, operation_name)
+    if operation is None:
+        return graphql_errors([GraphQLError("No se encontró la operación a ejecutar")], 400)
+
+    if operation.operation != OperationType.SUBSCRIPTION:
+        result = await schema.execute(
+            query, variable_values=variables, context_value=context, operation_name=operation_name
+        )
+        payload = {"data": result.data}
+        if result.errors:
+            payload["errors"] = [error.formatted for error in result.errors]
+        return FastJSONResponse(payload)
+
+    if GATEWAY_COST_ENABLED:
+        _, error = admission.admit(schema._schema, document, operation_name, variables, context["client_id"])
+        if error is not None:
+            return graphql_errors([error])
+
+    results = await schema.subscribe(
+        query, variable_values=variables, context_value=context, operation_name=operation_name
+    )
+    if isinstance(results, GraphQLExecutionResult):
+        return graphql_errors(results.errors or [])
+    return StreamingResponse(multipart_stream(results), media_type=MULTIPART_CONTENT_TYPE)
+
+@app.on_event("startup")
+async def startup_event():
+    """Crea los clientes HTTP compartidos y precalienta las conexiones con los servicios"""
+    await clients.start()
+    await cache_invalidation.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Detiene la invalidación de caché y cierra los clientes HTTP compartidos"""
+    await cache_invalidation.stop()
+    await clients.close()
+
 @app.get("/")
 async def root():
     return {
         "message": "Bienvenido al Gateway del Proceso de Selección",
-        "services": {
-            "requisitions": "http://localhost:8001",
-            "vacancies": "http://localhost:8002",
-            "candidates": "http://localhost:8003",
-            "evaluations": "http://localhost:8004",
-            "interviews": "http://localhost:8005",
-            "selections": "http://localhost:8006"
-        },
+        "services": SERVICE_URLS,
         "documentation": "/docs",
         "graphql": "/graphql"
-    } 
\ No newline at end of file
+    } 
+
+@app.get("/health")
+async def health_check():
+    return {"status": "ok"}
+
+@app.get("/metrics")
+async def metrics():
+    """Métricas en formato Prometheus"""
+    body, content_type = render_metrics()
+    return Response(content=body, headers={"Content-Type": content_type})
+
+@app.get("/metrics/summary")
+async def metrics_summary():
+    """Métricas de los pools, las llamadas a servicios por operación, la caché, el control de admisión y los lotes"""
+    return {
+        "pools": clients.metrics(),
+        "operations": clients.operations.to_dict(),
+        "cache": {**response_cache.metrics(), "invalidation": cache_invalidation.metrics()},
+        "admission": admission.metrics(),
+        "coalescing": in_flight.metrics(),
+        "batches": graphql_app.batch_stats
+    }
@@ -0,0 +1,140 @@
+"""
+Métricas en formato Prometheus del gateway.
+
+En el camino de cada petición solo se incrementan contadores e histogramas ya
+creados; el uso de los pools y los contadores de la caché se leen al momento
+de la recolección (scrape) mediante collectors.
+"""
+import os
+import time
+from typing import Callable, Iterator
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, REGISTRY
+from strawberry.extensions import SchemaExtension
+
+# Límite de nombres de operación distintos como etiqueta; el resto se agrupa en "other"
+GATEWAY_METRICS_MAX_OPERATIONS = int(os.getenv("GATEWAY_METRICS_MAX_OPERATIONS", "200"))
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUESTS = Counter(
+    "gateway_http_requests_total", "Peticiones HTTP atendidas", ["method", "route", "status"]
+)
+HTTP_ERRORS = Counter(
+    "gateway_http_request_errors_total", "Peticiones HTTP con error 5xx o excepción", ["method", "route"]
+)
+HTTP_DURATION = Histogram(
+    "gateway_http_request_duration_seconds", "Duración de las peticiones HTTP", ["method", "route"],
+    buckets=LATENCY_BUCKETS
+)
+GRAPHQL_OPERATIONS = Counter(
+    "gateway_graphql_operations_total", "Operaciones GraphQL ejecutadas", ["operation", "type"]
+)
+GRAPHQL_ERRORS = Counter(
+    "gateway_graphql_operation_errors_total", "Operaciones GraphQL con errores", ["operation", "type"]
+)
+GRAPHQL_DURATION = Histogram(
+    "gateway_graphql_operation_duration_seconds", "Duración de las operaciones GraphQL", ["operation", "type"],
+    buckets=LATENCY_BUCKETS
+)
+DOWNSTREAM_DURATION = Histogram(
+    "gateway_downstream_request_duration_seconds", "Latencia de las llamadas a los servicios", ["service", "outcome"],
+    buckets=LATENCY_BUCKETS
+)
+
+class PrometheusMiddleware:
+    """
+    Middleware ASGI que mide las peticiones HTTP. La ruta es la plantilla del
+    endpoint (no la URL) para acotar las etiquetas.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # El router de FastAPI deja la ruta resuelta en el scope
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            HTTP_REQUESTS.labels(method, path, status).inc()
+            HTTP_DURATION.labels(method, path).observe(time.perf_counter() - started_at)
+            if status >= 500:
+                HTTP_ERRORS.labels(method, path).inc()
+
+_operation_labels = set()
+
+def operation_label(operation_name) -> str:
+    name = operation_name or "anonymous"
+    if name not in _operation_labels:
+        if len(_operation_labels) >= GATEWAY_METRICS_MAX_OPERATIONS:
+            return "other"
+        _operation_labels.add(name)
+    return name
+
+class OperationMetrics(SchemaExtension):
+    """Cuenta y mide cada operación GraphQL por nombre y tipo"""
+
+    def on_operation(self) -> Iterator[None]:
+        started_at = time.perf_counter()
+        yield
+        execution_context = self.execution_context
+        operation = operation_label(execution_context.operation_name)
+        try:
+            operation_type = execution_context.operation_type.value
+        except RuntimeError:
+            # Documento inválido: no se pudo determinar el tipo
+            operation_type = "unknown"
+        GRAPHQL_OPERATIONS.labels(operation, operation_type).inc()
+        GRAPHQL_DURATION.labels(operation, operation_type).observe(time.perf_counter() - started_at)
+        result = execution_context.result
+        if execution_context.errors or (result is not None and result.errors):
+            GRAPHQL_ERRORS.labels(operation, operation_type).inc()
+
+class StatsCollector:
+    """
+    Expone como gauges y contadores los valores numéricos de unas métricas en
+    memoria con la forma {etiqueta: {campo: valor}}, leídas en cada scrape.
+    """
+
+    def __init__(self, prefix: str, label: str, source: Callable[[], dict], gauges: dict, counters: dict = None):
+        self.prefix = prefix
+        self.label = label
+        self.source = source
+        self.gauges = gauges
+        self.counters = counters or {}
+
+    def collect(self):
+        stats = self.source()
+        for field, documentation in self.gauges.items():
+            family = GaugeMetricFamily(f"{self.prefix}_{field}", documentation, labels=[self.label])
+            for label, values in stats.items():
+                family.add_metric([label], values.get(field, 0))
+            yield family
+        for field, documentation in self.counters.items():
+            family = CounterMetricFamily(f"{self.prefix}_{field}", documentation, labels=[self.label])
+            for label, values in stats.items():
+                family.add_metric([label], values.get(field, 0))
+            yield family
+
+def register_collector(collector) -> None:
+    REGISTRY.register(collector)
+
+def render_metrics() -> tuple:
+    """Devuelve (cuerpo, content-type) con todas las métricas registradas"""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
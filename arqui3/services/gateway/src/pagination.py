@@ -0,0 +1,147 @@
+"""
+Listas paginadas por cursor del gateway.
+
+Cada campo *Connection del gateway pide la página al campo *Connection del
+servicio que tiene los datos y devuelve sus edges y pageInfo tal cual: los
+cursores son los del servicio (keyset sobre createdAt, id), así la página N
+cuesta lo mismo que la primera. totalCount solo se pide al servicio, que lo
+calcula con un COUNT aparte, si el cliente lo seleccionó.
+"""
+from typing import Callable, Optional
+from strawberry.types import Info
+from .types import Connection, Edge, PageInfo
+from .loaders import (
+    CANDIDATE_FIELDS,
+    EVALUATION_FIELDS,
+    INTERVIEW_FIELDS,
+    SELECTION_FIELDS,
+    from_service
+)
+
+REQUISITION_FIELDS = """
+    id
+    positionName
+    functions
+    salaryCategory
+    profile
+    status
+    createdAt
+"""
+
+VACANCY_FIELDS = """
+    id
+    requisitionId
+    platforms
+    status
+    publicationDate
+    closingDate
+    createdAt
+"""
+
+# Selección común de una página; %s son los campos de cada nodo
+PAGE_SELECTION = """
+        edges { cursor node {%s} }
+        pageInfo { hasNextPage endCursor }
+        totalCount @include(if: $withTotal)
+"""
+
+REQUISITIONS_CONNECTION = """
+query RequisitionsConnection($status: String, $first: Int, $after: String, $withTotal: Boolean!) {
+    requisitionsConnection(status: $status, first: $first, after: $after) {%s}
+}
+""" % (PAGE_SELECTION % REQUISITION_FIELDS)
+
+VACANCIES_CONNECTION = """
+query VacanciesConnection($status: String, $first: Int, $after: String, $withTotal: Boolean!) {
+    vacanciesConnection(status: $status, first: $first, after: $after) {%s}
+}
+""" % (PAGE_SELECTION % VACANCY_FIELDS)
+
+CANDIDATES_CONNECTION = """
+query CandidatesConnection($vacancyId: Int!, $first: Int, $after: String, $withTotal: Boolean!) {
+    candidatesConnection(vacancyId: $vacancyId, first: $first, after: $after) {%s}
+}
+""" % (PAGE_SELECTION % CANDIDATE_FIELDS)
+
+EVALUATIONS_CONNECTION = """
+query EvaluationsConnection($candidateId: Int, $first: Int, $after: String, $withTotal: Boolean!) {
+    evaluationsConnection(candidateId: $candidateId, first: $first, after: $after) {%s}
+}
+""" % (PAGE_SELECTION % EVALUATION_FIELDS)
+
+INTERVIEWS_CONNECTION = """
+query InterviewsConnection(
+    $vacancyId: Int, $candidateId: Int, $interviewerId: Int, $status: String,
+    $startDate: DateTime, $endDate: DateTime, $first: Int, $after: String, $withTotal: Boolean!
+) {
+    interviewsConnection(
+        vacancyId: $vacancyId, candidateId: $candidateId, interviewerId: $interviewerId, status: $status,
+        startDate: $startDate, endDate: $endDate, first: $first, after: $after
+    ) {%s}
+}
+""" % (PAGE_SELECTION % INTERVIEW_FIELDS)
+
+SELECTIONS_CONNECTION = """
+query SelectionsConnection($vacancyId: Int, $candidateId: Int, $first: Int, $after: String, $withTotal: Boolean!) {
+    selectionsConnection(vacancyId: $vacancyId, candidateId: $candidateId, first: $first, after: $after) {%s}
+}
+""" % (PAGE_SELECTION % SELECTION_FIELDS)
+
+def selects_total_count(info: Info) -> bool:
+    """True si el cliente pidió totalCount en el campo que se está resolviendo"""
+    return any(
+        getattr(selection, "name", None) == "totalCount"
+        for field in info.selected_fields
+        for selection in field.selections
+    )
+
+async def fetch_page(
+    execute: Callable,
+    service_url: str,
+    query: str,
+    field: str,
+    variables: dict,
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    with_total: bool = False
+) -> dict:
+    """
+    Pide una página de un campo *Connection de un servicio.
+
+    Returns:
+        dict: La conexión del servicio (edges, pageInfo y, si se pidió, totalCount)
+    """
+    result = await execute(
+        service_url,
+        query,
+        {**variables, "first": first, "after": after, "withTotal": with_total}
+    )
+    return (result.get("data") or {}).get(field) or {}
+
+async def fetch_connection(
+    info: Info,
+    execute: Callable,
+    service_url: str,
+    query: str,
+    field: str,
+    node_type,
+    variables: dict,
+    first: Optional[int] = None,
+    after: Optional[str] = None
+) -> Connection:
+    """Página de un servicio convertida a la conexión del gateway"""
+    page = await fetch_page(
+        execute, service_url, query, field, variables, first, after, selects_total_count(info)
+    )
+    page_info = page.get("pageInfo") or {}
+    return Connection(
+        edges=[
+            Edge(cursor=edge["cursor"], node=from_service(node_type, edge["node"]))
+            for edge in page.get("edges") or []
+        ],
+        page_info=PageInfo(
+            has_next_page=page_info.get("hasNextPage", False),
+            end_cursor=page_info.get("endCursor")
+        ),
+        total_count=page.get("totalCount")
+    )
@@ -0,0 +1,285 @@
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Iterator, Optional
+from graphql import GraphQLError
+from strawberry.extensions import SchemaExtension
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLRequestData
+from strawberry.http.exceptions import HTTPException
+from strawberry.schema.exceptions import InvalidOperationTypeError
+from strawberry.schema.execute import parse_document, validate_document
+from strawberry.types import ExecutionResult
+from strawberry.types.graphql import OperationType
+from strawberry.unset import UNSET
+from .encoding import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+PERSISTED_QUERY_CACHE_SIZE = int(os.getenv("PERSISTED_QUERY_CACHE_SIZE", "500"))
+# Manifiesto generado por el paso de build de la app ({hash: query}) para precargar el registro
+PERSISTED_QUERIES_FILE = os.getenv("PERSISTED_QUERIES_FILE")
+# Máximo de operaciones en una petición por lotes (cuerpo JSON con una lista)
+GRAPHQL_BATCH_MAX_SIZE = int(os.getenv("GRAPHQL_BATCH_MAX_SIZE", "20"))
+
+NOT_FOUND_MESSAGE = "PersistedQueryNotFound"
+
+def query_hash(query: str) -> str:
+    """Hash sha256 del texto de la consulta, como en Automatic Persisted Queries"""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+class PersistedQuery:
+    """Consulta registrada: texto, documento parseado y resultado de la validación"""
+
+    __slots__ = ("query", "document", "errors")
+
+    def __init__(self, query: str):
+        self.query = query
+        self.document = None
+        self.errors = None
+
+class PersistedQueryStore:
+    """LRU de consultas por hash; guarda el documento ya parseado y validado"""
+
+    def __init__(self, maxsize: int = PERSISTED_QUERY_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "registered": 0, "evictions": 0}
+
+    def get(self, sha256_hash: str) -> Optional[PersistedQuery]:
+        entry = self.entries.get(sha256_hash)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self.entries.move_to_end(sha256_hash)
+        self.stats["hits"] += 1
+        return entry
+
+    def register(self, sha256_hash: str, query: str) -> PersistedQuery:
+        entry = self.entries.get(sha256_hash)
+        if entry is not None:
+            self.entries.move_to_end(sha256_hash)
+            return entry
+
+        entry = PersistedQuery(query)
+        self.entries[sha256_hash] = entry
+        self.stats["registered"] += 1
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+        return entry
+
+    def load_manifest(self, path: str) -> None:
+        """Registra por adelantado las consultas estáticas del manifiesto"""
+        with open(path, encoding="utf-8") as file:
+            manifest = json.load(file)
+        for sha256_hash, query in manifest.items():
+            if query_hash(query) == sha256_hash:
+                self.register(sha256_hash, query)
+        logger.info(f"{len(manifest)} consultas persistidas precargadas desde {path}")
+
+    def metrics(self) -> dict:
+        return {**self.stats, "size": len(self.entries), "maxsize": self.maxsize}
+
+store = PersistedQueryStore()
+if PERSISTED_QUERIES_FILE and os.path.exists(PERSISTED_QUERIES_FILE):
+    store.load_manifest(PERSISTED_QUERIES_FILE)
+
+class PersistedQueryNotFound(Exception):
+    pass
+
+class PersistedDocumentCache(SchemaExtension):
+    """Reutiliza el documento parseado y validado de las consultas registradas"""
+
+    entry = None
+
+    def on_parse(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        query = execution_context.query
+        sha256_hash = query_hash(query)
+        entry = store.entries.get(sha256_hash)
+        if entry is None or entry.document is None:
+            try:
+                document = parse_document(query, **execution_context.parse_options)
+            except GraphQLError:
+                # Strawberry vuelve a parsear y reporta el error de sintaxis
+                document = None
+            if document is not None:
+                entry = store.register(sha256_hash, query)
+                entry.document = document
+        if entry is not None and entry.document is not None:
+            self.entry = entry
+            execution_context.graphql_document = entry.document
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        if self.entry is not None:
+            if self.entry.errors is None:
+                self.entry.errors = validate_document(
+                    execution_context.schema._schema,
+                    execution_context.graphql_document,
+                    execution_context.validation_rules,
+                )
+            execution_context.errors = self.entry.errors
+        yield
+
+class PersistedQueryRouter(GraphQLRouter):
+    """
+    Router GraphQL que acepta consultas persistidas: el cliente envía
+    extensions.persistedQuery.sha256Hash y, si el hash no está registrado,
+    recibe PersistedQueryNotFound y reintenta con el texto completo.
+
+    También acepta lotes: un POST cuyo cuerpo JSON es una lista de operaciones
+    se responde con la lista de resultados en el mismo orden. Las operaciones
+    del lote se ejecutan en paralelo, así que deben ser independientes entre sí.
+    Si context_getter no recibe parámetros, cada operación tiene su propio
+    contexto (y su propia sesión de base de datos); si los recibe (por ejemplo
+    la petición), todas comparten el contexto de la petición.
+    """
+
+    def __init__(self, schema, context_getter=None, **kwargs):
+        super().__init__(schema, context_getter=context_getter, **kwargs)
+        self.operation_context_getter = None
+        if context_getter is not None and not inspect.signature(context_getter).parameters:
+            self.operation_context_getter = context_getter
+        self.batch_stats = {"batches": 0, "operations": 0}
+
+    def parse_json(self, data):
+        try:
+            return loads(data)
+        except ValueError as e:
+            raise HTTPException(400, "Unable to parse request body as JSON") from e
+
+    def encode_json(self, response_data) -> bytes:
+        return dumps(response_data)
+
+    def request_data(self, data) -> GraphQLRequestData:
+        """Datos de una operación; resuelve el texto de las consultas persistidas"""
+        if not isinstance(data, dict):
+            raise HTTPException(400, "Each operation must be a JSON object")
+
+        query = data.get("query")
+        persisted = (data.get("extensions") or {}).get("persistedQuery")
+
+        if persisted:
+            sha256_hash = persisted.get("sha256Hash")
+            if query:
+                if query_hash(query) != sha256_hash:
+                    raise HTTPException(400, "provided sha does not match query")
+                store.register(sha256_hash, query)
+            else:
+                entry = store.get(sha256_hash)
+                if entry is None:
+                    raise PersistedQueryNotFound()
+                query = entry.query
+
+        return GraphQLRequestData(
+            query=query,
+            variables=data.get("variables"),
+            operation_name=data.get("operationName"),
+        )
+
+    async def parse_http_body(self, request) -> GraphQLRequestData:
+        if "application/json" not in (request.content_type or ""):
+            return await super().parse_http_body(request)
+
+        # run() ya parseó el cuerpo para ver si era un lote
+        data = getattr(request.request.state, "graphql_body", None)
+        if data is None:
+            data = self.parse_json(await request.get_body())
+        return self.request_data(data)
+
+    async def run(self, request, context=UNSET, root_value=UNSET):
+        if request.method == "POST" and "application/json" in request.headers.get("content-type", ""):
+            data = self.parse_json(await request.body())
+            if isinstance(data, list):
+                return await self.run_batch(request, data, context, root_value)
+            request.state.graphql_body = data
+        return await super().run(request, context, root_value)
+
+    async def run_batch(self, request, operations: list, context, root_value):
+        """Ejecuta en paralelo las operaciones de un lote y responde sus resultados en orden"""
+        if not operations:
+            raise HTTPException(400, "Empty batch")
+        if len(operations) > GRAPHQL_BATCH_MAX_SIZE:
+            raise HTTPException(400, f"Batch exceeds the maximum of {GRAPHQL_BATCH_MAX_SIZE} operations")
+
+        self.batch_stats["batches"] += 1
+        self.batch_stats["operations"] += len(operations)
+        sub_response = await self.get_sub_response(request)
+        results = await asyncio.gather(*(
+            self.execute_batched_operation(request, data, context, root_value)
+            for data in operations
+        ))
+        return self.create_response(response_data=list(results), sub_response=sub_response)
+
+    async def execute_batched_operation(self, request, data, context, root_value) -> dict:
+        """Ejecuta una operación de un lote; sus errores se devuelven en su propio resultado"""
+        async with self.operation_context(context) as operation_context:
+            try:
+                request_data = self.request_data(data)
+                if not request_data.query:
+                    raise HTTPException(400, "No GraphQL query found in the request")
+                result = await self.schema.execute(
+                    request_data.query,
+                    root_value=root_value,
+                    variable_values=request_data.variables,
+                    context_value=operation_context,
+                    operation_name=request_data.operation_name,
+                    allowed_operation_types={OperationType.QUERY, OperationType.MUTATION},
+                )
+            except PersistedQueryNotFound:
+                result = persisted_query_not_found()
+            except HTTPException as e:
+                result = ExecutionResult(data=None, errors=[GraphQLError(e.reason)])
+            except InvalidOperationTypeError:
+                result = ExecutionResult(
+                    data=None, errors=[GraphQLError("Subscriptions are not supported in batches")]
+                )
+
+        response_data = await self.process_result(request=request, result=result)
+        if result.errors:
+            self._handle_errors(result.errors, response_data)
+        return response_data
+
+    @asynccontextmanager
+    async def operation_context(self, request_context):
+        """Contexto de una operación del lote, creado con context_getter y cerrado al terminar"""
+        getter = self.operation_context_getter
+        if getter is None:
+            yield request_context
+            return
+
+        if inspect.isasyncgenfunction(getter):
+            generator = getter()
+            try:
+                yield {**request_context, **(await generator.__anext__())}
+            finally:
+                await generator.aclose()
+            return
+
+        operation_context = getter()
+        if inspect.isawaitable(operation_context):
+            operation_context = await operation_context
+        yield {**request_context, **(operation_context or {})}
+
+    async def execute_operation(self, request, context, root_value) -> ExecutionResult:
+        try:
+            return await super().execute_operation(request, context, root_value)
+        except PersistedQueryNotFound:
+            return persisted_query_not_found()
+
+def persisted_query_not_found() -> ExecutionResult:
+    return ExecutionResult(
+        data=None,
+        errors=[GraphQLError(
+            NOT_FOUND_MESSAGE,
+            extensions={"code": "PERSISTED_QUERY_NOT_FOUND"}
+        )]
+    )
@@ -0,0 +1,203 @@
+"""
+Pipeline de contratación de una vacante en una sola operación del gateway.
+
+Consulta en paralelo la vacante (s2), sus candidatos (s3), entrevistas (s5) y
+selecciones (s6); las evaluaciones (s4) no se pueden filtrar por vacante, así
+que se piden por lote en cuanto llegan los IDs de candidatos. Cada servicio
+tiene su propio tiempo límite: si uno falla o no responde, el resto del
+pipeline se devuelve igual con el error anotado.
+"""
+import asyncio
+import logging
+import os
+from collections import defaultdict
+from typing import Callable
+from .types import (
+    Candidate,
+    EvaluationResult,
+    HiringPipeline,
+    Interview,
+    PipelineCandidate,
+    PipelineError,
+    PipelineFunnel,
+    Selection,
+    Vacancy
+)
+from .loaders import (
+    CANDIDATE_FIELDS,
+    EVALUATIONS_BY_CANDIDATES,
+    INTERVIEW_FIELDS,
+    SELECTION_FIELDS,
+    from_service
+)
+from .http_clients import (
+    VACANCIES_SERVICE_URL,
+    CANDIDATES_SERVICE_URL,
+    EVALUATIONS_SERVICE_URL,
+    INTERVIEWS_SERVICE_URL,
+    SELECTIONS_SERVICE_URL
+)
+
+logger = logging.getLogger(__name__)
+
+# Tiempo límite por servicio (segundos); se puede ajustar con PIPELINE_TIMEOUT_<SERVICIO>
+PIPELINE_SERVICE_TIMEOUT = float(os.getenv("PIPELINE_SERVICE_TIMEOUT", "3"))
+
+VACANCY_QUERY = """
+query PipelineVacancy($vacancyId: Int!) {
+    vacancy(vacancyId: $vacancyId) {
+        id
+        requisitionId
+        platforms
+        status
+        publicationDate
+        closingDate
+        createdAt
+    }
+}
+"""
+
+CANDIDATES_QUERY = """
+query PipelineCandidates($vacancyId: Int!) {
+    candidates(vacancyId: $vacancyId) {%s}
+}
+""" % CANDIDATE_FIELDS
+
+INTERVIEWS_QUERY = """
+query PipelineInterviews($vacancyId: Int!) {
+    interviewsByVacancy(vacancyId: $vacancyId) {%s}
+}
+""" % INTERVIEW_FIELDS
+
+SELECTIONS_QUERY = """
+query PipelineSelections($vacancyId: Int!) {
+    selections(vacancyId: $vacancyId) {%s}
+}
+""" % SELECTION_FIELDS
+
+def service_timeout(service: str) -> float:
+    return float(os.getenv(f"PIPELINE_TIMEOUT_{service.upper()}", PIPELINE_SERVICE_TIMEOUT))
+
+class PipelineFetch:
+    """Consultas de un pipeline: guarda los errores de cada servicio en lugar de propagarlos"""
+
+    def __init__(self, execute: Callable):
+        self.execute = execute
+        self.errors = []
+
+    async def fetch(self, service: str, service_url: str, query: str, variables: dict, field: str):
+        timeout = service_timeout(service)
+        try:
+            result = await asyncio.wait_for(self.execute(service_url, query, variables), timeout)
+        except asyncio.TimeoutError:
+            self.errors.append(PipelineError(
+                service=service, message=f"Sin respuesta en {timeout}s", timed_out=True
+            ))
+            return None
+        except Exception as e:
+            self.errors.append(PipelineError(service=service, message=str(e), timed_out=False))
+            return None
+        return (result.get("data") or {}).get(field)
+
+    async def evaluations(self, candidates_task: asyncio.Task):
+        """Evaluaciones por lote de los candidatos de la vacante, en cuanto se conocen"""
+        candidates = await candidates_task
+        if candidates is None:
+            self.errors.append(PipelineError(
+                service="evaluations",
+                message="No se consultaron: faltan los candidatos de la vacante",
+                timed_out=False
+            ))
+            return None
+        if not candidates:
+            return []
+        return await self.fetch(
+            "evaluations", EVALUATIONS_SERVICE_URL, EVALUATIONS_BY_CANDIDATES,
+            {"candidateIds": [candidate["id"] for candidate in candidates]},
+            "evaluationsByCandidates"
+        )
+
+def build_funnel(entries) -> PipelineFunnel:
+    return PipelineFunnel(
+        applied=sum(1 for entry in entries if entry.candidate is not None),
+        evaluated=sum(
+            1 for entry in entries
+            if any(evaluation.status == "COMPLETED" for evaluation in entry.evaluations)
+        ),
+        interviewed=sum(
+            1 for entry in entries
+            if any(interview.status == "COMPLETED" for interview in entry.interviews)
+        ),
+        selected=sum(
+            1 for entry in entries
+            if entry.selection is not None and entry.selection.status == "SELECTED"
+        ),
+        hired=sum(
+            1 for entry in entries
+            if entry.selection is not None and entry.selection.decision == "HIRE"
+        )
+    )
+
+async def build_hiring_pipeline(vacancy_id: int, execute: Callable, loaders=None) -> HiringPipeline:
+    """
+    Construye el pipeline de contratación de una vacante.
+
+    Args:
+        vacancy_id (int): ID de la vacante
+        execute (Callable): Función que ejecuta una consulta en un servicio
+        loaders (Loaders): DataLoaders de la petición, que se precargan con los candidatos
+
+    Returns:
+        HiringPipeline: Candidatos unidos por candidate_id con sus evaluaciones,
+            entrevistas y selección, el embudo y los errores de cada servicio
+    """
+    fetch = PipelineFetch(execute)
+    variables = {"vacancyId": vacancy_id}
+
+    candidates_task = asyncio.ensure_future(
+        fetch.fetch("candidates", CANDIDATES_SERVICE_URL, CANDIDATES_QUERY, variables, "candidates")
+    )
+    try:
+        vacancy, candidates, evaluations, interviews, selections = await asyncio.gather(
+            fetch.fetch("vacancies", VACANCIES_SERVICE_URL, VACANCY_QUERY, variables, "vacancy"),
+            candidates_task,
+            fetch.evaluations(candidates_task),
+            fetch.fetch("interviews", INTERVIEWS_SERVICE_URL, INTERVIEWS_QUERY, variables, "interviewsByVacancy"),
+            fetch.fetch("selections", SELECTIONS_SERVICE_URL, SELECTIONS_QUERY, variables, "selections")
+        )
+    finally:
+        candidates_task.cancel()
+
+    by_candidate = defaultdict(lambda: {"candidate": None, "evaluations": [], "interviews": [], "selection": None})
+    for row in candidates or []:
+        by_candidate[row["id"]]["candidate"] = from_service(Candidate, row)
+    for row in evaluations or []:
+        by_candidate[row["candidateId"]]["evaluations"].append(from_service(EvaluationResult, row))
+    for row in interviews or []:
+        by_candidate[row["candidateId"]]["interviews"].append(from_service(Interview, row))
+    for row in selections or []:
+        by_candidate[row["candidateId"]]["selection"] = from_service(Selection, row)
+
+    entries = [
+        PipelineCandidate(candidate_id=candidate_id, **parts)
+        for candidate_id, parts in sorted(by_candidate.items())
+    ]
+    if loaders is not None:
+        for entry in entries:
+            if entry.candidate is not None:
+                loaders.candidate_by_id.prime(entry.candidate_id, entry.candidate)
+
+    if fetch.errors:
+        logger.warning(
+            f"Pipeline de la vacante {vacancy_id} incompleto: "
+            f"{', '.join(error.service for error in fetch.errors)}"
+        )
+
+    return HiringPipeline(
+        vacancy_id=vacancy_id,
+        vacancy=from_service(Vacancy, vacancy) if vacancy else None,
+        candidates=entries,
+        funnel=build_funnel(entries),
+        errors=fetch.errors,
+        partial=bool(fetch.errors)
+    )
@@ -0,0 +1,377 @@
+"""
+Análisis estático del costo de las operaciones y control de admisión.
+
+Antes de ejecutar una operación se estima su costo recorriendo el documento:
+cada campo suma su peso (FIELD_COSTS) y los campos de lista multiplican el
+costo de sus hijos por el tamaño estimado de la lista (argumento first/limit
+o LIST_SIZES; en las conexiones, los edges toman el first del campo
+*Connection). También se miden la profundidad y la amplitud (máximo de campos
+en un mismo nivel).
+
+Cada cliente (cabecera X-Client-Id) tiene límites por operación y un
+presupuesto de costo por minuto. Las operaciones fuera de presupuesto se
+rechazan antes de llamar a ningún servicio. El costo estimado y la latencia
+observada se registran para ajustar el modelo.
+"""
+import json
+import logging
+import math
+import os
+import time
+from collections import deque
+from typing import Iterator, Optional
+from graphql import (
+    GraphQLError,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    OperationDefinitionNode,
+    get_named_type
+)
+from graphql.language import FieldNode, FragmentSpreadNode, InlineFragmentNode, VariableNode
+from strawberry.extensions import SchemaExtension
+from .http_clients import downstream_calls
+
+logger = logging.getLogger(__name__)
+
+GATEWAY_COST_ENABLED = os.getenv("GATEWAY_COST_ENABLED", "true").lower() == "true"
+GATEWAY_MAX_COST = int(os.getenv("GATEWAY_MAX_COST", "5000"))
+GATEWAY_MAX_DEPTH = int(os.getenv("GATEWAY_MAX_DEPTH", "8"))
+GATEWAY_MAX_BREADTH = int(os.getenv("GATEWAY_MAX_BREADTH", "50"))
+# Presupuesto de costo por cliente y minuto; 0 lo desactiva
+GATEWAY_COST_PER_MINUTE = int(os.getenv("GATEWAY_COST_PER_MINUTE", "50000"))
+# Límites por cliente en JSON, ej. {"dashboard": {"max_cost": 20000, "cost_per_minute": 200000}}
+GATEWAY_CLIENT_BUDGETS = json.loads(os.getenv("GATEWAY_CLIENT_BUDGETS", "{}"))
+GATEWAY_COST_SAMPLES = int(os.getenv("GATEWAY_COST_SAMPLES", "500"))
+
+CLIENT_HEADER = "x-client-id"
+DEFAULT_CLIENT = "anonymous"
+
+# Peso de los campos que llaman a servicios; el resto de objetos pesa 1 y los escalares 0
+FIELD_COSTS = {
+    "getRequisition": 10,
+    "getVacancy": 10,
+    "listCandidatesByVacancy": 10,
+    "getSelectionProcess": 10,
+    "hiringPipeline": 50,
+    "candidatesByVacancyStream": 10,
+    "selectionProcessStream": 10,
+    "candidates": 5,
+    "evaluations": 5,
+    "interviews": 5,
+    "selections": 5,
+    "candidate": 5,
+    "requisitionsConnection": 10,
+    "vacanciesConnection": 10,
+    "candidatesConnection": 10,
+    "evaluationsConnection": 10,
+    "interviewsConnection": 10,
+    "selectionsConnection": 10,
+    # COUNT aparte en el servicio
+    "totalCount": 5,
+}
+
+# Tamaño estimado de las listas sin paginar
+DEFAULT_LIST_SIZE = int(os.getenv("GATEWAY_DEFAULT_LIST_SIZE", "20"))
+LIST_SIZES = {
+    "listCandidatesByVacancy": 50,
+    "getSelectionProcess": 50,
+    "candidates": 50,
+    "evaluations": 5,
+    "interviews": 5,
+    "selections": 3,
+    # Ítems de cada página de las suscripciones incrementales
+    "items": 50,
+    # Página de una conexión sin first (PAGE_SIZE_DEFAULT de los servicios)
+    "edges": 50,
+    **json.loads(os.getenv("GATEWAY_LIST_SIZES", "{}"))
+}
+PAGE_SIZE_ARGUMENTS = ("first", "last", "limit")
+
+class QueryCost:
+    __slots__ = ("cost", "depth", "breadth", "fields")
+
+    def __init__(self):
+        self.cost = 0
+        self.depth = 0
+        self.breadth = 0
+        self.fields = 0
+
+    def to_dict(self) -> dict:
+        return {"cost": self.cost, "depth": self.depth, "breadth": self.breadth, "fields": self.fields}
+
+def _unwrap(field_type):
+    """Devuelve (tipo con nombre, True si es lista)"""
+    if isinstance(field_type, GraphQLNonNull):
+        field_type = field_type.of_type
+    return get_named_type(field_type), isinstance(field_type, GraphQLList)
+
+def _page_size(node: FieldNode, variables: dict) -> Optional[int]:
+    """Tamaño pedido con first/last/limit, o None si el campo no lo indica"""
+    for argument in node.arguments or ():
+        if argument.name.value in PAGE_SIZE_ARGUMENTS:
+            value_node = argument.value
+            value = (
+                variables.get(value_node.name.value)
+                if isinstance(value_node, VariableNode)
+                else getattr(value_node, "value", None)
+            )
+            try:
+                return max(int(value), 0)
+            except (TypeError, ValueError):
+                break
+    return None
+
+def _list_size(node: FieldNode, variables: dict, page: Optional[int] = None) -> int:
+    size = _page_size(node, variables)
+    if size is None and node.name.value == "edges":
+        size = page
+    return LIST_SIZES.get(node.name.value, DEFAULT_LIST_SIZE) if size is None else size
+
+def estimate_cost(schema, document, operation_name: Optional[str], variables: Optional[dict]) -> Optional[QueryCost]:
+    """
+    Estima el costo de la operación del documento.
+
+    Returns:
+        QueryCost: Costo, profundidad, amplitud y número de campos, o None si no
+            se encuentra la operación (la validación de GraphQL reportará el error)
+    """
+    variables = variables or {}
+    fragments = {}
+    operation = None
+    for definition in document.definitions:
+        if isinstance(definition, OperationDefinitionNode):
+            if operation_name is None or (definition.name and definition.name.value == operation_name):
+                operation = operation or definition
+        elif hasattr(definition, "type_condition"):
+            fragments[definition.name.value] = definition
+    if operation is None:
+        return None
+
+    root_type = {
+        "query": schema.query_type,
+        "mutation": schema.mutation_type,
+        "subscription": schema.subscription_type,
+    }[operation.operation.value]
+    result = QueryCost()
+
+    def fields_of(selection_set, seen_fragments):
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                yield selection
+            elif isinstance(selection, InlineFragmentNode):
+                yield from fields_of(selection.selection_set, seen_fragments)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                if name in fragments and name not in seen_fragments:
+                    yield from fields_of(fragments[name].selection_set, seen_fragments | {name})
+
+    def visit(parent_type, selection_set, depth, page=None):
+        fields = list(fields_of(selection_set, frozenset()))
+        result.depth = max(result.depth, depth)
+        result.breadth = max(result.breadth, len(fields))
+        result.fields += len(fields)
+        total = 0
+        for node in fields:
+            field_def = parent_type.fields.get(node.name.value) if isinstance(parent_type, GraphQLObjectType) else None
+            if field_def is None:
+                continue
+            named_type, is_list = _unwrap(field_def.type)
+            if node.selection_set is None:
+                total += FIELD_COSTS.get(node.name.value, 0)
+                continue
+            # El first de un campo *Connection (no es lista) fija el tamaño de sus edges
+            children = visit(named_type, node.selection_set, depth + 1, None if is_list else _page_size(node, variables))
+            multiplier = _list_size(node, variables, page) if is_list else 1
+            total += FIELD_COSTS.get(node.name.value, 1) + multiplier * children
+        return total
+
+    if root_type is not None:
+        result.cost = visit(root_type, operation.selection_set, 1)
+    return result
+
+class ClientBudget:
+    """Límites de un cliente y su presupuesto de costo por minuto (token bucket)"""
+
+    def __init__(self, client_id: str, limits: dict):
+        self.client_id = client_id
+        self.max_cost = limits.get("max_cost", GATEWAY_MAX_COST)
+        self.max_depth = limits.get("max_depth", GATEWAY_MAX_DEPTH)
+        self.max_breadth = limits.get("max_breadth", GATEWAY_MAX_BREADTH)
+        self.cost_per_minute = limits.get("cost_per_minute", GATEWAY_COST_PER_MINUTE)
+        self.available = float(self.cost_per_minute)
+        self.updated_at = time.monotonic()
+        self.admitted = 0
+        self.rejected = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(
+            float(self.cost_per_minute),
+            self.available + (now - self.updated_at) * self.cost_per_minute / 60
+        )
+        self.updated_at = now
+
+    def admit(self, cost: QueryCost) -> Optional[GraphQLError]:
+        """Descuenta el costo del presupuesto o devuelve el error de rechazo"""
+        error = None
+        if cost.depth > self.max_depth:
+            error = self._error("QUERY_TOO_DEEP", f"profundidad {cost.depth} supera el máximo {self.max_depth}", cost)
+        elif cost.breadth > self.max_breadth:
+            error = self._error("QUERY_TOO_BROAD", f"{cost.breadth} campos en un nivel superan el máximo {self.max_breadth}", cost)
+        elif cost.cost > self.max_cost:
+            error = self._error("QUERY_TOO_COSTLY", f"costo estimado {cost.cost} supera el máximo {self.max_cost}", cost)
+        elif self.cost_per_minute and cost.cost > self.cost_per_minute:
+            error = self._error(
+                "QUERY_TOO_COSTLY",
+                f"costo estimado {cost.cost} supera el presupuesto por minuto {self.cost_per_minute}",
+                cost
+            )
+        elif self.cost_per_minute:
+            self._refill()
+            if cost.cost > self.available:
+                retry_after = math.ceil((cost.cost - self.available) * 60 / self.cost_per_minute)
+                error = self._error(
+                    "COST_BUDGET_EXCEEDED",
+                    f"presupuesto por minuto agotado, reintente en {retry_after}s",
+                    cost,
+                    retryAfter=retry_after
+                )
+            else:
+                self.available -= cost.cost
+
+        if error is None:
+            self.admitted += 1
+        else:
+            self.rejected += 1
+        return error
+
+    def _error(self, code: str, reason: str, cost: QueryCost, **extensions) -> GraphQLError:
+        return GraphQLError(
+            f"Operación rechazada: {reason}",
+            extensions={"code": code, "cost": cost.to_dict(), **extensions}
+        )
+
+    def to_dict(self) -> dict:
+        if self.cost_per_minute:
+            self._refill()
+        return {
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "available": round(self.available, 1) if self.cost_per_minute else None,
+            "max_cost": self.max_cost,
+            "cost_per_minute": self.cost_per_minute,
+        }
+
+class CostRecorder:
+    """Costo estimado frente a latencia observada, para ajustar FIELD_COSTS y LIST_SIZES"""
+
+    def __init__(self, size: int = GATEWAY_COST_SAMPLES):
+        self.samples = deque(maxlen=size)
+        self.buckets = {}
+
+    def record(self, operation_name: str, cost: QueryCost, latency: float, calls: int) -> None:
+        self.samples.append({
+            "operation": operation_name,
+            "cost": cost.cost,
+            "depth": cost.depth,
+            "latency_ms": round(latency * 1000, 2),
+            "downstream_calls": calls,
+        })
+        # Cubetas por potencia de 2 del costo
+        bucket = 2 ** math.ceil(math.log2(cost.cost)) if cost.cost > 1 else 1
+        entry = self.buckets.setdefault(bucket, {"count": 0, "latency": 0.0, "max_latency": 0.0})
+        entry["count"] += 1
+        entry["latency"] += latency
+        entry["max_latency"] = max(entry["max_latency"], latency)
+
+    def to_dict(self) -> dict:
+        return {
+            "by_cost": {
+                f"<={bucket}": {
+                    "count": entry["count"],
+                    "avg_ms": round(entry["latency"] / entry["count"] * 1000, 2),
+                    "max_ms": round(entry["max_latency"] * 1000, 2),
+                }
+                for bucket, entry in sorted(self.buckets.items())
+            },
+            "recent": list(self.samples)[-20:],
+        }
+
+class AdmissionControl:
+    def __init__(self):
+        self.budgets = {}
+        self.recorder = CostRecorder()
+
+    def budget(self, client_id: str) -> ClientBudget:
+        budget = self.budgets.get(client_id)
+        if budget is None:
+            budget = self.budgets[client_id] = ClientBudget(client_id, GATEWAY_CLIENT_BUDGETS.get(client_id, {}))
+        return budget
+
+    def admit(self, schema, document, operation_name: Optional[str], variables: Optional[dict], client_id: str):
+        """
+        Estima el costo de una operación y lo descuenta del presupuesto del cliente.
+
+        Returns:
+            tuple: (QueryCost o None, GraphQLError si se rechaza o None)
+        """
+        cost = estimate_cost(schema, document, operation_name, variables)
+        if cost is None:
+            return None, None
+        error = self.budget(client_id).admit(cost)
+        if error is not None:
+            logger.info(f"Cliente {client_id}: {error.message}")
+        return cost, error
+
+    def metrics(self) -> dict:
+        return {
+            "clients": {client_id: budget.to_dict() for client_id, budget in self.budgets.items()},
+            "observed": self.recorder.to_dict(),
+        }
+
+admission = AdmissionControl()
+
+class QueryCostLimiter(SchemaExtension):
+    """
+    Estima el costo de la operación antes de validarla y la rechaza si supera
+    los límites del cliente; con el error asignado Strawberry no llega a ejecutarla.
+    """
+
+    cost = None
+    rejected = False
+
+    def on_operation(self) -> Iterator[None]:
+        started_at = time.perf_counter()
+        yield
+        if self.cost is not None and not self.rejected:
+            calls = downstream_calls.get()
+            total_calls = sum(calls.values()) if calls else 0
+            # Las respuestas servidas desde la caché no dicen nada del costo real
+            if total_calls:
+                admission.recorder.record(
+                    self.execution_context.operation_name or "anonymous",
+                    self.cost,
+                    time.perf_counter() - started_at,
+                    total_calls
+                )
+
+    def on_validate(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        if GATEWAY_COST_ENABLED and execution_context.graphql_document is not None:
+            context = execution_context.context or {}
+            client_id = context.get("client_id", DEFAULT_CLIENT) if isinstance(context, dict) else DEFAULT_CLIENT
+            self.cost, error = admission.admit(
+                execution_context.schema._schema,
+                execution_context.graphql_document,
+                execution_context.operation_name,
+                execution_context.variables,
+                client_id
+            )
+            if error is not None:
+                self.rejected = True
+                execution_context.errors = (execution_context.errors or []) + [error]
+        yield
+
+    def get_results(self) -> dict:
+        return {"cost": self.cost.to_dict()} if self.cost is not None else {}
@@ -0,0 +1,398 @@
+"""
+Caché de respuestas del gateway para operaciones de lectura.
+
+La clave es la operación normalizada (documento reimpreso sin espacios ni
+comentarios) más el nombre de la operación y las variables. El TTL de cada
+entrada es el menor de los campos que selecciona (FIELD_TTLS).
+
+Cada entrada recuerda los servicios a los que llamó y los IDs de vacante,
+candidato y requisición que aparecen en sus variables y en la respuesta. Los
+eventos de Kafka de los servicios y las mutaciones del propio gateway invalidan
+las entradas que llamaron al servicio afectado y comparten alguno de esos IDs.
+
+Las listas que no se acotan solo por IDs (sin filtro, o filtradas por estado o
+fechas) se guardan sin IDs: una entidad que pasa a cumplir el filtro no está
+entre las filas ya cacheadas, así que cualquier evento de su servicio las invalida.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterator, Optional
+from graphql import ExecutionResult as GraphQLExecutionResult, OperationType, parse, print_ast
+from graphql.language import FieldNode, VariableNode
+from strawberry.extensions import SchemaExtension
+from .http_clients import downstream_calls
+from .encoding import dumps
+
+logger = logging.getLogger(__name__)
+
+GATEWAY_CACHE_ENABLED = os.getenv("GATEWAY_CACHE_ENABLED", "true").lower() == "true"
+GATEWAY_CACHE_MAX_ENTRIES = int(os.getenv("GATEWAY_CACHE_MAX_ENTRIES", "5000"))
+GATEWAY_CACHE_MAX_BYTES = int(os.getenv("GATEWAY_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+GATEWAY_CACHE_DEFAULT_TTL = float(os.getenv("GATEWAY_CACHE_DEFAULT_TTL", "30"))
+
+# TTL (segundos) por campo, raíz o anidado; 0 desactiva la caché de las operaciones que lo usan.
+# Las requisiciones no publican eventos en Kafka: solo el TTL acota cuánto se ve un estado
+# anterior a reviewRequisition hecho en s1 sin pasar por el gateway
+FIELD_TTLS = {
+    "getRequisition": 60,
+    "getVacancy": 60,
+    "listCandidatesByVacancy": 30,
+    "getSelectionProcess": 30,
+    "hiringPipeline": 15,
+    "requisitionsConnection": 60,
+    "vacanciesConnection": 60,
+    "candidatesConnection": 30,
+    "selectionsConnection": 30,
+    "evaluations": 15,
+    "interviews": 15,
+    **json.loads(os.getenv("GATEWAY_CACHE_FIELD_TTLS", "{}"))
+}
+
+KAFKA_BOOTSTRAP_SERVERS = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
+
+# Topic de Kafka -> servicio que lo publica
+INVALIDATION_TOPICS = {
+    "vacancy_published": "vacancies",
+    "vacancy_closed": "vacancies",
+    "application_submitted": "candidates",
+    "candidate_status_updated": "candidates",
+    "interview_scheduled": "interviews",
+    "interview_feedback_submitted": "interviews",
+    "interview_rescheduled": "interviews",
+    "selection_report_generated": "selections",
+    "candidate_selection_decision": "selections",
+}
+
+# Campos de lista o conexión cuyos resultados dependen de sus argumentos de filtro
+LIST_FIELDS = {
+    "listCandidatesByVacancy",
+    "getSelectionProcess",
+    "requisitionsConnection",
+    "vacanciesConnection",
+    "candidatesConnection",
+    "evaluationsConnection",
+    "interviewsConnection",
+    "selectionsConnection",
+}
+
+# Argumentos de paginación, que no filtran
+PAGINATION_ARGUMENTS = {"first", "after"}
+
+# Claves (variables, respuestas y eventos) que identifican las entidades de una entrada
+TAG_KEYS = {
+    "vacancyId": "vacancy",
+    "vacancy_id": "vacancy",
+    "candidateId": "candidate",
+    "candidate_id": "candidate",
+    "requisitionId": "requisition",
+    "requisition_id": "requisition",
+}
+
+@lru_cache(maxsize=1024)
+def analyze_document(query: str):
+    """
+    Normaliza una consulta y calcula su TTL.
+
+    Returns:
+        tuple: (documento normalizado, TTL en segundos, True si es de solo lectura,
+            argumentos que identifican entidades como [(entidad, nodo del valor)],
+            filtros de cada campo de LIST_FIELDS como [[(argumento, nodo del valor)]])
+    """
+    document = parse(query)
+    ttl = GATEWAY_CACHE_DEFAULT_TTL
+    read_only = True
+    hinted = []
+    arguments = []
+    lists = []
+    for definition in document.definitions:
+        operation = getattr(definition, "operation", None)
+        if operation is not None and operation != OperationType.QUERY:
+            read_only = False
+        stack = [definition]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, FieldNode):
+                if node.name.value in FIELD_TTLS:
+                    hinted.append(FIELD_TTLS[node.name.value])
+                if node.name.value in LIST_FIELDS:
+                    lists.append(tuple(
+                        (argument.name.value, argument.value) for argument in node.arguments or ()
+                        if argument.name.value not in PAGINATION_ARGUMENTS
+                    ))
+                for argument in node.arguments or ():
+                    if argument.name.value in TAG_KEYS:
+                        arguments.append((TAG_KEYS[argument.name.value], argument.value))
+            selection_set = getattr(node, "selection_set", None)
+            if selection_set is not None:
+                stack.extend(selection_set.selections)
+    if hinted:
+        ttl = min(hinted)
+    return print_ast(document), ttl, read_only, tuple(arguments), tuple(lists)
+
+def argument_value(value_node, variables: dict):
+    """Valor de un argumento literal o por variable (None si no se indicó)"""
+    if isinstance(value_node, VariableNode):
+        return variables.get(value_node.name.value)
+    return getattr(value_node, "value", None)
+
+def argument_tags(arguments, variables: dict) -> set:
+    """IDs de entidades pasados como argumentos de los campos, literales o por variable"""
+    tags = set()
+    for entity, value_node in arguments:
+        value = argument_value(value_node, variables)
+        if isinstance(value, (int, str)):
+            tags.add((entity, str(value)))
+    return tags
+
+def has_unscoped_list(lists, variables: dict) -> bool:
+    """
+    Indica si algún campo de lista no está acotado solo por IDs: sin filtros o
+    con algún filtro que no es un ID (estado, fechas...).
+    """
+    for filters in lists:
+        given = [name for name, value_node in filters if argument_value(value_node, variables) is not None]
+        if not given or any(name not in TAG_KEYS for name in given):
+            return True
+    return False
+
+def collect_tags(value, tags: set) -> set:
+    """Recorre variables o datos de respuesta y junta los IDs de vacante, candidato y requisición"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            entity = TAG_KEYS.get(key)
+            if entity is not None and isinstance(item, (int, str)):
+                tags.add((entity, str(item)))
+            else:
+                collect_tags(item, tags)
+    elif isinstance(value, list):
+        for item in value:
+            collect_tags(item, tags)
+    return tags
+
+class SharedExecutionResult(GraphQLExecutionResult):
+    """
+    Resultado tomado de otra operación idéntica en curso (ver coalescing.py).
+    Esta operación no llamó a ningún servicio: la entrada de caché la guarda el
+    líder con los servicios que consultó.
+    """
+
+class CacheEntry:
+    __slots__ = ("data", "expires_at", "services", "tags", "size")
+
+    def __init__(self, data, expires_at, services, tags, size):
+        self.data = data
+        self.expires_at = expires_at
+        self.services = services
+        self.tags = tags
+        self.size = size
+
+class ResponseCache:
+    """LRU de respuestas acotado por número de entradas y por bytes"""
+
+    def __init__(self, max_entries: int = GATEWAY_CACHE_MAX_ENTRIES, max_bytes: int = GATEWAY_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.generation = 0
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    @staticmethod
+    def key(normalized_query: str, operation_name: Optional[str], variables: Optional[dict]) -> str:
+        raw = json.dumps([normalized_query, operation_name, variables or {}], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return None
+        self.entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry.data
+
+    def token(self) -> int:
+        """Marca tomada antes de consultar a los servicios; ver set()"""
+        return self.generation
+
+    def set(self, key: str, data: dict, ttl: float, services, tags, token: Optional[int] = None) -> None:
+        """Guarda una respuesta, salvo que haya habido invalidaciones desde que se tomó `token`"""
+        if token is not None and token != self.generation:
+            return
+        size = len(dumps(data))
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self._remove(key)
+        self.entries[key] = CacheEntry(data, time.monotonic() + ttl, frozenset(services), frozenset(tags), size)
+        self.bytes += size
+        self.stats["stores"] += 1
+        while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+            oldest = next(iter(self.entries))
+            self._remove(oldest)
+            self.stats["evictions"] += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self.entries.pop(key)
+        self.bytes -= entry.size
+
+    def invalidate(self, service: str, tags: set) -> int:
+        """
+        Elimina las entradas que llamaron al servicio y comparten algún ID con el cambio.
+        Sin IDs, o en entradas sin IDs, basta con que hayan llamado al servicio.
+        """
+        self.generation += 1
+        stale = [
+            key for key, entry in self.entries.items()
+            if service in entry.services and (not tags or not entry.tags or entry.tags & tags)
+        ]
+        for key in stale:
+            self._remove(key)
+        self.stats["invalidations"] += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.bytes = 0
+
+    def metrics(self) -> dict:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "size": len(self.entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+response_cache = ResponseCache()
+
+class ResponseCacheExtension(SchemaExtension):
+    """
+    Sirve las consultas desde la caché sin ejecutar sus resolvers y, tras una
+    mutación correcta, invalida las entradas de los servicios que tocó. Debe ir
+    después de DownstreamCallCounter, que registra los servicios llamados.
+    """
+
+    status = None
+
+    def on_execute(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        if not GATEWAY_CACHE_ENABLED:
+            yield
+            return
+
+        normalized, ttl, read_only, arguments, lists = analyze_document(execution_context.query)
+        key = None
+        token = response_cache.token()
+        if read_only and ttl > 0:
+            key = response_cache.key(normalized, execution_context.operation_name, execution_context.variables)
+            data = response_cache.get(key)
+            if data is not None:
+                # Con un resultado ya asignado Strawberry no ejecuta la operación
+                execution_context.result = GraphQLExecutionResult(data=data, errors=None)
+                self.status = "HIT"
+                yield
+                return
+            self.status = "MISS"
+
+        yield
+
+        result = execution_context.result
+        calls = downstream_calls.get() or {}
+        variables = execution_context.variables or {}
+        tags = collect_tags(variables, argument_tags(arguments, variables))
+        if result is not None and result.data is not None:
+            collect_tags(result.data, tags)
+
+        if not read_only:
+            # Una mutación con errores pudo aplicar cambios parciales: se invalida igual
+            for service in calls:
+                response_cache.invalidate(service, tags)
+        elif isinstance(result, SharedExecutionResult):
+            # Guardarla con los servicios vacíos reemplazaría la entrada del líder
+            # por una que ningún evento invalida
+            return
+        elif key is not None and result is not None and not result.errors and result.data is not None:
+            # Sin IDs la entrada se invalida con cualquier evento de sus servicios
+            if has_unscoped_list(lists, variables):
+                tags = set()
+            response_cache.set(key, result.data, ttl, calls.keys(), tags, token)
+
+    def get_results(self) -> dict:
+        return {"responseCache": self.status} if self.status else {}
+
+class CacheInvalidationConsumer:
+    """Consume los eventos de los servicios e invalida las entradas afectadas"""
+
+    def __init__(self, cache: ResponseCache = response_cache, topics: dict = None):
+        self.cache = cache
+        self.topics = topics or INVALIDATION_TOPICS
+        self.consumer = None
+        self.task = None
+        self.events = 0
+
+    async def start(self) -> None:
+        """Inicia el consumidor; si Kafka no está disponible la caché solo expira por TTL"""
+        try:
+            from aiokafka import AIOKafkaConsumer
+        except ImportError:
+            logger.warning("aiokafka no está instalado: la caché del gateway solo expira por TTL")
+            return
+        # Sin group_id cada instancia del gateway recibe todos los eventos para su caché local
+        self.consumer = AIOKafkaConsumer(
+            *self.topics,
+            bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
+            group_id=None,
+            auto_offset_reset="latest",
+            value_deserializer=lambda value: json.loads(value.decode("utf-8"))
+        )
+        try:
+            await self.consumer.start()
+        except Exception as e:
+            logger.warning(f"No se pudo conectar a Kafka ({str(e)}): la caché del gateway solo expira por TTL")
+            self.consumer = None
+            return
+        self.task = asyncio.create_task(self._consume())
+        logger.info(f"Invalidación de caché suscrita a {len(self.topics)} topics")
+
+    async def _consume(self) -> None:
+        try:
+            async for record in self.consumer:
+                self.handle(record.topic, record.value)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Error en el consumidor de invalidación de caché: {str(e)}")
+
+    def handle(self, topic: str, message) -> int:
+        service = self.topics.get(topic)
+        if service is None:
+            return 0
+        self.events += 1
+        tags = collect_tags(message, set()) if isinstance(message, dict) else set()
+        removed = self.cache.invalidate(service, tags)
+        if removed:
+            logger.debug(f"Evento {topic}: {removed} respuestas invalidadas")
+        return removed
+
+    async def stop(self) -> None:
+        if self.task:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+        if self.consumer:
+            await self.consumer.stop()
+
+    def metrics(self) -> dict:
+        return {"connected": self.consumer is not None, "events": self.events}
@@ -1,14 +1,20 @@
-from typing import List, Optional
+from typing import AsyncGenerator, List, Optional
 import strawberry
+from strawberry.types import Info
 from datetime import datetime
-import httpx
+from functools import lru_cache
 from .types import (
     Requisition,
     Vacancy,
     Candidate,
     Evaluation,
+    EvaluationResult,
     Interview,
     Selection,
+    HiringPipeline,
+    CandidatePage,
+    SelectionPage,
+    Connection,
     RequisitionInput,
     VacancyInput,
     CandidateInput,
@@ -17,40 +23,90 @@ from .types import (
     SelectionInput,
     ReportInput
 )
+from .persisted_queries import NOT_FOUND_MESSAGE, PersistedDocumentCache, query_hash
+from .loaders import CANDIDATE_FIELDS, SELECTION_FIELDS, DownstreamCallCounter, from_service
+from .pipeline import build_hiring_pipeline
+from .streaming import stream_candidates, stream_selections
+from .pagination import (
+    REQUISITIONS_CONNECTION,
+    VACANCIES_CONNECTION,
+    CANDIDATES_CONNECTION,
+    EVALUATIONS_CONNECTION,
+    INTERVIEWS_CONNECTION,
+    SELECTIONS_CONNECTION,
+    fetch_connection
+)
+from .response_cache import ResponseCacheExtension
+from .query_cost import QueryCostLimiter
+from .encoding import loads
+from .coalescing import RequestCoalescer
+from .metrics import OperationMetrics
+from .http_clients import (
+    clients,
+    REQUISITIONS_SERVICE_URL,
+    VACANCIES_SERVICE_URL,
+    CANDIDATES_SERVICE_URL,
+    EVALUATIONS_SERVICE_URL,
+    INTERVIEWS_SERVICE_URL,
+    SELECTIONS_SERVICE_URL
+)
 import os
 
-# URLs de los servicios
-REQUISITIONS_SERVICE_URL = os.getenv("REQUISITIONS_SERVICE_URL", "http://localhost:8001")
-VACANCIES_SERVICE_URL = os.getenv("VACANCIES_SERVICE_URL", "http://localhost:8002")
-CANDIDATES_SERVICE_URL = os.getenv("CANDIDATES_SERVICE_URL", "http://localhost:8003")
-EVALUATIONS_SERVICE_URL = os.getenv("EVALUATIONS_SERVICE_URL", "http://localhost:8004")
-INTERVIEWS_SERVICE_URL = os.getenv("INTERVIEWS_SERVICE_URL", "http://localhost:8005")
-SELECTIONS_SERVICE_URL = os.getenv("SELECTIONS_SERVICE_URL", "http://localhost:8006")
+# Enviar solo el hash de las consultas (Automatic Persisted Queries)
+PERSISTED_QUERIES_ENABLED = os.getenv("PERSISTED_QUERIES_ENABLED", "true").lower() == "true"
+
+@lru_cache(maxsize=None)
+def persisted_query_hash(query: str) -> str:
+    """Hash de la consulta; las consultas del gateway son estáticas y se calcula una sola vez"""
+    return query_hash(query)
+
+def is_persisted_query_not_found(result: dict) -> bool:
+    return any(error.get("message") == NOT_FOUND_MESSAGE for error in result.get("errors") or [])
 
 async def execute_graphql_query(service_url: str, query: str, variables: dict = None) -> dict:
-    """Ejecuta una query GraphQL en el servicio especificado"""
+    """Ejecuta una query GraphQL en el servicio especificado con su cliente keep-alive compartido"""
+    client = clients.get_client(service_url)
+    stats = clients.stats[service_url]
+    started_at = stats.begin()
+    success = False
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{service_url}/graphql",
-                json={
-                    "query": query,
-                    "variables": variables or {}
-                }
-            )
+        payload = {"variables": variables or {}}
+        if PERSISTED_QUERIES_ENABLED:
+            payload["extensions"] = {
+                "persistedQuery": {"version": 1, "sha256Hash": persisted_query_hash(query)}
+            }
+        else:
+            payload["query"] = query
+        
+        clients.count_call(service_url)
+        response = await client.post("/graphql", json=payload)
+        
+        if response.status_code != 200:
+            raise Exception(f"Error en la petición HTTP: {response.status_code}")
+        
+        result = loads(response.content)
+        
+        if is_persisted_query_not_found(result):
+            # El servicio no conoce el hash: se reenvía con el texto para registrarlo
+            payload["query"] = query
+            clients.count_call(service_url)
+            response = await client.post("/graphql", json=payload)
             
             if response.status_code != 200:
                 raise Exception(f"Error en la petición HTTP: {response.status_code}")
             
-            result = response.json()
-            
-            if "errors" in result:
-                raise Exception(f"Error GraphQL: {result['errors']}")
-                
-            return result
+            result = loads(response.content)
+        
+        if "errors" in result:
+            raise Exception(f"Error GraphQL: {result['errors']}")
+        
+        success = True
+        return result
     except Exception as e:
         print(f"Error al ejecutar query GraphQL: {str(e)}")
         raise Exception(f"Error al comunicarse con el servicio: {str(e)}")
+    finally:
+        stats.end(started_at, success)
 
 @strawberry.type
 class Query:
@@ -79,49 +135,145 @@ class Query:
         return None
 
     @strawberry.field
-    async def list_candidates_by_vacancy(self, vacancy_id: int) -> List[Candidate]:
+    async def get_vacancy(self, vacancy_id: int) -> Optional[Vacancy]:
+        """Obtiene una vacante; sus candidatos se resuelven con el DataLoader de candidatos"""
         query = """
-        query ListCandidates($vacancyId: Int!) {
-            candidates(vacancyId: $vacancyId) {
+        query GetVacancy($id: Int!) {
+            vacancy(vacancyId: $id) {
                 id
-                name
-                email
+                requisitionId
+                platforms
                 status
-                skills
-                experienceYears
-                applicationDate
+                publicationDate
+                closingDate
+                createdAt
             }
         }
         """
+        result = await execute_graphql_query(
+            VACANCIES_SERVICE_URL,
+            query,
+            {"id": vacancy_id}
+        )
+        vacancy = (result.get("data") or {}).get("vacancy")
+        return from_service(Vacancy, vacancy) if vacancy else None
+
+    @strawberry.field(deprecation_reason="Devuelve como mucho PAGE_SIZE_MAX candidatos; usar candidatesConnection")
+    async def list_candidates_by_vacancy(self, vacancy_id: int) -> List[Candidate]:
+        """Primeros PAGE_SIZE_MAX candidatos de la vacante (límite del servicio de candidatos)."""
+        query = """
+        query ListCandidates($vacancyId: Int!) {
+            candidates(vacancyId: $vacancyId) {%s}
+        }
+        """ % CANDIDATE_FIELDS
         result = await execute_graphql_query(
             CANDIDATES_SERVICE_URL,
             query,
             {"vacancyId": vacancy_id}
         )
-        return [Candidate(**c) for c in result.get("data", {}).get("candidates", [])]
+        return [from_service(Candidate, c) for c in (result.get("data") or {}).get("candidates") or []]
 
-    @strawberry.field
+    @strawberry.field(deprecation_reason="Devuelve como mucho PAGE_SIZE_MAX selecciones; usar selectionsConnection")
     async def get_selection_process(self, vacancy_id: int) -> List[Selection]:
-        """Obtiene el proceso de selección completo para una vacante."""
+        """Obtiene el proceso de selección de una vacante (PAGE_SIZE_MAX selecciones como mucho)."""
         query = """
         query($vacancyId: Int!) {
-            selections(vacancyId: $vacancyId) {
-                id
-                vacancyId
-                candidateId
-                status
-                report
-                decision
-                createdAt
-            }
+            selections(vacancyId: $vacancyId) {%s}
         }
-        """
+        """ % SELECTION_FIELDS
         result = await execute_graphql_query(
             SELECTIONS_SERVICE_URL,
             query,
             {"vacancyId": vacancy_id}
         )
-        return [Selection(**s) for s in result["data"]["selections"]]
+        return [from_service(Selection, s) for s in (result.get("data") or {}).get("selections") or []]
+
+    @strawberry.field
+    async def hiring_pipeline(self, info: Info, vacancy_id: int) -> HiringPipeline:
+        """Embudo completo de una vacante en una sola consulta, con resultados parciales si un servicio falla."""
+        return await build_hiring_pipeline(vacancy_id, execute_graphql_query, info.context.get("loaders"))
+
+    @strawberry.field
+    async def requisitions_connection(
+        self, info: Info, status: Optional[str] = None, first: Optional[int] = None, after: Optional[str] = None
+    ) -> Connection[Requisition]:
+        """Requisiciones paginadas por cursor, opcionalmente filtradas por estado."""
+        return await fetch_connection(
+            info, execute_graphql_query, REQUISITIONS_SERVICE_URL, REQUISITIONS_CONNECTION,
+            "requisitionsConnection", Requisition, {"status": status}, first, after
+        )
+
+    @strawberry.field
+    async def vacancies_connection(
+        self, info: Info, status: Optional[str] = None, first: Optional[int] = None, after: Optional[str] = None
+    ) -> Connection[Vacancy]:
+        """Vacantes paginadas por cursor, opcionalmente filtradas por estado."""
+        return await fetch_connection(
+            info, execute_graphql_query, VACANCIES_SERVICE_URL, VACANCIES_CONNECTION,
+            "vacanciesConnection", Vacancy, {"status": status}, first, after
+        )
+
+    @strawberry.field
+    async def candidates_connection(
+        self, info: Info, vacancy_id: int, first: Optional[int] = None, after: Optional[str] = None
+    ) -> Connection[Candidate]:
+        """Candidatos de una vacante paginados por cursor."""
+        return await fetch_connection(
+            info, execute_graphql_query, CANDIDATES_SERVICE_URL, CANDIDATES_CONNECTION,
+            "candidatesConnection", Candidate, {"vacancyId": vacancy_id}, first, after
+        )
+
+    @strawberry.field
+    async def evaluations_connection(
+        self, info: Info, candidate_id: Optional[int] = None, first: Optional[int] = None, after: Optional[str] = None
+    ) -> Connection[EvaluationResult]:
+        """Evaluaciones paginadas por cursor, opcionalmente de un candidato."""
+        return await fetch_connection(
+            info, execute_graphql_query, EVALUATIONS_SERVICE_URL, EVALUATIONS_CONNECTION,
+            "evaluationsConnection", EvaluationResult, {"candidateId": candidate_id}, first, after
+        )
+
+    @strawberry.field
+    async def interviews_connection(
+        self,
+        info: Info,
+        vacancy_id: Optional[int] = None,
+        candidate_id: Optional[int] = None,
+        interviewer_id: Optional[int] = None,
+        status: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        first: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> Connection[Interview]:
+        """Entrevistas paginadas por cursor; se filtra por estado, vacante, candidato o entrevistador."""
+        variables = {
+            "vacancyId": vacancy_id,
+            "candidateId": candidate_id,
+            "interviewerId": interviewer_id,
+            "status": status,
+            "startDate": start_date.isoformat() if start_date else None,
+            "endDate": end_date.isoformat() if end_date else None
+        }
+        return await fetch_connection(
+            info, execute_graphql_query, INTERVIEWS_SERVICE_URL, INTERVIEWS_CONNECTION,
+            "interviewsConnection", Interview, variables, first, after
+        )
+
+    @strawberry.field
+    async def selections_connection(
+        self,
+        info: Info,
+        vacancy_id: Optional[int] = None,
+        candidate_id: Optional[int] = None,
+        first: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> Connection[Selection]:
+        """Procesos de selección paginados por cursor, de una vacante o de un candidato."""
+        return await fetch_connection(
+            info, execute_graphql_query, SELECTIONS_SERVICE_URL, SELECTIONS_CONNECTION,
+            "selectionsConnection", Selection, {"vacancyId": vacancy_id, "candidateId": candidate_id}, first, after
+        )
 
 @strawberry.type
 class Mutation:
@@ -275,4 +427,30 @@ class Mutation:
         )
         return Selection(**result["data"]["generateFinalReport"])
 
-schema = strawberry.Schema(query=Query, mutation=Mutation) 
\ No newline at end of file
+@strawberry.type
+class Subscription:
+    @strawberry.subscription
+    async def candidates_by_vacancy_stream(
+        self, info: Info, vacancy_id: int, page_size: Optional[int] = None
+    ) -> AsyncGenerator[CandidatePage, None]:
+        """Candidatos de la vacante por páginas, cada una en cuanto llega del servicio."""
+        async for page in stream_candidates(info, vacancy_id, page_size, execute_graphql_query):
+            yield page
+
+    @strawberry.subscription
+    async def selection_process_stream(
+        self, info: Info, vacancy_id: int, page_size: Optional[int] = None
+    ) -> AsyncGenerator[SelectionPage, None]:
+        """Proceso de selección de la vacante por páginas, cada una en cuanto llega del servicio."""
+        async for page in stream_selections(info, vacancy_id, page_size, execute_graphql_query):
+            yield page
+
+schema = strawberry.Schema(query=Query, mutation=Mutation, subscription=Subscription, extensions=[
+    OperationMetrics,
+    PersistedDocumentCache,
+    # Después de PersistedDocumentCache, que fija los errores de validación en caché
+    QueryCostLimiter,
+    DownstreamCallCounter,
+    ResponseCacheExtension,
+    RequestCoalescer
+]) 
\ No newline at end of file
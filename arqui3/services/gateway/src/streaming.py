@@ -0,0 +1,132 @@
+"""
+Entrega incremental de listas grandes del gateway.
+
+Las listas de candidatos y de selecciones de una vacante se piden a los
+servicios por páginas (campos *Connection, paginados por cursor) y cada página se envía al cliente en
+cuanto llega, mientras ya se pide la siguiente. Los campos anidados de cada
+página se resuelven con DataLoaders nuevos por página, así la memoria y el
+tiempo hasta el primer resultado no crecen con el tamaño de la lista.
+
+Se expone como suscripciones GraphQL: por WebSocket en /graphql o por HTTP en
+/graphql/stream con respuestas multipart/mixed (una parte por página).
+"""
+import asyncio
+import os
+from typing import AsyncIterator, Callable, Optional
+from .types import Candidate, CandidatePage, Selection, SelectionPage
+from .loaders import Loaders, from_service
+from .pagination import CANDIDATES_CONNECTION, SELECTIONS_CONNECTION, fetch_page
+from .http_clients import CANDIDATES_SERVICE_URL, SELECTIONS_SERVICE_URL
+from .encoding import dumps
+
+GATEWAY_STREAM_PAGE_SIZE = int(os.getenv("GATEWAY_STREAM_PAGE_SIZE", "50"))
+GATEWAY_STREAM_MAX_PAGE_SIZE = int(os.getenv("GATEWAY_STREAM_MAX_PAGE_SIZE", "500"))
+
+MULTIPART_BOUNDARY = "-"
+MULTIPART_CONTENT_TYPE = f'multipart/mixed; boundary="{MULTIPART_BOUNDARY}"'
+
+def page_size_for(requested: Optional[int]) -> int:
+    if not requested or requested < 1:
+        return GATEWAY_STREAM_PAGE_SIZE
+    return min(requested, GATEWAY_STREAM_MAX_PAGE_SIZE)
+
+async def fetch_pages(
+    execute: Callable, service_url: str, query: str, field: str, vacancy_id: int, page_size: int
+) -> AsyncIterator[tuple]:
+    """
+    Recorre las páginas de una lista de un servicio.
+
+    Antes de entregar la página actual se lanza ya la consulta de la siguiente
+    con el cursor final que devolvió el servicio.
+
+    Returns:
+        AsyncIterator[tuple]: (filas de la página, True si hay más páginas)
+    """
+    def fetch(after):
+        return asyncio.ensure_future(
+            fetch_page(execute, service_url, query, field, {"vacancyId": vacancy_id}, page_size, after)
+        )
+
+    pending = fetch(None)
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            page_info = page.get("pageInfo") or {}
+            has_next = bool(page_info.get("hasNextPage"))
+            if has_next:
+                pending = fetch(page_info.get("endCursor"))
+            yield [edge["node"] for edge in page.get("edges") or []], has_next
+    finally:
+        # El cliente se desconectó o la suscripción terminó: no dejar consultas colgadas
+        if pending is not None:
+            pending.cancel()
+
+async def stream_candidates(info, vacancy_id: int, page_size: Optional[int], execute: Callable) -> AsyncIterator[CandidatePage]:
+    size = page_size_for(page_size)
+    page = 0
+    async for rows, has_next in fetch_pages(
+        execute, CANDIDATES_SERVICE_URL, CANDIDATES_CONNECTION, "candidatesConnection", vacancy_id, size
+    ):
+        # DataLoaders nuevos por página: su caché no acumula la lista completa
+        info.context["loaders"] = Loaders(execute)
+        yield CandidatePage(
+            vacancy_id=vacancy_id,
+            page=page,
+            items=[from_service(Candidate, row) for row in rows],
+            has_next=has_next
+        )
+        page += 1
+
+async def stream_selections(info, vacancy_id: int, page_size: Optional[int], execute: Callable) -> AsyncIterator[SelectionPage]:
+    size = page_size_for(page_size)
+    page = 0
+    async for rows, has_next in fetch_pages(
+        execute, SELECTIONS_SERVICE_URL, SELECTIONS_CONNECTION, "selectionsConnection", vacancy_id, size
+    ):
+        info.context["loaders"] = Loaders(execute)
+        yield SelectionPage(
+            vacancy_id=vacancy_id,
+            page=page,
+            items=[from_service(Selection, row) for row in rows],
+            has_next=has_next
+        )
+        page += 1
+
+PART_HEADER = (
+    f"\r\n--{MULTIPART_BOUNDARY}\r\n"
+    "Content-Type: application/json; charset=utf-8\r\n\r\n"
+).encode("utf-8")
+
+def multipart_part(payload: dict) -> bytes:
+    return PART_HEADER + dumps(payload)
+
+def result_payload(result, has_next: bool) -> dict:
+    payload = {"data": result.data, "hasNext": has_next}
+    if result.errors:
+        payload["errors"] = [error.formatted for error in result.errors]
+    return payload
+
+async def multipart_stream(results) -> AsyncIterator[bytes]:
+    """
+    Convierte los resultados de una suscripción en partes multipart/mixed con
+    el formato de entrega incremental de GraphQL sobre HTTP (hasNext).
+
+    Se lee un resultado por adelantado para que la última parte con datos lleve
+    hasNext: false; solo si no hay ningún resultado se envía {"hasNext": false}.
+    """
+    try:
+        previous = None
+        async for result in results:
+            if previous is not None:
+                yield multipart_part(result_payload(previous, True))
+            previous = result
+        if previous is not None:
+            yield multipart_part(result_payload(previous, False))
+        else:
+            yield multipart_part({"hasNext": False})
+        yield f"\r\n--{MULTIPART_BOUNDARY}--\r\n".encode("utf-8")
+    finally:
+        aclose = getattr(results, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -1,6 +1,9 @@
-from typing import List, Optional
+from typing import Generic, List, Optional, TypeVar
 from datetime import datetime
 import strawberry
+from strawberry.types import Info
+
+T = TypeVar("T")
 
 # Tipos para Requisiciones (s1)
 @strawberry.type
@@ -31,6 +34,11 @@ class Vacancy:
     closing_date: Optional[datetime]
     created_at: datetime
 
+    @strawberry.field
+    async def candidates(self, info: Info) -> List["Candidate"]:
+        """Candidatos de la vacante, agrupados en una consulta por lote al servicio de candidatos"""
+        return await info.context["loaders"].candidates_by_vacancy.load(self.id)
+
 @strawberry.input
 class VacancyInput:
     requisition_id: int
@@ -50,6 +58,18 @@ class Candidate:
     application_date: datetime
     created_at: datetime
 
+    @strawberry.field
+    async def evaluations(self, info: Info) -> List["EvaluationResult"]:
+        return await info.context["loaders"].evaluations_by_candidate.load(self.id)
+
+    @strawberry.field
+    async def interviews(self, info: Info) -> List["Interview"]:
+        return await info.context["loaders"].interviews_by_candidate.load(self.id)
+
+    @strawberry.field
+    async def selections(self, info: Info) -> List["Selection"]:
+        return await info.context["loaders"].selections_by_candidate.load(self.id)
+
 @strawberry.input
 class CandidateInput:
     name: str
@@ -84,6 +104,18 @@ class Evaluation:
     completion_date: Optional[datetime]
     created_at: datetime
 
+@strawberry.type
+class EvaluationResult:
+    """Evaluación tal como la expone el servicio de evaluaciones (s4)"""
+    id: int
+    candidate_id: int
+    test_type: str
+    status: str
+    score: Optional[float]
+    feedback: Optional[str]
+    created_at: str
+    updated_at: str
+
 @strawberry.input
 class TestInput:
     name: str
@@ -155,6 +187,10 @@ class Selection:
     created_at: datetime
     updated_at: datetime
 
+    @strawberry.field
+    async def candidate(self, info: Info) -> Optional[Candidate]:
+        return await info.context["loaders"].candidate_by_id.load(self.candidate_id)
+
 @strawberry.input
 class EvaluationScoreInput:
     score: float
@@ -169,4 +205,67 @@ class ReportInput:
 @strawberry.input
 class SelectionInput:
     vacancy_id: int
-    candidate_id: int 
\ No newline at end of file
+    candidate_id: int 
+# Tipos del pipeline de contratación (agregado en el gateway)
+@strawberry.type
+class PipelineError:
+    """Servicio que no respondió a tiempo o falló; su parte del pipeline queda vacía"""
+    service: str
+    message: str
+    timed_out: bool
+
+@strawberry.type
+class PipelineCandidate:
+    candidate_id: int
+    candidate: Optional[Candidate]
+    evaluations: List[EvaluationResult]
+    interviews: List[Interview]
+    selection: Optional[Selection]
+
+@strawberry.type
+class PipelineFunnel:
+    applied: int
+    evaluated: int
+    interviewed: int
+    selected: int
+    hired: int
+
+@strawberry.type
+class HiringPipeline:
+    vacancy_id: int
+    vacancy: Optional[Vacancy]
+    candidates: List[PipelineCandidate]
+    funnel: PipelineFunnel
+    errors: List[PipelineError]
+    partial: bool
+
+@strawberry.type
+class CandidatePage:
+    vacancy_id: int
+    page: int
+    items: List[Candidate]
+    has_next: bool
+
+@strawberry.type
+class SelectionPage:
+    vacancy_id: int
+    page: int
+    items: List[Selection]
+    has_next: bool
+
+# Listas paginadas por cursor (Relay); los cursores son los de cada servicio
+@strawberry.type
+class PageInfo:
+    has_next_page: bool
+    end_cursor: Optional[str]
+
+@strawberry.type
+class Edge(Generic[T]):
+    cursor: str
+    node: T
+
+@strawberry.type
+class Connection(Generic[T]):
+    edges: List[Edge[T]]
+    page_info: PageInfo
+    total_count: Optional[int] = None
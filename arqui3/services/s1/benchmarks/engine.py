@@ -0,0 +1,123 @@
+"""
+Mide el rendimiento del servicio de requisiciones con la configuración
+anterior del engine frente a la de engine.py.
+
+- anterior: create_async_engine(DATABASE_URL, echo=True), pool por defecto
+  (5 + 10 conexiones) y todas las sentencias registradas en INFO.
+- actual: create_service_engine(DATABASE_URL), con el pool, la caché de
+  sentencias preparadas, el statement_timeout y el registro de consultas
+  lentas del entorno (DB_*).
+
+Cada escenario lanza --concurrency tareas que, durante --seconds segundos,
+abren una sesión y listan una página de requisiciones con el repositorio del
+servicio (la misma consulta que requisitionsConnection). Reporta consultas por
+segundo y latencia p50/p95/p99. El echo de la configuración anterior se
+escribe en --log-file (por defecto /dev/null, que subestima su costo frente a
+una terminal o un colector de logs).
+
+Necesita la base de datos de DATABASE_URL; con --seed inserta filas de prueba.
+
+Uso (desde el directorio s1/):
+    python -m benchmarks.engine [--concurrency 50] [--seconds 10] [--page-size 50] [--seed 0]
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import statistics
+import time
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from src.infrastructure.database.config import DATABASE_URL, Base
+from src.infrastructure.database.engine import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_STATEMENT_CACHE_SIZE,
+    create_service_engine
+)
+from src.infrastructure.database.models import RequisitionModel
+from src.infrastructure.repositories.requisition_repository_impl import SQLAlchemyRequisitionRepository
+
+async def seed(engine, rows: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add_all([
+            RequisitionModel(
+                position_name=f"Cargo {i}",
+                functions=["análisis", "diseño", "pruebas"],
+                salary_category="B",
+                profile="Perfil de prueba para el benchmark del engine",
+                status="PENDING"
+            )
+            for i in range(rows)
+        ])
+        await session.commit()
+
+async def run(engine, concurrency: int, seconds: float, page_size: int) -> dict:
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + seconds
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started_at = time.perf_counter()
+            try:
+                async with session_factory() as session:
+                    await SQLAlchemyRequisitionRepository(session).list_by_status("PENDING", None, page_size)
+                latencies.append(time.perf_counter() - started_at)
+            except Exception:
+                errors += 1
+
+    # Calentar el pool y las cachés antes de medir
+    async with session_factory() as session:
+        await SQLAlchemyRequisitionRepository(session).list_by_status("PENDING", None, page_size)
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    return {
+        "qps": len(latencies) / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p95_ms": quantiles[94] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "errors": errors,
+    }
+
+async def main(concurrency: int, seconds: float, page_size: int, rows: int, log_file: str):
+    if rows:
+        engine = create_service_engine(DATABASE_URL)
+        await seed(engine, rows)
+        await engine.dispose()
+
+    print(f"{concurrency} tareas, {seconds:.0f} s por escenario, páginas de {page_size} filas")
+    print(f"actual: pool {DB_POOL_SIZE} + {DB_MAX_OVERFLOW}, caché de sentencias {DB_STATEMENT_CACHE_SIZE}\n")
+    print(f"{'escenario':<12}{'consultas/s':>13}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errores':>9}")
+
+    with open(log_file, "w") as log, contextlib.redirect_stdout(log):
+        # echo=True agrega su handler sobre sys.stdout al crear el engine
+        engine = create_async_engine(DATABASE_URL, echo=True)
+        before = await run(engine, concurrency, seconds, page_size)
+        await engine.dispose()
+
+    engine = create_service_engine(DATABASE_URL)
+    after = await run(engine, concurrency, seconds, page_size)
+    await engine.dispose()
+
+    for name, r in (("anterior", before), ("actual", after)):
+        print(f"{name:<12}{r['qps']:>13.0f}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}{r['errors']:>9}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0, help="Requisiciones de prueba a insertar antes de medir")
+    parser.add_argument("--log-file", default=os.devnull, help="Destino del echo de la configuración anterior")
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.seconds, args.page_size, args.seed, args.log_file))
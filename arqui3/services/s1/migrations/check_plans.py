@@ -0,0 +1,73 @@
+"""
+Comprueba que las consultas frecuentes de los repositorios usan índices.
+
+Ejecuta cada consulta de HOT_QUERIES con el repositorio del servicio, captura
+el SQL que emite y lo pasa por EXPLAIN con enable_seqscan desactivado: así el
+planificador solo elige un Seq Scan si ningún índice sirve, aunque la tabla
+esté vacía. Termina con código 1 si algún plan recorre una tabla completa.
+Todo corre en una transacción que se revierte.
+
+Uso (desde el directorio del servicio, con la base migrada):
+    python -m migrations.check_plans
+"""
+import asyncio
+import json
+import sys
+from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+from src.infrastructure.database.config import DATABASE_URL
+from src.infrastructure.repositories.requisition_repository_impl import SQLAlchemyRequisitionRepository
+
+AFTER = (datetime(2024, 1, 1), 1)
+
+# Consulta frecuente -> llamada al repositorio que la emite
+HOT_QUERIES = {
+    "requisitionsConnection": lambda repository: repository.list_by_status(None, AFTER, 51),
+    "requisitionsConnection por estado": lambda repository: repository.list_by_status("PENDING", AFTER, 51),
+    "totalCount por estado": lambda repository: repository.count_by_status("PENDING"),
+    "requisición por id": lambda repository: repository.get_by_id(1),
+}
+
+def seq_scans(plan: dict) -> list:
+    """Tablas recorridas completas en un nodo del plan y sus hijos"""
+    tables = [plan["Relation Name"]] if plan.get("Node Type") == "Seq Scan" else []
+    for child in plan.get("Plans", []):
+        tables += seq_scans(child)
+    return tables
+
+async def check() -> int:
+    engine = create_async_engine(DATABASE_URL, poolclass=NullPool)
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    failures = 0
+    async with engine.connect() as connection:
+        await connection.exec_driver_sql("SET enable_seqscan = off")
+        session = AsyncSession(bind=connection)
+        for name, run in HOT_QUERIES.items():
+            statements.clear()
+            event.listen(engine.sync_engine, "before_cursor_execute", capture)
+            try:
+                await run(SQLAlchemyRequisitionRepository(session))
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", capture)
+            for statement, parameters in statements:
+                result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                plan = result.scalar()
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                tables = seq_scans(plan[0]["Plan"])
+                if tables:
+                    failures += 1
+                    print(f"FALLA {name}: Seq Scan en {', '.join(tables)}\n    {statement}")
+                else:
+                    print(f"ok    {name}")
+        await connection.rollback()
+    await engine.dispose()
+    return failures
+
+if __name__ == "__main__":
+    sys.exit(1 if asyncio.run(check()) else 0)
@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from ...domain.entities.requisition import Requisition, RequisitionStatus
 from ...domain.interfaces.requisition_repository import RequisitionRepository
 
@@ -24,5 +25,10 @@ class ListRequisitionsUseCase:
     def __init__(self, repository: RequisitionRepository):
         self.repository = repository
 
-    async def execute(self, status: Optional[str] = None) -> List[Requisition]:
-        return await self.repository.list_by_status(status) 
\ No newline at end of file
+    async def execute(
+        self,
+        status: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Requisition]:
+        return await self.repository.list_by_status(status, after, limit) 
\ No newline at end of file
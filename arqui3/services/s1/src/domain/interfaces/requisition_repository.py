@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from ..entities.requisition import Requisition
 
 class RequisitionRepository(ABC):
@@ -14,8 +15,18 @@ class RequisitionRepository(ABC):
         pass
 
     @abstractmethod
-    async def list_by_status(self, status: Optional[str] = None) -> List[Requisition]:
-        """Lista las requisiciones filtradas por estado"""
+    async def list_by_status(
+        self,
+        status: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Requisition]:
+        """Lista las requisiciones filtradas por estado en orden (created_at, id); con after y limit devuelve una página"""
+        pass
+
+    @abstractmethod
+    async def count_by_status(self, status: Optional[str] = None) -> int:
+        """Cuenta las requisiciones filtradas por estado"""
         pass
 
     @abstractmethod
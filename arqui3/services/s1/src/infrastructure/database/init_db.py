@@ -1,11 +1,14 @@
 import asyncio
-from .config import engine, Base
-from ..database.models import RequisitionModel
+from pathlib import Path
+from alembic import command
+from alembic.config import Config
+
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
 
 async def init_db():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+    # El esquema lo crean las migraciones (migrations/); ya no se borran las tablas.
+    # env.py usa su propio bucle de eventos, por eso corre en otro hilo.
+    await asyncio.to_thread(command.upgrade, Config(str(ALEMBIC_INI)), "head")
 
 if __name__ == "__main__":
-    asyncio.run(init_db()) 
\ No newline at end of file
+    asyncio.run(init_db())
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, ARRAY, DateTime
+from sqlalchemy import Column, Integer, String, ARRAY, DateTime, Index
 from .config import Base
 
 class RequisitionModel(Base):
@@ -11,4 +11,10 @@ class RequisitionModel(Base):
     salary_category = Column(String(50), nullable=False)
     profile = Column(String(500), nullable=False)
     status = Column(String(20), nullable=False, default="PENDING")
-    created_at = Column(DateTime, default=datetime.utcnow) 
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Paginación por cursor sobre (created_at, id), con y sin filtro de estado
+    __table_args__ = (
+        Index("ix_requisitions_created_at_id", "created_at", "id"),
+        Index("ix_requisitions_status_created_at_id", "status", "created_at", "id"),
+    ) 
\ No newline at end of file
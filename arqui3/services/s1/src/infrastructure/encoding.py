@@ -0,0 +1,132 @@
+"""
+Codificación de las respuestas HTTP.
+
+- JSON con orjson si está instalado (varias veces más rápido que json), o con
+  json como alternativa.
+- Compresión gzip o brotli negociada con Accept-Encoding, solo para cuerpos
+  de tipos de texto/JSON desde COMPRESSION_MIN_SIZE bytes. Las respuestas en
+  streaming (más de un bloque) se envían sin comprimir para no retrasar cada
+  parte.
+"""
+import gzip
+import json
+import os
+from typing import Any, Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+
+COMPRESSIBLE_TYPES = ("application/json", "application/graphql-response+json", "text/", "application/javascript")
+
+def dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def loads(data) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse que serializa con dumps()"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Codificación preferida por el cliente entre las disponibles (br, gzip), según sus pesos q"""
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip().lower()] = quality
+
+    candidates = [("br", brotli is not None), ("gzip", True)]
+    best, best_quality = None, 0.0
+    for name, available in candidates:
+        quality = weights.get(name, weights.get("*", 0.0))
+        if available and quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+
+def is_compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+class CompressionMiddleware:
+    """Middleware ASGI que comprime las respuestas completas según Accept-Encoding"""
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                # Se retiene hasta ver el cuerpo: las cabeceras dependen de si se comprime
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(scope=start_message)
+            if message.get("more_body", False) or len(body) < self.minimum_size or not is_compressible(headers):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
@@ -2,6 +2,9 @@ from typing import List, Optional
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
 from .types import Requisition, RequisitionInput
+from .persisted_queries import PersistedDocumentCache
+from .connection import Connection, build_connection
+from ..pagination import PAGE_SIZE_MAX, decode_cursor, page_size
 from ...application.use_cases.requisition_use_cases import (
     CreateRequisitionUseCase,
     ReviewRequisitionUseCase,
@@ -18,12 +21,29 @@ class Query:
             result = await repository.get_by_id(requisition_id)
             return result
 
-    @strawberry.field
+    @strawberry.field(deprecation_reason="Devuelve como mucho PAGE_SIZE_MAX filas; usar requisitionsConnection")
     async def requisitions(self, info, status: Optional[str] = None) -> List[Requisition]:
+        """Primeras PAGE_SIZE_MAX requisiciones en orden (createdAt, id)"""
+        async for session in info.context["session"]:
+            repository = SQLAlchemyRequisitionRepository(session)
+            use_case = ListRequisitionsUseCase(repository)
+            return await use_case.execute(status, limit=PAGE_SIZE_MAX)
+
+    @strawberry.field
+    async def requisitions_connection(
+        self,
+        info,
+        status: Optional[str] = None,
+        first: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> Connection[Requisition]:
+        """Requisiciones paginadas por cursor en orden (createdAt, id)"""
+        size = page_size(first)
         async for session in info.context["session"]:
             repository = SQLAlchemyRequisitionRepository(session)
             use_case = ListRequisitionsUseCase(repository)
-            return await use_case.execute(status)
+            rows = await use_case.execute(status, decode_cursor(after), size + 1)
+            return build_connection(rows, size, lambda: repository.count_by_status(status))
 
 @strawberry.type
 class Mutation:
@@ -43,4 +63,4 @@ class Mutation:
             use_case = ReviewRequisitionUseCase(repository)
             return await use_case.execute(requisition_id, approve)
 
-schema = strawberry.Schema(query=Query, mutation=Mutation) 
\ No newline at end of file
+schema = strawberry.Schema(query=Query, mutation=Mutation, extensions=[PersistedDocumentCache]) 
\ No newline at end of file
@@ -1,9 +1,11 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from ...domain.entities.requisition import Requisition
 from ...domain.interfaces.requisition_repository import RequisitionRepository
 from ..database.models import RequisitionModel
+from ..pagination import keyset
 
 class SQLAlchemyRequisitionRepository(RequisitionRepository):
     def __init__(self, session: AsyncSession):
@@ -29,23 +31,37 @@ class SQLAlchemyRequisitionRepository(RequisitionRepository):
         db_requisition = result.scalar_one_or_none()
         return self._to_domain(db_requisition) if db_requisition else None
 
-    async def list_by_status(self, status: Optional[str] = None) -> List[Requisition]:
+    async def list_by_status(
+        self,
+        status: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Requisition]:
         query = select(RequisitionModel)
         if status:
             query = query.where(RequisitionModel.status == status)
-        result = await self.session.execute(query)
+        result = await self.session.execute(keyset(query, RequisitionModel, after, limit))
         return [self._to_domain(r) for r in result.scalars().all()]
 
+    async def count_by_status(self, status: Optional[str] = None) -> int:
+        query = select(func.count()).select_from(RequisitionModel)
+        if status:
+            query = query.where(RequisitionModel.status == status)
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
     async def update_status(self, requisition_id: int, status: str) -> Optional[Requisition]:
+        # Una sola sentencia UPDATE ... RETURNING en lugar de SELECT, cambio en Python y COMMIT
         result = await self.session.execute(
-            select(RequisitionModel).where(RequisitionModel.id == requisition_id)
+            update(RequisitionModel)
+            .where(RequisitionModel.id == requisition_id)
+            .values(status=status)
+            .returning(RequisitionModel)
+            .execution_options(populate_existing=True)
         )
         db_requisition = result.scalar_one_or_none()
-        if db_requisition:
-            db_requisition.status = status
-            await self.session.commit()
-            return self._to_domain(db_requisition)
-        return None
+        await self.session.commit()
+        return self._to_domain(db_requisition) if db_requisition else None
 
     def _to_domain(self, model: RequisitionModel) -> Requisition:
         if not model:
@@ -1,11 +1,15 @@
 from fastapi import FastAPI
-from strawberry.fastapi import GraphQLRouter
 from .infrastructure.graphql.schema import schema
+from .infrastructure.graphql.persisted_queries import PersistedQueryRouter
+from .infrastructure.encoding import CompressionMiddleware
 from .infrastructure.database.config import get_session
 
 app = FastAPI(title="Requisition Service")
 
-graphql_app = GraphQLRouter(
+# Comprimir con gzip/brotli las respuestas grandes según Accept-Encoding
+app.add_middleware(CompressionMiddleware)
+
+graphql_app = PersistedQueryRouter(
     schema,
     context_getter=lambda: {"session": get_session()}
 )
@@ -0,0 +1,47 @@
+"""
+Entorno de Alembic del servicio.
+
+Usa DATABASE_URL (la misma variable que la aplicación) y los modelos de
+src/infrastructure/database/models.py como metadata para --autogenerate.
+"""
+import asyncio
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from src.infrastructure.database.config import DATABASE_URL, Base
+from src.infrastructure.database import models  # noqa: F401 (registra las tablas en Base.metadata)
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+def run_migrations_offline() -> None:
+    """Genera el SQL de las migraciones sin conectarse (alembic upgrade head --sql)"""
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"}
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def do_run_migrations(connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
+async def run_migrations_online() -> None:
+    # Conexión propia sin pool: las migraciones no comparten el engine de la aplicación
+    engine = create_async_engine(DATABASE_URL, poolclass=NullPool)
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await engine.dispose()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from ...domain.entities.vacancy import Vacancy, VacancyStatus
 from ...domain.interfaces.vacancy_repository import VacancyRepository
 from ...infrastructure.events.kafka_producer import KafkaProducer
@@ -30,8 +30,12 @@ class PublishVacancyUseCase:
         updated_vacancy = await self.repository.update_status(
             vacancy.id,
             VacancyStatus.PUBLISHED,
-            datetime.utcnow()
+            datetime.utcnow(),
+            expected_statuses=[VacancyStatus.DRAFT]
         )
+        if not updated_vacancy:
+            # Otra petición cambió el estado después de la verificación
+            raise ValueError("La vacante no puede ser publicada")
 
         # Publicar evento
         await self.event_producer.send_message(
@@ -62,8 +66,12 @@ class CloseVacancyUseCase:
         updated_vacancy = await self.repository.update_status(
             vacancy_id,
             VacancyStatus.CLOSED,
-            datetime.utcnow()
+            datetime.utcnow(),
+            expected_statuses=[VacancyStatus.PUBLISHED]
         )
+        if not updated_vacancy:
+            # Otra petición cambió el estado después de la verificación
+            raise ValueError("La vacante no puede ser cerrada")
 
         # Publicar evento
         await self.event_producer.send_message(
@@ -81,5 +89,10 @@ class ListVacanciesUseCase:
     def __init__(self, repository: VacancyRepository):
         self.repository = repository
 
-    async def execute(self, status: Optional[str] = None) -> List[Vacancy]:
-        return await self.repository.list_by_status(status) 
\ No newline at end of file
+    async def execute(
+        self,
+        status: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Vacancy]:
+        return await self.repository.list_by_status(status, after, limit) 
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from ..entities.vacancy import Vacancy
 
@@ -15,13 +15,29 @@ class VacancyRepository(ABC):
         pass
 
     @abstractmethod
-    async def list_by_status(self, status: Optional[str] = None) -> List[Vacancy]:
-        """Lista las vacantes filtradas por estado"""
+    async def list_by_status(
+        self,
+        status: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Vacancy]:
+        """Lista las vacantes filtradas por estado en orden (created_at, id); con after y limit devuelve una página"""
         pass
 
     @abstractmethod
-    async def update_status(self, vacancy_id: int, status: str, date: datetime) -> Optional[Vacancy]:
-        """Actualiza el estado de una vacante y su fecha correspondiente"""
+    async def count_by_status(self, status: Optional[str] = None) -> int:
+        """Cuenta las vacantes filtradas por estado"""
+        pass
+
+    @abstractmethod
+    async def update_status(
+        self,
+        vacancy_id: int,
+        status: str,
+        date: datetime,
+        expected_statuses: Optional[List[str]] = None
+    ) -> Optional[Vacancy]:
+        """Actualiza el estado de una vacante y su fecha correspondiente; con expected_statuses solo si su estado actual es uno de ellos"""
         pass
 
     @abstractmethod
@@ -0,0 +1,162 @@
+"""
+Configuración del engine asíncrono de SQLAlchemy para producción.
+
+Todo se ajusta por variables de entorno:
+
+- Pool: DB_POOL_SIZE conexiones permanentes más DB_MAX_OVERFLOW temporales;
+  una petición espera DB_POOL_TIMEOUT segundos por una conexión libre.
+- DB_POOL_PRE_PING comprueba la conexión antes de entregarla (evita errores
+  tras un reinicio de la base o un corte de red) y DB_POOL_RECYCLE la reemplaza
+  pasado ese tiempo, antes de que la cierre un firewall o PgBouncer.
+- DB_STATEMENT_CACHE_SIZE: sentencias preparadas que asyncpg guarda por
+  conexión; 0 si hay un PgBouncer en modo transacción delante.
+- DB_STATEMENT_TIMEOUT_MS: statement_timeout de PostgreSQL; una consulta que
+  lo supera se cancela en el servidor en lugar de retener la conexión.
+- Registro de SQL: DB_ECHO=true reproduce el echo de SQLAlchemy (todas las
+  sentencias); si no, se registran con WARNING las que tardan más de
+  DB_SLOW_QUERY_MS y con INFO una fracción DB_LOG_SAMPLE_RATE del resto.
+  Solo se registra la sentencia; con DB_LOG_PARAMETERS=true se añade un resumen
+  de los parámetros sin los textos (pueden ser datos personales) y recortado a
+  DB_LOG_PARAMETERS_MAX_CHARS caracteres.
+"""
+import logging
+import os
+import random
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+logger = logging.getLogger(__name__)
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "500"))
+DB_LOG_SAMPLE_RATE = float(os.getenv("DB_LOG_SAMPLE_RATE", "0"))
+DB_LOG_PARAMETERS = os.getenv("DB_LOG_PARAMETERS", "false").lower() == "true"
+DB_LOG_PARAMETERS_MAX_CHARS = int(os.getenv("DB_LOG_PARAMETERS_MAX_CHARS", "200"))
+
+def engine_options(database_url: str) -> dict:
+    """
+    Argumentos de create_async_engine según la configuración del entorno.
+
+    Las opciones del pool y de asyncpg solo se aplican a PostgreSQL; con otros
+    drivers (por ejemplo aiosqlite en pruebas) se usan los valores por defecto.
+
+    Returns:
+        dict: url y argumentos de create_async_engine
+    """
+    url = make_url(database_url)
+    options = {"echo": DB_ECHO}
+    if url.get_backend_name() != "postgresql":
+        return {"url": url, **options}
+
+    options.update(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING
+    )
+    if url.get_driver_name() == "asyncpg":
+        # Caché del dialecto de SQLAlchemy y caché propia de asyncpg
+        url = url.update_query_dict({"prepared_statement_cache_size": str(DB_STATEMENT_CACHE_SIZE)})
+        connect_args = {"statement_cache_size": DB_STATEMENT_CACHE_SIZE}
+        if DB_STATEMENT_TIMEOUT_MS > 0:
+            connect_args["server_settings"] = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+        options["connect_args"] = connect_args
+    return {"url": url, **options}
+
+def create_service_engine(database_url: str, **overrides) -> AsyncEngine:
+    """
+    Crea el engine del servicio con la configuración del entorno.
+
+    Args:
+        database_url (str): URL de la base de datos
+        **overrides: Argumentos de create_async_engine que reemplazan a los del entorno
+
+    Returns:
+        AsyncEngine: Engine con el registro de consultas lentas instalado
+    """
+    options = engine_options(database_url)
+    options.update(overrides)
+    engine = create_async_engine(options.pop("url"), **options)
+    if not options.get("echo"):
+        log_queries(engine)
+    return engine
+
+def _redact(value):
+    if isinstance(value, (str, bytes)):
+        return f"<{type(value).__name__} de {len(value)}>"
+    return value
+
+def describe_parameters(parameters, executemany: bool) -> str:
+    """
+    Resumen de los parámetros de una sentencia para el registro.
+
+    Los textos se sustituyen por su longitud; de un executemany solo se describe
+    la primera fila.
+
+    Returns:
+        str: Resumen de como mucho DB_LOG_PARAMETERS_MAX_CHARS caracteres
+    """
+    rows = list(parameters) if executemany else [parameters]
+    row = rows[0] if rows else ()
+    if isinstance(row, dict):
+        row = {name: _redact(value) for name, value in row.items()}
+    else:
+        row = tuple(_redact(value) for value in row or ())
+    summary = f"{len(rows)} filas, la primera {row!r}" if executemany else repr(row)
+    if len(summary) > DB_LOG_PARAMETERS_MAX_CHARS:
+        summary = summary[:DB_LOG_PARAMETERS_MAX_CHARS] + "..."
+    return summary
+
+def log_queries(
+    engine: AsyncEngine,
+    slow_query_ms: float = None,
+    sample_rate: float = None,
+    log_parameters: bool = None
+) -> None:
+    """
+    Registra las consultas lentas y una muestra del resto.
+
+    Args:
+        engine (AsyncEngine): Engine a instrumentar
+        slow_query_ms (float, optional): Umbral de consulta lenta; por defecto DB_SLOW_QUERY_MS
+        sample_rate (float, optional): Fracción de consultas rápidas a registrar; por defecto DB_LOG_SAMPLE_RATE
+        log_parameters (bool, optional): Añadir el resumen de los parámetros a las consultas lentas; por defecto DB_LOG_PARAMETERS
+    """
+    slow_query_ms = DB_SLOW_QUERY_MS if slow_query_ms is None else slow_query_ms
+    sample_rate = DB_LOG_SAMPLE_RATE if sample_rate is None else sample_rate
+    log_parameters = DB_LOG_PARAMETERS if log_parameters is None else log_parameters
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_started_at"].pop()) * 1000
+        if elapsed_ms >= slow_query_ms:
+            if log_parameters:
+                logger.warning(
+                    "Consulta lenta (%.1f ms): %s [%s]",
+                    elapsed_ms, statement, describe_parameters(parameters, executemany)
+                )
+            else:
+                logger.warning("Consulta lenta (%.1f ms): %s", elapsed_ms, statement)
+        elif sample_rate > 0 and random.random() < sample_rate:
+            logger.info("Consulta (%.1f ms): %s", elapsed_ms, statement)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(context):
+        # La sentencia falló y no habrá after_cursor_execute: descartar su inicio
+        started = context.connection.info.get("query_started_at") if context.connection is not None else None
+        if started:
+            started.pop()
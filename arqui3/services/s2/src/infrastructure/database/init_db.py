@@ -1,8 +1,10 @@
 import asyncio
 import asyncpg
-from sqlalchemy.ext.asyncio import create_async_engine
-from .config import DATABASE_URL, DEFAULT_DATABASE_URL, Base
-from ..database.models import VacancyModel
+from pathlib import Path
+from alembic import command
+from alembic.config import Config
+
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
 
 async def create_database():
     try:
@@ -36,16 +38,13 @@ async def create_database():
 
 async def create_tables():
     try:
-        # Crear el engine con la nueva base de datos
-        engine = create_async_engine(DATABASE_URL, echo=True)
-        
-        async with engine.begin() as conn:
-            # Crear todas las tablas
-            await conn.run_sync(Base.metadata.create_all)
-            print("Tablas creadas exitosamente")
+        # Aplicar las migraciones pendientes (migrations/). env.py usa su
+        # propio bucle de eventos, por eso corre en otro hilo.
+        await asyncio.to_thread(command.upgrade, Config(str(ALEMBIC_INI)), "head")
+        print("Migraciones aplicadas exitosamente")
             
     except Exception as e:
-        print(f"Error al crear las tablas: {str(e)}")
+        print(f"Error al aplicar las migraciones: {str(e)}")
         raise
 
 async def init_db():
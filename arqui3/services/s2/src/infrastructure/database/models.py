@@ -1,14 +1,20 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, ARRAY, DateTime
+from sqlalchemy import Column, Integer, String, ARRAY, DateTime, Index
 from .config import Base
 
 class VacancyModel(Base):
     __tablename__ = "vacancies"
 
     id = Column(Integer, primary_key=True, index=True)
-    requisition_id = Column(Integer, nullable=False)
+    requisition_id = Column(Integer, nullable=False, index=True)
     platforms = Column(ARRAY(String), nullable=False)
     status = Column(String(20), nullable=False, default="DRAFT")
     publication_date = Column(DateTime, nullable=True)
     closing_date = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow) 
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Paginación por cursor sobre (created_at, id), con y sin filtro de estado
+    __table_args__ = (
+        Index("ix_vacancies_created_at_id", "created_at", "id"),
+        Index("ix_vacancies_status_created_at_id", "status", "created_at", "id"),
+    ) 
\ No newline at end of file
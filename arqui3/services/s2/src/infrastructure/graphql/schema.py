@@ -2,6 +2,9 @@ from typing import List, Optional
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
 from .types import Vacancy, VacancyInput
+from .persisted_queries import PersistedDocumentCache
+from .connection import Connection, build_connection
+from ..pagination import PAGE_SIZE_MAX, decode_cursor, page_size
 from ...application.use_cases.vacancy_use_cases import (
     PublishVacancyUseCase,
     CloseVacancyUseCase,
@@ -19,12 +22,29 @@ class Query:
             result = await repository.get_by_id(vacancy_id)
             return result
 
-    @strawberry.field
+    @strawberry.field(deprecation_reason="Devuelve como mucho PAGE_SIZE_MAX filas; usar vacanciesConnection")
     async def vacancies(self, info, status: Optional[str] = None) -> List[Vacancy]:
+        """Primeras PAGE_SIZE_MAX vacantes en orden (createdAt, id)"""
+        async for session in info.context["session"]:
+            repository = SQLAlchemyVacancyRepository(session)
+            use_case = ListVacanciesUseCase(repository)
+            return await use_case.execute(status, limit=PAGE_SIZE_MAX)
+
+    @strawberry.field
+    async def vacancies_connection(
+        self,
+        info,
+        status: Optional[str] = None,
+        first: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> Connection[Vacancy]:
+        """Vacantes paginadas por cursor en orden (createdAt, id)"""
+        size = page_size(first)
         async for session in info.context["session"]:
             repository = SQLAlchemyVacancyRepository(session)
             use_case = ListVacanciesUseCase(repository)
-            return await use_case.execute(status)
+            rows = await use_case.execute(status, decode_cursor(after), size + 1)
+            return build_connection(rows, size, lambda: repository.count_by_status(status))
 
 @strawberry.type
 class Mutation:
@@ -44,4 +64,4 @@ class Mutation:
             use_case = CloseVacancyUseCase(repository, producer)
             return await use_case.execute(vacancy_id)
 
-schema = strawberry.Schema(query=Query, mutation=Mutation) 
\ No newline at end of file
+schema = strawberry.Schema(query=Query, mutation=Mutation, extensions=[PersistedDocumentCache]) 
\ No newline at end of file
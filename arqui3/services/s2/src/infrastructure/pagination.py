@@ -0,0 +1,93 @@
+"""
+Paginación por cursor (keyset) sobre (created_at, id).
+
+Las páginas se piden con WHERE (created_at, id) > (cursor) ORDER BY created_at, id
+LIMIT n, así que el costo de cada página no depende de cuántas filas hay antes
+(a diferencia de OFFSET) y el orden es estable aunque se inserten filas nuevas.
+El cursor es opaco para los clientes: base64 de "created_at|id" de la última
+fila entregada.
+
+Las listas sin paginar (campos anteriores a las conexiones y búsquedas por
+lotes de los DataLoaders) devuelven como mucho PAGE_SIZE_MAX filas, o
+PAGE_SIZE_MAX por clave en los lotes.
+"""
+import base64
+import binascii
+import os
+from datetime import datetime
+from typing import Optional, Tuple
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import aliased
+
+PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", "50"))
+PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", "500"))
+
+def page_size(first: Optional[int]) -> int:
+    """Tamaño de página pedido, acotado a PAGE_SIZE_MAX"""
+    if first is None:
+        return PAGE_SIZE_DEFAULT
+    if first < 1:
+        raise ValueError("first debe ser mayor que cero")
+    return min(first, PAGE_SIZE_MAX)
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    value = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(value.encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """
+    Posición (created_at, id) de un cursor.
+
+    Returns:
+        Optional[Tuple[datetime, int]]: None si no hay cursor (primera página)
+    """
+    if not cursor:
+        return None
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Cursor no válido") from e
+
+def keyset(query, model, after: Optional[Tuple[datetime, int]] = None, limit: Optional[int] = None):
+    """
+    Aplica a la consulta el orden (created_at, id) y, si se indican, la posición
+    de inicio y el límite de filas.
+
+    Args:
+        query: Consulta select() o Query de SQLAlchemy
+        model: Modelo con columnas created_at e id
+        after (Optional[Tuple[datetime, int]]): (created_at, id) de la última fila de la página anterior
+        limit (Optional[int]): Máximo de filas
+
+    Returns:
+        La consulta paginada
+    """
+    if after is not None:
+        query = query.where(tuple_(model.created_at, model.id) > tuple_(*after))
+    query = query.order_by(model.created_at, model.id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+def first_rows_per_key(query, model, key_column, limit: int = PAGE_SIZE_MAX):
+    """
+    Limita una búsqueda por lotes a las primeras filas de cada clave en orden
+    (created_at, id), con ROW_NUMBER() OVER (PARTITION BY clave). Un LIMIT global
+    dejaría sin filas a las últimas claves del lote.
+
+    Args:
+        query: Consulta select() del modelo, ya filtrada por las claves del lote
+        model: Modelo con columnas created_at e id
+        key_column: Columna de la clave (ej. CandidateModel.vacancy_id)
+        limit (int): Máximo de filas por clave; por defecto PAGE_SIZE_MAX
+
+    Returns:
+        Consulta select() de instancias del modelo
+    """
+    row_number = func.row_number().over(
+        partition_by=key_column, order_by=(model.created_at, model.id)
+    ).label("row_number")
+    ranked = query.add_columns(row_number).subquery()
+    rows = aliased(model, ranked)
+    return select(rows).where(ranked.c.row_number <= limit).order_by(rows.created_at, rows.id)
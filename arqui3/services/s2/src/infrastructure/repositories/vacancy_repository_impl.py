@@ -1,10 +1,11 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from ...domain.entities.vacancy import Vacancy
 from ...domain.interfaces.vacancy_repository import VacancyRepository
 from ..database.models import VacancyModel
+from ..pagination import keyset
 
 class SQLAlchemyVacancyRepository(VacancyRepository):
     def __init__(self, session: AsyncSession):
@@ -28,27 +29,51 @@ class SQLAlchemyVacancyRepository(VacancyRepository):
         db_vacancy = result.scalar_one_or_none()
         return self._to_domain(db_vacancy) if db_vacancy else None
 
-    async def list_by_status(self, status: Optional[str] = None) -> List[Vacancy]:
+    async def list_by_status(
+        self,
+        status: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Vacancy]:
         query = select(VacancyModel)
         if status:
             query = query.where(VacancyModel.status == status)
-        result = await self.session.execute(query)
+        result = await self.session.execute(keyset(query, VacancyModel, after, limit))
         return [self._to_domain(r) for r in result.scalars().all()]
 
-    async def update_status(self, vacancy_id: int, status: str, date: datetime) -> Optional[Vacancy]:
+    async def count_by_status(self, status: Optional[str] = None) -> int:
+        query = select(func.count()).select_from(VacancyModel)
+        if status:
+            query = query.where(VacancyModel.status == status)
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
+    async def update_status(
+        self,
+        vacancy_id: int,
+        status: str,
+        date: datetime,
+        expected_statuses: Optional[List[str]] = None
+    ) -> Optional[Vacancy]:
+        values = {"status": status}
+        if status == "PUBLISHED":
+            values["publication_date"] = date
+        elif status == "CLOSED":
+            values["closing_date"] = date
+
+        # Una sola sentencia UPDATE ... RETURNING; la condición sobre el estado
+        # actual evita pisar un cambio concurrente
+        query = update(VacancyModel).where(VacancyModel.id == vacancy_id)
+        if expected_statuses:
+            query = query.where(VacancyModel.status.in_(expected_statuses))
         result = await self.session.execute(
-            select(VacancyModel).where(VacancyModel.id == vacancy_id)
+            query.values(**values)
+            .returning(VacancyModel)
+            .execution_options(populate_existing=True)
         )
         db_vacancy = result.scalar_one_or_none()
-        if db_vacancy:
-            db_vacancy.status = status
-            if status == "PUBLISHED":
-                db_vacancy.publication_date = date
-            elif status == "CLOSED":
-                db_vacancy.closing_date = date
-            await self.session.commit()
-            return self._to_domain(db_vacancy)
-        return None
+        await self.session.commit()
+        return self._to_domain(db_vacancy) if db_vacancy else None
 
     async def get_by_requisition_id(self, requisition_id: int) -> Optional[Vacancy]:
         result = await self.session.execute(
@@ -1,11 +1,15 @@
 from fastapi import FastAPI
-from strawberry.fastapi import GraphQLRouter
 from .infrastructure.graphql.schema import schema
+from .infrastructure.graphql.persisted_queries import PersistedQueryRouter
+from .infrastructure.encoding import CompressionMiddleware
 from .infrastructure.database.config import get_session
 from .infrastructure.events.kafka_producer import KafkaProducer
 
 app = FastAPI(title="Vacancy Service")
 
+# Comprimir con gzip/brotli las respuestas grandes según Accept-Encoding
+app.add_middleware(CompressionMiddleware)
+
 # Crear instancia del productor de Kafka
 kafka_producer = KafkaProducer()
 
@@ -17,7 +21,7 @@ async def startup_event():
 async def shutdown_event():
     await kafka_producer.stop()
 
-graphql_app = GraphQLRouter(
+graphql_app = PersistedQueryRouter(
     schema,
     context_getter=lambda: {
         "session": get_session(),
@@ -0,0 +1,45 @@
+"""Esquema inicial
+
+Tablas tal como las creaba init_db.py con create_all. En una base creada
+antes de las migraciones la tabla ya existe y no se toca, así que
+`alembic upgrade head` sirve tanto para bases nuevas como existentes.
+
+Revision ID: 0001
+Revises:
+Create Date: 2024-06-03 10:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def table_exists(name: str) -> bool:
+    # Con --sql no hay conexión: se genera el esquema completo
+    return not op.get_context().as_sql and sa.inspect(op.get_bind()).has_table(name)
+
+def upgrade() -> None:
+    if table_exists("candidates"):
+        return
+    op.create_table(
+        "candidates",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("email", sa.String(100), nullable=False),
+        sa.Column("resume_url", sa.String(500), nullable=False),
+        sa.Column("vacancy_id", sa.Integer(), nullable=False),
+        sa.Column("application_date", sa.DateTime(), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("skills", sa.ARRAY(sa.String()), nullable=False),
+        sa.Column("experience_years", sa.Integer(), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False)
+    )
+    op.create_index("ix_candidates_id", "candidates", ["id"])
+    op.create_index("ix_candidates_email", "candidates", ["email"])
+    op.create_index("ix_candidates_vacancy_id", "candidates", ["vacancy_id"])
+
+def downgrade() -> None:
+    op.drop_table("candidates")
@@ -0,0 +1,53 @@
+"""Índices de las consultas frecuentes
+
+Se crean con CREATE INDEX CONCURRENTLY, fuera de la transacción de la
+migración, para no bloquear las escrituras mientras se construyen. Si una
+construcción concurrente falla, PostgreSQL deja el índice marcado como no
+válido; se elimina antes de reintentar para que IF NOT EXISTS no lo dé por
+creado.
+
+- (vacancy_id, created_at, id): candidatesConnection de una vacante. El
+  índice simple ix_candidates_vacancy_id del esquema inicial ya cubre el
+  COUNT y los filtros por vacante
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2024-06-03 10:05:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+TABLE = "candidates"
+
+INDEXES = [
+    ("ix_candidates_vacancy_id_created_at_id", ["vacancy_id", "created_at", "id"]),
+]
+
+def drop_if_invalid(name: str) -> None:
+    if op.get_context().as_sql:
+        return
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name}
+    ).first()
+    if invalid:
+        op.drop_index(name, table_name=TABLE, postgresql_concurrently=True, if_exists=True)
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            drop_if_invalid(name)
+            op.create_index(name, TABLE, columns, postgresql_concurrently=True, if_not_exists=True)
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=TABLE, postgresql_concurrently=True, if_exists=True)
@@ -1,4 +1,6 @@
-from typing import List, Optional
+import asyncio
+from datetime import datetime
+from typing import List, Optional, Tuple
 from ...domain.entities.candidate import Candidate, CandidateStatus
 from ...domain.interfaces.candidate_repository import CandidateRepository
 from ...infrastructure.events.kafka_producer import KafkaProducer
@@ -30,6 +32,37 @@ class SubmitApplicationUseCase:
 
         return created_candidate
 
+class SubmitApplicationsUseCase:
+    def __init__(self, repository: CandidateRepository, event_producer: KafkaProducer):
+        self.repository = repository
+        self.event_producer = event_producer
+
+    async def execute(self, candidates_data: List[dict]) -> List[Candidate]:
+        candidates = [Candidate(**candidate_data) for candidate_data in candidates_data]
+        
+        invalid = [index for index, candidate in enumerate(candidates) if not candidate.is_valid()]
+        if invalid:
+            raise ValueError(f"Las aplicaciones {invalid} no contienen toda la información requerida")
+
+        created_candidates = await self.repository.create_many(candidates)
+
+        # Publicar los eventos de nueva aplicación en paralelo
+        await asyncio.gather(*[
+            self.event_producer.send_message(
+                "application_submitted",
+                {
+                    "candidate_id": candidate.id,
+                    "vacancy_id": candidate.vacancy_id,
+                    "candidate_name": candidate.name,
+                    "candidate_email": candidate.email,
+                    "application_date": candidate.application_date.isoformat()
+                }
+            )
+            for candidate in created_candidates
+        ])
+
+        return created_candidates
+
 class FilterCandidatesUseCase:
     def __init__(self, repository: CandidateRepository):
         self.repository = repository
@@ -39,30 +72,62 @@ class FilterCandidatesUseCase:
         vacancy_id: Optional[int] = None,
         required_skills: Optional[List[str]] = None,
         min_experience: Optional[int] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Candidate]:
+        if not limit:
+            candidates = await self.repository.list_by_filters(
+                vacancy_id=vacancy_id,
+                skills=required_skills,
+                min_experience=min_experience,
+                status=status
+            )
+            return self._matching(candidates, required_skills, min_experience)
+
+        # Con límite se lee por páginas de `limit` filas hasta reunir `limit`
+        # candidatos que pasen también el filtro en memoria
+        matches = []
+        after = None
+        while len(matches) < limit:
+            page = await self.repository.list_by_filters(
+                vacancy_id=vacancy_id,
+                skills=required_skills,
+                min_experience=min_experience,
+                status=status,
+                after=after,
+                limit=limit
+            )
+            matches.extend(self._matching(page, required_skills, min_experience))
+            if len(page) < limit:
+                break
+            after = (page[-1].created_at, page[-1].id)
+        return matches[:limit]
+
+    @staticmethod
+    def _matching(
+        candidates: List[Candidate],
+        required_skills: Optional[List[str]],
+        min_experience: Optional[int]
     ) -> List[Candidate]:
-        candidates = await self.repository.list_by_filters(
-            vacancy_id=vacancy_id,
-            skills=required_skills,
-            min_experience=min_experience,
-            status=status
-        )
-        
         # Aplicar filtros adicionales en memoria si es necesario
         if required_skills or min_experience:
             candidates = [
                 c for c in candidates
                 if c.matches_requirements(required_skills or [], min_experience or 0)
             ]
-        
         return candidates
 
 class ListCandidatesUseCase:
     def __init__(self, repository: CandidateRepository):
         self.repository = repository
 
-    async def execute(self, vacancy_id: int) -> List[Candidate]:
-        return await self.repository.list_by_vacancy(vacancy_id)
+    async def execute(
+        self,
+        vacancy_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Candidate]:
+        return await self.repository.list_by_vacancy(vacancy_id, after, limit)
 
 class UpdateCandidateStatusUseCase:
     def __init__(self, repository: CandidateRepository, event_producer: KafkaProducer):
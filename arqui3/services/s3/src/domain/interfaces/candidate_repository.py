@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from ..entities.candidate import Candidate
 
 class CandidateRepository(ABC):
@@ -8,14 +9,39 @@ class CandidateRepository(ABC):
         """Crea un nuevo candidato"""
         pass
 
+    @abstractmethod
+    async def create_many(self, candidates: List[Candidate]) -> List[Candidate]:
+        """Crea varios candidatos en una sola transacción"""
+        pass
+
     @abstractmethod
     async def get_by_id(self, candidate_id: int) -> Optional[Candidate]:
         """Obtiene un candidato por su ID"""
         pass
 
     @abstractmethod
-    async def list_by_vacancy(self, vacancy_id: int) -> List[Candidate]:
-        """Lista los candidatos de una vacante específica"""
+    async def list_by_ids(self, candidate_ids: List[int]) -> List[Candidate]:
+        """Obtiene varios candidatos por sus IDs en una sola consulta"""
+        pass
+
+    @abstractmethod
+    async def list_by_vacancy(
+        self,
+        vacancy_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Candidate]:
+        """Lista los candidatos de una vacante en orden (created_at, id); con after y limit devuelve una página"""
+        pass
+
+    @abstractmethod
+    async def count_by_vacancy(self, vacancy_id: int) -> int:
+        """Cuenta los candidatos de una vacante"""
+        pass
+
+    @abstractmethod
+    async def list_by_vacancies(self, vacancy_ids: List[int]) -> List[Candidate]:
+        """Lista los candidatos de varias vacantes en una sola consulta"""
         pass
 
     @abstractmethod
@@ -24,9 +50,11 @@ class CandidateRepository(ABC):
         vacancy_id: Optional[int] = None,
         status: Optional[str] = None,
         skills: Optional[List[str]] = None,
-        min_experience: Optional[int] = None
+        min_experience: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
     ) -> List[Candidate]:
-        """Lista los candidatos según los filtros especificados"""
+        """Lista los candidatos según los filtros especificados, en orden (created_at, id)"""
         pass
 
     @abstractmethod
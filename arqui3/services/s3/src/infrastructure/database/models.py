@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ARRAY, Text
+from sqlalchemy import Column, Integer, String, DateTime, ARRAY, Text, Index
 from .config import Base
 
 class CandidateModel(Base):
@@ -15,4 +15,9 @@ class CandidateModel(Base):
     skills = Column(ARRAY(String), nullable=False, default=list)
     experience_years = Column(Integer, nullable=True)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow) 
\ No newline at end of file
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    # Paginación por cursor de los candidatos de una vacante sobre (created_at, id)
+    __table_args__ = (
+        Index("ix_candidates_vacancy_id_created_at_id", "vacancy_id", "created_at", "id"),
+    ) 
\ No newline at end of file
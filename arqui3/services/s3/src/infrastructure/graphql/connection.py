@@ -0,0 +1,63 @@
+"""
+Tipos de conexión estilo Relay (edges, pageInfo, totalCount) para las listas
+paginadas por cursor. totalCount se calcula con un COUNT aparte y solo cuando
+el cliente lo pide.
+"""
+from typing import Awaitable, Callable, Generic, List, Optional, TypeVar
+import strawberry
+from ..pagination import encode_cursor
+
+T = TypeVar("T")
+
+@strawberry.type
+class PageInfo:
+    has_next_page: bool
+    end_cursor: Optional[str]
+
+@strawberry.type
+class Edge(Generic[T]):
+    cursor: str
+    node: T
+
+@strawberry.type
+class Connection(Generic[T]):
+    edges: List[Edge[T]]
+    page_info: PageInfo
+    count: strawberry.Private[Optional[Callable[[], Awaitable[int]]]] = None
+
+    @strawberry.field
+    async def total_count(self) -> Optional[int]:
+        """Total de filas que cumplen el filtro (consulta COUNT aparte)"""
+        if self.count is None:
+            return None
+        return await self.count()
+
+def build_connection(
+    rows: list,
+    first: int,
+    count: Optional[Callable[[], Awaitable[int]]] = None,
+    to_node: Optional[Callable] = None
+) -> Connection:
+    """
+    Arma la conexión a partir de una consulta que pidió first + 1 filas: la fila
+    de más solo indica que hay otra página y no se entrega.
+
+    Args:
+        rows (list): Filas con created_at e id, en orden de keyset
+        first (int): Tamaño de la página
+        count (optional): Función asíncrona que devuelve el total de filas
+        to_node (optional): Conversión de cada fila al tipo GraphQL
+    """
+    has_next_page = len(rows) > first
+    edges = [
+        Edge(cursor=encode_cursor(row.created_at, row.id), node=to_node(row) if to_node else row)
+        for row in rows[:first]
+    ]
+    return Connection(
+        edges=edges,
+        page_info=PageInfo(
+            has_next_page=has_next_page,
+            end_cursor=edges[-1].cursor if edges else None
+        ),
+        count=count
+    )
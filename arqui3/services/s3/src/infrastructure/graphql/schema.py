@@ -2,8 +2,12 @@ from typing import List, Optional
 import strawberry
 from sqlalchemy.ext.asyncio import AsyncSession
 from .types import Candidate, CandidateInput, CandidateFilterInput
+from .persisted_queries import PersistedDocumentCache
+from .connection import Connection, build_connection
+from ..pagination import PAGE_SIZE_MAX, decode_cursor, page_size
 from ...application.use_cases.candidate_use_cases import (
     SubmitApplicationUseCase,
+    SubmitApplicationsUseCase,
     FilterCandidatesUseCase,
     ListCandidatesUseCase,
     UpdateCandidateStatusUseCase
@@ -21,17 +25,54 @@ class Query:
             result = await repository.get_by_id(candidate_id)
             return result
 
-    @strawberry.field
+    @strawberry.field(deprecation_reason="Devuelve como mucho PAGE_SIZE_MAX filas; usar candidatesConnection")
     async def candidates(self, info, vacancy_id: int) -> List[Candidate]:
+        """Primeros PAGE_SIZE_MAX candidatos de la vacante en orden (createdAt, id)"""
         async with async_session() as session:
             repository = SQLAlchemyCandidateRepository(session)
             use_case = ListCandidatesUseCase(repository)
-            return await use_case.execute(vacancy_id)
+            return await use_case.execute(vacancy_id, limit=PAGE_SIZE_MAX)
+
+    @strawberry.field
+    async def candidates_connection(
+        self,
+        info,
+        vacancy_id: int,
+        first: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> Connection[Candidate]:
+        """Candidatos de la vacante paginados por cursor en orden (createdAt, id)"""
+        size = page_size(first)
+        async with async_session() as session:
+            repository = SQLAlchemyCandidateRepository(session)
+            use_case = ListCandidatesUseCase(repository)
+            rows = await use_case.execute(vacancy_id, decode_cursor(after), size + 1)
+
+        async def count():
+            async with async_session() as session:
+                return await SQLAlchemyCandidateRepository(session).count_by_vacancy(vacancy_id)
+
+        return build_connection(rows, size, count)
+
+    @strawberry.field
+    async def candidates_by_ids(self, info, ids: List[int]) -> List[Candidate]:
+        """Búsqueda por lotes para los DataLoaders del gateway"""
+        async with async_session() as session:
+            repository = SQLAlchemyCandidateRepository(session)
+            return await repository.list_by_ids(ids)
+
+    @strawberry.field
+    async def candidates_by_vacancies(self, info, vacancy_ids: List[int]) -> List[Candidate]:
+        """Búsqueda por lotes para los DataLoaders del gateway (PAGE_SIZE_MAX por vacante)"""
+        async with async_session() as session:
+            repository = SQLAlchemyCandidateRepository(session)
+            return await repository.list_by_vacancies(vacancy_ids)
 
     @strawberry.field
     async def filter_candidates(
         self, info, filters: CandidateFilterInput
     ) -> List[Candidate]:
+        """Primeros PAGE_SIZE_MAX candidatos que cumplen los filtros, en orden (createdAt, id)"""
         async with async_session() as session:
             repository = SQLAlchemyCandidateRepository(session)
             use_case = FilterCandidatesUseCase(repository)
@@ -39,7 +80,8 @@ class Query:
                 vacancy_id=filters.vacancy_id,
                 required_skills=filters.required_skills,
                 min_experience=filters.min_experience,
-                status=filters.status
+                status=filters.status,
+                limit=PAGE_SIZE_MAX
             )
 
 @strawberry.type
@@ -52,6 +94,14 @@ class Mutation:
             use_case = SubmitApplicationUseCase(repository, producer)
             return await use_case.execute(input.__dict__)
 
+    @strawberry.mutation
+    async def submit_applications(self, info, inputs: List[CandidateInput]) -> List[Candidate]:
+        async with async_session() as session:
+            producer: KafkaProducer = info.context["kafka_producer"]
+            repository = SQLAlchemyCandidateRepository(session)
+            use_case = SubmitApplicationsUseCase(repository, producer)
+            return await use_case.execute([input.__dict__ for input in inputs])
+
     @strawberry.mutation
     async def update_candidate_status(
         self, info, candidate_id: int, status: str
@@ -66,4 +116,4 @@ class Mutation:
     async def create_candidate(self, name: str, email: str) -> Candidate:
         return Candidate(id="1", name=name, email=email, status="ACTIVE")
 
-schema = strawberry.Schema(query=Query, mutation=Mutation) 
\ No newline at end of file
+schema = strawberry.Schema(query=Query, mutation=Mutation, extensions=[PersistedDocumentCache]) 
\ No newline at end of file
@@ -1,9 +1,11 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import func, select, update, and_
 from ...domain.entities.candidate import Candidate
 from ...domain.interfaces.candidate_repository import CandidateRepository
 from ..database.models import CandidateModel
+from ..pagination import first_rows_per_key, keyset
 
 class SQLAlchemyCandidateRepository(CandidateRepository):
     def __init__(self, session: AsyncSession):
@@ -26,6 +28,28 @@ class SQLAlchemyCandidateRepository(CandidateRepository):
         await self.session.refresh(db_candidate)
         return self._to_domain(db_candidate)
 
+    async def create_many(self, candidates: List[Candidate]) -> List[Candidate]:
+        db_candidates = [
+            CandidateModel(
+                name=candidate.name,
+                email=candidate.email,
+                resume_url=candidate.resume_url,
+                vacancy_id=candidate.vacancy_id,
+                application_date=candidate.application_date,
+                status=candidate.status,
+                skills=candidate.skills,
+                experience_years=candidate.experience_years,
+                notes=candidate.notes
+            )
+            for candidate in candidates
+        ]
+        self.session.add_all(db_candidates)
+        # Un solo INSERT por lotes; los IDs vuelven con el flush y no hace falta refrescar cada fila
+        await self.session.flush()
+        created = [self._to_domain(db_candidate) for db_candidate in db_candidates]
+        await self.session.commit()
+        return created
+
     async def get_by_id(self, candidate_id: int) -> Optional[Candidate]:
         result = await self.session.execute(
             select(CandidateModel).where(CandidateModel.id == candidate_id)
@@ -33,18 +57,45 @@ class SQLAlchemyCandidateRepository(CandidateRepository):
         db_candidate = result.scalar_one_or_none()
         return self._to_domain(db_candidate) if db_candidate else None
 
-    async def list_by_vacancy(self, vacancy_id: int) -> List[Candidate]:
+    async def list_by_ids(self, candidate_ids: List[int]) -> List[Candidate]:
+        if not candidate_ids:
+            return []
         result = await self.session.execute(
-            select(CandidateModel).where(CandidateModel.vacancy_id == vacancy_id)
+            select(CandidateModel).where(CandidateModel.id.in_(candidate_ids))
         )
         return [self._to_domain(r) for r in result.scalars().all()]
 
+    async def list_by_vacancy(
+        self,
+        vacancy_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Candidate]:
+        query = select(CandidateModel).where(CandidateModel.vacancy_id == vacancy_id)
+        result = await self.session.execute(keyset(query, CandidateModel, after, limit))
+        return [self._to_domain(r) for r in result.scalars().all()]
+
+    async def count_by_vacancy(self, vacancy_id: int) -> int:
+        result = await self.session.execute(
+            select(func.count()).select_from(CandidateModel).where(CandidateModel.vacancy_id == vacancy_id)
+        )
+        return result.scalar_one()
+
+    async def list_by_vacancies(self, vacancy_ids: List[int]) -> List[Candidate]:
+        if not vacancy_ids:
+            return []
+        query = select(CandidateModel).where(CandidateModel.vacancy_id.in_(vacancy_ids))
+        result = await self.session.execute(first_rows_per_key(query, CandidateModel, CandidateModel.vacancy_id))
+        return [self._to_domain(r) for r in result.scalars().all()]
+
     async def list_by_filters(
         self,
         vacancy_id: Optional[int] = None,
         status: Optional[str] = None,
         skills: Optional[List[str]] = None,
-        min_experience: Optional[int] = None
+        min_experience: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
     ) -> List[Candidate]:
         query = select(CandidateModel)
         conditions = []
@@ -62,30 +113,27 @@ class SQLAlchemyCandidateRepository(CandidateRepository):
         if conditions:
             query = query.where(and_(*conditions))
 
-        result = await self.session.execute(query)
+        result = await self.session.execute(keyset(query, CandidateModel, after, limit))
         return [self._to_domain(r) for r in result.scalars().all()]
 
     async def update_status(self, candidate_id: int, status: str) -> Optional[Candidate]:
-        result = await self.session.execute(
-            select(CandidateModel).where(CandidateModel.id == candidate_id)
-        )
-        db_candidate = result.scalar_one_or_none()
-        if db_candidate:
-            db_candidate.status = status
-            await self.session.commit()
-            return self._to_domain(db_candidate)
-        return None
+        return await self._update(candidate_id, status=status)
 
     async def add_notes(self, candidate_id: int, notes: str) -> Optional[Candidate]:
+        return await self._update(candidate_id, notes=notes)
+
+    async def _update(self, candidate_id: int, **values) -> Optional[Candidate]:
+        # Una sola sentencia UPDATE ... RETURNING en lugar de SELECT, cambio en Python y COMMIT
         result = await self.session.execute(
-            select(CandidateModel).where(CandidateModel.id == candidate_id)
+            update(CandidateModel)
+            .where(CandidateModel.id == candidate_id)
+            .values(**values)
+            .returning(CandidateModel)
+            .execution_options(populate_existing=True)
         )
         db_candidate = result.scalar_one_or_none()
-        if db_candidate:
-            db_candidate.notes = notes
-            await self.session.commit()
-            return self._to_domain(db_candidate)
-        return None
+        await self.session.commit()
+        return self._to_domain(db_candidate) if db_candidate else None
 
     def _to_domain(self, model: CandidateModel) -> Candidate:
         return Candidate(
@@ -1,10 +1,14 @@
 from fastapi import FastAPI
-from strawberry.fastapi import GraphQLRouter
 from .infrastructure.graphql.schema import schema
+from .infrastructure.graphql.persisted_queries import PersistedQueryRouter
+from .infrastructure.encoding import CompressionMiddleware
 from .infrastructure.events.kafka_producer import KafkaProducer
 
 app = FastAPI(title="Candidate Service")
 
+# Comprimir con gzip/brotli las respuestas grandes según Accept-Encoding
+app.add_middleware(CompressionMiddleware)
+
 # Crear instancia del productor de Kafka
 kafka_producer = KafkaProducer()
 
@@ -22,7 +26,7 @@ async def get_context():
         "kafka_producer": kafka_producer
     }
 
-graphql_app = GraphQLRouter(
+graphql_app = PersistedQueryRouter(
     schema,
     context_getter=get_context
 )
@@ -0,0 +1,294 @@
+"""
+Mide el rendimiento del servicio de evaluaciones bajo carga GraphQL
+concurrente, con la implementación anterior (síncrona) frente a la actual.
+
+- anterior: engine síncrono con psycopg2, resolvers síncronos que abren su
+  propia sesión con get_db_session() y reportes con una consulta por
+  evaluación y resultado, todo en el bucle de eventos (sync_query y
+  legacy_pdf_report). get_db_session() cerraba la sesión antes de usarla: la
+  consulta siguiente toma otra conexión que solo vuelve al pool cuando el
+  recolector de basura libera la sesión, así que bajo carga el pool se agota
+  y la petición espera pool_timeout (30 s) con el bucle bloqueado.
+- síncrono: los mismos resolvers con una sesión por petición cerrada al
+  terminar, sin la fuga. La conexión se sigue tomando dentro del bucle de
+  eventos: con más peticiones en curso que conexiones en el pool, la espera
+  bloquea al mismo bucle que debería liberarlas (hasta pool_timeout).
+- actual: la aplicación de src/main.py: engine asíncrono (engine.py), una
+  sesión por operación en el contexto de GraphQL, resolvers asíncronos y
+  reportes por el mismo pool, con el PDF armado en otro hilo.
+
+Cada escenario lanza --concurrency clientes que, durante --seconds segundos,
+envían peticiones a la aplicación en el mismo proceso (httpx con
+ASGITransport, sin red):
+
+- por id: evaluation(id)
+- por candidato: evaluationsByCandidate y una página de evaluationsConnection
+  con totalCount en la misma consulta
+- mixto con reportes: como "por candidato", pero una de cada --report-every
+  peticiones descarga el reporte PDF del candidato
+
+Reporta peticiones por segundo y latencia p50/p95/p99. Las filas de prueba
+usan candidate_id desde CANDIDATE_BASE y se borran al terminar.
+
+La implementación anterior necesita psycopg2-binary y el cliente httpx,
+que el servicio ya no usa: instálelos aparte para medir.
+
+Uso (desde el directorio s4/, con la base migrada):
+    python -m benchmarks.graphql_load [--concurrency 50] [--seconds 10] [--candidates 200] [--legacy-pool-timeout 30]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from tempfile import NamedTemporaryFile
+from typing import Callable, List, Optional
+import httpx
+import strawberry
+from fastapi import FastAPI, Request
+from sqlalchemy import create_engine, delete, func, select
+from sqlalchemy.orm import Session, sessionmaker
+from strawberry.types import Info
+from src.application.report_service import ReportService, report_version
+from src.domain.models import Evaluation, EvaluationStatus, PsychometricResult, TechnicalResult, TestType
+from src.infrastructure.database.config import async_session, database_url, engine
+from src.infrastructure.encoding import CompressionMiddleware
+from src.infrastructure.graphql.connection import Connection, build_connection
+from src.infrastructure.graphql.persisted_queries import PersistedDocumentCache, PersistedQueryRouter
+from src.infrastructure.pagination import decode_cursor, keyset, page_size
+from src.infrastructure.report_responses import report_response
+from src.infrastructure.resolvers import to_evaluation_type
+from src.infrastructure.schema import EvaluationType
+from src.main import app
+
+CANDIDATE_BASE = 900_000_000
+
+# Se enlaza en main() al engine síncrono de la implementación anterior
+LegacySessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+def get_db_session(info: Info):
+    """get_db_session() anterior: cierra la sesión antes de entregarla"""
+    db = LegacySessionLocal()
+    try:
+        return db
+    finally:
+        db.close()
+
+def get_sync_context():
+    """Sesión síncrona por petición, cerrada al terminar (variante "síncrono")"""
+    db = LegacySessionLocal()
+    try:
+        yield {"db": db}
+    finally:
+        db.close()
+
+def sync_query(session_for: Callable[[Info], Session]):
+    """
+    Resolvers síncronos tal como estaban antes del engine asíncrono.
+
+    Args:
+        session_for: Sesión que usa cada resolver (get_db_session en la
+            implementación anterior, la del contexto en la variante "síncrono")
+    """
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def evaluation(self, info: Info, id: int) -> Optional[EvaluationType]:
+            db = session_for(info)
+            eval_db = db.query(Evaluation).filter(Evaluation.id == id).first()
+            return to_evaluation_type(eval_db) if eval_db else None
+
+        @strawberry.field
+        def evaluations_by_candidate(self, info: Info, candidate_id: int) -> List[EvaluationType]:
+            db = session_for(info)
+            evals_db = db.query(Evaluation).filter(Evaluation.candidate_id == candidate_id).all()
+            return [to_evaluation_type(eval_db) for eval_db in evals_db]
+
+        @strawberry.field
+        def evaluations_connection(
+            self,
+            info: Info,
+            candidate_id: Optional[int] = None,
+            first: Optional[int] = None,
+            after: Optional[str] = None
+        ) -> Connection[EvaluationType]:
+            size = page_size(first)
+            db = session_for(info)
+            query = db.query(Evaluation)
+            if candidate_id is not None:
+                query = query.filter(Evaluation.candidate_id == candidate_id)
+            rows = keyset(query, Evaluation, decode_cursor(after), size + 1).all()
+
+            async def count() -> int:
+                count_db = session_for(info)
+                count_query = count_db.query(func.count(Evaluation.id))
+                if candidate_id is not None:
+                    count_query = count_query.filter(Evaluation.candidate_id == candidate_id)
+                return count_query.scalar()
+
+            return build_connection(rows, size, count, to_evaluation_type)
+
+    return Query
+
+def legacy_evaluations(db, candidate_id: int) -> list:
+    """Lectura anterior de los reportes: una consulta por evaluación y por resultado"""
+    rows = []
+    for evaluation in db.query(Evaluation).filter(Evaluation.candidate_id == candidate_id).all():
+        psychometric = db.query(PsychometricResult).filter(PsychometricResult.evaluation_id == evaluation.id).first()
+        technical = db.query(TechnicalResult).filter(TechnicalResult.evaluation_id == evaluation.id).first()
+        rows.append((evaluation, psychometric, technical))
+    return rows
+
+def legacy_pdf_report(candidate_id: int, request: Request):
+    """Endpoint anterior del reporte PDF: sesión síncrona y reportlab en el bucle de eventos"""
+    temp_file = NamedTemporaryFile(delete=False, suffix=".pdf")
+    temp_file.close()
+    db = LegacySessionLocal()
+    try:
+        evaluations = legacy_evaluations(db, candidate_id)
+        ReportService.write_pdf_report(candidate_id, evaluations, temp_file.name)
+    finally:
+        db.close()
+    version = report_version(candidate_id, "pdf", evaluations)
+    return report_response(
+        request, temp_file.name, "application/pdf", f"evaluation_report_{candidate_id}.pdf",
+        version.etag, version.last_modified
+    )
+
+def sync_app(session_for: Callable[[Info], Session], context_getter=None) -> FastAPI:
+    """Aplicación con los resolvers y el reporte síncronos"""
+    schema = strawberry.Schema(query=sync_query(session_for), extensions=[PersistedDocumentCache])
+    sync = FastAPI()
+    sync.add_middleware(CompressionMiddleware)
+    sync.include_router(PersistedQueryRouter(schema, context_getter=context_getter), prefix="/graphql")
+
+    async def pdf_report(candidate_id: int, request: Request):
+        return legacy_pdf_report(candidate_id, request)
+
+    sync.add_api_route("/reports/{candidate_id}/pdf", pdf_report, methods=["GET"])
+    return sync
+
+BY_ID = "query ($id: Int!) { evaluation(id: $id) { id status score } }"
+BY_CANDIDATE = """
+query ($candidateId: Int!) {
+  evaluationsByCandidate(candidateId: $candidateId) { id testType status score }
+  evaluationsConnection(candidateId: $candidateId, first: 10) {
+    edges { node { id status } }
+    pageInfo { hasNextPage endCursor }
+    totalCount
+  }
+}
+"""
+
+async def seed(candidates: int, per_candidate: int) -> List[int]:
+    async with async_session() as session:
+        evaluations = [
+            Evaluation(
+                candidate_id=CANDIDATE_BASE + c,
+                test_type=TestType.TECHNICAL if i % 2 else TestType.PSYCHOMETRIC,
+                status=EvaluationStatus.COMPLETED,
+                score=80.0
+            )
+            for c in range(1, candidates + 1)
+            for i in range(per_candidate)
+        ]
+        session.add_all(evaluations)
+        await session.flush()
+        for evaluation in evaluations:
+            if evaluation.test_type == TestType.TECHNICAL:
+                session.add(TechnicalResult(evaluation_id=evaluation.id, programming_score=80, problem_solving_score=80, technical_knowledge="Benchmark"))
+            else:
+                session.add(PsychometricResult(evaluation_id=evaluation.id, personality_traits="Benchmark", cognitive_score=80, emotional_intelligence=80))
+        await session.commit()
+        return [evaluation.id for evaluation in evaluations]
+
+async def cleanup():
+    async with async_session() as session:
+        ids = select(Evaluation.id).where(Evaluation.candidate_id > CANDIDATE_BASE).scalar_subquery()
+        await session.execute(delete(TechnicalResult).where(TechnicalResult.evaluation_id.in_(ids)))
+        await session.execute(delete(PsychometricResult).where(PsychometricResult.evaluation_id.in_(ids)))
+        await session.execute(delete(Evaluation).where(Evaluation.candidate_id > CANDIDATE_BASE))
+        await session.commit()
+
+async def run(target: FastAPI, concurrency: int, seconds: float, request) -> dict:
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + seconds
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=target), base_url="http://bench", timeout=None) as client:
+        async def worker():
+            nonlocal errors
+            n = 0
+            while time.perf_counter() < deadline:
+                started_at = time.perf_counter()
+                response = await request(client, n)
+                latencies.append(time.perf_counter() - started_at)
+                if response.status_code != 200 or (response.headers["content-type"].startswith("application/json") and "errors" in response.json()):
+                    errors += 1
+                n += 1
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started_at
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p95_ms": quantiles[94] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "errors": errors,
+    }
+
+async def main(concurrency: int, seconds: float, candidates: int, per_candidate: int, report_every: int, legacy_pool_timeout: float):
+    # Pool por defecto de create_engine (5 + 10 conexiones), como antes
+    legacy_engine = create_engine(database_url(drivername="postgresql+psycopg2"), pool_timeout=legacy_pool_timeout)
+    LegacySessionLocal.configure(bind=legacy_engine)
+    await cleanup()
+    ids = await seed(candidates, per_candidate)
+
+    def candidate() -> int:
+        return CANDIDATE_BASE + random.randint(1, candidates)
+
+    async def by_id(client, n):
+        return await client.post("/graphql", json={"query": BY_ID, "variables": {"id": random.choice(ids)}})
+
+    async def by_candidate(client, n):
+        return await client.post("/graphql", json={"query": BY_CANDIDATE, "variables": {"candidateId": candidate()}})
+
+    async def mixed(client, n):
+        if n % report_every == report_every - 1:
+            return await client.get(f"/reports/{candidate()}/pdf")
+        return await by_candidate(client, n)
+
+    scenarios = {"por id": by_id, "por candidato": by_candidate, "mixto con reportes": mixed}
+    targets = (
+        ("anterior", sync_app(get_db_session)),
+        ("síncrono", sync_app(lambda info: info.context["db"], get_sync_context)),
+        ("actual", app),
+    )
+
+    print(f"{concurrency} clientes, {seconds:.0f} s por escenario, {candidates} candidatos con {per_candidate} evaluaciones")
+    print(f"pool: anterior {legacy_engine.pool.size()} + {legacy_engine.pool._max_overflow}, actual {engine.pool.size()} + {engine.pool._max_overflow}\n")
+    print(f"{'escenario':<30}{'pet/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errores':>9}")
+    try:
+        for name, request in scenarios.items():
+            for label, target in targets:
+                r = await run(target, concurrency, seconds, request)
+                print(f"{name + ' ' + label:<30}{r['rps']:>9.0f}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}{r['errors']:>9}")
+    finally:
+        await cleanup()
+        await engine.dispose()
+        legacy_engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--candidates", type=int, default=200, help="Candidatos de prueba")
+    parser.add_argument("--per-candidate", type=int, default=6, help="Evaluaciones por candidato")
+    parser.add_argument("--report-every", type=int, default=20, help="Una de cada N peticiones del escenario mixto es un reporte")
+    parser.add_argument("--legacy-pool-timeout", type=float, default=30, help="pool_timeout del engine anterior (30 s por defecto en SQLAlchemy)")
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.seconds, args.candidates, args.per_candidate, args.report_every, args.legacy_pool_timeout))
@@ -0,0 +1,87 @@
+"""
+Comprueba que las consultas frecuentes del servicio usan índices.
+
+Ejecuta cada consulta de HOT_QUERIES (las mismas que emiten los resolvers y
+ReportService), captura el SQL que emite y lo pasa por EXPLAIN con
+enable_seqscan desactivado: así el planificador solo elige un Seq Scan si
+ningún índice sirve, aunque la tabla esté vacía. Termina con código 1 si
+algún plan recorre una tabla completa. Todo corre en una transacción que se
+revierte.
+
+Uso (desde el directorio del servicio, con la base migrada):
+    python -m migrations.check_plans
+"""
+import asyncio
+import json
+import sys
+from datetime import datetime
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+from src.domain.models import Evaluation, PsychometricResult, TechnicalResult
+from src.infrastructure.database.config import DATABASE_URL
+from src.infrastructure.pagination import keyset
+
+AFTER = (datetime(2024, 1, 1), 1)
+
+# Consulta frecuente -> misma consulta que emite el resolver o el reporte
+HOT_QUERIES = {
+    "evaluationsConnection": lambda session: session.scalars(keyset(select(Evaluation), Evaluation, AFTER, 51)),
+    "evaluationsConnection por candidato": lambda session: session.scalars(keyset(
+        select(Evaluation).where(Evaluation.candidate_id == 1), Evaluation, AFTER, 51
+    )),
+    "totalCount por candidato": lambda session: session.scalar(
+        select(func.count(Evaluation.id)).where(Evaluation.candidate_id == 1)
+    ),
+    "evaluationsByCandidate y reportes": lambda session: session.scalars(select(Evaluation).where(Evaluation.candidate_id == 1)),
+    "evaluationsByCandidates": lambda session: session.scalars(select(Evaluation).where(Evaluation.candidate_id.in_([1, 2, 3]))),
+    "resultados psicométricos (reportes)": lambda session: session.scalars(
+        select(PsychometricResult).where(PsychometricResult.evaluation_id.in_([1, 2, 3])).order_by(PsychometricResult.id)
+    ),
+    "resultados técnicos (reportes)": lambda session: session.scalars(
+        select(TechnicalResult).where(TechnicalResult.evaluation_id.in_([1, 2, 3])).order_by(TechnicalResult.id)
+    ),
+    "evaluación por id": lambda session: session.get(Evaluation, 1),
+}
+
+def seq_scans(plan: dict) -> list:
+    """Tablas recorridas completas en un nodo del plan y sus hijos"""
+    tables = [plan["Relation Name"]] if plan.get("Node Type") == "Seq Scan" else []
+    for child in plan.get("Plans", []):
+        tables += seq_scans(child)
+    return tables
+
+async def check() -> int:
+    engine = create_async_engine(DATABASE_URL, poolclass=NullPool)
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    failures = 0
+    async with engine.connect() as connection:
+        await connection.exec_driver_sql("SET enable_seqscan = off")
+        session = AsyncSession(bind=connection)
+        for name, run in HOT_QUERIES.items():
+            statements.clear()
+            event.listen(engine.sync_engine, "before_cursor_execute", capture)
+            try:
+                await run(session)
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", capture)
+            for statement, parameters in statements:
+                result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                plan = result.scalar()
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                tables = seq_scans(plan[0]["Plan"])
+                if tables:
+                    failures += 1
+                    print(f"FALLA {name}: Seq Scan en {', '.join(tables)}\n    {statement}")
+                else:
+                    print(f"ok    {name}")
+        await connection.rollback()
+    await engine.dispose()
+    return failures
+
+if __name__ == "__main__":
+    sys.exit(1 if asyncio.run(check()) else 0)
@@ -0,0 +1,65 @@
+"""Esquema inicial
+
+Tablas tal como las creaba el arranque del servicio con create_all. En una
+base creada antes de las migraciones las tablas ya existen y no se tocan,
+así que `alembic upgrade head` sirve tanto para bases nuevas como
+existentes.
+
+Revision ID: 0001
+Revises:
+Create Date: 2024-06-03 10:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+test_type = sa.Enum("TECHNICAL", "PSYCHOMETRIC", name="testtype")
+evaluation_status = sa.Enum("PENDING", "IN_PROGRESS", "COMPLETED", "FAILED", name="evaluationstatus")
+
+def table_exists(name: str) -> bool:
+    # Con --sql no hay conexión: se genera el esquema completo
+    return not op.get_context().as_sql and sa.inspect(op.get_bind()).has_table(name)
+
+def upgrade() -> None:
+    if table_exists("evaluations"):
+        return
+    op.create_table(
+        "evaluations",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("candidate_id", sa.Integer(), nullable=False),
+        sa.Column("test_type", test_type, nullable=False),
+        sa.Column("status", evaluation_status, nullable=True),
+        sa.Column("score", sa.Float(), nullable=True),
+        sa.Column("feedback", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True)
+    )
+    op.create_table(
+        "psychometric_results",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("evaluation_id", sa.Integer(), sa.ForeignKey("evaluations.id"), nullable=True),
+        sa.Column("personality_traits", sa.String(), nullable=True),
+        sa.Column("cognitive_score", sa.Float(), nullable=True),
+        sa.Column("emotional_intelligence", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True)
+    )
+    op.create_table(
+        "technical_results",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("evaluation_id", sa.Integer(), sa.ForeignKey("evaluations.id"), nullable=True),
+        sa.Column("programming_score", sa.Float(), nullable=True),
+        sa.Column("problem_solving_score", sa.Float(), nullable=True),
+        sa.Column("technical_knowledge", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True)
+    )
+
+def downgrade() -> None:
+    op.drop_table("technical_results")
+    op.drop_table("psychometric_results")
+    op.drop_table("evaluations")
+    evaluation_status.drop(op.get_bind(), checkfirst=True)
+    test_type.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,56 @@
+"""Índices de las consultas frecuentes
+
+Se crean con CREATE INDEX CONCURRENTLY, fuera de la transacción de la
+migración, para no bloquear las escrituras mientras se construyen. Si una
+construcción concurrente falla, PostgreSQL deja el índice marcado como no
+válido; se elimina antes de reintentar para que IF NOT EXISTS no lo dé por
+creado.
+
+- evaluations (created_at, id): evaluationsConnection sin filtro
+- evaluations (candidate_id, created_at, id): evaluationsConnection de un
+  candidato y su COUNT, evaluationsByCandidate(s) y los reportes
+- psychometric_results / technical_results (evaluation_id): resultados de
+  cada evaluación en los reportes Excel y PDF
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2024-06-03 10:05:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_evaluations_created_at_id", "evaluations", ["created_at", "id"]),
+    ("ix_evaluations_candidate_id_created_at_id", "evaluations", ["candidate_id", "created_at", "id"]),
+    ("ix_psychometric_results_evaluation_id", "psychometric_results", ["evaluation_id"]),
+    ("ix_technical_results_evaluation_id", "technical_results", ["evaluation_id"]),
+]
+
+def drop_if_invalid(name: str, table: str) -> None:
+    if op.get_context().as_sql:
+        return
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name}
+    ).first()
+    if invalid:
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            drop_if_invalid(name, table)
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -1,15 +1 @@
 # Este archivo marca el directorio como un paquete Python 
-
-from src.application.use_cases.evaluation_use_cases import (
-    AssignTestsUseCase,
-    SubmitTestResultUseCase,
-    ListEvaluationsUseCase,
-    GetCandidateEvaluationsUseCase
-)
-
-__all__ = [
-    'AssignTestsUseCase',
-    'SubmitTestResultUseCase',
-    'ListEvaluationsUseCase',
-    'GetCandidateEvaluationsUseCase'
-] 
\ No newline at end of file
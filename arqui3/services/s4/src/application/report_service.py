@@ -1,29 +1,164 @@
-from typing import List
+import asyncio
+import hashlib
+import json
+import zipfile
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple
 import pandas as pd
+from openpyxl.packaging.core import DocumentProperties
+from openpyxl.xml.constants import ARC_CORE
+from openpyxl.xml.functions import tostring
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
 from reportlab.lib.styles import getSampleStyleSheet
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.models import Evaluation, PsychometricResult, TechnicalResult, TestType
 
+# Evaluación con su resultado psicotécnico y técnico (None si no tiene)
+EvaluationRow = Tuple[Evaluation, Optional[PsychometricResult], Optional[TechnicalResult]]
+
+# Se incrementa al cambiar el diseño de los reportes para invalidar los ETag anteriores
+REPORT_LAYOUT_VERSION = 1
+
+# Fecha de los reportes sin evaluaciones y de las entradas del zip del xlsx
+EPOCH = datetime(1980, 1, 1)
+
+class ReportVersion(NamedTuple):
+    """Validadores HTTP de un reporte, derivados de sus datos y no del archivo generado"""
+    etag: str
+    last_modified: datetime
+
+def report_version(candidate_id: int, report_format: str, evaluations: List[EvaluationRow]) -> ReportVersion:
+    """
+    ETag y fecha de modificación de un reporte.
+
+    Los archivos se generan de forma determinista (ver write_excel_report y
+    write_pdf_report), así que los mismos datos producen los mismos bytes y el
+    ETag puede ser fuerte: If-None-Match e If-Range funcionan entre peticiones.
+
+    Args:
+        candidate_id (int): ID del candidato
+        report_format (str): Formato del reporte (excel, pdf)
+        evaluations (List[EvaluationRow]): Filas del reporte
+
+    Returns:
+        ReportVersion: ETag (SHA-1 de los datos) y fecha del último cambio
+    """
+    rows = []
+    last_modified = EPOCH
+    for evaluation, psychometric, technical in evaluations:
+        rows.append([
+            evaluation.id, evaluation.test_type, evaluation.status, evaluation.score,
+            evaluation.created_at, evaluation.updated_at,
+            psychometric and [
+                psychometric.id, psychometric.personality_traits,
+                psychometric.cognitive_score, psychometric.emotional_intelligence
+            ],
+            technical and [
+                technical.id, technical.programming_score,
+                technical.problem_solving_score, technical.technical_knowledge
+            ]
+        ])
+        # Los resultados no se modifican después de registrarse
+        for changed_at in (evaluation.updated_at, evaluation.created_at,
+                           psychometric and psychometric.created_at, technical and technical.created_at):
+            if changed_at and changed_at > last_modified:
+                last_modified = changed_at
+
+    payload = json.dumps([REPORT_LAYOUT_VERSION, candidate_id, report_format, rows], default=str)
+    return ReportVersion(f'"{hashlib.sha1(payload.encode("utf-8")).hexdigest()}"', last_modified)
+
+def normalize_xlsx(path: str, modified_at: datetime):
+    """
+    Quita del xlsx las marcas de tiempo de la generación.
+
+    openpyxl guarda la hora actual como fecha de modificación del libro y zipfile
+    en cada entrada; se reemplazan por modified_at y por una fecha fija.
+    """
+    with zipfile.ZipFile(path) as archive:
+        entries = [(info, archive.read(info)) for info in archive.infolist()]
+    properties = DocumentProperties(creator="openpyxl", created=modified_at, modified=modified_at)
+    with zipfile.ZipFile(path, "w") as archive:
+        for info, data in entries:
+            if info.filename == ARC_CORE:
+                data = tostring(properties.to_tree())
+            fixed = zipfile.ZipInfo(info.filename, date_time=EPOCH.timetuple()[:6])
+            fixed.compress_type = info.compress_type
+            fixed.external_attr = info.external_attr
+            archive.writestr(fixed, data)
+
 class ReportService:
-    def __init__(self, db: Session):
-        self.db = db
+    """
+    Reportes de evaluaciones de un candidato.
 
-    def generate_excel_report(self, candidate_id: int, output_path: str):
-        evaluations = self.db.query(Evaluation).filter(Evaluation.candidate_id == candidate_id).all()
-        
+    Los datos se leen con la sesión asíncrona de la petición (el mismo pool que
+    GraphQL) en tres consultas; el archivo lo arman pandas y reportlab, que son
+    síncronos, en otro hilo para no bloquear el bucle de eventos.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_evaluations(self, candidate_id: int) -> List[EvaluationRow]:
+        """
+        Evaluaciones del candidato con sus resultados.
+
+        Returns:
+            List[EvaluationRow]: Una fila por evaluación; si una evaluación tiene
+            varios resultados del mismo tipo se usa el primero registrado
+        """
+        # Orden fijo: el mismo conjunto de datos debe dar el mismo archivo
+        evaluations = (await self.session.scalars(
+            select(Evaluation)
+            .where(Evaluation.candidate_id == candidate_id)
+            .order_by(Evaluation.created_at, Evaluation.id)
+        )).all()
+        ids = [evaluation.id for evaluation in evaluations]
+        if not ids:
+            return []
+
+        psychometric = {}
+        for result in (await self.session.scalars(
+            select(PsychometricResult).where(PsychometricResult.evaluation_id.in_(ids)).order_by(PsychometricResult.id)
+        )).all():
+            psychometric.setdefault(result.evaluation_id, result)
+
+        technical = {}
+        for result in (await self.session.scalars(
+            select(TechnicalResult).where(TechnicalResult.evaluation_id.in_(ids)).order_by(TechnicalResult.id)
+        )).all():
+            technical.setdefault(result.evaluation_id, result)
+
+        return [
+            (evaluation, psychometric.get(evaluation.id), technical.get(evaluation.id))
+            for evaluation in evaluations
+        ]
+
+    async def load_report(self, candidate_id: int, report_format: str) -> Tuple[List[EvaluationRow], ReportVersion]:
+        """
+        Lee los datos de un reporte y devuelve la conexión al pool.
+
+        Con la versión se puede responder 304 antes de generar el archivo.
+
+        Returns:
+            tuple: (filas del reporte, ReportVersion)
+        """
+        evaluations = await self.get_evaluations(candidate_id)
+        await self.session.close()
+        return evaluations, report_version(candidate_id, report_format, evaluations)
+
+    async def generate_excel_report(self, evaluations: List[EvaluationRow], version: ReportVersion, output_path: str):
+        await asyncio.to_thread(self.write_excel_report, evaluations, output_path, version.last_modified)
+
+    async def generate_pdf_report(self, candidate_id: int, evaluations: List[EvaluationRow], output_path: str):
+        await asyncio.to_thread(self.write_pdf_report, candidate_id, evaluations, output_path)
+
+    @staticmethod
+    def write_excel_report(evaluations: List[EvaluationRow], output_path: str, modified_at: datetime = EPOCH):
         data = []
-        for eval in evaluations:
-            psychometric = self.db.query(PsychometricResult).filter(
-                PsychometricResult.evaluation_id == eval.id
-            ).first()
-            
-            technical = self.db.query(TechnicalResult).filter(
-                TechnicalResult.evaluation_id == eval.id
-            ).first()
-            
+        for eval, psychometric, technical in evaluations:
             row = {
                 'Tipo de Prueba': eval.test_type,
                 'Estado': eval.status,
@@ -48,10 +183,14 @@ class ReportService:
             data.append(row)
         
         df = pd.DataFrame(data)
-        df.to_excel(output_path, index=False)
+        df.to_excel(output_path, index=False, engine="openpyxl")
+        normalize_xlsx(output_path, modified_at)
 
-    def generate_pdf_report(self, candidate_id: int, output_path: str):
-        doc = SimpleDocTemplate(output_path, pagesize=letter)
+    @staticmethod
+    def write_pdf_report(candidate_id: int, evaluations: List[EvaluationRow], output_path: str):
+        # invariant: fecha de creación e ID del documento fijos, para que los
+        # mismos datos den los mismos bytes
+        doc = SimpleDocTemplate(output_path, pagesize=letter, invariant=1)
         styles = getSampleStyleSheet()
         elements = []
         
@@ -59,9 +198,7 @@ class ReportService:
         elements.append(Paragraph(f"Reporte de Evaluación - Candidato {candidate_id}", styles['Title']))
         elements.append(Paragraph("<br/><br/>", styles['Normal']))
         
-        evaluations = self.db.query(Evaluation).filter(Evaluation.candidate_id == candidate_id).all()
-        
-        for eval in evaluations:
+        for eval, psychometric, technical in evaluations:
             elements.append(Paragraph(f"Evaluación {eval.test_type}", styles['Heading1']))
             
             data = [
@@ -72,9 +209,6 @@ class ReportService:
             ]
             
             if eval.test_type == TestType.PSYCHOMETRIC:
-                psychometric = self.db.query(PsychometricResult).filter(
-                    PsychometricResult.evaluation_id == eval.id
-                ).first()
                 if psychometric:
                     data.extend([
                         ['Rasgos de Personalidad', psychometric.personality_traits or 'N/A'],
@@ -82,9 +216,6 @@ class ReportService:
                         ['Inteligencia Emocional', str(psychometric.emotional_intelligence or 'N/A')]
                     ])
             elif eval.test_type == TestType.TECHNICAL:
-                technical = self.db.query(TechnicalResult).filter(
-                    TechnicalResult.evaluation_id == eval.id
-                ).first()
                 if technical:
                     data.extend([
                         ['Programación', str(technical.programming_score or 'N/A')],
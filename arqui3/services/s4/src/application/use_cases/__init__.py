@@ -1 +0,0 @@
-# Este archivo marca el directorio como un paquete Python 
\ No newline at end of file
@@ -1,7 +1,7 @@
 from datetime import datetime
 import strawberry
 from enum import Enum
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -30,6 +30,12 @@ class Evaluation(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Paginación por cursor de evaluationsConnection sobre (created_at, id)
+    __table_args__ = (
+        Index("ix_evaluations_created_at_id", "created_at", "id"),
+        Index("ix_evaluations_candidate_id_created_at_id", "candidate_id", "created_at", "id"),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -46,7 +52,7 @@ class PsychometricResult(Base):
     __tablename__ = "psychometric_results"
     
     id = Column(Integer, primary_key=True)
-    evaluation_id = Column(Integer, ForeignKey("evaluations.id"))
+    evaluation_id = Column(Integer, ForeignKey("evaluations.id"), index=True)
     personality_traits = Column(String, nullable=True)
     cognitive_score = Column(Float, nullable=True)
     emotional_intelligence = Column(Float, nullable=True)
@@ -66,7 +72,7 @@ class TechnicalResult(Base):
     __tablename__ = "technical_results"
     
     id = Column(Integer, primary_key=True)
-    evaluation_id = Column(Integer, ForeignKey("evaluations.id"))
+    evaluation_id = Column(Integer, ForeignKey("evaluations.id"), index=True)
     programming_score = Column(Float, nullable=True)
     problem_solving_score = Column(Float, nullable=True)
     technical_knowledge = Column(String, nullable=True)
@@ -1,36 +1,38 @@
 import asyncio
 import asyncpg
-from sqlalchemy.ext.asyncio import create_async_engine
-from .config import DEFAULT_DATABASE_URL, DATABASE_URL
-from .models import Base
+from pathlib import Path
+from alembic import command
+from alembic.config import Config
+from .config import POSTGRES_DB, POSTGRES_HOST, POSTGRES_PASSWORD, POSTGRES_PORT, POSTGRES_USER
+
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
 
 async def create_database():
+    # Conectar a la base de datos por defecto 'postgres' para crear la del servicio
+    conn = await asyncpg.connect(
+        user=POSTGRES_USER,
+        password=POSTGRES_PASSWORD,
+        host=POSTGRES_HOST,
+        port=POSTGRES_PORT,
+        database="postgres"
+    )
     try:
-        conn = await asyncpg.connect(DEFAULT_DATABASE_URL)
-        await conn.execute(
-            "CREATE DATABASE evaluations_db"
-        )
-        print("Base de datos evaluations_db creada exitosamente")
-    except asyncpg.exceptions.DuplicateDatabaseError:
-        print("La base de datos evaluations_db ya existe")
-    except Exception as e:
-        print(f"Error al crear la base de datos: {str(e)}")
+        exists = await conn.fetchval("SELECT 1 FROM pg_catalog.pg_database WHERE datname = $1", POSTGRES_DB)
+        if not exists:
+            await conn.execute(f'CREATE DATABASE "{POSTGRES_DB}"')
+            print(f"Base de datos {POSTGRES_DB} creada exitosamente")
     finally:
         await conn.close()
 
-async def create_tables():
-    engine = create_async_engine(DATABASE_URL)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    print("Tablas creadas exitosamente")
-    await engine.dispose()
+async def create_tables(configure_logger: bool = True):
+    # Aplicar las migraciones pendientes (migrations/). env.py usa su propio
+    # bucle de eventos, por eso corre en otro hilo.
+    config = Config(str(ALEMBIC_INI), attributes={"configure_logger": configure_logger})
+    await asyncio.to_thread(command.upgrade, config, "head")
 
-async def init_db():
-    print("Iniciando creación de base de datos...")
+async def init_db(configure_logger: bool = True):
     await create_database()
-    print("Iniciando creación de tablas...")
-    await create_tables()
-    print("Inicialización completada")
+    await create_tables(configure_logger)
 
 if __name__ == "__main__":
-    asyncio.run(init_db()) 
\ No newline at end of file
+    asyncio.run(init_db())
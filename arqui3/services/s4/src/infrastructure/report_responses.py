@@ -0,0 +1,112 @@
+import calendar
+import os
+from datetime import datetime
+from email.utils import formatdate
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+
+CHUNK_SIZE = int(os.getenv("REPORT_CHUNK_SIZE", "65536"))
+
+def report_headers(etag: str, last_modified: datetime, filename: str) -> dict:
+    """Cabeceras comunes de un reporte; last_modified es una fecha UTC sin zona"""
+    return {
+        "ETag": etag,
+        "Last-Modified": formatdate(calendar.timegm(last_modified.utctimetuple()), usegmt=True),
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f"attachment; filename={filename}"
+    }
+
+def not_modified(request: Request, etag: str) -> bool:
+    """Indica si el cliente ya tiene esta versión del reporte (If-None-Match)"""
+    if_none_match = request.headers.get("if-none-match")
+    return bool(if_none_match) and (
+        if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]
+    )
+
+def parse_range(header: str, size: int):
+    """
+    Interpreta una cabecera Range de un solo rango (bytes=inicio-fin, bytes=inicio-, bytes=-sufijo).
+
+    Devuelve (inicio, fin) inclusivos, None si la cabecera no se puede usar
+    (se responde el archivo completo) o lanza ValueError si el rango no es satisfacible.
+    """
+    unit, _, ranges = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+
+    start, _, end = ranges.strip().partition("-")
+    if (start and not start.isdigit()) or (end and not end.isdigit()) or not (start or end):
+        return None
+
+    if not start:
+        suffix = int(end)
+        if suffix == 0:
+            raise ValueError("Rango vacío")
+        return max(size - suffix, 0), size - 1
+
+    first = int(start)
+    if end and int(end) < first:
+        return None
+    if first >= size:
+        raise ValueError("Rango fuera del archivo")
+    return first, min(int(end), size - 1) if end else size - 1
+
+def iter_file(path: str, start: int, end: int):
+    """Lee el tramo [start, end] del archivo por bloques"""
+    with open(path, "rb") as file:
+        file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+def report_response(
+    request: Request,
+    path: str,
+    media_type: str,
+    filename: str,
+    etag: str,
+    last_modified: datetime
+) -> Response:
+    """
+    Responde un reporte generado en un archivo temporal, por bloques y con soporte de
+    If-None-Match, If-Range y Range. El archivo se elimina cuando termina el envío.
+
+    etag y last_modified vienen de los datos del reporte (ReportVersion): el archivo
+    se genera de nuevo en cada petición y solo así un rango reanudado corresponde
+    al mismo documento.
+    """
+    size = os.stat(path).st_size
+    headers = report_headers(etag, last_modified, filename)
+    cleanup = BackgroundTask(os.unlink, path)
+
+    if not_modified(request, etag):
+        return Response(status_code=304, headers=headers, background=cleanup)
+
+    status_code = 200
+    start, end = 0, size - 1
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and size and (not if_range or if_range == etag):
+        try:
+            requested = parse_range(range_header, size)
+        except ValueError:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers, background=cleanup)
+        if requested:
+            start, end = requested
+            status_code = 206
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    headers["Content-Length"] = str(end - start + 1 if size else 0)
+    return StreamingResponse(
+        iter_file(path, start, end),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+        background=cleanup
+    )
@@ -1,133 +1,141 @@
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
 import strawberry
-from sqlalchemy.orm import Session
+from strawberry.types import Info
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.models import Evaluation, PsychometricResult, TechnicalResult, TestType, EvaluationStatus
 from src.infrastructure.schema import (
     EvaluationType, PsychometricResultType, TechnicalResultType,
     EvaluationInput, PsychometricResultInput, TechnicalResultInput
 )
-from src.infrastructure.database import get_db, SessionLocal
+from src.infrastructure.graphql.connection import Connection, build_connection
+from src.infrastructure.pagination import PAGE_SIZE_MAX, decode_cursor, first_rows_per_key, keyset, page_size
 from datetime import datetime
 
-# Función auxiliar para obtener la sesión de DB de forma síncrona
-def get_db_session():
-    db = next(get_db())
-    try:
-        return db
-    finally:
-        db.close()
+@asynccontextmanager
+async def request_session(info: Info) -> AsyncIterator[AsyncSession]:
+    """
+    Sesión de la petición (ver get_context en main.py).
+
+    Los campos raíz de una consulta se resuelven en paralelo y una AsyncSession
+    no admite operaciones concurrentes, así que se usa por turnos.
+    """
+    async with info.context["session_lock"]:
+        yield info.context["session"]
 
 def convert_datetime_to_str(dt: datetime) -> str:
     return dt.isoformat() if dt else ""
 
+def to_evaluation_type(eval_db: Evaluation) -> EvaluationType:
+    return EvaluationType(
+        id=eval_db.id,
+        candidate_id=eval_db.candidate_id,
+        test_type=eval_db.test_type,
+        status=eval_db.status,
+        score=eval_db.score,
+        feedback=eval_db.feedback,
+        created_at=convert_datetime_to_str(eval_db.created_at),
+        updated_at=convert_datetime_to_str(eval_db.updated_at)
+    )
+
 @strawberry.type
 class Query:
     @strawberry.field
-    def evaluation(self, id: int) -> Optional[EvaluationType]:
-        db = get_db_session()
-        eval_db = db.query(Evaluation).filter(Evaluation.id == id).first()
-        if not eval_db:
-            return None
-        return EvaluationType(
-            id=eval_db.id,
-            candidate_id=eval_db.candidate_id,
-            test_type=eval_db.test_type,
-            status=eval_db.status,
-            score=eval_db.score,
-            feedback=eval_db.feedback,
-            created_at=convert_datetime_to_str(eval_db.created_at),
-            updated_at=convert_datetime_to_str(eval_db.updated_at)
-        )
+    async def evaluation(self, info: Info, id: int) -> Optional[EvaluationType]:
+        async with request_session(info) as session:
+            eval_db = await session.get(Evaluation, id)
+        return to_evaluation_type(eval_db) if eval_db else None
+
+    @strawberry.field(deprecation_reason="Devuelve como mucho PAGE_SIZE_MAX filas; usar evaluationsConnection")
+    async def evaluations(self, info: Info) -> List[EvaluationType]:
+        """Primeras PAGE_SIZE_MAX evaluaciones en orden (createdAt, id)"""
+        async with request_session(info) as session:
+            evals_db = (await session.scalars(keyset(select(Evaluation), Evaluation, limit=PAGE_SIZE_MAX))).all()
+        return [to_evaluation_type(eval_db) for eval_db in evals_db]
+
+    @strawberry.field(deprecation_reason="Devuelve como mucho PAGE_SIZE_MAX filas; usar evaluationsConnection")
+    async def evaluations_by_candidate(self, info: Info, candidate_id: int) -> List[EvaluationType]:
+        """Primeras PAGE_SIZE_MAX evaluaciones del candidato en orden (createdAt, id)"""
+        query = select(Evaluation).where(Evaluation.candidate_id == candidate_id)
+        async with request_session(info) as session:
+            evals_db = (await session.scalars(keyset(query, Evaluation, limit=PAGE_SIZE_MAX))).all()
+        return [to_evaluation_type(eval_db) for eval_db in evals_db]
 
     @strawberry.field
-    def evaluations(self) -> List[EvaluationType]:
-        db = get_db_session()
-        evals_db = db.query(Evaluation).all()
-        return [
-            EvaluationType(
-                id=eval_db.id,
-                candidate_id=eval_db.candidate_id,
-                test_type=eval_db.test_type,
-                status=eval_db.status,
-                score=eval_db.score,
-                feedback=eval_db.feedback,
-                created_at=convert_datetime_to_str(eval_db.created_at),
-                updated_at=convert_datetime_to_str(eval_db.updated_at)
-            )
-            for eval_db in evals_db
-        ]
+    async def evaluations_connection(
+        self,
+        info: Info,
+        candidate_id: Optional[int] = None,
+        first: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> Connection[EvaluationType]:
+        """Evaluaciones paginadas por cursor en orden (createdAt, id), opcionalmente de un candidato"""
+        size = page_size(first)
+        query = select(Evaluation)
+        if candidate_id is not None:
+            query = query.where(Evaluation.candidate_id == candidate_id)
+        async with request_session(info) as session:
+            rows = (await session.scalars(keyset(query, Evaluation, decode_cursor(after), size + 1))).all()
+
+        async def count() -> int:
+            count_query = select(func.count(Evaluation.id))
+            if candidate_id is not None:
+                count_query = count_query.where(Evaluation.candidate_id == candidate_id)
+            async with request_session(info) as session:
+                return await session.scalar(count_query)
+
+        return build_connection(rows, size, count, to_evaluation_type)
 
     @strawberry.field
-    def evaluations_by_candidate(self, candidate_id: int) -> List[EvaluationType]:
-        db = get_db_session()
-        evals_db = db.query(Evaluation).filter(Evaluation.candidate_id == candidate_id).all()
-        return [
-            EvaluationType(
-                id=eval_db.id,
-                candidate_id=eval_db.candidate_id,
-                test_type=eval_db.test_type,
-                status=eval_db.status,
-                score=eval_db.score,
-                feedback=eval_db.feedback,
-                created_at=convert_datetime_to_str(eval_db.created_at),
-                updated_at=convert_datetime_to_str(eval_db.updated_at)
-            )
-            for eval_db in evals_db
-        ]
+    async def evaluations_by_candidates(self, info: Info, candidate_ids: List[int]) -> List[EvaluationType]:
+        """Búsqueda por lotes para los DataLoaders del gateway (PAGE_SIZE_MAX por candidato)"""
+        query = select(Evaluation).where(Evaluation.candidate_id.in_(candidate_ids))
+        async with request_session(info) as session:
+            evals_db = (await session.scalars(first_rows_per_key(query, Evaluation, Evaluation.candidate_id))).all()
+        return [to_evaluation_type(eval_db) for eval_db in evals_db]
 
 @strawberry.type
 class Mutation:
     @strawberry.mutation
-    def create_evaluation(self, input: EvaluationInput) -> EvaluationType:
-        db = get_db_session()
-        evaluation = Evaluation(
-            candidate_id=input.candidate_id,
-            test_type=input.test_type,
-            status=EvaluationStatus.PENDING,
-            score=None,
-            feedback=None
-        )
-        db.add(evaluation)
-        db.commit()
-        db.refresh(evaluation)
-        
-        return EvaluationType(
-            id=evaluation.id,
-            candidate_id=evaluation.candidate_id,
-            test_type=evaluation.test_type,
-            status=evaluation.status,
-            score=evaluation.score,
-            feedback=evaluation.feedback,
-            created_at=convert_datetime_to_str(evaluation.created_at),
-            updated_at=convert_datetime_to_str(evaluation.updated_at)
-        )
+    async def create_evaluation(self, info: Info, input: EvaluationInput) -> EvaluationType:
+        async with request_session(info) as session:
+            evaluation = Evaluation(
+                candidate_id=input.candidate_id,
+                test_type=input.test_type,
+                status=EvaluationStatus.PENDING,
+                score=None,
+                feedback=None
+            )
+            session.add(evaluation)
+            await session.commit()
+
+        return to_evaluation_type(evaluation)
 
     @strawberry.mutation
-    def update_psychometric_result(self, input: PsychometricResultInput) -> PsychometricResultType:
-        db = get_db_session()
-        
-        evaluation = db.query(Evaluation).filter(Evaluation.id == input.evaluation_id).first()
-        if not evaluation:
-            raise ValueError(f"No se encontró la evaluación con ID {input.evaluation_id}")
-        
-        if evaluation.test_type != TestType.PSYCHOMETRIC:
-            raise ValueError("Esta evaluación no es de tipo psicotécnico")
-        
-        result = PsychometricResult(
-            evaluation_id=input.evaluation_id,
-            personality_traits=input.personality_traits,
-            cognitive_score=input.cognitive_score,
-            emotional_intelligence=input.emotional_intelligence
-        )
-        db.add(result)
-        
-        if input.cognitive_score is not None and input.emotional_intelligence is not None:
-            evaluation.score = (input.cognitive_score + input.emotional_intelligence) / 2
-        evaluation.status = EvaluationStatus.COMPLETED
-        
-        db.commit()
-        db.refresh(result)
-        
+    async def update_psychometric_result(self, info: Info, input: PsychometricResultInput) -> PsychometricResultType:
+        async with request_session(info) as session:
+            evaluation = await session.get(Evaluation, input.evaluation_id)
+            if not evaluation:
+                raise ValueError(f"No se encontró la evaluación con ID {input.evaluation_id}")
+
+            if evaluation.test_type != TestType.PSYCHOMETRIC:
+                raise ValueError("Esta evaluación no es de tipo psicotécnico")
+
+            result = PsychometricResult(
+                evaluation_id=input.evaluation_id,
+                personality_traits=input.personality_traits,
+                cognitive_score=input.cognitive_score,
+                emotional_intelligence=input.emotional_intelligence
+            )
+            session.add(result)
+
+            if input.cognitive_score is not None and input.emotional_intelligence is not None:
+                evaluation.score = (input.cognitive_score + input.emotional_intelligence) / 2
+            evaluation.status = EvaluationStatus.COMPLETED
+
+            await session.commit()
+
         return PsychometricResultType(
             id=result.id,
             evaluation_id=result.evaluation_id,
@@ -138,31 +146,29 @@ class Mutation:
         )
 
     @strawberry.mutation
-    def update_technical_result(self, input: TechnicalResultInput) -> TechnicalResultType:
-        db = get_db_session()
-        
-        evaluation = db.query(Evaluation).filter(Evaluation.id == input.evaluation_id).first()
-        if not evaluation:
-            raise ValueError(f"No se encontró la evaluación con ID {input.evaluation_id}")
-        
-        if evaluation.test_type != TestType.TECHNICAL:
-            raise ValueError("Esta evaluación no es de tipo técnico")
-        
-        result = TechnicalResult(
-            evaluation_id=input.evaluation_id,
-            programming_score=input.programming_score,
-            problem_solving_score=input.problem_solving_score,
-            technical_knowledge=input.technical_knowledge
-        )
-        db.add(result)
-        
-        if input.programming_score is not None and input.problem_solving_score is not None:
-            evaluation.score = (input.programming_score + input.problem_solving_score) / 2
-        evaluation.status = EvaluationStatus.COMPLETED
-        
-        db.commit()
-        db.refresh(result)
-        
+    async def update_technical_result(self, info: Info, input: TechnicalResultInput) -> TechnicalResultType:
+        async with request_session(info) as session:
+            evaluation = await session.get(Evaluation, input.evaluation_id)
+            if not evaluation:
+                raise ValueError(f"No se encontró la evaluación con ID {input.evaluation_id}")
+
+            if evaluation.test_type != TestType.TECHNICAL:
+                raise ValueError("Esta evaluación no es de tipo técnico")
+
+            result = TechnicalResult(
+                evaluation_id=input.evaluation_id,
+                programming_score=input.programming_score,
+                problem_solving_score=input.problem_solving_score,
+                technical_knowledge=input.technical_knowledge
+            )
+            session.add(result)
+
+            if input.programming_score is not None and input.problem_solving_score is not None:
+                evaluation.score = (input.programming_score + input.problem_solving_score) / 2
+            evaluation.status = EvaluationStatus.COMPLETED
+
+            await session.commit()
+
         return TechnicalResultType(
             id=result.id,
             evaluation_id=result.evaluation_id,
@@ -170,4 +176,4 @@ class Mutation:
             problem_solving_score=result.problem_solving_score,
             technical_knowledge=result.technical_knowledge,
             created_at=convert_datetime_to_str(result.created_at)
-        ) 
\ No newline at end of file
+        )
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -7,16 +8,17 @@ current_dir = Path(__file__).resolve().parent.parent
 if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
-from fastapi import FastAPI, File, UploadFile, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, File, UploadFile, Depends, HTTPException, Request, Response
 import strawberry
-from strawberry.fastapi import GraphQLRouter
 from src.infrastructure.resolvers import Query, Mutation
-from src.infrastructure.database import engine, get_db
-from src.domain.models import Base
+from src.infrastructure.database.config import engine, get_session
+from src.infrastructure.database.init_db import init_db
 from src.application.report_service import ReportService
+from src.infrastructure.report_responses import not_modified, report_headers, report_response
+from src.infrastructure.graphql.persisted_queries import PersistedDocumentCache, PersistedQueryRouter
+from src.infrastructure.encoding import CompressionMiddleware
 from tempfile import NamedTemporaryFile
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 
@@ -35,25 +37,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Comprimir con gzip/brotli las respuestas grandes según Accept-Encoding
+app.add_middleware(CompressionMiddleware)
+
 @app.on_event("startup")
 async def startup_event():
     try:
-        # Crear las tablas en la base de datos
-        Base.metadata.create_all(bind=engine)
-        logger.info("Tablas creadas exitosamente en la base de datos")
+        # Crear la base si no existe y aplicar las migraciones pendientes (migrations/)
+        await init_db(configure_logger=False)
+        logger.info("Migraciones aplicadas en la base de datos")
     except Exception as e:
-        logger.error(f"Error al crear las tablas: {e}")
+        logger.error(f"Error al aplicar las migraciones: {e}")
         raise
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await engine.dispose()
+
 # Crear y configurar el schema GraphQL
 schema = strawberry.Schema(
     query=Query,
-    mutation=Mutation
+    mutation=Mutation,
+    extensions=[PersistedDocumentCache]
 )
 
+# Configurar el contexto de GraphQL: una sesión por operación, cerrada al terminar
+async def get_context():
+    async for session in get_session():
+        yield {
+            "session": session,
+            "session_lock": asyncio.Lock()
+        }
+
 # Crear y configurar el router de GraphQL
-graphql_app = GraphQLRouter(
+graphql_app = PersistedQueryRouter(
     schema,
+    context_getter=get_context,
     graphiql=True  # Habilitar la interfaz GraphiQL
 )
 
@@ -64,43 +83,52 @@ app.include_router(graphql_app, prefix="/graphql")
 async def root():
     return {"message": "Servicio de Evaluación API"}
 
-@app.post("/reports/{candidate_id}/excel")
-async def generate_excel_report(candidate_id: int, db: Session = Depends(get_db)):
+# Extensión y tipo de contenido de cada formato de reporte
+REPORT_FORMATS = {
+    "excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "pdf": ("pdf", "application/pdf")
+}
+
+async def send_report(request: Request, session: AsyncSession, candidate_id: int, report_format: str):
+    """Genera un reporte y lo responde con validadores tomados de sus datos"""
+    suffix, media_type = REPORT_FORMATS[report_format]
+    report_service = ReportService(session)
+    evaluations, version = await report_service.load_report(candidate_id, report_format)
+    filename = f"evaluation_report_{candidate_id}.{suffix}"
+
+    # Sin cambios en los datos no hace falta generar el archivo
+    if not_modified(request, version.etag):
+        return Response(status_code=304, headers=report_headers(version.etag, version.last_modified, filename))
+
+    temp_file = NamedTemporaryFile(delete=False, suffix=f".{suffix}")
+    temp_file.close()
+    try:
+        if report_format == "excel":
+            await report_service.generate_excel_report(evaluations, version, temp_file.name)
+        else:
+            await report_service.generate_pdf_report(candidate_id, evaluations, temp_file.name)
+    except Exception:
+        os.unlink(temp_file.name)
+        raise
+
+    # El archivo temporal se elimina al terminar el envío
+    return report_response(request, temp_file.name, media_type, filename, version.etag, version.last_modified)
+
+@app.api_route("/reports/{candidate_id}/excel", methods=["GET", "POST"])
+async def generate_excel_report(candidate_id: int, request: Request, session: AsyncSession = Depends(get_session)):
     try:
-        report_service = ReportService(db)
-        temp_file = NamedTemporaryFile(delete=False, suffix=".xlsx")
-        report_service.generate_excel_report(candidate_id, temp_file.name)
-        
-        return FileResponse(
-            temp_file.name,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            filename=f"evaluation_report_{candidate_id}.xlsx"
-        )
+        return await send_report(request, session, candidate_id, "excel")
     except Exception as e:
         logger.error(f"Error generando reporte Excel: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if 'temp_file' in locals():
-            os.unlink(temp_file.name)
 
-@app.post("/reports/{candidate_id}/pdf")
-async def generate_pdf_report(candidate_id: int, db: Session = Depends(get_db)):
+@app.api_route("/reports/{candidate_id}/pdf", methods=["GET", "POST"])
+async def generate_pdf_report(candidate_id: int, request: Request, session: AsyncSession = Depends(get_session)):
     try:
-        report_service = ReportService(db)
-        temp_file = NamedTemporaryFile(delete=False, suffix=".pdf")
-        report_service.generate_pdf_report(candidate_id, temp_file.name)
-        
-        return FileResponse(
-            temp_file.name,
-            media_type="application/pdf",
-            filename=f"evaluation_report_{candidate_id}.pdf"
-        )
+        return await send_report(request, session, candidate_id, "pdf")
     except Exception as e:
         logger.error(f"Error generando reporte PDF: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if 'temp_file' in locals():
-            os.unlink(temp_file.name)
 
 if __name__ == "__main__":
     import uvicorn
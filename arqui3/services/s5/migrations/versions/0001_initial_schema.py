@@ -0,0 +1,44 @@
+"""Esquema inicial
+
+Tablas tal como las creaba init_db.py con create_all. En una base creada
+antes de las migraciones la tabla ya existe y no se toca, así que
+`alembic upgrade head` sirve tanto para bases nuevas como existentes.
+
+Revision ID: 0001
+Revises:
+Create Date: 2024-06-03 10:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def table_exists(name: str) -> bool:
+    # Con --sql no hay conexión: se genera el esquema completo
+    return not op.get_context().as_sql and sa.inspect(op.get_bind()).has_table(name)
+
+def upgrade() -> None:
+    if table_exists("interviews"):
+        return
+    op.create_table(
+        "interviews",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("candidate_id", sa.Integer(), nullable=False),
+        sa.Column("interviewer_id", sa.Integer(), nullable=False),
+        sa.Column("vacancy_id", sa.Integer(), nullable=False),
+        sa.Column("interview_type", sa.String(20), nullable=False),
+        sa.Column("scheduled_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("duration_minutes", sa.Integer(), nullable=False),
+        sa.Column("location", sa.String(500), nullable=True),
+        sa.Column("feedback", sa.JSON(), nullable=True),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False)
+    )
+    op.create_index("ix_interviews_id", "interviews", ["id"])
+
+def downgrade() -> None:
+    op.drop_table("interviews")
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from ...domain.entities.interview import Interview, InterviewStatus, InterviewFeedback
 from ...domain.interfaces.interview_repository import InterviewRepository
 from ...infrastructure.events.kafka_producer import KafkaProducer
@@ -52,15 +52,17 @@ class SubmitInterviewResultUseCase:
         if not interview.can_submit_feedback():
             raise ValueError("No se puede enviar feedback para esta entrevista")
 
+        # Guardar el feedback y completar la entrevista en una sola sentencia
         feedback = InterviewFeedback(**feedback_data)
-        updated_interview = await self.repository.submit_feedback(interview_id, feedback)
-
-        # Actualizar estado a completado
-        if updated_interview.status != InterviewStatus.COMPLETED:
-            updated_interview = await self.repository.update_status(
-                interview_id,
-                InterviewStatus.COMPLETED
-            )
+        updated_interview = await self.repository.submit_feedback(
+            interview_id,
+            feedback,
+            status=InterviewStatus.COMPLETED,
+            expected_statuses=[InterviewStatus.IN_PROGRESS]
+        )
+        if not updated_interview:
+            # Otra petición cambió el estado después de la verificación
+            raise ValueError("No se puede enviar feedback para esta entrevista")
 
         # Publicar evento de feedback enviado
         await self.event_producer.send_message(
@@ -88,16 +90,39 @@ class ListInterviewsUseCase:
         candidate_id: Optional[int] = None,
         interviewer_id: Optional[int] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
     ) -> List[Interview]:
         if status:
-            return await self.repository.list_by_status(status, start_date, end_date)
+            return await self.repository.list_by_status(status, start_date, end_date, after, limit)
+        elif vacancy_id:
+            return await self.repository.list_by_vacancy(vacancy_id, after, limit)
+        elif candidate_id:
+            return await self.repository.list_by_candidate(candidate_id, after, limit)
+        elif interviewer_id:
+            return await self.repository.list_by_interviewer(interviewer_id, start_date, end_date, after, limit)
+        else:
+            raise ValueError("Debe especificar al menos un criterio de búsqueda")
+
+    async def count(
+        self,
+        status: Optional[str] = None,
+        vacancy_id: Optional[int] = None,
+        candidate_id: Optional[int] = None,
+        interviewer_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        # Mismo criterio que execute(): solo el primer filtro presente, y las fechas para estado y entrevistador
+        if status:
+            return await self.repository.count(status=status, start_date=start_date, end_date=end_date)
         elif vacancy_id:
-            return await self.repository.list_by_vacancy(vacancy_id)
+            return await self.repository.count(vacancy_id=vacancy_id)
         elif candidate_id:
-            return await self.repository.list_by_candidate(candidate_id)
+            return await self.repository.count(candidate_id=candidate_id)
         elif interviewer_id:
-            return await self.repository.list_by_interviewer(interviewer_id, start_date, end_date)
+            return await self.repository.count(interviewer_id=interviewer_id, start_date=start_date, end_date=end_date)
         else:
             raise ValueError("Debe especificar al menos un criterio de búsqueda")
 
@@ -122,8 +147,12 @@ class RescheduleInterviewUseCase:
         updated_interview = await self.repository.reschedule(
             interview_id,
             new_time,
-            new_duration
+            new_duration,
+            expected_statuses=[InterviewStatus.SCHEDULED, InterviewStatus.CANCELLED]
         )
+        if not updated_interview:
+            # Otra petición cambió el estado después de la verificación
+            raise ValueError("No se puede reprogramar esta entrevista")
 
         # Publicar evento de entrevista reprogramada
         await self.event_producer.send_message(
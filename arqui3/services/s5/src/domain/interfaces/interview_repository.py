@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from ..entities.interview import Interview, InterviewFeedback
 
 class InterviewRepository(ABC):
+    """
+    Los listados devuelven las entrevistas en orden (created_at, id); con after
+    ((created_at, id) de la última fila de la página anterior) y limit devuelven una página.
+    """
+
     @abstractmethod
     async def create(self, interview: Interview) -> Interview:
         """Crea una nueva entrevista"""
@@ -15,21 +20,38 @@ class InterviewRepository(ABC):
         pass
 
     @abstractmethod
-    async def list_by_vacancy(self, vacancy_id: int) -> List[Interview]:
+    async def list_by_vacancy(
+        self,
+        vacancy_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Interview]:
         """Lista las entrevistas de una vacante específica"""
         pass
 
     @abstractmethod
-    async def list_by_candidate(self, candidate_id: int) -> List[Interview]:
+    async def list_by_candidate(
+        self,
+        candidate_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Interview]:
         """Lista las entrevistas de un candidato específico"""
         pass
 
+    @abstractmethod
+    async def list_by_candidates(self, candidate_ids: List[int]) -> List[Interview]:
+        """Lista las entrevistas de varios candidatos en una sola consulta"""
+        pass
+
     @abstractmethod
     async def list_by_interviewer(
         self,
         interviewer_id: int,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
     ) -> List[Interview]:
         """Lista las entrevistas asignadas a un entrevistador"""
         pass
@@ -39,11 +61,26 @@ class InterviewRepository(ABC):
         self,
         status: str,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
     ) -> List[Interview]:
         """Lista las entrevistas por estado"""
         pass
 
+    @abstractmethod
+    async def count(
+        self,
+        vacancy_id: Optional[int] = None,
+        candidate_id: Optional[int] = None,
+        interviewer_id: Optional[int] = None,
+        status: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        """Cuenta las entrevistas que cumplen los filtros indicados"""
+        pass
+
     @abstractmethod
     async def update_status(
         self,
@@ -57,9 +94,11 @@ class InterviewRepository(ABC):
     async def submit_feedback(
         self,
         interview_id: int,
-        feedback: InterviewFeedback
+        feedback: InterviewFeedback,
+        status: Optional[str] = None,
+        expected_statuses: Optional[List[str]] = None
     ) -> Optional[Interview]:
-        """Registra el feedback de una entrevista"""
+        """Registra el feedback de una entrevista y, con status, su nuevo estado en la misma sentencia; con expected_statuses solo si su estado actual es uno de ellos"""
         pass
 
     @abstractmethod
@@ -67,7 +106,8 @@ class InterviewRepository(ABC):
         self,
         interview_id: int,
         new_time: datetime,
-        new_duration: Optional[int] = None
+        new_duration: Optional[int] = None,
+        expected_statuses: Optional[List[str]] = None
     ) -> Optional[Interview]:
-        """Reprograma una entrevista"""
+        """Reprograma una entrevista; con expected_statuses solo si su estado actual es uno de ellos"""
         pass 
\ No newline at end of file
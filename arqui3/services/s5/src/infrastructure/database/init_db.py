@@ -1,8 +1,11 @@
 import asyncio
 import asyncpg
-from sqlalchemy.ext.asyncio import create_async_engine
-from .config import DEFAULT_DATABASE_URL, DATABASE_URL
-from .models import Base
+from pathlib import Path
+from alembic import command
+from alembic.config import Config
+from .config import DEFAULT_DATABASE_URL
+
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
 
 async def create_database():
     try:
@@ -19,11 +22,10 @@ async def create_database():
         await conn.close()
 
 async def create_tables():
-    engine = create_async_engine(DATABASE_URL)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    print("Tablas creadas exitosamente")
-    await engine.dispose()
+    # Aplicar las migraciones pendientes (migrations/). env.py usa su propio
+    # bucle de eventos, por eso corre en otro hilo.
+    await asyncio.to_thread(command.upgrade, Config(str(ALEMBIC_INI)), "head")
+    print("Migraciones aplicadas exitosamente")
 
 async def init_db():
     print("Iniciando creación de base de datos...")
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
 from .config import Base
 from ...domain.entities.interview import InterviewStatus, InterviewType
 
@@ -17,4 +17,15 @@ class InterviewModel(Base):
     feedback = Column(JSON, nullable=True)
     status = Column(String(20), nullable=False, default=InterviewStatus.SCHEDULED)
     created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Paginación por cursor de cada listado sobre (created_at, id) y filtros
+    # por rango de fechas de la agenda de un entrevistador o de un estado
+    __table_args__ = (
+        Index("ix_interviews_vacancy_id_created_at_id", "vacancy_id", "created_at", "id"),
+        Index("ix_interviews_candidate_id_created_at_id", "candidate_id", "created_at", "id"),
+        Index("ix_interviews_interviewer_id_created_at_id", "interviewer_id", "created_at", "id"),
+        Index("ix_interviews_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_interviews_interviewer_id_scheduled_time", "interviewer_id", "scheduled_time"),
+        Index("ix_interviews_status_scheduled_time", "status", "scheduled_time"),
+    ) 
\ No newline at end of file
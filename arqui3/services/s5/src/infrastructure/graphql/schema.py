@@ -12,6 +12,9 @@ from ...application.use_cases.interview_use_cases import (
 from ...infrastructure.repositories.interview_repository import SQLAlchemyInterviewRepository
 from ...infrastructure.events.kafka_producer import KafkaProducer
 from .types import Interview, InterviewInput, InterviewFeedbackInput, RescheduleInput
+from .persisted_queries import PersistedDocumentCache
+from .connection import Connection, build_connection
+from ..pagination import PAGE_SIZE_MAX, decode_cursor, page_size
 
 @strawberry.type
 class Query:
@@ -22,21 +25,30 @@ class Query:
         interview = await repository.get_by_id(interview_id)
         return interview
 
-    @strawberry.field
+    @strawberry.field(deprecation_reason="Devuelve como mucho PAGE_SIZE_MAX filas; usar interviewsConnection")
     async def interviews_by_vacancy(self, info, vacancy_id: int) -> List[Interview]:
+        """Primeras PAGE_SIZE_MAX entrevistas de la vacante en orden (createdAt, id)"""
         session: AsyncSession = info.context["session"]
         repository = SQLAlchemyInterviewRepository(session)
         use_case = ListInterviewsUseCase(repository)
-        return await use_case.execute(vacancy_id=vacancy_id)
+        return await use_case.execute(vacancy_id=vacancy_id, limit=PAGE_SIZE_MAX)
 
-    @strawberry.field
+    @strawberry.field(deprecation_reason="Devuelve como mucho PAGE_SIZE_MAX filas; usar interviewsConnection")
     async def interviews_by_candidate(self, info, candidate_id: int) -> List[Interview]:
+        """Primeras PAGE_SIZE_MAX entrevistas del candidato en orden (createdAt, id)"""
         session: AsyncSession = info.context["session"]
         repository = SQLAlchemyInterviewRepository(session)
         use_case = ListInterviewsUseCase(repository)
-        return await use_case.execute(candidate_id=candidate_id)
+        return await use_case.execute(candidate_id=candidate_id, limit=PAGE_SIZE_MAX)
 
     @strawberry.field
+    async def interviews_by_candidates(self, info, candidate_ids: List[int]) -> List[Interview]:
+        """Búsqueda por lotes para los DataLoaders del gateway (PAGE_SIZE_MAX por candidato)"""
+        session: AsyncSession = info.context["session"]
+        repository = SQLAlchemyInterviewRepository(session)
+        return await repository.list_by_candidates(candidate_ids)
+
+    @strawberry.field(deprecation_reason="Devuelve como mucho PAGE_SIZE_MAX filas; usar interviewsConnection")
     async def interviews_by_interviewer(
         self,
         info,
@@ -44,16 +56,18 @@ class Query:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> List[Interview]:
+        """Primeras PAGE_SIZE_MAX entrevistas del entrevistador en orden (createdAt, id)"""
         session: AsyncSession = info.context["session"]
         repository = SQLAlchemyInterviewRepository(session)
         use_case = ListInterviewsUseCase(repository)
         return await use_case.execute(
             interviewer_id=interviewer_id,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            limit=PAGE_SIZE_MAX
         )
 
-    @strawberry.field
+    @strawberry.field(deprecation_reason="Devuelve como mucho PAGE_SIZE_MAX filas; usar interviewsConnection")
     async def interviews_by_status(
         self,
         info,
@@ -61,15 +75,50 @@ class Query:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> List[Interview]:
+        """Primeras PAGE_SIZE_MAX entrevistas con el estado dado en orden (createdAt, id)"""
         session: AsyncSession = info.context["session"]
         repository = SQLAlchemyInterviewRepository(session)
         use_case = ListInterviewsUseCase(repository)
         return await use_case.execute(
             status=status,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            limit=PAGE_SIZE_MAX
         )
 
+    @strawberry.field
+    async def interviews_connection(
+        self,
+        info,
+        vacancy_id: Optional[int] = None,
+        candidate_id: Optional[int] = None,
+        interviewer_id: Optional[int] = None,
+        status: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        first: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> Connection[Interview]:
+        """
+        Entrevistas paginadas por cursor en orden (createdAt, id). Se filtra por
+        estado, vacante, candidato o entrevistador (el primero presente, como en
+        los listados interviewsBy*); las fechas aplican a estado y entrevistador.
+        """
+        size = page_size(first)
+        session: AsyncSession = info.context["session"]
+        repository = SQLAlchemyInterviewRepository(session)
+        use_case = ListInterviewsUseCase(repository)
+        filters = {
+            "status": status,
+            "vacancy_id": vacancy_id,
+            "candidate_id": candidate_id,
+            "interviewer_id": interviewer_id,
+            "start_date": start_date,
+            "end_date": end_date
+        }
+        rows = await use_case.execute(**filters, after=decode_cursor(after), limit=size + 1)
+        return build_connection(rows, size, lambda: use_case.count(**filters))
+
 @strawberry.type
 class Mutation:
     @strawberry.mutation
@@ -124,4 +173,4 @@ class Mutation:
         )
         return interview
 
-schema = strawberry.Schema(query=Query, mutation=Mutation) 
\ No newline at end of file
+schema = strawberry.Schema(query=Query, mutation=Mutation, extensions=[PersistedDocumentCache]) 
\ No newline at end of file
@@ -1,10 +1,11 @@
 from datetime import datetime
-from typing import List, Optional
-from sqlalchemy import select
+from typing import List, Optional, Tuple
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from ...domain.entities.interview import Interview, InterviewStatus, InterviewFeedback
 from ...domain.interfaces.interview_repository import InterviewRepository
 from ..database.models import InterviewModel
+from ..pagination import first_rows_per_key, keyset
 
 class SQLAlchemyInterviewRepository(InterviewRepository):
     def __init__(self, session: AsyncSession):
@@ -33,93 +34,129 @@ class SQLAlchemyInterviewRepository(InterviewRepository):
         db_interview = result.scalar_one_or_none()
         return self._to_entity(db_interview) if db_interview else None
 
-    async def list_by_vacancy(self, vacancy_id: int) -> List[Interview]:
-        result = await self.session.execute(
-            select(InterviewModel).where(InterviewModel.vacancy_id == vacancy_id)
-        )
+    async def list_by_vacancy(
+        self,
+        vacancy_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Interview]:
+        query = select(InterviewModel).where(InterviewModel.vacancy_id == vacancy_id)
+        result = await self.session.execute(keyset(query, InterviewModel, after, limit))
         return [self._to_entity(i) for i in result.scalars().all()]
 
-    async def list_by_candidate(self, candidate_id: int) -> List[Interview]:
-        result = await self.session.execute(
-            select(InterviewModel).where(InterviewModel.candidate_id == candidate_id)
-        )
+    async def list_by_candidate(
+        self,
+        candidate_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Interview]:
+        query = select(InterviewModel).where(InterviewModel.candidate_id == candidate_id)
+        result = await self.session.execute(keyset(query, InterviewModel, after, limit))
+        return [self._to_entity(i) for i in result.scalars().all()]
+
+    async def list_by_candidates(self, candidate_ids: List[int]) -> List[Interview]:
+        if not candidate_ids:
+            return []
+        query = select(InterviewModel).where(InterviewModel.candidate_id.in_(candidate_ids))
+        result = await self.session.execute(first_rows_per_key(query, InterviewModel, InterviewModel.candidate_id))
         return [self._to_entity(i) for i in result.scalars().all()]
 
     async def list_by_interviewer(
         self,
         interviewer_id: int,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
     ) -> List[Interview]:
         query = select(InterviewModel).where(InterviewModel.interviewer_id == interviewer_id)
-        
-        if start_date:
-            query = query.where(InterviewModel.scheduled_time >= start_date)
-        if end_date:
-            query = query.where(InterviewModel.scheduled_time <= end_date)
-
-        result = await self.session.execute(query)
+        query = self._scheduled_between(query, start_date, end_date)
+        result = await self.session.execute(keyset(query, InterviewModel, after, limit))
         return [self._to_entity(i) for i in result.scalars().all()]
 
     async def list_by_status(
         self,
         status: str,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
     ) -> List[Interview]:
         query = select(InterviewModel).where(InterviewModel.status == status)
-        
+        query = self._scheduled_between(query, start_date, end_date)
+        result = await self.session.execute(keyset(query, InterviewModel, after, limit))
+        return [self._to_entity(i) for i in result.scalars().all()]
+
+    async def count(
+        self,
+        vacancy_id: Optional[int] = None,
+        candidate_id: Optional[int] = None,
+        interviewer_id: Optional[int] = None,
+        status: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        query = select(func.count()).select_from(InterviewModel)
+        if vacancy_id:
+            query = query.where(InterviewModel.vacancy_id == vacancy_id)
+        if candidate_id:
+            query = query.where(InterviewModel.candidate_id == candidate_id)
+        if interviewer_id:
+            query = query.where(InterviewModel.interviewer_id == interviewer_id)
+        if status:
+            query = query.where(InterviewModel.status == status)
+        query = self._scheduled_between(query, start_date, end_date)
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
+    def _scheduled_between(self, query, start_date: Optional[datetime], end_date: Optional[datetime]):
         if start_date:
             query = query.where(InterviewModel.scheduled_time >= start_date)
         if end_date:
             query = query.where(InterviewModel.scheduled_time <= end_date)
-
-        result = await self.session.execute(query)
-        return [self._to_entity(i) for i in result.scalars().all()]
+        return query
 
     async def update_status(self, interview_id: int, status: InterviewStatus) -> Optional[Interview]:
-        db_interview = await self._get_db_interview(interview_id)
-        if not db_interview:
-            return None
-
-        db_interview.status = status
-        await self.session.commit()
-        await self.session.refresh(db_interview)
-        return self._to_entity(db_interview)
-
-    async def submit_feedback(self, interview_id: int, feedback: InterviewFeedback) -> Optional[Interview]:
-        db_interview = await self._get_db_interview(interview_id)
-        if not db_interview:
-            return None
+        return await self._update(interview_id, None, status=status)
 
-        db_interview.feedback = feedback.dict()
-        await self.session.commit()
-        await self.session.refresh(db_interview)
-        return self._to_entity(db_interview)
+    async def submit_feedback(
+        self,
+        interview_id: int,
+        feedback: InterviewFeedback,
+        status: Optional[str] = None,
+        expected_statuses: Optional[List[str]] = None
+    ) -> Optional[Interview]:
+        values = {"feedback": feedback.dict()}
+        if status:
+            values["status"] = status
+        return await self._update(interview_id, expected_statuses, **values)
 
     async def reschedule(
         self,
         interview_id: int,
         new_time: datetime,
-        new_duration: Optional[int] = None
+        new_duration: Optional[int] = None,
+        expected_statuses: Optional[List[str]] = None
     ) -> Optional[Interview]:
-        db_interview = await self._get_db_interview(interview_id)
-        if not db_interview:
-            return None
-
-        db_interview.scheduled_time = new_time
+        values = {"scheduled_time": new_time}
         if new_duration:
-            db_interview.duration_minutes = new_duration
-
-        await self.session.commit()
-        await self.session.refresh(db_interview)
-        return self._to_entity(db_interview)
-
-    async def _get_db_interview(self, interview_id: int) -> Optional[InterviewModel]:
+            values["duration_minutes"] = new_duration
+        return await self._update(interview_id, expected_statuses, **values)
+
+    async def _update(self, interview_id: int, expected_statuses: Optional[List[str]], **values) -> Optional[Interview]:
+        # Una sola sentencia UPDATE ... RETURNING (updated_at lo pone el onupdate
+        # del modelo); la condición sobre el estado actual evita pisar un cambio concurrente
+        query = update(InterviewModel).where(InterviewModel.id == interview_id)
+        if expected_statuses:
+            query = query.where(InterviewModel.status.in_(expected_statuses))
         result = await self.session.execute(
-            select(InterviewModel).where(InterviewModel.id == interview_id)
+            query.values(**values)
+            .returning(InterviewModel)
+            .execution_options(populate_existing=True)
         )
-        return result.scalar_one_or_none()
+        db_interview = result.scalar_one_or_none()
+        await self.session.commit()
+        return self._to_entity(db_interview) if db_interview else None
 
     def _to_entity(self, model: InterviewModel) -> Interview:
         return Interview(
@@ -1,10 +1,11 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from strawberry.fastapi import GraphQLRouter
 from contextlib import asynccontextmanager
 from .infrastructure.database.config import get_session
 from .infrastructure.events.kafka_producer import KafkaProducer
 from .infrastructure.graphql.schema import schema
+from .infrastructure.graphql.persisted_queries import PersistedQueryRouter
+from .infrastructure.encoding import CompressionMiddleware
 
 # Inicializar el productor de Kafka
 kafka_producer = KafkaProducer()
@@ -33,6 +34,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Comprimir con gzip/brotli las respuestas grandes según Accept-Encoding
+app.add_middleware(CompressionMiddleware)
+
 # Configurar el contexto de GraphQL
 async def get_context():
     async for session in get_session():
@@ -42,7 +46,7 @@ async def get_context():
         }
 
 # Configurar la ruta de GraphQL
-graphql_app = GraphQLRouter(
+graphql_app = PersistedQueryRouter(
     schema,
     context_getter=get_context,
     graphiql=True
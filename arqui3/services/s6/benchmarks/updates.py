@@ -0,0 +1,223 @@
+"""
+Mide la latencia de las actualizaciones del servicio de selección antes y
+después de reescribirlas como una sola sentencia UPDATE ... RETURNING.
+
+- anterior: la implementación previa, reproducida en LegacySelectionRepository
+  y legacy_update_report: SELECT de la fila, cambio en Python, COMMIT y
+  REFRESH; UpdateSelectionReportUseCase además llamaba de nuevo a
+  update_decision para pasar la selección a IN_REVIEW.
+- actual: SQLAlchemySelectionRepository y UpdateSelectionReportUseCase.
+
+Escenarios (cada uno sobre --ops selecciones nuevas, repartidas entre
+--concurrency tareas, cada operación con su propia sesión):
+
+- decisión: update_decision sobre una selección en revisión
+- reporte: UpdateSelectionReportUseCase sobre una selección pendiente
+  (get_by_id, reporte y cambio de estado)
+- conflictos: dos decisiones concurrentes (HIRE y NO_HIRE) sobre la misma
+  selección; cuenta cuántas selecciones aceptaron las dos, es decir, en
+  cuántas se perdió una decisión sin aviso
+
+Reporta operaciones por segundo, latencia p50/p95/p99 y sentencias SQL por
+operación. Las filas de prueba usan vacancy_id desde VACANCY_BASE y se borran
+al terminar.
+
+Uso (desde el directorio s6/, con la base migrada):
+    python -m benchmarks.updates [--concurrency 20] [--ops 2000]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Optional
+from sqlalchemy import delete, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from src.application.use_cases.selection_use_cases import UpdateSelectionReportUseCase
+from src.domain.entities.selection import Selection, SelectionDecision, SelectionStatus
+from src.infrastructure.database.config import engine
+from src.infrastructure.database.models import SelectionModel
+from src.infrastructure.repositories.selection_repository_impl import SQLAlchemySelectionRepository
+
+VACANCY_BASE = 900_000_000
+REPORT = {"technical_evaluation": {"score": 85, "feedback": "Benchmark"}}
+
+class LegacySelectionRepository(SQLAlchemySelectionRepository):
+    """Actualizaciones tal como estaban antes de UPDATE ... RETURNING"""
+
+    async def update_report(self, selection_id: int, report: dict, status=None, expected_statuses=None) -> Optional[Selection]:
+        result = await self.session.execute(
+            select(SelectionModel).where(SelectionModel.id == selection_id)
+        )
+        db_selection = result.scalar_one_or_none()
+        if db_selection:
+            db_selection.report = report
+            await self.session.commit()
+            await self.session.refresh(db_selection)
+            return self._to_domain(db_selection)
+        return None
+
+    async def update_decision(self, selection_id: int, decision: str, status: str, expected_statuses=None) -> Optional[Selection]:
+        result = await self.session.execute(
+            select(SelectionModel).where(SelectionModel.id == selection_id)
+        )
+        db_selection = result.scalar_one_or_none()
+        if db_selection:
+            db_selection.decision = decision
+            db_selection.status = status
+            await self.session.commit()
+            await self.session.refresh(db_selection)
+            return self._to_domain(db_selection)
+        return None
+
+async def legacy_update_report(repository: LegacySelectionRepository, selection_id: int, report: dict) -> Selection:
+    """UpdateSelectionReportUseCase.execute anterior: reporte y, si estaba pendiente, segunda actualización"""
+    selection = await repository.get_by_id(selection_id)
+    if not selection or not selection.can_generate_report():
+        raise ValueError("No se puede generar el reporte en este momento")
+    updated_selection = await repository.update_report(selection_id, report)
+    if updated_selection.status == SelectionStatus.PENDING:
+        updated_selection = await repository.update_decision(selection_id, None, SelectionStatus.IN_REVIEW)
+    return updated_selection
+
+async def legacy_decide(repository: LegacySelectionRepository, selection_id: int, decision: str) -> Selection:
+    """UpdateSelectionDecisionUseCase.execute anterior (sin condición sobre el estado en el UPDATE)"""
+    selection = await repository.get_by_id(selection_id)
+    if not selection or not selection.can_make_decision():
+        raise ValueError("No se puede tomar una decisión en este momento")
+    status = SelectionStatus.SELECTED if decision == SelectionDecision.HIRE else SelectionStatus.REJECTED
+    return await repository.update_decision(selection_id, decision, status)
+
+async def current_decide(repository: SQLAlchemySelectionRepository, selection_id: int, decision: str) -> Optional[Selection]:
+    """UpdateSelectionDecisionUseCase.execute actual"""
+    selection = await repository.get_by_id(selection_id)
+    if not selection or not selection.can_make_decision():
+        raise ValueError("No se puede tomar una decisión en este momento")
+    status = SelectionStatus.SELECTED if decision == SelectionDecision.HIRE else SelectionStatus.REJECTED
+    updated_selection = await repository.update_decision(
+        selection_id, decision, status, expected_statuses=[SelectionStatus.IN_REVIEW]
+    )
+    if not updated_selection:
+        raise ValueError("No se puede tomar una decisión en este momento")
+    return updated_selection
+
+async def seed(session_factory, vacancy_id: int, rows: int, status: str) -> list:
+    async with session_factory() as session:
+        models = [
+            SelectionModel(
+                vacancy_id=vacancy_id,
+                candidate_id=i + 1,
+                report=REPORT if status == SelectionStatus.IN_REVIEW else {},
+                status=status
+            )
+            for i in range(rows)
+        ]
+        session.add_all(models)
+        await session.commit()
+        return [m.id for m in models]
+
+async def measure(session_factory, ids: list, concurrency: int, operation) -> dict:
+    statements = 0
+    latencies = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        nonlocal statements
+        statements += 1
+
+    queue = list(ids)
+
+    async def worker():
+        while queue:
+            selection_id = queue.pop()
+            started_at = time.perf_counter()
+            async with session_factory() as session:
+                await operation(session, selection_id)
+            latencies.append(time.perf_counter() - started_at)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    started_at = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+    elapsed = time.perf_counter() - started_at
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "ops": len(latencies) / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p95_ms": quantiles[94] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        # COMMIT no pasa por el cursor: se suma uno por operación
+        "statements": statements / len(latencies) + 1,
+    }
+
+async def conflicts(session_factory, ids: list, concurrency: int, repository_class, decide) -> int:
+    """Selecciones en las que se aceptaron las dos decisiones concurrentes"""
+    accepted = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def attempt(selection_id: int, decision: str):
+        async with semaphore, session_factory() as session:
+            try:
+                await decide(repository_class(session), selection_id, decision)
+                accepted[selection_id] = accepted.get(selection_id, 0) + 1
+            except ValueError:
+                pass
+
+    await asyncio.gather(*(
+        attempt(selection_id, decision)
+        for selection_id in ids
+        for decision in (SelectionDecision.HIRE, SelectionDecision.NO_HIRE)
+    ))
+    return sum(1 for n in accepted.values() if n > 1)
+
+async def main(concurrency: int, ops: int):
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    scenarios = {
+        "decisión": (
+            SelectionStatus.IN_REVIEW,
+            lambda session, i: LegacySelectionRepository(session).update_decision(i, SelectionDecision.ON_HOLD, SelectionStatus.IN_REVIEW),
+            lambda session, i: SQLAlchemySelectionRepository(session).update_decision(
+                i, SelectionDecision.ON_HOLD, SelectionStatus.IN_REVIEW, expected_statuses=[SelectionStatus.IN_REVIEW]
+            ),
+        ),
+        "reporte": (
+            SelectionStatus.PENDING,
+            lambda session, i: legacy_update_report(LegacySelectionRepository(session), i, REPORT),
+            lambda session, i: UpdateSelectionReportUseCase(SQLAlchemySelectionRepository(session)).execute(i, REPORT),
+        ),
+    }
+
+    print(f"{concurrency} tareas, {ops} operaciones por escenario\n")
+    print(f"{'escenario':<24}{'ops/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'sentencias':>12}")
+    vacancy_id = VACANCY_BASE
+    try:
+        for name, (status, before, after) in scenarios.items():
+            for label, operation in (("anterior", before), ("actual", after)):
+                vacancy_id += 1
+                ids = await seed(session_factory, vacancy_id, ops, status)
+                r = await measure(session_factory, ids, concurrency, operation)
+                print(f"{name + ' ' + label:<24}{r['ops']:>9.0f}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}{r['statements']:>12.1f}")
+
+        print("\nconflictos: selecciones con dos decisiones concurrentes aceptadas (una se pierde sin aviso)")
+        for label, repository_class, decide in (
+            ("anterior", LegacySelectionRepository, legacy_decide),
+            ("actual", SQLAlchemySelectionRepository, current_decide),
+        ):
+            vacancy_id += 1
+            ids = await seed(session_factory, vacancy_id, ops, SelectionStatus.IN_REVIEW)
+            lost = await conflicts(session_factory, ids, concurrency, repository_class, decide)
+            print(f"{label:<24}{lost:>9} de {ops}")
+    finally:
+        async with session_factory() as session:
+            await session.execute(delete(SelectionModel).where(SelectionModel.vacancy_id > VACANCY_BASE))
+            await session.commit()
+        await engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--ops", type=int, default=2000, help="Operaciones (y selecciones de prueba) por escenario")
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.ops))
@@ -0,0 +1,81 @@
+"""Índices de las consultas frecuentes
+
+Se crean con CREATE INDEX CONCURRENTLY, fuera de la transacción de la
+migración, para no bloquear las escrituras mientras se construyen. Si una
+construcción concurrente falla, PostgreSQL deja el índice marcado como no
+válido; se elimina antes de reintentar para que IF NOT EXISTS no lo dé por
+creado.
+
+- (vacancy_id | candidate_id, created_at, id): selections y
+  selectionsConnection por vacante o por candidato y su COUNT;
+  (candidate_id, ...) también sirve a selectionsByCandidates
+- UNIQUE (vacancy_id, candidate_id): get_by_vacancy_and_candidate espera como
+  mucho una fila (scalar_one_or_none). Si ya hay selecciones repetidas la
+  migración se detiene y las lista; hay que resolverlas antes de reintentar.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2024-06-03 10:05:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+TABLE = "selections"
+
+INDEXES = [
+    ("ix_selections_vacancy_id_created_at_id", ["vacancy_id", "created_at", "id"], False),
+    ("ix_selections_candidate_id_created_at_id", ["candidate_id", "created_at", "id"], False),
+    ("uq_selections_vacancy_id_candidate_id", ["vacancy_id", "candidate_id"], True),
+]
+
+def drop_if_invalid(name: str) -> None:
+    if op.get_context().as_sql:
+        return
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name}
+    ).first()
+    if invalid:
+        op.drop_index(name, table_name=TABLE, postgresql_concurrently=True, if_exists=True)
+
+def check_duplicates() -> None:
+    if op.get_context().as_sql:
+        return
+    duplicates = op.get_bind().execute(
+        sa.text(
+            "SELECT vacancy_id, candidate_id, array_agg(id ORDER BY id) FROM selections "
+            "GROUP BY vacancy_id, candidate_id HAVING count(*) > 1 ORDER BY vacancy_id, candidate_id"
+        )
+    ).all()
+    if duplicates:
+        rows = "\n".join(
+            f"  vacancy_id={vacancy_id} candidate_id={candidate_id} ids={ids}"
+            for vacancy_id, candidate_id, ids in duplicates
+        )
+        raise RuntimeError(
+            "No se puede crear uq_selections_vacancy_id_candidate_id: hay selecciones repetidas "
+            f"para el mismo candidato y vacante. Conserve una por par y elimine el resto:\n{rows}"
+        )
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns, unique in INDEXES:
+            drop_if_invalid(name)
+            if unique:
+                check_duplicates()
+            op.create_index(
+                name, TABLE, columns, unique=unique, postgresql_concurrently=True, if_not_exists=True
+            )
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=TABLE, postgresql_concurrently=True, if_exists=True)
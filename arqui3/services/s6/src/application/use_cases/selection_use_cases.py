@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from ...domain.entities.selection import Selection, SelectionStatus, SelectionDecision
 from ...domain.interfaces.selection_repository import SelectionRepository
 from ...infrastructure.events.kafka_producer import KafkaProducer
@@ -18,6 +18,10 @@ class CreateSelectionUseCase:
         if not selection.is_valid():
             raise ValueError("La selección no contiene toda la información requerida")
 
+        # Un candidato tiene una sola selección por vacante (índice único en la tabla)
+        if await self.repository.get_by_vacancy_and_candidate(vacancy_id, candidate_id):
+            raise ValueError("El candidato ya tiene una selección para esta vacante")
+
         return await self.repository.create(selection)
 
 class GetSelectionUseCase:
@@ -37,12 +41,22 @@ class ListSelectionsUseCase:
     async def execute(
         self,
         vacancy_id: Optional[int] = None,
-        candidate_id: Optional[int] = None
+        candidate_id: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
     ) -> List[Selection]:
         if vacancy_id:
-            return await self.repository.list_by_vacancy(vacancy_id)
+            return await self.repository.list_by_vacancy(vacancy_id, after, limit)
         elif candidate_id:
-            return await self.repository.list_by_candidate(candidate_id)
+            return await self.repository.list_by_candidate(candidate_id, after, limit)
+        else:
+            raise ValueError("Debe especificar al menos un criterio de búsqueda")
+
+    async def count(self, vacancy_id: Optional[int] = None, candidate_id: Optional[int] = None) -> int:
+        if vacancy_id:
+            return await self.repository.count_by_vacancy(vacancy_id)
+        elif candidate_id:
+            return await self.repository.count_by_candidate(candidate_id)
         else:
             raise ValueError("Debe especificar al menos un criterio de búsqueda")
 
@@ -58,13 +72,16 @@ class UpdateSelectionReportUseCase:
         if not selection.can_generate_report():
             raise ValueError("No se puede generar el reporte en este momento")
 
-        updated_selection = await self.repository.update_report(id, report)
-        if updated_selection.status == SelectionStatus.PENDING:
-            updated_selection = await self.repository.update_decision(
-                id,
-                None,
-                SelectionStatus.IN_REVIEW
-            )
+        # Guardar el reporte y pasar a revisión en una sola sentencia
+        updated_selection = await self.repository.update_report(
+            id,
+            report,
+            status=SelectionStatus.IN_REVIEW,
+            expected_statuses=[SelectionStatus.PENDING, SelectionStatus.IN_REVIEW]
+        )
+        if not updated_selection:
+            # Otra petición cambió el estado después de la verificación
+            raise ValueError("No se puede generar el reporte en este momento")
 
         return updated_selection
 
@@ -93,7 +110,17 @@ class UpdateSelectionDecisionUseCase:
             else SelectionStatus.IN_REVIEW
         )
 
-        return await self.repository.update_decision(id, decision, status)
+        updated_selection = await self.repository.update_decision(
+            id,
+            decision,
+            status,
+            expected_statuses=[SelectionStatus.IN_REVIEW]
+        )
+        if not updated_selection:
+            # Otra petición tomó una decisión después de la verificación
+            raise ValueError("No se puede tomar una decisión en este momento")
+
+        return updated_selection
 
 class GenerateFinalReportUseCase:
     def __init__(self, repository: SelectionRepository, event_producer: KafkaProducer):
@@ -108,14 +135,16 @@ class GenerateFinalReportUseCase:
         if not selection.can_generate_report():
             raise ValueError("No se puede generar el reporte en este momento")
 
-        # Actualizar reporte y estado
-        updated_selection = await self.repository.update_report(selection_id, report_data)
-        if updated_selection.status == SelectionStatus.PENDING:
-            updated_selection = await self.repository.update_decision(
-                selection_id,
-                None,
-                SelectionStatus.IN_REVIEW
-            )
+        # Actualizar reporte y estado en una sola sentencia
+        updated_selection = await self.repository.update_report(
+            selection_id,
+            report_data,
+            status=SelectionStatus.IN_REVIEW,
+            expected_statuses=[SelectionStatus.PENDING, SelectionStatus.IN_REVIEW]
+        )
+        if not updated_selection:
+            # Otra petición cambió el estado después de la verificación
+            raise ValueError("No se puede generar el reporte en este momento")
 
         # Publicar evento
         await self.event_producer.send_message(
@@ -166,8 +195,12 @@ class SelectCandidateUseCase:
         updated_selection = await self.repository.update_decision(
             selection_id,
             decision,
-            status
+            status,
+            expected_statuses=[SelectionStatus.IN_REVIEW]
         )
+        if not updated_selection:
+            # Otra petición tomó una decisión después de la verificación
+            raise ValueError("No se puede tomar una decisión en este momento")
 
         # Publicar evento
         await self.event_producer.send_message(
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from ..entities.selection import Selection
 
 class SelectionRepository(ABC):
@@ -23,22 +24,49 @@ class SelectionRepository(ABC):
         pass
 
     @abstractmethod
-    async def list_by_vacancy(self, vacancy_id: int) -> List[Selection]:
-        """Lista las selecciones de una vacante específica"""
+    async def list_by_vacancy(
+        self,
+        vacancy_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Selection]:
+        """Lista las selecciones de una vacante en orden (created_at, id); con after y limit devuelve una página"""
+        pass
+
+    @abstractmethod
+    async def list_by_candidate(
+        self,
+        candidate_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Selection]:
+        """Lista las selecciones de un candidato en orden (created_at, id); con after y limit devuelve una página"""
+        pass
+
+    @abstractmethod
+    async def count_by_vacancy(self, vacancy_id: int) -> int:
+        """Cuenta las selecciones de una vacante"""
+        pass
+
+    @abstractmethod
+    async def count_by_candidate(self, candidate_id: int) -> int:
+        """Cuenta las selecciones de un candidato"""
         pass
 
     @abstractmethod
-    async def list_by_candidate(self, candidate_id: int) -> List[Selection]:
-        """Lista las selecciones de un candidato específico"""
+    async def list_by_candidates(self, candidate_ids: List[int]) -> List[Selection]:
+        """Lista las selecciones de varios candidatos en una sola consulta"""
         pass
 
     @abstractmethod
     async def update_report(
         self,
         selection_id: int,
-        report: dict
+        report: dict,
+        status: Optional[str] = None,
+        expected_statuses: Optional[List[str]] = None
     ) -> Optional[Selection]:
-        """Actualiza el reporte de una selección"""
+        """Actualiza el reporte de una selección y, con status, su estado en la misma sentencia; con expected_statuses solo si su estado actual es uno de ellos"""
         pass
 
     @abstractmethod
@@ -46,7 +74,8 @@ class SelectionRepository(ABC):
         self,
         selection_id: int,
         decision: str,
-        status: str
+        status: str,
+        expected_statuses: Optional[List[str]] = None
     ) -> Optional[Selection]:
-        """Actualiza la decisión y estado de una selección"""
+        """Actualiza la decisión y estado de una selección; con expected_statuses solo si su estado actual es uno de ellos"""
         pass 
\ No newline at end of file
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, JSON, DateTime
+from sqlalchemy import Column, Integer, String, JSON, DateTime, Index
 from .config import Base
 from ...domain.entities.selection import SelectionStatus, SelectionDecision
 
@@ -13,4 +13,12 @@ class SelectionModel(Base):
     decision = Column(String(20), nullable=True)
     status = Column(String(20), nullable=False, default=SelectionStatus.PENDING)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow) 
\ No newline at end of file
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Paginación por cursor de las selecciones de una vacante o de un candidato sobre (created_at, id);
+    # un candidato tiene como mucho una selección por vacante (get_by_vacancy_and_candidate)
+    __table_args__ = (
+        Index("ix_selections_vacancy_id_created_at_id", "vacancy_id", "created_at", "id"),
+        Index("ix_selections_candidate_id_created_at_id", "candidate_id", "created_at", "id"),
+        Index("uq_selections_vacancy_id_candidate_id", "vacancy_id", "candidate_id", unique=True),
+    ) 
\ No newline at end of file
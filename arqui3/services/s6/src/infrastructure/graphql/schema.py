@@ -15,6 +15,9 @@ from ...application.use_cases.selection_use_cases import (
 from ..repositories.selection_repository_impl import SQLAlchemySelectionRepository
 from ..events.kafka_producer import KafkaProducer
 from .types import Selection, SelectionInput, ReportInput
+from .persisted_queries import PersistedDocumentCache
+from .connection import Connection, build_connection
+from ..pagination import PAGE_SIZE_MAX, decode_cursor, page_size
 
 @strawberry.type
 class Query:
@@ -25,17 +28,42 @@ class Query:
         use_case = GetSelectionUseCase(repository)
         return await use_case.execute(selection_id)
 
-    @strawberry.field
+    @strawberry.field(deprecation_reason="Devuelve como mucho PAGE_SIZE_MAX filas; usar selectionsConnection")
     async def selections(
         self,
         info,
         vacancy_id: Optional[int] = None,
         candidate_id: Optional[int] = None
     ) -> List[Selection]:
+        """Primeras PAGE_SIZE_MAX selecciones de la vacante o candidato en orden (createdAt, id)"""
         session: AsyncSession = info.context["session"]
         repository = SQLAlchemySelectionRepository(session)
         use_case = ListSelectionsUseCase(repository)
-        return await use_case.execute(vacancy_id, candidate_id)
+        return await use_case.execute(vacancy_id, candidate_id, limit=PAGE_SIZE_MAX)
+
+    @strawberry.field
+    async def selections_connection(
+        self,
+        info,
+        vacancy_id: Optional[int] = None,
+        candidate_id: Optional[int] = None,
+        first: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> Connection[Selection]:
+        """Selecciones de una vacante o candidato paginadas por cursor en orden (createdAt, id)"""
+        size = page_size(first)
+        session: AsyncSession = info.context["session"]
+        repository = SQLAlchemySelectionRepository(session)
+        use_case = ListSelectionsUseCase(repository)
+        rows = await use_case.execute(vacancy_id, candidate_id, decode_cursor(after), size + 1)
+        return build_connection(rows, size, lambda: use_case.count(vacancy_id, candidate_id))
+
+    @strawberry.field
+    async def selections_by_candidates(self, info, candidate_ids: List[int]) -> List[Selection]:
+        """Búsqueda por lotes para los DataLoaders del gateway (PAGE_SIZE_MAX por candidato)"""
+        session: AsyncSession = info.context["session"]
+        repository = SQLAlchemySelectionRepository(session)
+        return await repository.list_by_candidates(candidate_ids)
 
 @strawberry.type
 class Mutation:
@@ -117,4 +145,4 @@ class Mutation:
         use_case = UpdateSelectionDecisionUseCase(repository)
         return await use_case.execute(id=id, decision=decision)
 
-schema = strawberry.Schema(query=Query, mutation=Mutation) 
\ No newline at end of file
+schema = strawberry.Schema(query=Query, mutation=Mutation, extensions=[PersistedDocumentCache]) 
\ No newline at end of file
@@ -1,9 +1,11 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import func, select, update, and_
 from ...domain.entities.selection import Selection
 from ...domain.interfaces.selection_repository import SelectionRepository
 from ..database.models import SelectionModel
+from ..pagination import first_rows_per_key, keyset
 
 class SQLAlchemySelectionRepository(SelectionRepository):
     def __init__(self, session: AsyncSession):
@@ -45,51 +47,80 @@ class SQLAlchemySelectionRepository(SelectionRepository):
         db_selection = result.scalar_one_or_none()
         return self._to_domain(db_selection) if db_selection else None
 
-    async def list_by_vacancy(self, vacancy_id: int) -> List[Selection]:
+    async def list_by_vacancy(
+        self,
+        vacancy_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Selection]:
+        query = select(SelectionModel).where(SelectionModel.vacancy_id == vacancy_id)
+        result = await self.session.execute(keyset(query, SelectionModel, after, limit))
+        return [self._to_domain(r) for r in result.scalars().all()]
+
+    async def list_by_candidate(
+        self,
+        candidate_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[Selection]:
+        query = select(SelectionModel).where(SelectionModel.candidate_id == candidate_id)
+        result = await self.session.execute(keyset(query, SelectionModel, after, limit))
+        return [self._to_domain(r) for r in result.scalars().all()]
+
+    async def count_by_vacancy(self, vacancy_id: int) -> int:
         result = await self.session.execute(
-            select(SelectionModel).where(SelectionModel.vacancy_id == vacancy_id)
+            select(func.count()).select_from(SelectionModel).where(SelectionModel.vacancy_id == vacancy_id)
         )
-        return [self._to_domain(r) for r in result.scalars().all()]
+        return result.scalar_one()
 
-    async def list_by_candidate(self, candidate_id: int) -> List[Selection]:
+    async def count_by_candidate(self, candidate_id: int) -> int:
         result = await self.session.execute(
-            select(SelectionModel).where(SelectionModel.candidate_id == candidate_id)
+            select(func.count()).select_from(SelectionModel).where(SelectionModel.candidate_id == candidate_id)
         )
+        return result.scalar_one()
+
+    async def list_by_candidates(self, candidate_ids: List[int]) -> List[Selection]:
+        if not candidate_ids:
+            return []
+        query = select(SelectionModel).where(SelectionModel.candidate_id.in_(candidate_ids))
+        result = await self.session.execute(first_rows_per_key(query, SelectionModel, SelectionModel.candidate_id))
         return [self._to_domain(r) for r in result.scalars().all()]
 
     async def update_report(
         self,
         selection_id: int,
-        report: dict
+        report: dict,
+        status: Optional[str] = None,
+        expected_statuses: Optional[List[str]] = None
     ) -> Optional[Selection]:
-        result = await self.session.execute(
-            select(SelectionModel).where(SelectionModel.id == selection_id)
-        )
-        db_selection = result.scalar_one_or_none()
-        if db_selection:
-            db_selection.report = report
-            await self.session.commit()
-            await self.session.refresh(db_selection)
-            return self._to_domain(db_selection)
-        return None
+        values = {"report": report}
+        if status:
+            values["status"] = status
+        return await self._update(selection_id, expected_statuses, **values)
 
     async def update_decision(
         self,
         selection_id: int,
         decision: str,
-        status: str
+        status: str,
+        expected_statuses: Optional[List[str]] = None
     ) -> Optional[Selection]:
+        return await self._update(selection_id, expected_statuses, decision=decision, status=status)
+
+    async def _update(self, selection_id: int, expected_statuses: Optional[List[str]], **values) -> Optional[Selection]:
+        # Una sola sentencia UPDATE ... RETURNING (updated_at lo pone el onupdate
+        # del modelo); la condición sobre el estado actual evita pisar un cambio concurrente
+        query = update(SelectionModel).where(SelectionModel.id == selection_id)
+        if expected_statuses:
+            query = query.where(SelectionModel.status.in_(expected_statuses))
         result = await self.session.execute(
-            select(SelectionModel).where(SelectionModel.id == selection_id)
+            query.values(**values)
+            .returning(SelectionModel)
+            .execution_options(populate_existing=True)
         )
         db_selection = result.scalar_one_or_none()
-        if db_selection:
-            db_selection.decision = decision
-            db_selection.status = status
-            await self.session.commit()
-            await self.session.refresh(db_selection)
-            return self._to_domain(db_selection)
-        return None
+        await self.session.commit()
+        return self._to_domain(db_selection) if db_selection else None
 
     def _to_domain(self, model: SelectionModel) -> Selection:
         return Selection(